@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""ブキテンプレートを前計算したバンクファイルを生成するCLI。"""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_SRC = REPO_ROOT / "backend" / "src"
+if str(BACKEND_SRC) not in sys.path:
+    sys.path.insert(0, str(BACKEND_SRC))
+
+from splat_replay.domain.config import ImageMatchingSettings
+from splat_replay.infrastructure.adapters.weapon_detection import constants
+from splat_replay.infrastructure.adapters.weapon_detection.recognizer import (
+    WeaponRecognitionAdapter,
+)
+
+DEFAULT_CONFIG_PATH = "backend/config/image_matching.yaml"
+DEFAULT_ASSETS_DIR = "backend/assets"
+
+
+class BuildError(RuntimeError):
+    """バンク生成で期待外の入力を検出した場合の例外。"""
+
+
+class _NullLogger:
+    """構造化ログ用のダミーロガー。"""
+
+    def debug(self, event: str, **kw: object) -> None:
+        return None
+
+    def info(self, event: str, **kw: object) -> None:
+        return None
+
+    def warning(self, event: str, **kw: object) -> None:
+        return None
+
+    def error(self, event: str, **kw: object) -> None:
+        return None
+
+    def exception(self, event: str, **kw: object) -> None:
+        return None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "image_matching.yaml のブキテンプレートとラベリング追加テンプレートを"
+            "前計算し、起動時にメモリマップで読み込むバンクファイルを生成する。"
+        )
+    )
+    parser.add_argument(
+        "--config",
+        default=DEFAULT_CONFIG_PATH,
+        help="image_matching.yaml のパス",
+    )
+    parser.add_argument(
+        "--assets-dir",
+        default=DEFAULT_ASSETS_DIR,
+        help="assets ディレクトリのパス",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help=(
+            "出力先のパス (省略時は assets ディレクトリ配下の "
+            f"{constants.WEAPON_TEMPLATE_BANK_RELATIVE_PATH.as_posix()})"
+        ),
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    config_path = Path(args.config)
+    assets_dir = Path(args.assets_dir).resolve()
+    if not config_path.is_file():
+        raise BuildError(f"--config が見つかりません: {config_path}")
+    if not assets_dir.is_dir():
+        raise BuildError(
+            f"--assets-dir のディレクトリが見つかりません: {assets_dir}"
+        )
+    output_path = (
+        Path(args.output)
+        if args.output
+        else assets_dir / constants.WEAPON_TEMPLATE_BANK_RELATIVE_PATH
+    )
+
+    started = time.perf_counter()
+    recognizer = WeaponRecognitionAdapter(
+        settings=ImageMatchingSettings.load_from_yaml(config_path),
+        logger=_NullLogger(),
+        assets_dir=assets_dir,
+    )
+    count = recognizer.write_template_bank(output_path)
+    if count == 0:
+        raise BuildError("バンクに格納するブキテンプレートがありません")
+    elapsed = time.perf_counter() - started
+    size_kib = output_path.stat().st_size / 1024
+    print(
+        f"{count} 件のテンプレートを書き出しました: {output_path} "
+        f"({size_kib:.0f} KiB, {elapsed:.2f}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main())
+    except BuildError as exc:
+        print(f"[ERROR] {exc}", file=sys.stderr)
+        raise SystemExit(1)
@@ -19,6 +19,9 @@ __all__ = [
     # Metadata DTO
     "SubtitleDTO",
     "RecordingMetadataPatchDTO",
+    # Reanalysis DTO
+    "ReanalysisReportDTO",
+    "RecordingReanalysisDTO",
     # Replay DTO
     "ReplayBootstrapDTO",
     # Subtitle DTO
@@ -28,5 +31,6 @@ __all__ = [
 
 from .assets import EditedVideoDTO, EditUploadStatusDTO, RecordedVideoDTO
 from .metadata import RecordingMetadataPatchDTO, SubtitleDTO
+from .reanalysis import ReanalysisReportDTO, RecordingReanalysisDTO
 from .replay import ReplayBootstrapDTO
 from .subtitle import SubtitleBlockDTO, SubtitleDataDTO
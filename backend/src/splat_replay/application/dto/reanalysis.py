@@ -0,0 +1,60 @@
+"""録画済み動画の一括再解析関連のDTO定義。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal
+
+ReanalysisStatus = Literal["analyzed", "skipped", "failed"]
+
+
+@dataclass(frozen=True)
+class RecordingReanalysisDTO:
+    """1 本の録画の再解析結果を表すDTO。
+
+    Attributes:
+        path: 動画ファイルの絶対パス（文字列）
+        status: analyzed / skipped (解析済みのため省略) / failed
+        outcome: 解析の終わり方 (completed / incomplete / cancelled)
+        frames_analyzed: 読み込んだフレーム数
+        video_seconds: 読み込んだ最後のフレームの再生位置（秒）
+        elapsed_seconds: 解析にかかった時間（秒）
+        metadata_saved: メタデータ (サイドカー JSON) を書き込んだか
+        error: 失敗時のエラー内容
+    """
+
+    path: str
+    status: ReanalysisStatus
+    outcome: str | None = None
+    frames_analyzed: int = 0
+    video_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    metadata_saved: bool = False
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ReanalysisReportDTO:
+    """一括再解析の集計を表すDTO。
+
+    Attributes:
+        items: 録画ごとの結果
+        workers: 並列に解析したプロセス数
+        elapsed_seconds: 全体の所要時間（秒）
+    """
+
+    items: tuple[RecordingReanalysisDTO, ...]
+    workers: int
+    elapsed_seconds: float
+
+    def count(self, status: ReanalysisStatus) -> int:
+        return sum(1 for item in self.items if item.status == status)
+
+    @property
+    def video_seconds(self) -> float:
+        """解析した動画の合計再生時間（秒）。"""
+        return sum(
+            item.video_seconds
+            for item in self.items
+            if item.status == "analyzed"
+        )
@@ -33,6 +33,9 @@ from splat_replay.application.interfaces.history import (
     BattleHistoryRepositoryPort,
 )
 from splat_replay.application.interfaces.data import (
+    AssetListQuery,
+    AssetPage,
+    AssetSortKey,
     AudioInputHealthCheckResult,
     AudioInputHealthStatus,
     BehaviorSettingsView,
@@ -57,6 +60,7 @@ from splat_replay.application.interfaces.data import (
     SpeechSynthesisRequest,
     SpeechSynthesisResult,
     UploadSettingsView,
+    VideoEditPlan,
     VideoEditSettingsView,
 )
 from splat_replay.application.interfaces.image import (
@@ -77,12 +81,14 @@ from splat_replay.application.interfaces.messaging import (
     FrameSource,
 )
 from splat_replay.application.interfaces.recording import (
+    BufferedCapturePort,
     CaptureDeviceEnumeratorPort,
     CaptureDevicePort,
     CapturePort,
     ReplayBootstrapResolverPort,
     RecorderStatus,
     RecorderWithTranscriptionPort,
+    SeekableCapturePort,
     VideoRecorderPort,
 )
 from splat_replay.application.interfaces.system import (
@@ -122,6 +128,9 @@ __all__ = [
     "LoggerPort",
     "PathsPort",
     # Data
+    "AssetListQuery",
+    "AssetPage",
+    "AssetSortKey",
     "AudioInputHealthCheckResult",
     "AudioInputHealthStatus",
     "BehaviorSettingsView",
@@ -146,14 +155,17 @@ __all__ = [
     "SpeechSynthesisRequest",
     "SpeechSynthesisResult",
     "UploadSettingsView",
+    "VideoEditPlan",
     "VideoEditSettingsView",
     # Recording
+    "BufferedCapturePort",
     "CaptureDeviceEnumeratorPort",
     "CaptureDevicePort",
     "CapturePort",
     "ReplayBootstrapResolverPort",
     "RecorderStatus",
     "RecorderWithTranscriptionPort",
+    "SeekableCapturePort",
     "VideoRecorderPort",
     # Audio
     "MicrophoneEnumeratorPort",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Protocol
 
@@ -91,4 +92,12 @@ class FileSystemPort(Protocol):
 
     def write_bytes(self, path: Path, data: bytes) -> None: ...
 
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> None: ...
+
     def unlink(self, path: Path, *, missing_ok: bool = True) -> None: ...
+
+    def copy_file(
+        self, src: Path, dst: Path, *, allow_link: bool = False
+    ) -> str: ...
+
+    def move_file(self, src: Path, dst: Path) -> str: ...
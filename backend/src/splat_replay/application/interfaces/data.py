@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import datetime
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     Any,
+    Generic,
     List,
     Literal,
     NotRequired,
@@ -13,6 +15,7 @@ from typing import (
     Protocol,
     Required,
     TypedDict,
+    TypeVar,
 )
 
 from pydantic import SecretStr
@@ -20,6 +23,9 @@ from pydantic import SecretStr
 # Type aliases
 PrivacyStatus = Literal["public", "private", "unlisted"]
 SpeechAudioEncoding = Literal["LINEAR16", "MP3", "OGG_OPUS"]
+AssetSortKey = Literal["started_at", "filename", "size", "updated_at"]
+
+ItemT = TypeVar("ItemT")
 
 
 # Settings View Protocols
@@ -54,12 +60,14 @@ class SpeechSettingsView(Protocol):
     sample_rate_hz: int
     model: str
     track_title: str
+    max_concurrent_requests: int
 
 
 class VideoEditSettingsView(Protocol):
     """Video edit settings shape exposed to application services."""
 
     volume_multiplier: float
+    max_parallel_groups: int
     title_template: str
     description_template: str
     chapter_template: str
@@ -215,6 +223,29 @@ class SpeechSynthesisResult:
     sample_rate_hz: int
 
 
+@dataclass(frozen=True)
+class VideoEditPlan:
+    """1 回の書き出しで適用する動画編集の内容。
+
+    Attributes:
+        clips: 結合する動画 (この順に連結する)
+        output: 書き出し先
+        metadata: 埋め込むメタデータ (空の値は無視する)
+        thumbnail: 埋め込むサムネイル画像 (PNG)
+        narration: 音声トラックとして追加する読み上げ音声
+        narration_title: 読み上げ音声トラックのタイトル
+        volume_multiplier: 音声全体に掛ける音量倍率
+    """
+
+    clips: tuple[Path, ...]
+    output: Path
+    metadata: dict[str, str] = field(default_factory=dict)
+    thumbnail: Optional[bytes] = None
+    narration: Optional[Path] = None
+    narration_title: Optional[str] = None
+    volume_multiplier: float = 1.0
+
+
 @dataclass(frozen=True)
 class FileStats:
     """ファイルの統計情報。"""
@@ -223,6 +254,63 @@ class FileStats:
     updated_at: float
 
 
+@dataclass(frozen=True)
+class AssetListQuery:
+    """録画・編集済み動画一覧の絞り込み・並び順・ページ指定。
+
+    Attributes:
+        game_mode: ゲームモード
+        match: マッチ種別
+        rule: ルール
+        stage: ステージ
+        judgement: 勝敗
+        since: この日以降 (録画は録画開始日、編集済みは更新日)
+        until: この日以前 (同上)
+        sort: 並び替えの基準
+        descending: 降順にするか
+        limit: 1 ページの件数。None なら全件
+        cursor: 前のページの AssetPage.next_cursor
+    """
+
+    game_mode: Optional[str] = None
+    match: Optional[str] = None
+    rule: Optional[str] = None
+    stage: Optional[str] = None
+    judgement: Optional[str] = None
+    since: Optional[datetime.date] = None
+    until: Optional[datetime.date] = None
+    sort: AssetSortKey = "started_at"
+    descending: bool = True
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+
+    def filters(self) -> dict[str, str]:
+        """値が指定されたメタデータ項目の絞り込み条件。"""
+        values = {
+            "game_mode": self.game_mode,
+            "match": self.match,
+            "rule": self.rule,
+            "stage": self.stage,
+            "judgement": self.judgement,
+        }
+        return {key: value for key, value in values.items() if value}
+
+
+@dataclass(frozen=True)
+class AssetPage(Generic[ItemT]):
+    """一覧の 1 ページ。
+
+    Attributes:
+        items: このページの項目
+        total: 絞り込み条件に一致する全件数
+        next_cursor: 次のページを取得するカーソル。最後のページなら None
+    """
+
+    items: list[ItemT]
+    total: int
+    next_cursor: Optional[str] = None
+
+
 @dataclass
 class Caption:
     """Video caption metadata."""
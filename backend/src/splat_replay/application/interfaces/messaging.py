@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Mapping, Optional, Protocol, Set
+from typing import Callable, Mapping, Optional, Protocol, Set, Tuple
 
 from splat_replay.domain.events import DomainEvent
 from splat_replay.domain.models import Frame
@@ -57,6 +57,10 @@ class EventSubscription(Protocol):
         """Poll events from subscription."""
         ...
 
+    async def wait(self, max_items: int = 100) -> Optional[list[object]]:
+        """Wait until events arrive, then return them (None once closed)."""
+        ...
+
     def close(self) -> None:
         """Close subscription."""
         ...
@@ -95,6 +99,10 @@ class FrameSource(Protocol):
         """Get latest published frame."""
         ...
 
+    def get_latest_with_sequence(self) -> Tuple[int, Optional[Frame]]:
+        """Get latest frame with its publish sequence number."""
+        ...
+
 
 class CommandDispatcher(Protocol):
     """Dispatch commands to command bus."""
@@ -58,6 +58,22 @@ class CapturePort(Protocol):
     def teardown(self) -> None: ...
 
 
+class BufferedCapturePort(CapturePort, Protocol):
+    """Port for capture sources that can decode into a caller-owned buffer.
+
+    ``out`` is reused when its shape matches the next frame; otherwise a
+    newly allocated frame is returned.
+    """
+
+    def capture_into(self, out: Optional[Frame]) -> Optional[Frame]: ...
+
+
+class SeekableCapturePort(CapturePort, Protocol):
+    """Port for capture sources that can jump to a position (recorded files)."""
+
+    def seek(self, seconds: float) -> None: ...
+
+
 class VideoRecorderPort(Protocol):
     """Port for controlling the external recorder (OBS)."""
 
@@ -5,7 +5,12 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Protocol
 
-from splat_replay.application.interfaces.data import FileStats
+from splat_replay.application.interfaces.data import (
+    AssetListQuery,
+    AssetPage,
+    FileStats,
+    VideoEditPlan,
+)
 from splat_replay.domain.models import Frame, RecordingMetadata, VideoAsset
 
 
@@ -60,6 +65,10 @@ class VideoEditorPort(Protocol):
         """Add audio track to video."""
         ...
 
+    async def render(self, plan: VideoEditPlan) -> Path:
+        """Write the edited video described by the plan in a single pass."""
+        ...
+
     async def list_video_devices(self) -> list[str]:
         """List available video capture devices."""
         ...
@@ -112,6 +121,10 @@ class VideoAssetRepositoryPort(Protocol):
         """List all recorded videos."""
         ...
 
+    def query_recordings(self, query: AssetListQuery) -> AssetPage[VideoAsset]:
+        """List one filtered, sorted page of recorded videos."""
+        ...
+
     def delete_recording(self, video: Path) -> bool:
         """Delete recorded video."""
         ...
@@ -132,6 +145,10 @@ class VideoAssetRepositoryPort(Protocol):
         """List all edited videos."""
         ...
 
+    def query_edited(self, query: AssetListQuery) -> AssetPage[Path]:
+        """List one filtered, sorted page of edited videos."""
+        ...
+
     def delete_edited(self, video: Path) -> bool:
         """Delete edited video."""
         ...
@@ -7,6 +7,7 @@ Threading model: events are dispatched to listeners; GUI controller bridges to T
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
 import threading
 from collections.abc import Awaitable, Mapping
@@ -259,6 +260,11 @@ def build_progress_payload(event: ProgressEvent) -> dict[str, object]:
     }
 
 
+def _resolve_waiter(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class ProgressEventStore:
     """進捗イベントを保持して再送できるようにするインメモリストア。"""
 
@@ -267,6 +273,10 @@ class ProgressEventStore:
         self._events: list[dict[str, object]] = []
         self._active_tasks: set[str] = set()
         self._lock = threading.Lock()
+        # wait_since で新しいイベントを待っている購読者
+        self._waiters: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = []
 
     def record(self, event: ProgressEvent) -> None:
         """進捗イベントを保存する。"""
@@ -291,6 +301,12 @@ class ProgressEventStore:
                 overflow = len(self._events) - self._max_events
                 if overflow > 0:
                     del self._events[:overflow]
+            # 連続したイベントでも起こすのは待機中の購読者ごとに 1 回
+            waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            # 待機側のイベントループが既に閉じていれば何もしない
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
 
     def snapshot(self) -> list[dict[str, object]]:
         """現在の進捗イベント履歴を返す。"""
@@ -307,10 +323,39 @@ class ProgressEventStore:
             (新規イベント一覧, 次回のcursor)
         """
         with self._lock:
-            total = len(self._events)
-            if cursor < 0 or cursor > total:
-                cursor = 0
-            return list(self._events[cursor:]), total
+            return self._read_since(cursor)
+
+    async def wait_since(
+        self, cursor: int
+    ) -> tuple[list[dict[str, object]], int]:
+        """指定位置以降の進捗イベントが届くまで待ってから返す。
+
+        Args:
+            cursor: 前回取得した位置
+
+        Returns:
+            (新規イベント一覧, 次回のcursor)
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                events, next_cursor = self._read_since(cursor)
+                if events:
+                    return events, next_cursor
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def _read_since(self, cursor: int) -> tuple[list[dict[str, object]], int]:
+        total = len(self._events)
+        if cursor < 0 or cursor > total:
+            cursor = 0
+        return list(self._events[cursor:]), total
 
     async def start_listening(self, event_bus: EventBusPort) -> None:
         """イベントバスから進捗イベントを購読して保存する。"""
@@ -328,12 +373,14 @@ class ProgressEventStore:
         )
         try:
             while True:
-                events = sub.poll(max_items=20)
+                events = await sub.wait(max_items=20)
+                if events is None:
+                    # 購読が閉じられた
+                    break
                 for ev in events:
                     payload = getattr(ev, "payload", None)
                     if isinstance(payload, dict):
                         self.record_payload(payload)
-                await asyncio.sleep(0.1)
         except asyncio.CancelledError:
             sub.close()
             raise
@@ -26,6 +26,7 @@ from splat_replay.application.interfaces import (
     TextToSpeechPort,
     VideoAssetRepositoryPort,
     VideoEditorPort,
+    VideoEditPlan,
 )
 from splat_replay.application.services.common.progress import ProgressReporter
 from splat_replay.domain.models import VideoAsset
@@ -127,70 +128,83 @@ class AutoEditor:
 
         total_groups = len([g for g in groups.values() if g])
         completed_groups = 0
-
-        for idx, (key, group) in enumerate(groups.items()):
-            if self._cancelled:
-                self.progress.finish(
-                    task_id, False, "自動編集をキャンセルしました"
+        # グループ間に依存はないため、設定した上限まで並行して編集する
+        budget = asyncio.Semaphore(max(1, self.settings.max_parallel_groups))
+        results: dict[int, Path] = {}
+
+        async def run_group(
+            idx: int,
+            key: tuple[datetime.date, datetime.time, str, str],
+            group: List[VideoAsset],
+        ) -> None:
+            nonlocal completed_groups
+            async with budget:
+                if self._cancelled:
+                    return
+                day, time_slot, match_name, rule_name = key
+                label = f"{day.strftime('%m/%d')} {time_slot.strftime('%H')}時～ {match_name} {rule_name}"
+
+                # 進捗率を更新
+                progress_percent = (
+                    int((completed_groups / total_groups) * 100)
+                    if total_groups > 0
+                    else 0
                 )
-                self.logger.info("自動編集をキャンセルしました")
-                self._state = self._state.with_cancelled()
-                return edited
-            if not group:
-                continue
-            day, time_slot, match_name, rule_name = key
-            label = f"{day.strftime('%m/%d')} {time_slot.strftime('%H')}時～ {match_name} {rule_name}"
-
-            # 進捗率を更新
-            progress_percent = (
-                int((completed_groups / total_groups) * 100)
-                if total_groups > 0
-                else 0
-            )
-            self._state = self._state.with_progress(progress_percent, label)
-
-            # 現在処理中のアイテムを明示 (GUI のタスクリスト更新用)
-            self.progress.item_stage(
-                task_id,
-                idx,
-                "edit_group",
-                "グループ編集",
-                message=label,
-            )
-
-            try:
-                target = await self._edit(
-                    idx, day, time_slot, match_name, rule_name, group
+                self._state = self._state.with_progress(
+                    progress_percent, label
                 )
-                self.logger.info("動画編集を開始します", path=str(target))
-                target = self.repo.save_edited(Path(target))
-                for asset in group:
-                    self.logger.info(
-                        "録画済み動画を削除します", path=str(asset.video)
-                    )
-                    self.repo.delete_recording(asset.video)
-                # 保存ステップを通知し、全体の進捗を 1 進める
+
+                # 現在処理中のアイテムを明示 (GUI のタスクリスト更新用)
                 self.progress.item_stage(
                     task_id,
                     idx,
-                    "save",
-                    "録画済動画削除・編集済動画保存",
-                    message=target.name,
-                )
-                self.progress.advance(task_id)
-                completed_groups += 1
-                edited.append(target)
-            except Exception as e:
-                self.logger.error(
-                    "Video edit failed",
-                    group_label=label,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    exc_info=True,
+                    "edit_group",
+                    "グループ編集",
+                    message=label,
                 )
-                # 失敗したグループをスキップして次へ
-                self.progress.advance(task_id)
-                continue
+
+                try:
+                    target = await self._edit(
+                        idx, day, time_slot, match_name, rule_name, group
+                    )
+                    self.logger.info("動画編集を開始します", path=str(target))
+                    target = self.repo.save_edited(Path(target))
+                    for asset in group:
+                        self.logger.info(
+                            "録画済み動画を削除します", path=str(asset.video)
+                        )
+                        self.repo.delete_recording(asset.video)
+                    # 保存ステップを通知し、全体の進捗を 1 進める
+                    self.progress.item_stage(
+                        task_id,
+                        idx,
+                        "save",
+                        "録画済動画削除・編集済動画保存",
+                        message=target.name,
+                    )
+                    self.progress.advance(task_id)
+                    completed_groups += 1
+                    results[idx] = target
+                except Exception as e:
+                    self.logger.error(
+                        "Video edit failed",
+                        group_label=label,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                        exc_info=True,
+                    )
+                    # 失敗したグループをスキップして次へ
+                    self.progress.advance(task_id)
+
+        await asyncio.gather(
+            *(
+                run_group(idx, key, group)
+                for idx, (key, group) in enumerate(groups.items())
+                if group
+            )
+        )
+        # 完了順ではなくグループ順で返す
+        edited.extend(results[idx] for idx in sorted(results))
 
         if self._cancelled:
             self.progress.finish(
@@ -213,60 +227,69 @@ class AutoEditor:
         rule_name: str,
         group: List[VideoAsset],
     ) -> Path:
-        """1つのグループを編集する。"""
+        """1つのグループを編集する。
+
+        字幕・読み上げ音声・タイトル・サムネイルを並行して用意し、
+        結合とあわせて 1 回の書き出しで編集済み動画を作る。
+        """
         target = self._make_filename(
             group, day, time_slot, match_name, rule_name
         )
         task_id = "auto_edit"
 
-        # 動画結合
-        self.progress.item_stage(
-            task_id,
-            idx,
-            "concat",
-            "動画結合",
-            message=f"{len(group)}本の動画を結合",
-        )
-        await self._merge_videos(target, group)
-
-        # 字幕編集
+        # 字幕・メタデータ・サムネイルの準備
         self.progress.item_stage(
             task_id,
             idx,
             "subtitle",
             "字幕編集",
         )
-        await self.subtitle_processor.create_and_embed(target, group)
-
-        # メタデータ編集
-        self.progress.item_stage(
-            task_id,
-            idx,
-            "metadata",
-            "メタデータ編集",
-        )
-        await self._save_metadata(target, group, day, time_slot)
-
-        # サムネイル編集
-        self.progress.item_stage(
-            task_id,
-            idx,
-            "thumbnail",
-            "サムネイル編集",
+        clips, narration, metadata, thumb_data = await asyncio.gather(
+            self._valid_clips(group),
+            self.subtitle_processor.prepare(target, group),
+            self._build_metadata(group, day, time_slot),
+            self._create_thumbnail(group),
+            return_exceptions=True,
         )
-        await self._save_thumbnail(target, group)
+        try:
+            for outcome in (clips, narration, metadata, thumb_data):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+            assert isinstance(clips, list)
+            assert isinstance(metadata, dict)
+            plan = VideoEditPlan(
+                clips=tuple(clips),
+                output=target,
+                metadata=metadata,
+                thumbnail=thumb_data
+                if isinstance(thumb_data, bytes)
+                else None,
+                narration=narration if isinstance(narration, Path) else None,
+                narration_title=self.settings.speech.track_title,
+                volume_multiplier=self.settings.volume_multiplier,
+            )
 
-        # 音量調整
-        if self.settings.volume_multiplier != 1.0:
+            # 動画結合 (メタデータ・サムネイル・音声の編集も同時に行う)
             self.progress.item_stage(
                 task_id,
                 idx,
-                "volume",
-                "音量調整",
-                message=f"x{self.settings.volume_multiplier}",
+                "concat",
+                "動画結合",
+                message=f"{len(clips)}本の動画を結合",
             )
-            await self._change_volume(target, self.settings.volume_multiplier)
+            await self.video_editor.render(plan)
+        finally:
+            if isinstance(narration, Path):
+                await self.subtitle_processor.discard_narration(narration)
 
+        # メタデータとサムネイルをリポジトリ経由で保存
+        await asyncio.to_thread(
+            self.repo.save_edited_metadata_dict, target, metadata
+        )
+        if plan.thumbnail is not None:
+            await asyncio.to_thread(
+                self.repo.save_edited_thumbnail, target, plan.thumbnail
+            )
         return target
 
     def _make_filename(
@@ -283,15 +306,12 @@ class AutoEditor:
         target = group[0].video.with_name(filename)
         return target
 
-    async def _merge_videos(
-        self, target: Path, group: List[VideoAsset]
-    ) -> None:
-        """動画を結合する。
+    async def _valid_clips(self, group: List[VideoAsset]) -> list[Path]:
+        """結合できる動画を返す。
 
         破損した動画ファイルは自動的にスキップされる。
         """
-        # 有効な動画ファイルのみをフィルタリング
-        valid_videos = []
+        valid_videos: list[Path] = []
         for asset in group:
             length = await self.video_editor.get_video_length(asset.video)
             if length is None or length <= 0:
@@ -304,25 +324,15 @@ class AutoEditor:
 
         if not valid_videos:
             raise ValueError("No valid video files to merge")
+        return valid_videos
 
-        if len(valid_videos) > 1:
-            await self.video_editor.merge(valid_videos, target)
-            return
-
-        # 単一ファイルの場合はコピー
-        data = await asyncio.to_thread(
-            self._file_system.read_bytes, valid_videos[0]
-        )
-        await asyncio.to_thread(self._file_system.write_bytes, target, data)
-
-    async def _save_metadata(
+    async def _build_metadata(
         self,
-        target: Path,
         group: List[VideoAsset],
         day: datetime.date,
         time_slot: datetime.time,
-    ) -> None:
-        """メタデータをJSONファイルとして保存する。"""
+    ) -> dict[str, str]:
+        """タイトルと説明を生成する。"""
         title, description = await self.title_generator.generate(
             group,
             day,
@@ -330,45 +340,22 @@ class AutoEditor:
         )
         self.logger.info("タイトル編集", title=title)
         self.logger.debug("説明編集", description=description)
-
-        metadata = {
+        return {
             "title": title,
             "description": description,
         }
 
-        await self.video_editor.embed_metadata(target, metadata)
-
-        # メタデータをリポジトリ経由で保存
-        await asyncio.to_thread(
-            self.repo.save_edited_metadata_dict, target, metadata
-        )
-
-    async def _save_thumbnail(
-        self, target: Path, group: List[VideoAsset]
-    ) -> None:
-        """サムネイルを作成して動画とリポジトリに保存する。"""
+    async def _create_thumbnail(self, group: List[VideoAsset]) -> bytes | None:
+        """サムネイルを作成して画像データを返す。"""
         thumb = await asyncio.to_thread(self.thumbnail_generator.create, group)
         if not thumb or not self._file_system.is_file(thumb):
             self.logger.warning("Thumbnail generation failed")
-            return
+            return None
 
         try:
-            # サムネイルをリポジトリ経由で保存
-            thumb_data = await asyncio.to_thread(
-                self._file_system.read_bytes, thumb
-            )
-            await self.video_editor.embed_thumbnail(target, thumb_data)
-            await asyncio.to_thread(
-                self.repo.save_edited_thumbnail, target, thumb_data
-            )
+            return await asyncio.to_thread(self._file_system.read_bytes, thumb)
         finally:
             # 一時ファイルを削除
             await asyncio.to_thread(
                 self._file_system.unlink, thumb, missing_ok=True
             )
-
-    async def _change_volume(self, target: Path, multiplier: float) -> None:
-        """動画の音量を調整する。"""
-        if multiplier == 1.0:
-            return
-        await self.video_editor.change_volume(target, multiplier)
@@ -6,19 +6,24 @@
 from __future__ import annotations
 
 import asyncio
-import io
 import re
-import wave
-from array import array
+import struct
+from collections.abc import Iterator
 from pathlib import Path
 from typing import List, Tuple
 
+import numpy as np
+import numpy.typing as npt
+
 from splat_replay.application.interfaces.common import (
     ConfigPort,
     FileSystemPort,
     LoggerPort,
 )
-from splat_replay.application.interfaces.data import SpeechSynthesisRequest
+from splat_replay.application.interfaces.data import (
+    SpeechSynthesisRequest,
+    SpeechSynthesisResult,
+)
 from splat_replay.application.interfaces.image import SubtitleEditorPort
 from splat_replay.application.interfaces.audio import TextToSpeechPort
 from splat_replay.application.interfaces.video import (
@@ -27,6 +32,9 @@ from splat_replay.application.interfaces.video import (
 )
 from splat_replay.domain.models import VideoAsset
 
+# 読み上げ音声を合成してファイルへ書き出す単位 (秒)
+NARRATION_CHUNK_SECONDS = 30
+
 
 class SubtitleProcessor:
     """字幕を処理し、音声読み上げを生成するサービス。"""
@@ -54,10 +62,41 @@ class SubtitleProcessor:
         self, target: Path, group: List[VideoAsset]
     ) -> None:
         """字幕を作成し、音声読み上げを動画に埋め込む。"""
+        narration = await self.prepare(target, group)
+        if narration is None:
+            return
+        try:
+            await self.embed_narration(target, narration)
+        finally:
+            await self.discard_narration(narration)
+
+    async def prepare(
+        self, target: Path, group: List[VideoAsset]
+    ) -> Path | None:
+        """字幕を保存し、読み上げ音声の WAV を書き出してそのパスを返す。
+
+        動画本体には触れないため、結合処理と並行して実行できる。
+        読み上げ音声がない場合は None を返す。
+        """
         self.settings = self.config.get_video_edit_settings()
         combined_srt = await self._create_subtitle(target, group)
-        if combined_srt:
-            await self._embed_subtitle_speech(target, combined_srt)
+        if not combined_srt:
+            return None
+        return await self._synthesize_narration(target, combined_srt)
+
+    async def embed_narration(self, target: Path, narration: Path) -> None:
+        """読み上げ音声を動画に音声トラックとして追加する。"""
+        await self.video_editor.add_audio_track(
+            target,
+            narration,
+            stream_title=self.settings.speech.track_title,
+        )
+
+    async def discard_narration(self, narration: Path) -> None:
+        """読み上げ音声の一時ファイルを削除する。"""
+        await asyncio.to_thread(
+            self._file_system.unlink, narration, missing_ok=True
+        )
 
     async def _create_subtitle(
         self, target: Path, group: List[VideoAsset]
@@ -91,32 +130,30 @@ class SubtitleProcessor:
             )
         return combined_srt
 
-    async def _embed_subtitle_speech(
+    async def _synthesize_narration(
         self, target: Path, srt_text: str
-    ) -> None:
-        """字幕を読み上げ、動画に音声トラックとして追加する。"""
+    ) -> Path | None:
+        """字幕を読み上げた音声を WAV ファイルに書き出す。"""
         speech_settings = self.settings.speech
         if not speech_settings.enabled:
             self.logger.info("字幕読み上げは無効化されています")
-            return
+            return None
         if not self.text_to_speech:
             self.logger.warning(
                 "テキスト読み上げポートが利用できないためスキップします"
             )
-            return
+            return None
         entries = self._parse_srt(srt_text)
         if not entries:
             self.logger.info("読み上げ対象の字幕がありません")
-            return
+            return None
 
-        segments: list[tuple[float, bytes]] = []
-        has_text = False
+        requests: list[tuple[float, SpeechSynthesisRequest]] = []
         for start, _, original_text in entries:
             sanitized = re.sub(r"<[^>]+>", "", original_text)
             normalized = sanitized.replace("\n", " ").strip()
             if not normalized:
                 continue
-            has_text = True
             request = SpeechSynthesisRequest(
                 text=normalized,
                 language_code=speech_settings.language_code,
@@ -127,17 +164,40 @@ class SubtitleProcessor:
                 sample_rate_hz=speech_settings.sample_rate_hz,
                 model=speech_settings.model or None,
             )
-            try:
-                result = await asyncio.to_thread(
-                    self.text_to_speech.synthesize, request
+            requests.append((start, request))
+
+        if not requests:
+            self.logger.info("読み上げ対象となる字幕テキストがありません")
+            return None
+
+        # 字幕ごとの合成は独立しているため、上限まで同時に呼び出す
+        limit = asyncio.Semaphore(
+            max(1, speech_settings.max_concurrent_requests)
+        )
+        text_to_speech = self.text_to_speech
+
+        async def synthesize(
+            request: SpeechSynthesisRequest,
+        ) -> SpeechSynthesisResult:
+            async with limit:
+                return await asyncio.to_thread(
+                    text_to_speech.synthesize, request
                 )
-            except Exception as exc:  # noqa: BLE001
+
+        results = await asyncio.gather(
+            *(synthesize(request) for _, request in requests),
+            return_exceptions=True,
+        )
+
+        segments: list[tuple[float, bytes]] = []
+        for (start, request), result in zip(requests, results, strict=True):
+            if isinstance(result, BaseException):
                 self.logger.error(
                     "字幕読み上げ生成に失敗しました",
-                    error=str(exc),
+                    error=str(result),
                     subtitle=request.text,
                 )
-                return
+                return None
             if result.sample_rate_hz != speech_settings.sample_rate_hz:
                 self.logger.warning(
                     "サンプルレートが設定と一致しません",
@@ -146,88 +206,91 @@ class SubtitleProcessor:
                 )
             segments.append((start, result.audio))
 
-        if not has_text:
-            self.logger.info("読み上げ対象となる字幕テキストがありません")
-            return
-
         if not segments:
             self.logger.info("読み上げ音声の生成結果が空でした")
-            return
+            return None
 
+        placed = self._place_segments(segments, speech_settings.sample_rate_hz)
+        frame_count = max(
+            (start + len(samples) for start, samples in placed), default=0
+        )
+        if frame_count == 0:
+            self.logger.info("生成された読み上げ波形が空のためスキップします")
+            return None
         narration_path = target.with_name(f"{target.stem}_narration.wav")
-        try:
-            waveform = await asyncio.to_thread(
-                self._compose_wave,
-                segments,
-                speech_settings.sample_rate_hz,
-            )
-            if not waveform:
-                self.logger.info(
-                    "生成された読み上げ波形が空のためスキップします"
-                )
-                return
-            wave_bytes = self._build_wave_bytes(
-                waveform, speech_settings.sample_rate_hz
-            )
-            await asyncio.to_thread(
-                self._file_system.write_bytes, narration_path, wave_bytes
-            )
-            await self.video_editor.add_audio_track(
-                target,
-                narration_path,
-                stream_title=speech_settings.track_title,
-            )
-        finally:
-            await asyncio.to_thread(
-                self._file_system.unlink, narration_path, missing_ok=True
-            )
-
-    @staticmethod
-    def _build_wave_bytes(waveform: bytes, sample_rate: int) -> bytes:
-        """WAVEデータをメモリ上で生成する。"""
-        with io.BytesIO() as buffer:
-            with wave.open(buffer, "wb") as wave_writer:
-                wave_writer.setnchannels(1)
-                wave_writer.setsampwidth(2)
-                wave_writer.setframerate(sample_rate)
-                wave_writer.writeframes(waveform)
-            return buffer.getvalue()
+        await asyncio.to_thread(
+            self._file_system.write_chunks,
+            narration_path,
+            self._wave_chunks(
+                placed, frame_count, speech_settings.sample_rate_hz
+            ),
+        )
+        return narration_path
 
     @staticmethod
-    def _compose_wave(
+    def _place_segments(
         segments: List[Tuple[float, bytes]],
         sample_rate: int,
-    ) -> bytes:
-        """複数の音声セグメントを1つの波形に合成する。"""
-        timeline: array[int] = array("h")
+    ) -> list[tuple[int, npt.NDArray[np.int16]]]:
+        """音声セグメントを (開始サンプル位置, サンプル列) に変換する。"""
+        placed: list[tuple[int, npt.NDArray[np.int16]]] = []
         for start_sec, audio_bytes in segments:
-            samples: array[int] = array("h")
-            samples.frombytes(audio_bytes)
-            start_index = max(int(round(start_sec * sample_rate)), 0)
-            SubtitleProcessor._mix_into_timeline(
-                timeline, samples, start_index
+            samples = np.frombuffer(
+                audio_bytes, dtype="<i2", count=len(audio_bytes) // 2
             )
-        return timeline.tobytes()
+            if samples.size == 0:
+                continue
+            placed.append((max(round(start_sec * sample_rate), 0), samples))
+        return placed
 
     @staticmethod
-    def _mix_into_timeline(
-        timeline: array[int],
-        samples: array[int],
-        start_index: int,
-    ) -> None:
-        """タイムラインに音声サンプルをミックスする。"""
-        required_length = start_index + len(samples)
-        if len(timeline) < required_length:
-            timeline.extend([0] * (required_length - len(timeline)))
-        for offset, sample in enumerate(samples):
-            idx = start_index + offset
-            mixed = timeline[idx] + sample
-            if mixed > 32767:
-                timeline[idx] = 32767
-            elif mixed < -32768:
-                timeline[idx] = -32768
-            else:
-                timeline[idx] = mixed
+    def _wave_chunks(
+        placed: list[tuple[int, npt.NDArray[np.int16]]],
+        frame_count: int,
+        sample_rate: int,
+        chunk_frames: int | None = None,
+    ) -> Iterator[bytes]:
+        """WAVE ヘッダーと合成した波形を一定の長さずつ返す。
+
+        タイムラインは区間ごとに int32 で確保してセグメントを加算し、
+        最後に 1 回だけクリップするため、メモリ使用量は動画の長さに
+        よらず区間の長さで決まる。
+        """
+        yield SubtitleProcessor._wave_header(frame_count, sample_rate)
+        step = chunk_frames or sample_rate * NARRATION_CHUNK_SECONDS
+        for chunk_start in range(0, frame_count, step):
+            chunk_end = min(chunk_start + step, frame_count)
+            mixed = np.zeros(chunk_end - chunk_start, dtype=np.int32)
+            for start, samples in placed:
+                low = max(start, chunk_start)
+                high = min(start + len(samples), chunk_end)
+                if low < high:
+                    mixed[low - chunk_start : high - chunk_start] += samples[
+                        low - start : high - start
+                    ]
+            np.clip(mixed, -32768, 32767, out=mixed)
+            yield mixed.astype("<i2").tobytes()
+
+    @staticmethod
+    def _wave_header(frame_count: int, sample_rate: int) -> bytes:
+        """モノラル 16bit PCM の WAVE ヘッダーを生成する。"""
+        data_size = frame_count * 2
+        return struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,
+            1,
+            1,
+            sample_rate,
+            sample_rate * 2,
+            2,
+            16,
+            b"data",
+            data_size,
+        )
 
     @staticmethod
     def _parse_srt(srt_text: str) -> List[Tuple[float, float, str]]:
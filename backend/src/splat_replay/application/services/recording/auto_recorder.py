@@ -19,6 +19,9 @@ from splat_replay.application.interfaces import (
 from splat_replay.application.services.recording.frame_capture_producer import (
     FrameCaptureProducer,
 )
+from splat_replay.application.services.recording.frame_ring_buffer import (
+    FrameRingBuffer,
+)
 from splat_replay.application.services.recording.frame_processing_service import (
     FrameProcessingService,
 )
@@ -61,6 +64,9 @@ FRAME_QUEUE_MAXSIZE = 1
 PUBLISH_QUEUE_MAXSIZE = 200
 FRAME_DEVICE_RETRY_SLEEP = 0.005
 FRAME_QUEUE_PUT_TIMEOUT = 0.001
+# キュー・処理中・プレビュー・ブキ判別の保持分 (最大 10 枚程度) を賄う数
+FRAME_RING_CAPACITY = 16
+FRAME_RING_WRITER_RESERVE = 3
 PUBLISHER_LOOP_IDLE = 0.01
 WELCOME_MESSAGE = "🎮🎮🎮 Let's play! 🎮🎮🎮"
 
@@ -98,12 +104,16 @@ class AutoRecorder:
         self._ctx = RecordingContext(self.metadata)
 
         # ワーカーの初期化
+        self._frame_ring = FrameRingBuffer(
+            FRAME_RING_CAPACITY, writer_reserve=FRAME_RING_WRITER_RESERVE
+        )
         self._capture_producer = FrameCaptureProducer(
             capture,
             frame_publisher,
             queue_maxsize=FRAME_QUEUE_MAXSIZE,
             device_retry_sleep=FRAME_DEVICE_RETRY_SLEEP,
             queue_put_timeout=FRAME_QUEUE_PUT_TIMEOUT,
+            frame_ring=self._frame_ring,
         )
         self._publisher_worker = PublisherWorker(
             publisher,
@@ -171,6 +181,7 @@ class AutoRecorder:
             event_bus=event_bus_adapter,
             detection_window_seconds=weapon_detection_window_seconds,
             clock=clock,
+            frame_ring=self._frame_ring,
         )
 
         self._phase_handlers = PhaseHandlerRegistry(
@@ -0,0 +1,65 @@
+"""Detection schedule - フェーズごとの検出頻度の管理。
+
+各フェーズハンドラは ``detector_rates`` で使用する検出器と実行頻度 (Hz) を
+宣言し、フレームごとに実行時刻に達した検出器だけを評価する。
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Mapping
+
+from splat_replay.application.interfaces import ClockPort
+
+
+class _MonotonicClock:
+    def now(self) -> float:
+        return time.monotonic()
+
+
+class DetectionSchedule:
+    """検出器ごとの次回実行時刻を保持し、フレームごとに実行可否を決める。
+
+    ``begin_frame`` に渡された頻度表に含まれない検出器は毎フレーム実行する。
+    次回実行時刻は前回の予定時刻から間隔ぶん進めるため、フレーム間隔の
+    揺らぎがあっても平均の実行頻度は宣言値に保たれる。長時間呼ばれなかった
+    検出器は次のフレームで即座に実行する。
+    """
+
+    def __init__(self, clock: ClockPort | None = None) -> None:
+        self._clock = clock or _MonotonicClock()
+        self._next_due: Dict[str, float] = {}
+        self._due: Dict[str, bool] = {}
+
+    def begin_frame(self, rates: Mapping[str, float]) -> None:
+        """現在のフレームで実行する検出器を確定する。
+
+        Args:
+            rates: 検出器名 → 実行頻度 (Hz)。0 以下は実行しない。
+        """
+        now = self._clock.now()
+        due: Dict[str, bool] = {}
+        for name, rate in rates.items():
+            if rate <= 0:
+                due[name] = False
+                continue
+            next_due = self._next_due.get(name)
+            if next_due is not None and now < next_due:
+                due[name] = False
+                continue
+            interval = 1.0 / rate
+            scheduled = (next_due if next_due is not None else now) + interval
+            self._next_due[name] = (
+                scheduled if scheduled > now else now + interval
+            )
+            due[name] = True
+        self._due = due
+
+    def is_due(self, name: str) -> bool:
+        """現在のフレームで検出器を実行すべきか返す。"""
+        return self._due.get(name, True)
+
+    def reset(self) -> None:
+        """全検出器を次のフレームで実行可能な状態に戻す。"""
+        self._next_due.clear()
+        self._due = {}
@@ -1,9 +1,12 @@
 import queue
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 from splat_replay.application.interfaces import CapturePort, FramePublisher
+from splat_replay.application.services.recording.frame_ring_buffer import (
+    FrameRingBuffer,
+)
 from splat_replay.domain.models import Frame
 
 
@@ -13,6 +16,9 @@ class FrameCaptureProducer:
     - 非同期ループ本体からは thread-safe な queue.Queue 経由で最新フレームを pull する
     - 遅延抑制のためキュー満杯時は最古フレームを破棄
     - GUI へは即時に publish (非同期フローをブロックしない)
+    - frame_ring を渡すとフレームをリングバッファのスロットへ書き込み、
+      キュー・GUI・各コンシューマはスロットをコピーせずに共有する
+      (capture_into を持つ入力はスロットへ直接デコードさせる)
     """
 
     def __init__(
@@ -22,9 +28,14 @@ class FrameCaptureProducer:
         queue_maxsize: int = 1,
         device_retry_sleep: float = 0.1,
         queue_put_timeout: float = 0.001,
+        frame_ring: Optional[FrameRingBuffer] = None,
     ) -> None:
         self._capture = capture
         self._frame_publisher = frame_publisher
+        self._frame_ring = frame_ring
+        self._capture_into: Optional[
+            Callable[[Optional[Frame]], Optional[Frame]]
+        ] = getattr(capture, "capture_into", None)
         self._queue: queue.Queue[Frame] = queue.Queue(maxsize=queue_maxsize)
         self._device_retry_sleep = device_retry_sleep
         self._queue_put_timeout = queue_put_timeout
@@ -92,12 +103,20 @@ class FrameCaptureProducer:
             return generation == self._generation
 
     # Internal ------------------------------------------------------
+    def _next_frame(self) -> Optional[Frame]:
+        if self._frame_ring is None:
+            return self._capture.capture()
+        if self._capture_into is not None:
+            return self._frame_ring.fill(self._capture_into)
+        frame = self._capture.capture()
+        return None if frame is None else self._frame_ring.write(frame)
+
     def _loop(self, generation: int) -> None:
         while self._running.is_set() and self._is_current_generation(
             generation
         ):
             try:
-                frame = self._capture.capture()
+                frame = self._next_frame()
                 if (
                     not self._running.is_set()
                     or not self._is_current_generation(generation)
@@ -0,0 +1,195 @@
+"""キャプチャフレームを事前確保したスロットへ書き込むリングバッファ。
+
+キャプチャスレッドはフレームを空きスロットへ直接デコードし (デコード先を
+受け取れない入力はコピーし)、スロットを参照する読み取り専用のビューを
+各コンシューマへ渡す。ビュー (およびそこから作った
+スライス) が 1 つでも生きている間はスロットが使用中となり上書きされない。
+すべてのビューが破棄されるとスロットは自動的に空きへ戻るため、
+コンシューマは解放処理を意識せずにフレームをそのまま保持できる。
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import weakref
+from typing import Callable, Optional
+
+import numpy as np
+
+from splat_replay.domain.models import Frame, as_frame
+
+
+class _FrameLease:
+    """スロットの使用権。ビューの base として保持され、破棄時にスロットを返す。"""
+
+    def __init__(self, buffer: np.ndarray) -> None:
+        self._buffer = buffer
+        interface = dict(buffer.__array_interface__)
+        # 読み取り専用として公開し、コンシューマによる上書きを防ぐ
+        interface["data"] = (interface["data"][0], True)
+        self.__array_interface__ = interface
+
+
+class FrameRingBuffer:
+    """固定数のスロットを使い回すフレームのリングバッファ。
+
+    - ``fill`` は空きスロットをデコード先として渡し、コピーせずにビューを返す
+    - ``write`` は渡されたフレームを空きスロットへコピーしてビューを返す
+    - スロットは初回使用時と解像度変更時にのみ確保する
+    - スロットの返却はビューの破棄 (GC) から呼ばれるためロックを取らず、
+      キューへ積んでおき次の ``fill`` / ``write`` で回収する
+    - 空きスロットがない場合はキャプチャを止めないよう、スロット外の
+      フレームをそのまま返す (``overflow_count`` で観測できる)
+    - 長く保持したいフレームは ``pin`` を通し、書き込み用の空きを
+      ``writer_reserve`` 以上残せる場合だけスロットのまま保持する
+    """
+
+    def __init__(self, capacity: int, *, writer_reserve: int = 2) -> None:
+        if capacity < 1:
+            raise ValueError("capacity は 1 以上である必要があります")
+        if not 0 <= writer_reserve < capacity:
+            raise ValueError(
+                "writer_reserve は 0 以上 capacity 未満である必要があります"
+            )
+        self._capacity = capacity
+        self._writer_reserve = writer_reserve
+        self._buffers: list[np.ndarray | None] = [None] * capacity
+        self._in_use = [False] * capacity
+        self._lock = threading.Lock()
+        self._released: queue.SimpleQueue[int] = queue.SimpleQueue()
+        self._sequence = 0
+        self._overflow_count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def in_use(self) -> int:
+        """コンシューマが参照中のスロット数。"""
+        with self._lock:
+            self._collect_released()
+            return sum(self._in_use)
+
+    @property
+    def latest_sequence(self) -> int:
+        with self._lock:
+            return self._sequence
+
+    @property
+    def overflow_count(self) -> int:
+        """空きスロットがなくスロット外で渡したフレーム数。"""
+        with self._lock:
+            return self._overflow_count
+
+    def fill(
+        self, decode: Callable[[Optional[np.ndarray]], Optional[Frame]]
+    ) -> Optional[Frame]:
+        """空きスロットへ ``decode`` でフレームを書き込み、ビューを返す。
+
+        ``decode`` にはデコード先のスロット (未確保なら ``None``) を渡す。
+        解像度が合わず新しく確保した配列が返った場合はその配列を以後の
+        スロットとして使うため、どちらの場合もコピーは発生しない。
+        ``decode`` が返す配列は呼び出し側が以後書き換えないものに限る。
+        空きスロットがない場合は ``decode(None)`` の結果をそのまま返す。
+        """
+        with self._lock:
+            index = self._claim_free_slot()
+        if index is None:
+            return decode(None)
+        return self._fill_slot(index, decode)
+
+    def write(self, frame: Frame) -> Frame:
+        """フレームを空きスロットへコピーし、読み取り専用のビューを返す。"""
+        with self._lock:
+            index = self._claim_free_slot()
+        if index is None:
+            return frame
+
+        def copy_into(buffer: Optional[np.ndarray]) -> Frame:
+            if buffer is None or (
+                buffer.shape != frame.shape or buffer.dtype != frame.dtype
+            ):
+                return frame.copy()
+            np.copyto(buffer, frame)
+            return as_frame(buffer)
+
+        leased = self._fill_slot(index, copy_into)
+        return frame if leased is None else leased
+
+    def pin(self, frame: Frame) -> Frame:
+        """フレームを長く保持するための参照を返す。
+
+        スロット上のフレームは、書き込み用の空きを ``writer_reserve`` 以上
+        残せる場合だけそのまま返して保持を許す。それ以外はコピーを返し、
+        スロットを書き込み側へ明け渡す。
+        """
+        if self._lease_of(frame) is None:
+            return frame.copy()
+        with self._lock:
+            self._collect_released()
+            free = self._in_use.count(False)
+        if free <= self._writer_reserve:
+            return frame.copy()
+        return frame
+
+    def _claim_free_slot(self) -> int | None:
+        self._collect_released()
+        self._sequence += 1
+        # 先頭から使い回し、同時に使う枚数分だけメモリを確保する
+        for index, in_use in enumerate(self._in_use):
+            if not in_use:
+                self._in_use[index] = True
+                return index
+        self._overflow_count += 1
+        return None
+
+    def _fill_slot(
+        self,
+        index: int,
+        decode: Callable[[Optional[np.ndarray]], Optional[Frame]],
+    ) -> Optional[Frame]:
+        buffer = self._buffers[index]
+        # 空きスロットは誰からも参照されていないためロック外で書き込める
+        try:
+            frame = decode(buffer)
+        except BaseException:
+            self._release(index)
+            raise
+        if frame is None:
+            self._release(index)
+            return None
+        if frame is not buffer:
+            self._buffers[index] = frame
+        return self._lease(frame, index)
+
+    def _lease(self, buffer: np.ndarray, index: int) -> Frame:
+        lease = _FrameLease(buffer)
+        weakref.finalize(lease, self._release, index)
+        return as_frame(np.asarray(lease))
+
+    def _release(self, index: int) -> None:
+        # GC から任意のタイミングで呼ばれるため、ロックを取らずに積むだけ
+        self._released.put(index)
+
+    def _collect_released(self) -> None:
+        while True:
+            try:
+                index = self._released.get_nowait()
+            except queue.Empty:
+                return
+            self._in_use[index] = False
+
+    def _lease_of(self, frame: Frame) -> _FrameLease | None:
+        base = frame
+        while isinstance(base, np.ndarray):
+            base = base.base
+        if isinstance(base, _FrameLease) and any(
+            buffer is base._buffer for buffer in self._buffers
+        ):
+            return base
+        return None
+
+
+__all__ = ["FrameRingBuffer"]
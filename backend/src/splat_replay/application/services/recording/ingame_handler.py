@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import time
 from dataclasses import replace
+from typing import Mapping
 
 from splat_replay.application.interfaces import (
     ClockPort,
@@ -16,6 +17,9 @@ from splat_replay.application.interfaces import (
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
@@ -23,7 +27,7 @@ from splat_replay.application.services.recording.weapon_detection_service import
     WeaponDetectionService,
 )
 from splat_replay.domain.events import BattleFinished, BattleInterrupted
-from splat_replay.domain.models import Frame
+from splat_replay.domain.models import Frame, GameMode
 from splat_replay.domain.services import FrameAnalyzer, RecordState
 
 # 定数
@@ -51,6 +55,19 @@ class InGamePhaseHandler:
     - 検出結果に応じた Command を返す（副作用は UseCase で実行）
     """
 
+    # 1 フレームの中でまとめて先行評価するマッチャーキー
+    # (バトル専用。中断検出は開始直後のみなので含めない)
+    prefetch_keys: tuple[str, ...] = (
+        "battle_finish",
+        "battle_communication_error",
+    )
+    # 検出器ごとの実行頻度 (Hz)。終了表示は数フレームしか映らないため、
+    # 終了検出は頻度を制限せず毎フレーム実行する
+    detector_rates: Mapping[str, float] = {
+        "battle_abort": 2.0,
+        "battle_communication_error": 2.0,
+    }
+
     def __init__(
         self,
         analyzer: FrameAnalyzer,
@@ -58,12 +75,20 @@ class InGamePhaseHandler:
         event_bus: EventBusPort,
         weapon_detection_service: WeaponDetectionService | None = None,
         clock: ClockPort | None = None,
+        schedule: DetectionSchedule | None = None,
     ):
         self.analyzer = analyzer
         self.logger = logger
         self.event_bus = event_bus
         self.weapon_detection_service = weapon_detection_service
         self._clock = clock or _WallClock()
+        self.schedule = schedule or DetectionSchedule()
+
+    def prefetch_keys_for(self, ctx: RecordingContext) -> tuple[str, ...]:
+        """このコンテキストで評価される先行評価キーを返す。"""
+        if ctx.metadata.game_mode is not GameMode.BATTLE:
+            return ()
+        return self.prefetch_keys
 
     def cancel_background_tasks(self) -> None:
         """バックグラウンドのブキ判別タスクを中断する。"""
@@ -85,6 +110,7 @@ class InGamePhaseHandler:
         # バトル中断検出（開始60秒以内）
         if (
             now - ctx.battle_started_at <= EARLY_ABORT_WINDOW_SECONDS
+            and self.schedule.is_due("battle_abort")
             and await self.analyzer.detect_session_abort(frame, gm)
         ):
             self.cancel_background_tasks()
@@ -114,7 +140,9 @@ class InGamePhaseHandler:
             )
 
         # バトル終了検出
-        if await self.analyzer.detect_session_finish(frame, gm):
+        if self.schedule.is_due(
+            "battle_finish"
+        ) and await self.analyzer.detect_session_finish(frame, gm):
             duration = now - ctx.battle_started_at
             self.logger.info("バトル終了を検出、一時停止")
             self.event_bus.publish_domain_event(
@@ -133,7 +161,9 @@ class InGamePhaseHandler:
             )
 
         # 通信エラー検出
-        if await self.analyzer.detect_communication_error(frame, gm):
+        if self.schedule.is_due(
+            "battle_communication_error"
+        ) and await self.analyzer.detect_communication_error(frame, gm):
             self.cancel_background_tasks()
             self.logger.info("通信エラーを検出")
             self.event_bus.publish_domain_event(
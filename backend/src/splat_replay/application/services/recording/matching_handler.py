@@ -5,15 +5,20 @@ Phase 4 Refactoring: Handler を純粋関数化し、副作用ではなく Comma
 
 from __future__ import annotations
 
+from typing import Mapping
+
 from splat_replay.application.interfaces import EventBusPort, LoggerPort
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
 from splat_replay.domain.events import BattleStarted, ScheduleChanged
-from splat_replay.domain.models import Frame
+from splat_replay.domain.models import Frame, GameMode
 from splat_replay.domain.services import FrameAnalyzer, RecordState
 
 
@@ -26,15 +31,32 @@ class MatchingPhaseHandler:
     - 検出結果に応じた Command を返す（副作用は UseCase で実行）
     """
 
+    # 1 フレームの中でまとめて先行評価するマッチャーキー
+    prefetch_keys: tuple[str, ...] = ("schedule_change", "battle_start")
+    # 検出器ごとの実行頻度 (Hz)。録画開始の遅れを抑えるためバトル開始は高頻度
+    detector_rates: Mapping[str, float] = {
+        "schedule_change": 2.0,
+        "battle_start": 30.0,
+    }
+
     def __init__(
         self,
         analyzer: FrameAnalyzer,
         logger: LoggerPort,
         event_bus: EventBusPort,
+        schedule: DetectionSchedule | None = None,
     ):
         self.analyzer = analyzer
         self.logger = logger
         self.event_bus = event_bus
+        self.schedule = schedule or DetectionSchedule()
+
+    def prefetch_keys_for(self, ctx: RecordingContext) -> tuple[str, ...]:
+        """このコンテキストで評価される先行評価キーを返す。"""
+        if ctx.metadata.game_mode is not GameMode.BATTLE:
+            # バトル開始の判定はモードごとのプラグインが行う
+            return ("schedule_change",)
+        return self.prefetch_keys
 
     async def handle(
         self, frame: Frame, ctx: RecordingContext, state: RecordState
@@ -47,7 +69,9 @@ class MatchingPhaseHandler:
         md = ctx.metadata
 
         # スケジュール変更検出
-        if await self.analyzer.detect_schedule_change(frame):
+        if self.schedule.is_due(
+            "schedule_change"
+        ) and await self.analyzer.detect_schedule_change(frame):
             self.logger.info("スケジュール変更を検出、情報をリセット")
             self.event_bus.publish_domain_event(ScheduleChanged())
             return RecordingCommand.reset_metadata(
@@ -55,7 +79,9 @@ class MatchingPhaseHandler:
             )
 
         # バトル開始検出
-        if await self.analyzer.detect_session_start(frame, md.game_mode):
+        if self.schedule.is_due(
+            "battle_start"
+        ) and await self.analyzer.detect_session_start(frame, md.game_mode):
             self.logger.info("バトル開始を検出")
 
             # ドメインイベント発行
@@ -0,0 +1,310 @@
+"""Offline analyzer - 録画済み動画からのメタデータ再解析。
+
+録画済みの動画をライブ録画と同じフェーズハンドラで解析し、ライブ録画と
+同じ RecordingMetadata を導出する。実時間に縛られないよう動画上の時刻を
+時計として使い、フェーズごとの間隔でシークしながらフレームを間引いて読む。
+間引いた区間でフェーズの遷移を読み飛ばしたことを検出した場合だけ、
+その区間を全フレーム読み直す。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from typing import Literal, Mapping, Optional, Set
+
+from splat_replay.application.interfaces import (
+    EventSubscription,
+    LoggerPort,
+    SeekableCapturePort,
+    WeaponRecognitionPort,
+)
+from splat_replay.application.services.recording.commands import (
+    RecordingAction,
+)
+from splat_replay.application.services.recording.phase_handler_registry import (
+    PhaseHandlerRegistry,
+)
+from splat_replay.application.services.recording.recording_context import (
+    RecordingContext,
+    SessionPhase,
+)
+from splat_replay.application.services.recording.weapon_detection_service import (
+    SAMPLED_FRAME_INTERVAL_SECONDS,
+    WeaponDetectionService,
+)
+from splat_replay.domain.events import DomainEvent
+from splat_replay.domain.models import Frame, RecordingMetadata
+from splat_replay.domain.models.result import BattleResult
+from splat_replay.domain.services import FrameAnalyzer, RecordState
+
+# バトル中 (ブキ判別後) と結果画面の読み込み間隔。
+# 判定画面は数秒表示されるため、この間隔でも読み飛ばさない
+OFFLINE_COARSE_STEP_SECONDS = 2.0
+# 判定・ローディング・結果画面を待つ区間の読み込み間隔 (検出頻度 10Hz 相当)
+OFFLINE_DENSE_STEP_SECONDS = 0.1
+
+OfflineAnalysisOutcome = Literal["completed", "cancelled", "incomplete"]
+
+
+@dataclass(frozen=True)
+class OfflineAnalysisResult:
+    """録画済み動画の解析結果。
+
+    Attributes:
+        metadata: 導出したメタデータ
+        result_frame: 結果画面のフレーム (検出できなかった場合は None)
+        outcome: completed = 結果画面まで解析、cancelled = 中断・通信エラー、
+            incomplete = 結果画面に到達する前に動画が終了
+        frames_analyzed: 解析したフレーム数
+        video_seconds: 解析を終えた動画上の時刻
+    """
+
+    metadata: RecordingMetadata
+    result_frame: Frame | None
+    outcome: OfflineAnalysisOutcome
+    frames_analyzed: int
+    video_seconds: float
+
+
+class _VideoClock:
+    """動画上の時刻を ClockPort として公開する。"""
+
+    def __init__(self) -> None:
+        self._origin = time.time()
+        self.position = 0.0
+
+    def now(self) -> float:
+        return self._origin + self.position
+
+
+class _EmptySubscription:
+    """イベントが届かない購読。"""
+
+    def __init__(self) -> None:
+        self._closed = asyncio.Event()
+
+    def poll(self, max_items: int = 100) -> list[object]:
+        return []
+
+    async def wait(self, max_items: int = 100) -> list[object] | None:
+        # 閉じられるまで何も届かない
+        await self._closed.wait()
+        return None
+
+    def close(self) -> None:
+        self._closed.set()
+
+
+class _DiscardingEventBus:
+    """オフライン解析ではイベントを通知しない。"""
+
+    def publish(
+        self, event_type: str, payload: Mapping[str, object] | None = None
+    ) -> None:
+        return None
+
+    def publish_domain_event(self, event: DomainEvent) -> None:
+        return None
+
+    def subscribe(
+        self, event_types: Optional[Set[str]] = None
+    ) -> EventSubscription:
+        return _EmptySubscription()
+
+
+class OfflineRecordingAnalyzer:
+    """録画済み動画を実時間より速く解析してメタデータを導出する。
+
+    録画ファイルはバトル開始時点から始まるため、録画中の状態から解析を始める。
+    読み込み間隔はフェーズごとに次のとおり切り替える。
+
+    - ブキ判別中のバトル: ブキ判別のサンプリング間隔
+    - 判定待ち・一時停止中: OFFLINE_DENSE_STEP_SECONDS
+    - それ以外: OFFLINE_COARSE_STEP_SECONDS
+
+    終了表示は数フレームしか録画されないため、間引いて読んだバトル中の
+    フレームに判定画面が映っていた場合は直前の区間を全フレーム読み直す。
+    結果画面を検出した時点で残りは読まずに解析を終える。
+    """
+
+    def __init__(
+        self,
+        analyzer: FrameAnalyzer,
+        weapon_recognizer: WeaponRecognitionPort,
+        logger: LoggerPort,
+    ) -> None:
+        self._analyzer = analyzer
+        self._weapon_recognizer = weapon_recognizer
+        self.logger = logger
+
+    async def analyze(
+        self,
+        capture: SeekableCapturePort,
+        metadata: RecordingMetadata | None = None,
+    ) -> OfflineAnalysisResult:
+        """動画を解析する。
+
+        Args:
+            capture: 解析する動画 (setup/teardown はこのメソッドで行う)
+            metadata: 録画前に確定していた情報 (ゲームモード・レート・
+                マッチング開始時刻など)。動画からは導出できないため引き継ぐ。
+        """
+        capture.setup()
+        try:
+            return await self._scan(capture, metadata or RecordingMetadata())
+        finally:
+            capture.teardown()
+
+    async def _scan(
+        self, capture: SeekableCapturePort, metadata: RecordingMetadata
+    ) -> OfflineAnalysisResult:
+        clock = _VideoClock()
+        weapon_detection = WeaponDetectionService(
+            recognizer=self._weapon_recognizer,
+            logger=self.logger,
+            event_bus=_DiscardingEventBus(),
+            clock=clock,
+        )
+        handlers = PhaseHandlerRegistry(
+            analyzer=self._analyzer,
+            logger=self.logger,
+            event_bus=_DiscardingEventBus(),
+            weapon_detection_service=weapon_detection,
+            clock=clock,
+        )
+        ctx = RecordingContext(
+            metadata=metadata, battle_started_at=clock.now()
+        )
+        state = RecordState.RECORDING
+        outcome: OfflineAnalysisOutcome = "incomplete"
+        frames_analyzed = 0
+        previous_position: float | None = None
+        # 全フレーム読み直し中の区間の終端
+        rescan_until: float | None = None
+        next_position: float | None = 0.0
+
+        try:
+            while True:
+                if next_position is not None:
+                    capture.seek(next_position)
+                frame = capture.capture()
+                if frame is None:
+                    break
+                position = capture.current_time_seconds()
+                if position is None:
+                    position = next_position or 0.0
+                clock.position = position
+                frames_analyzed += 1
+                phase = ctx.phase(state)
+
+                if (
+                    rescan_until is None
+                    and previous_position is not None
+                    and phase is SessionPhase.IN_GAME
+                    and ctx.weapon_detection_done
+                    and await self._analyzer.detect_session_judgement(
+                        frame, ctx.metadata.game_mode
+                    )
+                ):
+                    self.logger.info(
+                        "終了表示を読み飛ばしたため区間を読み直します",
+                        start=previous_position,
+                        end=position,
+                    )
+                    rescan_until = position
+                    next_position = previous_position
+                    previous_position = None
+                    continue
+
+                command = await handlers.handle_frame(frame, ctx, state)
+                ctx = command.updated_context
+                action = command.action
+                if action is RecordingAction.CANCEL_RECORDING:
+                    outcome = "cancelled"
+                    break
+                if action is RecordingAction.STOP_RECORDING:
+                    outcome = "completed"
+                    break
+                if action is RecordingAction.START_RECORDING:
+                    state = RecordState.RECORDING
+                    ctx = replace(ctx, battle_started_at=clock.now())
+                elif action is RecordingAction.PAUSE_RECORDING:
+                    state = RecordState.PAUSED
+                elif action is RecordingAction.RESUME_RECORDING:
+                    state = RecordState.RECORDING
+                elif action is RecordingAction.RESET_METADATA:
+                    ctx = RecordingContext(
+                        metadata=RecordingMetadata(
+                            game_mode=ctx.metadata.game_mode
+                        )
+                    )
+                    state = RecordState.STOPPED
+                # 実時間の制約がないため、判別結果を待ってから次へ進む
+                await weapon_detection.wait_for_inflight()
+
+                if ctx.phase(state) is SessionPhase.RESULT:
+                    outcome = "completed"
+                    break
+
+                if rescan_until is not None and position >= rescan_until:
+                    rescan_until = None
+                    if ctx.phase(state) is SessionPhase.IN_GAME:
+                        # 終了表示が録画されていない場合は判定画面から続ける
+                        self.logger.warning(
+                            "終了表示を検出できなかったため判定画面から解析を続けます",
+                            position=position,
+                        )
+                        ctx = replace(ctx, finish=True)
+
+                previous_position = position
+                next_position = (
+                    None
+                    if rescan_until is not None
+                    else position + self._step_seconds(ctx, state)
+                )
+            ctx = await handlers.drain_weapon_detection_completed(ctx)
+        finally:
+            handlers.cancel_background_tasks()
+
+        metadata = await self._extract_result(ctx)
+        return OfflineAnalysisResult(
+            metadata=metadata,
+            result_frame=ctx.result_frame,
+            outcome=outcome,
+            frames_analyzed=frames_analyzed,
+            video_seconds=clock.position,
+        )
+
+    @staticmethod
+    def _step_seconds(ctx: RecordingContext, state: RecordState) -> float:
+        phase = ctx.phase(state)
+        if state is RecordState.PAUSED or phase is SessionPhase.POST_FINISH:
+            return OFFLINE_DENSE_STEP_SECONDS
+        if phase is SessionPhase.IN_GAME and not ctx.weapon_detection_done:
+            return SAMPLED_FRAME_INTERVAL_SECONDS
+        return OFFLINE_COARSE_STEP_SECONDS
+
+    async def _extract_result(
+        self, ctx: RecordingContext
+    ) -> RecordingMetadata:
+        """ライブ録画の停止時と同様に結果画面から詳細を抽出する。"""
+        metadata = ctx.metadata
+        if ctx.result_frame is None or metadata.result is not None:
+            return metadata
+        result = await self._analyzer.extract_session_result(
+            ctx.result_frame, metadata.game_mode
+        )
+        if result is not None and isinstance(result, BattleResult):
+            metadata = replace(metadata, result=result)
+        return metadata
+
+
+__all__ = [
+    "OFFLINE_COARSE_STEP_SECONDS",
+    "OFFLINE_DENSE_STEP_SECONDS",
+    "OfflineAnalysisOutcome",
+    "OfflineAnalysisResult",
+    "OfflineRecordingAnalyzer",
+]
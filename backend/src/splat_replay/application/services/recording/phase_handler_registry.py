@@ -15,6 +15,9 @@ from splat_replay.application.interfaces import (
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.ingame_handler import (
     InGamePhaseHandler,
 )
@@ -62,19 +65,32 @@ class PhaseHandlerRegistry:
         weapon_detection_service: WeaponDetectionService,
         clock: ClockPort | None = None,
     ):
+        self._analyzer = analyzer
+        # 検出器の実行頻度は全フェーズで 1 つのスケジュールを共有する
+        self._schedule = DetectionSchedule(clock)
+        self._scheduled_phase: SessionPhase | None = None
         # フェーズハンドラの初期化
-        self._standby = StandbyPhaseHandler(analyzer, logger, event_bus)
+        self._standby = StandbyPhaseHandler(
+            analyzer, logger, event_bus, schedule=self._schedule
+        )
         self._weapon_detection_service = weapon_detection_service
-        self._matching = MatchingPhaseHandler(analyzer, logger, event_bus)
+        self._matching = MatchingPhaseHandler(
+            analyzer, logger, event_bus, schedule=self._schedule
+        )
         self._in_game = InGamePhaseHandler(
             analyzer,
             logger,
             event_bus,
             weapon_detection_service,
             clock=clock,
+            schedule=self._schedule,
+        )
+        self._post_finish = PostFinishPhaseHandler(
+            analyzer, logger, event_bus, schedule=self._schedule
+        )
+        self._result = ResultPhaseHandler(
+            analyzer, logger, event_bus, schedule=self._schedule
         )
-        self._post_finish = PostFinishPhaseHandler(analyzer, logger, event_bus)
-        self._result = ResultPhaseHandler(analyzer, logger, event_bus)
         self._paused = PausedStateHandler(logger, event_bus)
 
         # フェーズ → ハンドラのマッピング
@@ -111,6 +127,22 @@ class PhaseHandlerRegistry:
             # 未知のフェーズ（通常は発生しない）
             return RecordingCommand.none(ctx)
 
+        # フェーズが切り替わったら、新しいフェーズの検出器を間引かずに始める
+        if phase is not self._scheduled_phase:
+            self._schedule.reset()
+            self._scheduled_phase = phase
+
+        # このフレームで実行時刻に達した検出器を確定し、
+        # それらの判定を 1 回のワーカー呼び出しでまとめて評価する
+        self._schedule.begin_frame(handler.detector_rates)
+        keys = [
+            key
+            for key in handler.prefetch_keys_for(ctx)
+            if self._schedule.is_due(key)
+        ]
+        if keys:
+            await self._analyzer.prefetch(frame, keys)
+
         return await handler.handle(frame, ctx, state)
 
     def cancel_background_tasks(self) -> None:
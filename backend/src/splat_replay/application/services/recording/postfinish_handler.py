@@ -6,12 +6,16 @@ Phase 4 Refactoring: Handler を純粋関数化し、副作用ではなく Comma
 from __future__ import annotations
 
 from dataclasses import replace
+from typing import Mapping
 
 from splat_replay.application.interfaces import EventBusPort, LoggerPort
 from splat_replay.application.metadata import recording_metadata_to_dict
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
@@ -20,7 +24,7 @@ from splat_replay.domain.events import (
     RecordingMetadataUpdated,
     RecordingPaused,
 )
-from splat_replay.domain.models import Frame
+from splat_replay.domain.models import Frame, GameMode
 from splat_replay.domain.services import FrameAnalyzer, RecordState
 
 
@@ -34,15 +38,42 @@ class PostFinishPhaseHandler:
     - 検出結果に応じた Command を返す（副作用は UseCase で実行）
     """
 
+    # 1 フレームの中でまとめて先行評価するマッチャーキー
+    prefetch_keys: tuple[str, ...] = (
+        "battle_judgement_latter_half",
+        "loading",
+        "battle_result",
+    )
+    # 検出器ごとの実行頻度 (Hz)
+    detector_rates: Mapping[str, float] = {
+        "battle_judgement_latter_half": 10.0,
+        "loading": 10.0,
+        "battle_result": 10.0,
+    }
+
     def __init__(
         self,
         analyzer: FrameAnalyzer,
         logger: LoggerPort,
         event_bus: EventBusPort,
+        schedule: DetectionSchedule | None = None,
     ):
         self.analyzer = analyzer
         self.logger = logger
         self.event_bus = event_bus
+        self.schedule = schedule or DetectionSchedule()
+
+    def prefetch_keys_for(self, ctx: RecordingContext) -> tuple[str, ...]:
+        """このコンテキストで評価される先行評価キーを返す。
+
+        判定の取得前は判定の検出だけを先行評価する (検出したフレームでは
+        ローディング・結果画面の判定を行わずに戻るため)。
+        """
+        if ctx.metadata.game_mode is not GameMode.BATTLE:
+            return ()
+        if ctx.metadata.judgement is None:
+            return ("battle_judgement_latter_half",)
+        return ("loading", "battle_result")
 
     async def handle(
         self, frame: Frame, ctx: RecordingContext, state: RecordState
@@ -53,6 +84,7 @@ class PostFinishPhaseHandler:
         # バトルジャッジメント検出
         if (
             ctx.metadata.judgement is None
+            and self.schedule.is_due("battle_judgement_latter_half")
             and await self.analyzer.detect_session_judgement(frame, gm)
         ):
             self.logger.info("バトル判定を検出")
@@ -80,7 +112,9 @@ class PostFinishPhaseHandler:
             return RecordingCommand.none(ctx)
 
         # ローディング画面検出
-        if await self.analyzer.detect_loading(frame):
+        if self.schedule.is_due(
+            "loading"
+        ) and await self.analyzer.detect_loading(frame):
             self.logger.info("ローディング画面を検出、一時停止")
             self.event_bus.publish_domain_event(
                 RecordingPaused(
@@ -95,7 +129,9 @@ class PostFinishPhaseHandler:
             )
 
         # 結果画面検出
-        if await self.analyzer.detect_session_result(frame, gm):
+        if self.schedule.is_due(
+            "battle_result"
+        ) and await self.analyzer.detect_session_result(frame, gm):
             self.logger.info("結果画面を検出")
             return RecordingCommand.none(replace(ctx, result_frame=frame))
 
@@ -5,10 +5,15 @@ Phase 4 Refactoring: Handler を純粋関数化し、副作用ではなく Comma
 
 from __future__ import annotations
 
+from typing import Mapping
+
 from splat_replay.application.interfaces import EventBusPort, LoggerPort
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
@@ -28,15 +33,26 @@ class ResultPhaseHandler:
         録画停止を優先し、詳細情報は result_frame から後で抽出される。
     """
 
+    # 判定が 1 つだけなので先行評価は行わない
+    prefetch_keys: tuple[str, ...] = ()
+    # 検出器ごとの実行頻度 (Hz)
+    detector_rates: Mapping[str, float] = {"battle_result": 10.0}
+
     def __init__(
         self,
         analyzer: FrameAnalyzer,
         logger: LoggerPort,
         event_bus: EventBusPort,
+        schedule: DetectionSchedule | None = None,
     ):
         self.analyzer = analyzer
         self.logger = logger
         self.event_bus = event_bus
+        self.schedule = schedule or DetectionSchedule()
+
+    def prefetch_keys_for(self, ctx: RecordingContext) -> tuple[str, ...]:
+        """このコンテキストで評価される先行評価キーを返す。"""
+        return self.prefetch_keys
 
     async def handle(
         self, frame: Frame, ctx: RecordingContext, state: RecordState
@@ -60,6 +76,9 @@ class ResultPhaseHandler:
         if state is RecordState.STOPPED:
             return RecordingCommand.none(ctx)
 
+        if not self.schedule.is_due("battle_result"):
+            return RecordingCommand.none(ctx)
+
         gm = ctx.metadata.game_mode
 
         # 結果画面の継続判定（遷移したら即座に停止）
@@ -6,12 +6,16 @@ Phase 4 Refactoring: Handler を純粋関数化し、副作用ではなく Comma
 from __future__ import annotations
 
 from dataclasses import replace
+from typing import Mapping
 
 from splat_replay.application.interfaces import EventBusPort, LoggerPort
 from splat_replay.application.metadata import recording_metadata_to_dict
 from splat_replay.application.services.recording.commands import (
     RecordingCommand,
 )
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
@@ -33,15 +37,29 @@ class StandbyPhaseHandler:
     - 検出結果に応じた Command を返す（このフェーズは副作用なし）
     """
 
+    # 1 フレームの中でまとめて先行評価するマッチャーキー
+    prefetch_keys: tuple[str, ...] = ("match_select", "matching_start")
+    # 検出器ごとの実行頻度 (Hz)
+    detector_rates: Mapping[str, float] = {
+        "match_select": 5.0,
+        "matching_start": 10.0,
+    }
+
     def __init__(
         self,
         analyzer: FrameAnalyzer,
         logger: LoggerPort,
         event_bus: EventBusPort,
+        schedule: DetectionSchedule | None = None,
     ):
         self.analyzer = analyzer
         self.logger = logger
         self.event_bus = event_bus
+        self.schedule = schedule or DetectionSchedule()
+
+    def prefetch_keys_for(self, ctx: RecordingContext) -> tuple[str, ...]:
+        """このコンテキストで評価される先行評価キーを返す。"""
+        return self.prefetch_keys
 
     async def handle(
         self, frame: Frame, ctx: RecordingContext, state: RecordState
@@ -54,7 +72,9 @@ class StandbyPhaseHandler:
         md = ctx.metadata
 
         # ゲームモード・レート検出
-        if await self.analyzer.detect_match_select(frame):
+        if self.schedule.is_due(
+            "match_select"
+        ) and await self.analyzer.detect_match_select(frame):
             updated = False
             updates = {}
 
@@ -84,7 +104,9 @@ class StandbyPhaseHandler:
                 )
 
         # マッチング開始検出
-        if await self.analyzer.detect_matching_start(frame):
+        if self.schedule.is_due(
+            "matching_start"
+        ) and await self.analyzer.detect_matching_start(frame):
             import datetime
 
             self.logger.info("マッチング開始を検出")
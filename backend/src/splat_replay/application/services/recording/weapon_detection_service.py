@@ -20,6 +20,9 @@ from splat_replay.application.interfaces import (
     WeaponSlotResult,
 )
 from splat_replay.application.metadata import recording_metadata_to_dict
+from splat_replay.application.services.recording.frame_ring_buffer import (
+    FrameRingBuffer,
+)
 from splat_replay.application.services.recording.recording_context import (
     RecordingContext,
 )
@@ -118,8 +121,10 @@ class WeaponDetectionService:
         event_bus: EventBusPort,
         detection_window_seconds: float = DETECTION_WINDOW_SECONDS,
         clock: ClockPort | None = None,
+        frame_ring: FrameRingBuffer | None = None,
     ) -> None:
         self._recognizer = recognizer
+        self._frame_ring = frame_ring
         self._logger = logger
         self._event_bus = event_bus
         self._detection_window_seconds = detection_window_seconds
@@ -189,7 +194,7 @@ class WeaponDetectionService:
                 elapsed_seconds=elapsed,
                 now=now,
             )
-            self._pending_frame = frame.copy()
+            self._pending_frame = self._retain_frame(frame)
             self._pending_elapsed_seconds = elapsed
             if self._inflight_task is not None:
                 self._sample_frame_if_needed(
@@ -235,6 +240,13 @@ class WeaponDetectionService:
         self._cleanup_report_output_task()
         return await self._drain_completed_task(context)
 
+    async def wait_for_inflight(self) -> None:
+        """実行中のブキ判別タスクの完了を待つ (結果は次回の処理で反映する)。"""
+        inflight = self._inflight_task
+        if inflight is None or inflight.done():
+            return
+        await asyncio.wait({inflight})
+
     async def finalize_for_finish(
         self,
         *,
@@ -438,6 +450,7 @@ class WeaponDetectionService:
             < FALLBACK_FRAME_INTERVAL_SECONDS
         ):
             return
+        # 最大 40 秒分を保持するため、リングバッファのスロットは占有しない
         self._fallback_frames.append(
             _QueuedFrame(frame=frame.copy(), elapsed_seconds=elapsed_seconds)
         )
@@ -456,7 +469,10 @@ class WeaponDetectionService:
         ):
             return
         self._sampled_frames.append(
-            _QueuedFrame(frame=frame.copy(), elapsed_seconds=elapsed_seconds)
+            _QueuedFrame(
+                frame=self._retain_frame(frame),
+                elapsed_seconds=elapsed_seconds,
+            )
         )
         self._last_sampled_at = now
 
@@ -487,7 +503,16 @@ class WeaponDetectionService:
         return self._pending_frame is not None or bool(self._sampled_frames)
 
     def _remember_visible_candidate(self, frame: Frame) -> None:
-        self._visible_candidates.append(frame.copy())
+        self._visible_candidates.append(self._retain_frame(frame))
+
+    def _retain_frame(self, frame: Frame) -> Frame:
+        """バッファに保持するフレームを返す。
+
+        リングバッファのフレームは空きに余裕があればコピーせずにピン留めする。
+        """
+        if self._frame_ring is None:
+            return frame.copy()
+        return self._frame_ring.pin(frame)
 
     async def _drain_completed_task(
         self,
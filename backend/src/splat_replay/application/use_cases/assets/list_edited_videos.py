@@ -6,9 +6,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from splat_replay.application.dto import EditedVideoDTO
+from splat_replay.application.interfaces.data import AssetPage
 
 if TYPE_CHECKING:
     from splat_replay.application.interfaces import (
+        AssetListQuery,
         LoggerPort,
         VideoAssetRepositoryPort,
         VideoEditorPort,
@@ -41,9 +43,27 @@ class ListEditedVideosUseCase:
         Returns:
             EditedVideoDTO のリスト
         """
+        return await self._to_dtos(self._repository.list_edited())
 
-        videos = self._repository.list_edited()
+    async def execute_page(
+        self, query: AssetListQuery
+    ) -> AssetPage[EditedVideoDTO]:
+        """絞り込み・並び替えた編集済みビデオを 1 ページ分取得。
 
+        Args:
+            query: 絞り込み・並び順・ページの指定
+
+        Returns:
+            このページの EditedVideoDTO と全件数、次のページのカーソル
+        """
+        page = self._repository.query_edited(query)
+        return AssetPage(
+            items=await self._to_dtos(page.items),
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
+    async def _to_dtos(self, videos: list[Path]) -> list[EditedVideoDTO]:
         items: list[EditedVideoDTO] = []
         for video_path in videos:
             # base_dir からの相対パスに変換（edited/xxx.mkv）
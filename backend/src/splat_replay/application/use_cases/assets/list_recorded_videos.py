@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from splat_replay.application.dto import RecordedVideoDTO
+from splat_replay.application.interfaces.data import AssetPage
 from splat_replay.application.services.common.recorded_video_mapper import (
     build_recorded_video_dto,
 )
-from splat_replay.domain.models import RecordingMetadata
+from splat_replay.domain.models import RecordingMetadata, VideoAsset
 
 if TYPE_CHECKING:
     from splat_replay.application.interfaces import (
+        AssetListQuery,
         LoggerPort,
         VideoAssetRepositoryPort,
         VideoEditorPort,
     )
 
+# 一覧作成時に同時に問い合わせる動画の数
+DTO_BUILD_CONCURRENCY = 8
+
 
 class ListRecordedVideosUseCase:
     """録画済みビデオ一覧を取得するユースケース。
@@ -45,10 +51,30 @@ class ListRecordedVideosUseCase:
         Returns:
             RecordedVideoDTO のリスト
         """
+        return await self._to_dtos(self._repository.list_recordings())
+
+    async def execute_page(
+        self, query: AssetListQuery
+    ) -> AssetPage[RecordedVideoDTO]:
+        """絞り込み・並び替えた録画済みビデオを 1 ページ分取得。
 
-        assets = self._repository.list_recordings()
+        Args:
+            query: 絞り込み・並び順・ページの指定
+
+        Returns:
+            このページの RecordedVideoDTO と全件数、次のページのカーソル
+        """
+        page = self._repository.query_recordings(query)
+        return AssetPage(
+            items=await self._to_dtos(page.items),
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
 
-        items: list[RecordedVideoDTO] = []
+    async def _to_dtos(
+        self, assets: list[VideoAsset]
+    ) -> list[RecordedVideoDTO]:
+        recorded: list[tuple[VideoAsset, RecordingMetadata]] = []
         for asset in assets:
             # メタデータが無い場合はスキップ
             if asset.metadata is None:
@@ -62,9 +88,16 @@ class ListRecordedVideosUseCase:
             assert isinstance(metadata, RecordingMetadata), (
                 "metadata は RecordingMetadata 型である必要があります"
             )
+            recorded.append((asset, metadata))
+
+        # 動画の長さの取得 (キャッシュに無い動画は ffprobe) を並行させる
+        semaphore = asyncio.Semaphore(DTO_BUILD_CONCURRENCY)
 
-            items.append(
-                await build_recorded_video_dto(
+        async def build(
+            asset: VideoAsset, metadata: RecordingMetadata
+        ) -> RecordedVideoDTO:
+            async with semaphore:
+                return await build_recorded_video_dto(
                     video_path=asset.video,
                     metadata=metadata,
                     base_dir=self._base_dir,
@@ -72,6 +105,9 @@ class ListRecordedVideosUseCase:
                     video_editor=self._video_editor,
                     logger=self._logger,
                 )
-            )
 
-        return items
+        return list(
+            await asyncio.gather(
+                *(build(asset, metadata) for asset, metadata in recorded)
+            )
+        )
@@ -1,19 +1,24 @@
-"""CLI composition root."""
+"""CLI composition root.
+
+Only typer and the CLI definitions are imported at module load so that
+``--help`` stays fast; each resource imports what it needs on first use.
+"""
 
 from __future__ import annotations
 
-import punq
-from fastapi import FastAPI
-from structlog.stdlib import BoundLogger
 from typing import TYPE_CHECKING
 
-from splat_replay.application.use_cases import AutoUseCase, UploadUseCase
-from splat_replay.infrastructure.config import load_settings_from_toml
-from splat_replay.infrastructure.di import configure_container, resolve
-from splat_replay.infrastructure.filesystem import PROJECT_ROOT
 from splat_replay.interface.cli.main import CliDependencies, build_app
 
 if TYPE_CHECKING:
+    import punq
+    from fastapi import FastAPI
+    from structlog.stdlib import BoundLogger
+
+    from splat_replay.application.use_cases import AutoUseCase, UploadUseCase
+    from splat_replay.infrastructure.adapters.reanalysis import (
+        BatchRecordingReanalyzer,
+    )
     from splat_replay.interface.gui.webview_app import SplatReplayWebViewApp
 
 
@@ -27,21 +32,33 @@ class _LazyResources:
 
     def container(self) -> punq.Container:
         if self._container is None:
+            from splat_replay.infrastructure.di import configure_container
+
             self._container = configure_container()
         return self._container
 
     def logger(self) -> BoundLogger:
         if self._logger is None:
+            from structlog.stdlib import BoundLogger
+
+            from splat_replay.infrastructure.di import resolve
+
             self._logger = resolve(self.container(), BoundLogger)
         return self._logger
 
     def auto_use_case(self) -> AutoUseCase:
         if self._auto_use_case is None:
+            from splat_replay.application.use_cases import AutoUseCase
+            from splat_replay.infrastructure.di import resolve
+
             self._auto_use_case = resolve(self.container(), AutoUseCase)
         return self._auto_use_case
 
     def upload_use_case(self) -> UploadUseCase:
         if self._upload_use_case is None:
+            from splat_replay.application.use_cases import UploadUseCase
+            from splat_replay.infrastructure.di import resolve
+
             self._upload_use_case = resolve(self.container(), UploadUseCase)
         return self._upload_use_case
 
@@ -55,6 +72,8 @@ class _LazyResources:
         return self._web_app
 
     def webview_app(self) -> "SplatReplayWebViewApp":
+        from splat_replay.infrastructure.config import load_settings_from_toml
+        from splat_replay.infrastructure.filesystem import PROJECT_ROOT
         from splat_replay.interface.gui.webview_app import (
             SplatReplayWebViewApp,
             resolve_backend_hosts,
@@ -73,7 +92,22 @@ class _LazyResources:
             backend_url_host=backend_url_host,
         )
 
+    def recording_reanalyzer(self) -> "BatchRecordingReanalyzer":
+        # 録画・GUI 用のコンテナは起動せず、解析に必要なものだけを使う
+        from splat_replay.infrastructure.adapters.reanalysis import (
+            BatchRecordingReanalyzer,
+        )
+        from splat_replay.infrastructure.config import load_settings_from_toml
+        from splat_replay.infrastructure.logging import get_logger
+
+        return BatchRecordingReanalyzer(
+            settings=load_settings_from_toml().storage,
+            logger=get_logger(),
+        )
+
     def remote_access_enabled(self) -> bool:
+        from splat_replay.infrastructure.config import load_settings_from_toml
+
         return load_settings_from_toml().remote_access.enabled
 
     def start_dev_server(self) -> None:
@@ -92,6 +126,7 @@ dependencies = CliDependencies(
     webview_app=_resources.webview_app,
     start_dev_server=_resources.start_dev_server,
     remote_access_enabled=_resources.remote_access_enabled,
+    recording_reanalyzer=_resources.recording_reanalyzer,
 )
 
 app = build_app(dependencies)
@@ -13,6 +13,12 @@ from splat_replay.infrastructure.adapters import (
 from splat_replay.infrastructure.adapters.audio import (
     _LAZY_EXPORTS as AUDIO_LAZY_EXPORTS,
 )
+from splat_replay.infrastructure.adapters.upload import (
+    _LAZY_EXPORTS as UPLOAD_LAZY_EXPORTS,
+)
+from splat_replay.infrastructure.adapters.weapon_detection import (
+    _LAZY_EXPORTS as WEAPON_DETECTION_LAZY_EXPORTS,
+)
 
 _LAZY_EXPORT_PACKAGES: tuple[
     tuple[str, Mapping[str, tuple[str, str]]], ...
@@ -20,6 +26,11 @@ _LAZY_EXPORT_PACKAGES: tuple[
     ("splat_replay.infrastructure", INFRASTRUCTURE_LAZY_EXPORTS),
     ("splat_replay.infrastructure.adapters", ADAPTERS_LAZY_EXPORTS),
     ("splat_replay.infrastructure.adapters.audio", AUDIO_LAZY_EXPORTS),
+    ("splat_replay.infrastructure.adapters.upload", UPLOAD_LAZY_EXPORTS),
+    (
+        "splat_replay.infrastructure.adapters.weapon_detection",
+        WEAPON_DETECTION_LAZY_EXPORTS,
+    ),
 )
 
 
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any, AsyncGenerator, Dict, Literal
+import asyncio
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Literal,
+    cast,
+)
 
 import punq
 from fastapi import FastAPI
-from splat_replay.application.interfaces import EventBusPort
+from splat_replay.application.interfaces import (
+    EventBusPort,
+    LoggerPort,
+    WeaponRecognitionPort,
+)
 from splat_replay.application.services import (
     AutoRecorder,
     DeviceChecker,
@@ -17,6 +30,9 @@ from splat_replay.application.services import (
     SystemCheckService,
     SystemSetupService,
 )
+from splat_replay.application.services.common.progress import (
+    ProgressReporter,
+)
 from splat_replay.application.services.common.settings_service import (
     SettingsService,
 )
@@ -44,14 +60,25 @@ from splat_replay.application.use_cases.metadata import (
     UpdateRecordedSubtitleStructuredUseCase,
 )
 from splat_replay.domain.config import AppSettings
+from splat_replay.domain.ports import ImageMatcherPort
 from splat_replay.infrastructure.adapters.system.gui_runtime_port_adapter import (
     GuiRuntimePortAdapter,
 )
-from splat_replay.infrastructure.di import configure_container, resolve
+from splat_replay.infrastructure.di import (
+    configure_container,
+    reload_image_matching,
+    resolve,
+)
 from splat_replay.infrastructure.filesystem import (
     ASSETS_DIR,
     PROJECT_ROOT,
     RUNTIME_ROOT,
+    paths,
+)
+from splat_replay.infrastructure.runtime.startup import (
+    StartupProfile,
+    WarmUpTarget,
+    warm_up_components,
 )
 from splat_replay.infrastructure.test_input import (
     resolve_configured_test_video,
@@ -61,8 +88,86 @@ from splat_replay.interface.web.server import WebAPIServer
 from structlog.stdlib import BoundLogger
 
 
+def build_warm_up(container: punq.Container) -> Callable[[], Awaitable[None]]:
+    """Build the background warm-up run once the web server is up.
+
+    Heavy adapters are registered as lazy wrappers; this constructs them
+    ahead of first use and reports the startup-time breakdown.
+    """
+    profile = resolve(container, StartupProfile)
+    logger = resolve(container, LoggerPort)
+    candidates: list[tuple[str, object]] = [
+        ("画像マッチャー", resolve(container, ImageMatcherPort)),
+        ("ブキ判別", resolve(container, WeaponRecognitionPort)),
+    ]
+    targets = [
+        (label, cast(WarmUpTarget, component))
+        for label, component in candidates
+        if hasattr(component, "warm_up")
+    ]
+
+    async def warm_up() -> None:
+        profile.report(logger, "Web API の起動が完了しました")
+        await warm_up_components(
+            targets, resolve(container, ProgressReporter), profile, logger
+        )
+
+    return warm_up
+
+
+IMAGE_MATCHING_WATCH_INTERVAL_SEC = 2.0
+
+
+def build_image_matching_watch(
+    container: punq.Container,
+    interval: float = IMAGE_MATCHING_WATCH_INTERVAL_SEC,
+) -> Callable[[], Awaitable[None]]:
+    """Build the background loop that reloads image_matching.yaml on change.
+
+    The file is polled by modification time and size. A reload that fails
+    keeps the previous matchers and is retried on the next change.
+    """
+    path = paths.IMAGE_MATCHING_FILE
+    logger = resolve(container, LoggerPort)
+
+    def signature() -> tuple[int, int] | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    async def watch() -> None:
+        last = signature()
+        while True:
+            await asyncio.sleep(interval)
+            current = signature()
+            if current is None or current == last:
+                continue
+            last = current
+            try:
+                await asyncio.to_thread(reload_image_matching, container, path)
+            except Exception as exc:
+                logger.warning(
+                    "画像マッチング設定の再読み込みに失敗しました",
+                    path=str(path),
+                    error=str(exc),
+                )
+            else:
+                logger.info(
+                    "画像マッチング設定を再読み込みしました", path=str(path)
+                )
+
+    return watch
+
+
 def build_web_api_server(container: punq.Container) -> WebAPIServer:
     """Resolve dependencies and assemble WebAPIServer."""
+    with resolve(container, StartupProfile).stage("web_api_server"):
+        return _build_web_api_server(container)
+
+
+def _build_web_api_server(container: punq.Container) -> WebAPIServer:
     auto_recorder = resolve(container, AutoRecorder)
     auto_process_service = resolve(container, AutoProcessService)
     progress_store = resolve(container, ProgressEventStore)
@@ -234,6 +339,10 @@ def build_web_api_server(container: punq.Container) -> WebAPIServer:
         list_battle_history_uc=list_battle_history_uc,
         # Speech test
         speech_test_fn=speech_test_fn,
+        # Startup warm-up
+        warm_up_fn=build_warm_up(container),
+        # Config watch
+        image_matching_watch_fn=build_image_matching_watch(container),
     )
 
 
@@ -258,4 +367,10 @@ def create_app(
 # Expose a factory for uvicorn's --factory mode.
 app = create_app
 
-__all__ = ["app", "create_app", "build_web_api_server"]
+__all__ = [
+    "app",
+    "create_app",
+    "build_image_matching_watch",
+    "build_warm_up",
+    "build_web_api_server",
+]
@@ -4,10 +4,12 @@ from splat_replay.domain.config.app import SECTION_CLASSES, AppSettings
 from splat_replay.domain.config.behavior import BehaviorSettings
 from splat_replay.domain.config.capture_device import CaptureDeviceSettings
 from splat_replay.domain.config.image_matching import (
+    ChangeGateConfig,
     CompositeMatcherConfig,
     ImageMatchingSettings,
     MatcherConfig,
     MatchExpression,
+    WeaponRecognitionConfig,
 )
 from splat_replay.domain.config.obs import OBSSettings
 from splat_replay.domain.config.record import RecordSettings
@@ -25,6 +27,7 @@ __all__ = [
     "AppSettings",
     "BehaviorSettings",
     "CaptureDeviceSettings",
+    "ChangeGateConfig",
     "CompositeMatcherConfig",
     "ImageMatchingSettings",
     "MatchExpression",
@@ -36,5 +39,6 @@ __all__ = [
     "UploadSettings",
     "VideoEditSettings",
     "VideoStorageSettings",
+    "WeaponRecognitionConfig",
     "WebViewSettings",
 ]
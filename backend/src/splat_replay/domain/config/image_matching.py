@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 from pathlib import Path
 from typing import (
     Awaitable,
@@ -48,7 +47,11 @@ class MatchExpression(BaseModel):
         return value
 
     async def evaluate(self, fn: Callable[[str], Awaitable[bool]]) -> bool:
-        """Evaluate the expression using the provided matcher callback."""
+        """Evaluate the expression using the provided matcher callback.
+
+        Children of ``and`` / ``or`` are evaluated in order and evaluation
+        stops as soon as the result is decided.
+        """
         if self.matcher is not None:
             return await fn(self.matcher)
 
@@ -56,16 +59,16 @@ class MatchExpression(BaseModel):
             return not await self.not_.evaluate(fn)
 
         if self.and_ is not None:
-            results = await asyncio.gather(
-                *(expr.evaluate(fn) for expr in self.and_)
-            )
-            return all(results)
+            for expr in self.and_:
+                if not await expr.evaluate(fn):
+                    return False
+            return True
 
         if self.or_ is not None:
-            results = await asyncio.gather(
-                *(expr.evaluate(fn) for expr in self.or_)
-            )
-            return any(results)
+            for expr in self.or_:
+                if await expr.evaluate(fn):
+                    return True
+            return False
 
         return False
 
@@ -106,20 +109,43 @@ class CompositeMatcherConfig(BaseModel):
     rule: MatchExpression
 
 
+class ChangeGateConfig(BaseModel):
+    """Reuse of matcher verdicts while their ROI stays unchanged."""
+
+    enabled: bool = True
+    # Largest per-cell absolute difference (0-255) of the ROI fingerprint
+    # below which the ROI is treated as unchanged.
+    tolerance: float = 0.0
+    # Minimum number of fingerprint cells along the shorter side of the ROI.
+    samples: int = 64
+
+
+class WeaponRecognitionConfig(BaseModel):
+    """Execution backend of weapon recognition."""
+
+    # Number of worker processes that recognize slots in parallel.
+    # 0 recognizes the slots sequentially in the calling process.
+    workers: int = 0
+
+
 class ImageMatchingSettings(BaseModel):
     """Repository of matcher definitions."""
 
     matchers: Dict[str, MatcherConfig] = {}
     composites: Dict[str, CompositeMatcherConfig] = {}
     matcher_groups: Dict[str, List[str]] = {}
+    change_gate: ChangeGateConfig = ChangeGateConfig()
+    weapon_recognition: WeaponRecognitionConfig = WeaponRecognitionConfig()
 
     @classmethod
     def load_from_yaml(cls, path: Path) -> "ImageMatchingSettings":
         """Load configuration from YAML."""
         import yaml
 
+        # libyaml があれば C 実装のローダーを使う (純 Python 版の数倍速い)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with path.open("rb") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=loader) or {}  # noqa: S506
 
         if not isinstance(data, dict):
             raise ValueError("image matching config must be a mapping")
@@ -160,10 +186,20 @@ class ImageMatchingSettings(BaseModel):
                 raise ValueError("matcher_groups values must be iterable")
             groups[name] = [str(key) for key in keys]
 
+        gate_raw = raw.get("change_gate", {}) or {}
+        if not isinstance(gate_raw, dict):
+            raise ValueError("change_gate must be a mapping")
+
+        weapon_raw = raw.get("weapon_recognition", {}) or {}
+        if not isinstance(weapon_raw, dict):
+            raise ValueError("weapon_recognition must be a mapping")
+
         return cls(
             matchers=matchers,
             composites=composites,
             matcher_groups=groups,
+            change_gate=ChangeGateConfig.parse_obj(gate_raw),
+            weapon_recognition=WeaponRecognitionConfig.parse_obj(weapon_raw),
         )
 
     class Config:
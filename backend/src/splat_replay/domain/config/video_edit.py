@@ -74,6 +74,13 @@ class SubtitleSpeechSettings(BaseModel):
         description="動画に追加する音声トラックのタイトル",
         recommended=False,
     )
+    max_concurrent_requests: int = Field(
+        default=4,
+        ge=1,
+        title="同時リクエスト数",
+        description="読み上げ音声を並行して生成するリクエスト数の上限",
+        recommended=False,
+    )
 
 
 class VideoEditSettings(BaseModel):
@@ -85,6 +92,13 @@ class VideoEditSettings(BaseModel):
         description="動画の音量を調整する倍率",
         recommended=False,
     )
+    max_parallel_groups: int = Field(
+        default=2,
+        ge=1,
+        title="同時に編集するグループ数",
+        description="複数のグループを並行して編集する上限。CPU やディスクに余裕がない場合は 1 にします",
+        recommended=False,
+    )
     title_template: str = Field(
         default="{BATTLE}({RATE}) {RULE} {WIN}勝{LOSE}敗 {DAY:'%y.%m.%d} {SCHEDULE:%H}時～",
         title="タイトルテンプレート",
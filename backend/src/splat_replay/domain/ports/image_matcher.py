@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Mapping, Protocol, Sequence
 
 from splat_replay.domain.models import Frame
 
@@ -12,4 +12,8 @@ class ImageMatcherPort(Protocol):
 
     async def match(self, key: str, image: Frame) -> bool: ...
 
+    async def match_many(
+        self, keys: Sequence[str], image: Frame
+    ) -> Mapping[str, bool]: ...
+
     async def matched_name(self, group: str, image: Frame) -> str | None: ...
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Sequence
 
 from splat_replay.domain.models import (
     Frame,
@@ -34,6 +34,14 @@ class FrameAnalyzer:
         }
         self.matcher = matcher
 
+    async def prefetch(self, frame: Frame, keys: Sequence[str]) -> None:
+        """同じフレームで使う判定をまとめて先行評価する。
+
+        結果はマッチャー側に保持され、続く ``detect_*`` 呼び出しで再利用される。
+        """
+        if keys:
+            await self.matcher.match_many(keys, frame)
+
     async def detect_power_off(self, frame: Frame) -> bool:
         """Switch の電源 OFF を検出する。"""
         return await self.matcher.match("power_off", frame)
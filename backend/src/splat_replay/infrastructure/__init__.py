@@ -11,6 +11,7 @@ __all__ = [
     "filesystem",
     "logging",
     "MatcherRegistry",
+    "LazyMatcherRegistry",
     "AdaptiveCapture",
     "AdaptiveCaptureDeviceChecker",
     "AdaptiveVideoRecorder",
@@ -48,6 +49,7 @@ __all__ = [
     "ReplayRecorderController",
     "VideoFileCapture",
     "WeaponRecognitionAdapter",
+    "LazyWeaponRecognitionAdapter",
 ]
 
 _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
@@ -117,6 +119,11 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
         ".adapters.audio.integrated_speech_recognition",
         "IntegratedSpeechRecognizer",
     ),
+    "LazyMatcherRegistry": (".matchers", "LazyMatcherRegistry"),
+    "LazyWeaponRecognitionAdapter": (
+        ".adapters.weapon_detection",
+        "LazyWeaponRecognitionAdapter",
+    ),
     "LocalFileSystemAdapter": (
         ".adapters.system.cross_cutting",
         "LocalFileSystemAdapter",
@@ -9,6 +9,7 @@ __all__ = [
     "AdaptiveCapture",
     "AdaptiveCaptureDeviceChecker",
     "AdaptiveVideoRecorder",
+    "BatchRecordingReanalyzer",
     "CaptureDeviceChecker",
     "CaptureDeviceEnumerator",
     "NDICapture",
@@ -58,6 +59,10 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
         ".medal_detection",
         "BattleMedalRecognizerAdapter",
     ),
+    "BatchRecordingReanalyzer": (
+        ".reanalysis.batch_reanalyzer",
+        "BatchRecordingReanalyzer",
+    ),
     "Capture": (".capture.capture", "Capture"),
     "CaptureDeviceChecker": (
         ".capture.capture_device_checker",
@@ -6,6 +6,7 @@ from importlib import import_module
 from typing import Any
 
 __all__ = [
+    "CachedTextToSpeech",
     "IntegratedSpeechRecognizer",
     "MicrophoneEnumerator",
     "SpeechTranscriber",
@@ -13,6 +14,10 @@ __all__ = [
 ]
 
 _LAZY_EXPORTS = {
+    "CachedTextToSpeech": (
+        ".cached_text_to_speech",
+        "CachedTextToSpeech",
+    ),
     "IntegratedSpeechRecognizer": (
         ".integrated_speech_recognition",
         "IntegratedSpeechRecognizer",
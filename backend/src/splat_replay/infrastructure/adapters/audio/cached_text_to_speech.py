@@ -0,0 +1,186 @@
+"""読み上げ音声のキャッシュ付きアダプタ."""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+
+from structlog.stdlib import BoundLogger
+
+from splat_replay.application.interfaces import (
+    SpeechSynthesisRequest,
+    SpeechSynthesisResult,
+    TextToSpeechPort,
+)
+
+# キャッシュファイルの形式を変えたら更新する
+SPEECH_CACHE_VERSION = 1
+
+# キャッシュファイル先頭のサンプルレート (little-endian uint32)
+_HEADER = struct.Struct("<I")
+
+# キャッシュフォルダの合計サイズの上限
+_MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+# 上限を超えたら、毎回消さずに済むよう上限の 3/4 まで減らす
+_TRIM_RATIO = 0.75
+
+
+def speech_cache_key(request: SpeechSynthesisRequest, identity: str) -> str:
+    """読み上げ結果を左右するリクエスト内容と読み上げ元から求めたキー.
+
+    Args:
+        request: 読み上げリクエスト
+        identity: 読み上げサービスや認証情報・モデルを表す文字列
+    """
+    payload = json.dumps(
+        {
+            "version": SPEECH_CACHE_VERSION,
+            "identity": identity,
+            **dataclasses.asdict(request),
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CachedTextToSpeech(TextToSpeechPort):
+    """合成結果をリクエスト内容のハッシュで保存して再利用する読み上げアダプタ.
+
+    試合をまたいで繰り返される字幕や、同じ録画の再編集では
+    読み上げサービスを呼び出さずにキャッシュから返す。フォルダの合計が
+    ``max_bytes`` を超えたら、最後に使われたのが古いものから消す。
+
+    Args:
+        inner: 実際に合成する読み上げアダプタ
+        cache_dir: キャッシュフォルダ
+        logger: ロガー
+        identity: 読み上げ元を表す文字列。読み上げサービスや認証情報を
+            切り替えたときに別のキャッシュを使うため、キーに含める。
+            省略時は ``inner`` のクラス名
+        max_bytes: キャッシュフォルダの合計サイズの上限
+    """
+
+    def __init__(
+        self,
+        inner: TextToSpeechPort,
+        cache_dir: Path,
+        logger: BoundLogger,
+        *,
+        identity: str | None = None,
+        max_bytes: int = _MAX_CACHE_BYTES,
+    ) -> None:
+        self._inner = inner
+        self._cache_dir = cache_dir
+        self._logger = logger
+        self._identity = identity or (
+            f"{type(inner).__module__}.{type(inner).__qualname__}"
+        )
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # キャッシュフォルダの合計サイズ (初回の保存時にフォルダを数える)
+        self._cache_bytes: int | None = None
+
+    def synthesize(
+        self, request: SpeechSynthesisRequest
+    ) -> SpeechSynthesisResult:
+        key = speech_cache_key(request, self._identity)
+        path = self._cache_dir / f"{key}.bin"
+        cached = self._load(path)
+        if cached is not None:
+            return cached
+
+        result = self._inner.synthesize(request)
+        try:
+            self._store(path, result)
+            self._trim(path.stat().st_size)
+        except OSError as exc:
+            # キャッシュできなくても合成結果はそのまま使う
+            self._logger.warning(
+                "読み上げ音声をキャッシュできませんでした",
+                path=str(path),
+                error=str(exc),
+            )
+        return result
+
+    def _load(self, path: Path) -> SpeechSynthesisResult | None:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if len(data) < _HEADER.size:
+            return None
+        # 使われた時刻を更新時刻で表し、消す順番に使う
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        (sample_rate_hz,) = _HEADER.unpack_from(data)
+        return SpeechSynthesisResult(
+            audio=data[_HEADER.size :], sample_rate_hz=sample_rate_hz
+        )
+
+    def _store(self, path: Path, result: SpeechSynthesisResult) -> None:
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # 同じ字幕を並行して合成した場合も壊れたファイルを残さない
+        with tempfile.NamedTemporaryFile(
+            dir=self._cache_dir, suffix=".tmp", delete=False
+        ) as handle:
+            temp_path = Path(handle.name)
+            try:
+                handle.write(_HEADER.pack(result.sample_rate_hz))
+                handle.write(result.audio)
+            except OSError:
+                handle.close()
+                temp_path.unlink(missing_ok=True)
+                raise
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def _trim(self, added_bytes: int) -> None:
+        """合計サイズが上限を超えていれば古いものから消す."""
+        with self._lock:
+            if self._cache_bytes is None:
+                self._cache_bytes = sum(size for _, _, size in self._scan())
+            else:
+                self._cache_bytes += added_bytes
+            if self._cache_bytes <= self._max_bytes:
+                return
+            entries = sorted(self._scan())
+            total = sum(size for _, _, size in entries)
+            removed = 0
+            for _, entry, size in entries:
+                if total <= self._max_bytes * _TRIM_RATIO:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            self._cache_bytes = total
+        self._logger.debug(
+            "読み上げ音声のキャッシュを整理しました",
+            removed=removed,
+            size_bytes=total,
+        )
+
+    def _scan(self) -> list[tuple[int, Path, int]]:
+        """キャッシュファイルごとの (更新時刻, パス, サイズ)."""
+        entries: list[tuple[int, Path, int]] = []
+        for entry in self._cache_dir.glob("*.bin"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, entry, stat.st_size))
+        return entries
+
+
+__all__ = ["CachedTextToSpeech", "speech_cache_key"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 
 import httpx
 from structlog.stdlib import BoundLogger
@@ -36,6 +37,12 @@ class GoogleTextToSpeech(TextToSpeechPort):
         self._logger = logger
         self._timeout = 30.0
 
+    @property
+    def cache_identity(self) -> str:
+        """合成結果を左右する読み上げ元 (API キーはハッシュにして含める)."""
+        key_hash = hashlib.sha256(self._api_key.encode("utf-8")).hexdigest()
+        return f"google:{self._model or ''}:{key_hash[:16]}"
+
     def synthesize(
         self, request: SpeechSynthesisRequest
     ) -> SpeechSynthesisResult:
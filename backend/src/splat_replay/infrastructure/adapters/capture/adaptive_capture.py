@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from structlog.stdlib import BoundLogger
 
-from splat_replay.application.interfaces import CapturePort
+from splat_replay.application.interfaces import BufferedCapturePort
+from splat_replay.domain.models import Frame
 from splat_replay.infrastructure.adapters.capture.ndi_capture import NDICapture
 from splat_replay.infrastructure.adapters.capture.video_file_capture import (
     VideoFileCapture,
@@ -12,17 +13,17 @@ from splat_replay.infrastructure.test_input import (
 )
 
 
-class AdaptiveCapture(CapturePort):
+class AdaptiveCapture(BufferedCapturePort):
     """設定に応じて NDI と動画ファイル入力を切り替える。"""
 
     def __init__(self, logger: BoundLogger) -> None:
         self._logger = logger
         self._live_capture = NDICapture(logger)
         self._video_capture: VideoFileCapture | None = None
-        self._active_capture: CapturePort | None = None
+        self._active_capture: BufferedCapturePort | None = None
         self._active_key: str | None = None
 
-    def _resolve_capture(self) -> tuple[str, CapturePort]:
+    def _resolve_capture(self) -> tuple[str, BufferedCapturePort]:
         resolved = resolve_configured_test_video()
         if resolved is None:
             return "live_capture", self._live_capture
@@ -37,7 +38,7 @@ class AdaptiveCapture(CapturePort):
             )
         return key, self._video_capture
 
-    def _switch_capture(self, *, setup: bool) -> CapturePort:
+    def _switch_capture(self, *, setup: bool) -> BufferedCapturePort:
         key, capture = self._resolve_capture()
         if key != self._active_key or capture is not self._active_capture:
             if self._active_capture is not None:
@@ -58,6 +59,10 @@ class AdaptiveCapture(CapturePort):
         capture = self._switch_capture(setup=False)
         return capture.capture()
 
+    def capture_into(self, out: Frame | None) -> Frame | None:
+        capture = self._switch_capture(setup=False)
+        return capture.capture_into(out)
+
     def current_time_seconds(self) -> float | None:
         if self._active_capture is None:
             return None
@@ -3,7 +3,7 @@ from typing import List, Optional
 import cv2
 from structlog.stdlib import BoundLogger
 
-from splat_replay.application.interfaces import CapturePort
+from splat_replay.application.interfaces import BufferedCapturePort
 from splat_replay.domain.config import RecordSettings
 from splat_replay.domain.models import Frame, as_frame
 
@@ -19,7 +19,7 @@ def _list_capture_devices_via_dshow() -> List[str]:
     return graph.get_input_devices()
 
 
-class Capture(CapturePort):
+class Capture(BufferedCapturePort):
     @staticmethod
     def list_capture_devices() -> List[str]:
         """DirectShowのビデオ入力デバイス名一覧を取得"""
@@ -65,10 +65,16 @@ class Capture(CapturePort):
         self.video_capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
 
     def capture(self) -> Optional[Frame]:
+        return self.capture_into(None)
+
+    def capture_into(self, out: Optional[Frame]) -> Optional[Frame]:
         if self.video_capture is None:
             raise RuntimeError("キャプチャデバイスが初期化されていません")
 
-        success, frame = self.video_capture.read()
+        if out is None:
+            success, frame = self.video_capture.read()
+        else:
+            success, frame = self.video_capture.read(out)
         if not success:
             self.logger.warning("Frame capture failed")
             return None
@@ -7,11 +7,11 @@ from cyndilib.video_frame import VideoFrameSync
 from cyndilib.wrapper.ndi_recv import RecvBandwidth, RecvColorFormat
 from structlog.stdlib import BoundLogger
 
-from splat_replay.application.interfaces import CapturePort
+from splat_replay.application.interfaces import BufferedCapturePort
 from splat_replay.domain.models import Frame, as_frame
 
 
-class NDICapture(CapturePort):
+class NDICapture(BufferedCapturePort):
     def __init__(self, logger: BoundLogger):
         self.logger = logger
 
@@ -50,6 +50,9 @@ class NDICapture(CapturePort):
             elapsed += wait_interval
 
     def capture(self) -> Optional[Frame]:
+        return self.capture_into(None)
+
+    def capture_into(self, out: Optional[Frame]) -> Optional[Frame]:
         if not self.receiver.is_connected():
             self.on_finder_change()
         if self.receiver.is_connected():
@@ -59,7 +62,10 @@ class NDICapture(CapturePort):
                 frame_reshaped = raw_frame.reshape(
                     self.video_frame.yres, self.video_frame.xres, 4
                 )
-                frame_bgr = cv2.cvtColor(frame_reshaped, cv2.COLOR_RGBA2BGR)
+                # 形状が一致すれば out へ直接変換される
+                frame_bgr = cv2.cvtColor(
+                    frame_reshaped, cv2.COLOR_RGBA2BGR, dst=out
+                )
                 return as_frame(frame_bgr)
         return None
 
@@ -7,14 +7,20 @@ from pathlib import Path
 import cv2
 from structlog.stdlib import BoundLogger
 
-from splat_replay.application.interfaces import CapturePort
+from splat_replay.application.interfaces import (
+    BufferedCapturePort,
+    SeekableCapturePort,
+)
 from splat_replay.domain.models import Frame, as_frame
 from splat_replay.infrastructure.test_input import resolve_video_input_path
 
 
-class VideoFileCapture(CapturePort):
+class VideoFileCapture(SeekableCapturePort, BufferedCapturePort):
     """動画ファイルからフレームを取得する。"""
 
+    # この範囲内の前方への移動はデコーダを再初期化せず grab で読み飛ばす
+    SEEK_GRAB_LIMIT_SECONDS = 0.5
+
     def __init__(self, source_path: Path, logger: BoundLogger) -> None:
         self._source_path = source_path
         self._logger = logger
@@ -51,11 +57,18 @@ class VideoFileCapture(CapturePort):
             )
 
     def capture(self) -> Frame | None:
+        return self.capture_into(None)
+
+    def capture_into(self, out: Frame | None) -> Frame | None:
         with self._lock:
             if self._capture is None or self._exhausted:
                 return None
 
-            success, frame = self._capture.read()
+            if out is None:
+                success, frame = self._capture.read()
+            else:
+                # 形状が一致すれば out へ直接デコードされる
+                success, frame = self._capture.read(out)
             if not success or frame is None:
                 self._exhausted = True
                 self._logger.info(
@@ -68,6 +81,26 @@ class VideoFileCapture(CapturePort):
             self._skip_frames()
             return as_frame(frame)
 
+    def seek(self, seconds: float) -> None:
+        """次に読み込むフレームを ``seconds`` の位置へ移動する。"""
+        with self._lock:
+            if self._capture is None:
+                raise RuntimeError("動画ファイルが開かれていません")
+            target = max(0.0, seconds)
+            if self._fps > 0.0:
+                next_index = int(
+                    self._capture.get(cv2.CAP_PROP_POS_FRAMES) or 0.0
+                )
+                skip = round(target * self._fps) - next_index
+                if 0 <= skip <= self.SEEK_GRAB_LIMIT_SECONDS * self._fps:
+                    for _ in range(skip):
+                        if not self._capture.grab():
+                            self._exhausted = True
+                            return
+                    return
+            self._capture.set(cv2.CAP_PROP_POS_MSEC, target * 1000.0)
+            self._exhausted = False
+
     def current_time_seconds(self) -> float | None:
         with self._lock:
             return self._current_time_seconds
@@ -14,7 +14,7 @@ from splat_replay.application.interfaces import LoggerPort
 from splat_replay.domain.models import Frame
 from splat_replay.domain.ports import BattleMedalRecognizerPort
 from splat_replay.infrastructure.filesystem import ASSETS_DIR
-from splat_replay.infrastructure.matchers.utils import imread_unicode
+from splat_replay.infrastructure.matchers.utils import load_shared_image
 
 
 MEDAL_ROI: Final[tuple[int, int, int, int]] = (880, 430, 1370, 710)
@@ -119,8 +119,8 @@ class BattleMedalRecognizerAdapter(BattleMedalRecognizerPort):
     ) -> _TemplateData:
         image_path = self._assets_dir / "matching" / image_name
         mask_path = self._assets_dir / "matching" / mask_name
-        image = imread_unicode(image_path)
-        mask = imread_unicode(mask_path, cv2.IMREAD_GRAYSCALE)
+        image = load_shared_image(image_path)
+        mask = load_shared_image(mask_path, cv2.IMREAD_GRAYSCALE)
         if image is None:
             raise FileNotFoundError(
                 f"テンプレート画像の読み込みに失敗しました: {image_path}"
@@ -0,0 +1,9 @@
+"""Recorded video re-analysis adapters."""
+
+from __future__ import annotations
+
+from splat_replay.infrastructure.adapters.reanalysis.batch_reanalyzer import (
+    BatchRecordingReanalyzer,
+)
+
+__all__ = ["BatchRecordingReanalyzer"]
@@ -0,0 +1,348 @@
+"""録画済み動画の一括再解析。
+
+録画フォルダの動画を 1 本ずつワーカープロセスへ割り当て、
+OfflineRecordingAnalyzer で解析してメタデータ (サイドカー JSON) を
+書き直す。各ワーカーは起動時に解析器 (マッチャーとブキ判別の
+テンプレートバンクを含む) を 1 度だけ構築して使い回す。
+
+解析の進捗は録画フォルダの状態ファイルに動画ごとに記録し、
+画像マッチング設定が同じでサイドカーが解析時点から書き換わっていない
+動画は次回以降の実行で読み飛ばす。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from pathlib import Path
+
+from structlog.stdlib import BoundLogger
+
+from splat_replay.application.dto import (
+    ReanalysisReportDTO,
+    RecordingReanalysisDTO,
+)
+from splat_replay.application.services.recording.offline_analyzer import (
+    OfflineRecordingAnalyzer,
+)
+from splat_replay.domain.config import VideoStorageSettings
+from splat_replay.domain.models import RecordingMetadata
+from splat_replay.infrastructure.adapters.capture.video_file_capture import (
+    VideoFileCapture,
+)
+from splat_replay.infrastructure.filesystem import paths
+from splat_replay.infrastructure.repositories.asset_file_operations import (
+    AssetFileOperations,
+)
+
+REANALYSIS_STATE_FILENAME = ".reanalysis_state.json"
+REANALYSIS_STATE_VERSION = 1
+
+RECORDING_PATTERNS = ("*.mkv", "*.mp4")
+
+
+def matcher_config_hash(image_matching_file: Path) -> str:
+    """画像マッチング設定の内容から解析結果の世代を表すハッシュを求める。"""
+    return hashlib.sha256(image_matching_file.read_bytes()).hexdigest()
+
+
+@dataclass
+class _WorkerState:
+    analyzer: OfflineRecordingAnalyzer
+    file_ops: AssetFileOperations
+    logger: BoundLogger
+
+
+_worker_state: _WorkerState | None = None
+
+
+def _initialize_worker(image_matching_file: Path) -> None:
+    from splat_replay.infrastructure.di import (
+        configure_analysis_container,
+        resolve,
+    )
+
+    global _worker_state
+    container = configure_analysis_container(image_matching_file)
+    logger = resolve(container, BoundLogger)
+    _worker_state = _WorkerState(
+        analyzer=resolve(container, OfflineRecordingAnalyzer),
+        file_ops=AssetFileOperations(logger),
+        logger=logger,
+    )
+
+
+def _seed_metadata(
+    previous: RecordingMetadata | None,
+) -> RecordingMetadata | None:
+    """録画前に確定していて動画からは導出できない情報だけを引き継ぐ。"""
+    if previous is None:
+        return None
+    return RecordingMetadata(
+        game_mode=previous.game_mode,
+        started_at=previous.started_at,
+        rate=previous.rate,
+    )
+
+
+def _analyze_in_worker(video: Path) -> RecordingReanalysisDTO:
+    state = _worker_state
+    if state is None:
+        raise RuntimeError("再解析ワーカーが初期化されていません")
+    started = time.perf_counter()
+    try:
+        previous = state.file_ops.load_metadata(video)
+        result = asyncio.run(
+            state.analyzer.analyze(
+                VideoFileCapture(video, state.logger),
+                _seed_metadata(previous),
+            )
+        )
+        saved = False
+        # 最後まで解析できた場合だけ録画時と同じ形式で書き直す
+        if result.outcome == "completed":
+            if not state.file_ops.save_metadata(video, result.metadata):
+                raise RuntimeError("メタデータの保存に失敗しました")
+            saved = True
+            if (
+                result.result_frame is not None
+                and not video.with_suffix(".png").exists()
+            ):
+                state.file_ops.save_thumbnail(video, result.result_frame)
+    except Exception as exc:
+        state.logger.exception(
+            "録画の再解析に失敗しました", video=str(video), error=str(exc)
+        )
+        return RecordingReanalysisDTO(
+            path=str(video),
+            status="failed",
+            elapsed_seconds=time.perf_counter() - started,
+            error=str(exc),
+        )
+    return RecordingReanalysisDTO(
+        path=str(video),
+        status="analyzed",
+        outcome=result.outcome,
+        frames_analyzed=result.frames_analyzed,
+        video_seconds=result.video_seconds,
+        elapsed_seconds=time.perf_counter() - started,
+        metadata_saved=saved,
+    )
+
+
+class BatchRecordingReanalyzer:
+    """録画フォルダの動画をプロセスプールで並列に再解析する。
+
+    - 同時に投入する動画はワーカー数までに抑え、中断時の取りこぼしを減らす
+    - 1 本終わるごとに状態ファイルを更新するため、途中で止めても再開できる
+    - ``workers`` が 0 の場合はプールを使わずこのプロセスで順に解析する
+    """
+
+    def __init__(
+        self,
+        settings: VideoStorageSettings,
+        logger: BoundLogger,
+        image_matching_file: Path = paths.IMAGE_MATCHING_FILE,
+    ) -> None:
+        self._settings = settings
+        self._logger = logger
+        self._image_matching_file = image_matching_file
+
+    @property
+    def state_path(self) -> Path:
+        return self._settings.recorded_dir / REANALYSIS_STATE_FILENAME
+
+    def list_recordings(self) -> list[Path]:
+        recorded_dir = self._settings.recorded_dir
+        if not recorded_dir.is_dir():
+            return []
+        return sorted(
+            video
+            for pattern in RECORDING_PATTERNS
+            for video in recorded_dir.glob(pattern)
+        )
+
+    def run(
+        self,
+        *,
+        workers: int,
+        force: bool = False,
+        on_result: Callable[[RecordingReanalysisDTO], None] | None = None,
+    ) -> ReanalysisReportDTO:
+        """録画フォルダの動画を再解析し、結果の集計を返す。
+
+        Args:
+            workers: ワーカープロセス数 (0 ならこのプロセスで解析する)
+            force: 解析済みの動画も解析し直す
+            on_result: 1 本ごとの結果を受け取るコールバック
+        """
+        if workers < 0:
+            raise ValueError("workers は 0 以上である必要があります")
+        started = time.perf_counter()
+        config_hash = matcher_config_hash(self._image_matching_file)
+        entries = self._load_state()
+        items: list[RecordingReanalysisDTO] = []
+
+        def record(item: RecordingReanalysisDTO) -> None:
+            items.append(item)
+            if on_result is not None:
+                on_result(item)
+
+        pending: list[Path] = []
+        for video in self.list_recordings():
+            if not force and self._is_up_to_date(
+                video, entries.get(video.name), config_hash
+            ):
+                record(
+                    RecordingReanalysisDTO(path=str(video), status="skipped")
+                )
+            else:
+                pending.append(video)
+
+        self._logger.info(
+            "録画の再解析を開始します",
+            pending=len(pending),
+            skipped=len(items),
+            workers=workers,
+        )
+        for item in self._analyze(pending, workers):
+            if item.status == "analyzed":
+                sidecar = Path(item.path).with_suffix(".json")
+                entries[Path(item.path).name] = {
+                    "config_hash": config_hash,
+                    "sidecar_mtime_ns": (
+                        sidecar.stat().st_mtime_ns
+                        if sidecar.exists()
+                        else None
+                    ),
+                }
+                self._save_state(entries)
+            record(item)
+
+        report = ReanalysisReportDTO(
+            items=tuple(items),
+            workers=workers,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self._logger.info(
+            "録画の再解析が完了しました",
+            analyzed=report.count("analyzed"),
+            skipped=report.count("skipped"),
+            failed=report.count("failed"),
+            elapsed_seconds=round(report.elapsed_seconds, 1),
+        )
+        return report
+
+    def _analyze(
+        self, videos: list[Path], workers: int
+    ) -> Iterator[RecordingReanalysisDTO]:
+        if not videos:
+            return
+        if workers == 0:
+            _initialize_worker(self._image_matching_file)
+            for video in videos:
+                yield _analyze_in_worker(video)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(videos)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self._image_matching_file,),
+        ) as pool:
+            queue = iter(videos)
+            inflight: dict[Future[RecordingReanalysisDTO], Path] = {}
+            while True:
+                while len(inflight) < workers:
+                    video = next(queue, None)
+                    if video is None:
+                        break
+                    inflight[pool.submit(_analyze_in_worker, video)] = video
+                if not inflight:
+                    return
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    video = inflight.pop(future)
+                    try:
+                        yield future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        # ワーカーの異常終了など、解析結果を受け取れなかった
+                        yield RecordingReanalysisDTO(
+                            path=str(video), status="failed", error=str(exc)
+                        )
+
+    @staticmethod
+    def _is_up_to_date(
+        video: Path, entry: dict[str, object] | None, config_hash: str
+    ) -> bool:
+        if entry is None or entry.get("config_hash") != config_hash:
+            return False
+        recorded_mtime = entry.get("sidecar_mtime_ns")
+        if recorded_mtime is None:
+            # 解析しても書き込む結果がなかった動画
+            return True
+        sidecar = video.with_suffix(".json")
+        if not sidecar.exists() or not isinstance(recorded_mtime, int):
+            return False
+        return sidecar.stat().st_mtime_ns >= recorded_mtime
+
+    def _load_state(self) -> dict[str, dict[str, object]]:
+        path = self.state_path
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            self._logger.warning(
+                "再解析の状態ファイルを読み込めません",
+                path=str(path),
+                error=str(exc),
+            )
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != REANALYSIS_STATE_VERSION
+            or not isinstance(data.get("videos"), dict)
+        ):
+            return {}
+        return {
+            str(name): entry
+            for name, entry in data["videos"].items()
+            if isinstance(entry, dict)
+        }
+
+    def _save_state(self, entries: dict[str, dict[str, object]]) -> None:
+        path = self.state_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": REANALYSIS_STATE_VERSION, "videos": entries}
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=path.stem,
+            suffix=".tmp",
+            delete=False,
+        ) as handle:
+            temp_path = Path(handle.name)
+            json.dump(payload, handle, ensure_ascii=False, indent=2)
+            handle.flush()
+        temp_path.replace(path)
+
+
+__all__ = [
+    "REANALYSIS_STATE_FILENAME",
+    "BatchRecordingReanalyzer",
+    "matcher_config_hash",
+]
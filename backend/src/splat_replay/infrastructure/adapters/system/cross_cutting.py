@@ -6,6 +6,7 @@ Logger / Config / Paths ポートの具象実装を提供。
 from __future__ import annotations
 
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import cast
 
@@ -37,7 +38,7 @@ from splat_replay.infrastructure.config import (
     load_settings_from_toml,
     save_settings_to_toml,
 )
-from splat_replay.infrastructure.filesystem import paths
+from splat_replay.infrastructure.filesystem import paths, transfer
 from splat_replay.infrastructure.logging import get_logger
 
 
@@ -176,9 +177,22 @@ class LocalFileSystemAdapter(FileSystemPort):
     def write_bytes(self, path: Path, data: bytes) -> None:
         path.write_bytes(data)
 
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> None:
+        with path.open("wb") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+
     def unlink(self, path: Path, *, missing_ok: bool = True) -> None:
         path.unlink(missing_ok=missing_ok)
 
+    def copy_file(
+        self, src: Path, dst: Path, *, allow_link: bool = False
+    ) -> str:
+        return transfer.copy_file(src, dst, allow_link=allow_link)
+
+    def move_file(self, src: Path, dst: Path) -> str:
+        return transfer.move_file(src, dst)
+
 
 class ProcessEnvironmentAdapter(EnvironmentPort):
     """プロセス環境変数を使用した EnvironmentPort の実装。"""
@@ -204,5 +204,8 @@ class GuiRuntimePortAdapter(CommandDispatcher, EventSubscriber, FrameSource):
     def get_latest(self) -> Optional[Frame]:
         return self._rt.frame_hub.get_latest()
 
+    def get_latest_with_sequence(self) -> Tuple[int, Optional[Frame]]:
+        return self._rt.frame_hub.get_latest_with_sequence()
+
 
 __all__ = ["GuiRuntimePortAdapter"]
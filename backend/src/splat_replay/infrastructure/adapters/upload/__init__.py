@@ -1,15 +1,35 @@
-"""Upload adapters."""
+"""Upload adapters.
+
+YouTubeClient は Google API クライアントの読み込みが重いため、
+必要になった時点で import する。
+"""
 
 from __future__ import annotations
 
-from splat_replay.infrastructure.adapters.upload.noop_upload_port import (
-    NoOpUploadPort,
-)
-from splat_replay.infrastructure.adapters.upload.youtube_client import (
-    YouTubeClient,
-)
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "NoOpUploadPort",
     "YouTubeClient",
 ]
+
+_LAZY_EXPORTS = {
+    "NoOpUploadPort": (".noop_upload_port", "NoOpUploadPort"),
+    "YouTubeClient": (".youtube_client", "YouTubeClient"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """必要になったアダプターだけを import する。"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute_name = _LAZY_EXPORTS[name]
+    module = import_module(module_name, __name__)
+    value = getattr(module, attribute_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
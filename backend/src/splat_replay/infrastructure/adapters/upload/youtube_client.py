@@ -5,17 +5,9 @@ from __future__ import annotations
 import gc
 import pickle
 from pathlib import Path
-from typing import Any, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, List, Optional, Union, cast
 
 import google.auth.exceptions
-from google.auth.external_account_authorized_user import (
-    Credentials as Credentials1,
-)
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials as Credentials2
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient import discovery
-from googleapiclient.http import MediaFileUpload
 from structlog.stdlib import BoundLogger
 
 from splat_replay.application.interfaces import (
@@ -30,10 +22,18 @@ from splat_replay.domain.exceptions import (
 )
 from splat_replay.infrastructure import filesystem as paths
 
-Credentials = Union[
-    Credentials1,
-    Credentials2,
-]
+# Google API クライアントと認証ライブラリは読み込みだけで数百ミリ秒かかる。
+# upload 以外のコマンドの起動を遅らせないよう、使う直前に import する。
+if TYPE_CHECKING:
+    from google.auth.external_account_authorized_user import (
+        Credentials as Credentials1,
+    )
+    from google.oauth2.credentials import Credentials as Credentials2
+
+    Credentials = Union[
+        Credentials1,
+        Credentials2,
+    ]
 
 
 class YouTubeClient(UploadPort, AuthenticatedClientPort):
@@ -65,7 +65,7 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
 
         with open(self.TOKEN_FILE, "rb") as token_file:
             data = pickle.load(token_file)
-        return cast(Optional[Credentials], data)
+        return cast("Optional[Credentials]", data)
 
     def _save_credentials(self, credentials: Credentials) -> None:
         """認証情報をファイルに保存する
@@ -97,6 +97,10 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         Returns:
             Credentials: 取得した認証情報
         """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials as Credentials2
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
         credentials = self._load_credentials()
         if credentials:
             try:
@@ -117,7 +121,7 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         flow = InstalledAppFlow.from_client_secrets_file(
             str(self.CLIENT_SECRET_FILE), self.SCOPES
         )
-        credentials = cast(Credentials, flow.run_local_server(port=8080))
+        credentials = cast("Credentials", flow.run_local_server(port=8080))
         self._save_credentials(credentials)
         return credentials
 
@@ -131,6 +135,8 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         if not needs_refresh:
             return
 
+        from googleapiclient import discovery
+
         self._credentials = self._get_credentials()
         self._youtube = discovery.build(
             self.API_NAME,
@@ -200,6 +206,8 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         if self._youtube is None:
             raise RuntimeError("YouTube クライアントの初期化に失敗しました")
 
+        from googleapiclient.http import MediaFileUpload
+
         media_file = None
         try:
             media_file = MediaFileUpload(
@@ -244,6 +252,8 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         if self._youtube is None:
             raise RuntimeError("YouTube クライアントの初期化に失敗しました")
 
+        from googleapiclient.http import MediaFileUpload
+
         media_file = None
         try:
             media_file = MediaFileUpload(thumb)
@@ -277,6 +287,8 @@ class YouTubeClient(UploadPort, AuthenticatedClientPort):
         if self._youtube is None:
             raise RuntimeError("YouTube クライアントの初期化に失敗しました")
 
+        from googleapiclient.http import MediaFileUpload
+
         media_file = None
         try:
             media_file = MediaFileUpload(subtitle)
@@ -5,25 +5,101 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import json
+import os
 import subprocess
 from asyncio import subprocess as asyncio_subprocess
 from pathlib import Path
 from subprocess import CompletedProcess
 from typing import Dict, List, Literal, Optional, Sequence, TypeVar
 
-from splat_replay.application.interfaces import VideoEditorPort
+from splat_replay.application.interfaces import VideoEditorPort, VideoEditPlan
+from splat_replay.infrastructure.adapters.video.media_probe_cache import (
+    MediaProbe,
+    MediaProbeCache,
+)
 from structlog.stdlib import BoundLogger
 
 ResultT = TypeVar("ResultT", str, bytes)
 
+# ffprobe はヘッダーしか読まないため、これを超える場合は異常とみなす
+PROBE_TIMEOUT_SECONDS = 5
+
+
+def build_render_command(
+    plan: VideoEditPlan,
+    source: Path,
+    *,
+    concat: bool,
+    source_audio_streams: int,
+) -> list[str]:
+    """編集内容をまとめて適用する ffmpeg コマンドを組み立てる。
+
+    Args:
+        plan: 編集内容
+        source: 入力動画 (``concat`` が真なら concat demuxer のリスト)
+        concat: ``source`` を concat demuxer で読み込むか
+        source_audio_streams: 入力動画の音声ストリーム数
+
+    サムネイルは標準入力から渡す前提とする。映像と元の音声は
+    音量を変えない限り再エンコードせずにコピーする。
+    """
+    command: list[str] = ["ffmpeg", "-y"]
+    if concat:
+        command.extend(["-f", "concat", "-safe", "0"])
+    command.extend(["-i", str(source)])
+    maps: list[str] = ["-map", "0:v", "-map", "0:a?", "-map", "0:s?"]
+    next_input = 1
+    if plan.narration is not None:
+        command.extend(["-i", str(plan.narration.resolve())])
+        maps.extend(["-map", f"{next_input}:a"])
+        next_input += 1
+    if plan.thumbnail is not None:
+        command.extend(["-i", "-"])
+        maps.extend(["-map", f"{next_input}"])
+        next_input += 1
+    command.extend(maps)
+
+    command.extend(["-c", "copy"])
+    if plan.volume_multiplier != 1.0:
+        command.extend(
+            ["-filter:a", f"volume={plan.volume_multiplier}", "-c:a", "aac"]
+        )
+    elif plan.narration is not None:
+        command.extend([f"-c:a:{source_audio_streams}", "aac"])
+    if plan.narration is not None and plan.narration_title:
+        command.extend(
+            [
+                f"-metadata:s:a:{source_audio_streams}",
+                f"title={plan.narration_title}",
+            ]
+        )
+    for key, value in plan.metadata.items():
+        if value:
+            command.extend(["-metadata", f"{key}={value}"])
+    command.append(str(plan.output.resolve()))
+    return command
+
+
+def _concat_entry(clip: Path) -> str:
+    escaped = str(clip).replace("'", "'\\''")
+    return f"file '{escaped}'"
+
 
 class FFmpegProcessor(VideoEditorPort):
     """Provides high-level helpers around ffmpeg/ffprobe commands."""
 
-    def __init__(self, logger: BoundLogger) -> None:
+    def __init__(
+        self,
+        logger: BoundLogger,
+        probe_cache: MediaProbeCache | None = None,
+    ) -> None:
         self.logger = logger
-        # 動画長のキャッシュ (GUI リスト表示時の ffprobe 過多を防止)
-        self._length_cache: dict[Path, float | None] = {}
+        # ffprobe の結果 (GUI リスト表示・編集・アップロードで共有する)
+        self._probe_cache = probe_cache
+        self._probes: dict[Path, tuple[int, int, MediaProbe | None]] = {}
+        self._inflight_probes: dict[
+            Path, asyncio.Future[MediaProbe | None]
+        ] = {}
         self._subprocess_fallback_logged = False
 
     # ------------------------------------------------------------------
@@ -264,42 +340,8 @@ class FFmpegProcessor(VideoEditorPort):
     async def get_metadata(self, path: Path) -> Dict[str, str]:
         abs_path = path.resolve()
         self.logger.info("FFmpeg: メタデータ取得", path=str(abs_path))
-
-        result = await self._run_text(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_format",
-                "-print_format",
-                "json",
-                str(abs_path),
-            ]
-        )
-        if result.returncode != 0 or not result.stdout:
-            self._log_failure("FFmpeg: メタデータ取得失敗", result)
-            return {}
-
-        try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            self.logger.error("FFmpeg metadata JSON parse failed")
-            return {}
-
-        if not isinstance(data, dict):
-            return {}
-        format_section = data.get("format")
-        if not isinstance(format_section, dict):
-            return {}
-        tags = format_section.get("tags")
-        if not isinstance(tags, dict):
-            return {}
-
-        metadata: Dict[str, str] = {}
-        for key, value in tags.items():
-            if isinstance(key, str) and isinstance(value, str):
-                metadata[key.lower()] = value
-        return metadata
+        probe = await self._probe(abs_path)
+        return dict(probe.tags) if probe is not None else {}
 
     async def embed_subtitle(self, path: Path, srt: str) -> None:
         abs_path = path.resolve()
@@ -454,50 +496,12 @@ class FFmpegProcessor(VideoEditorPort):
 
     async def get_video_length(self, path: Path) -> Optional[float]:
         abs_path = path.resolve()
-        # キャッシュ利用
-        cached = self._length_cache.get(abs_path)
-        if cached is not None:
-            self.logger.debug(
-                "FFprobe: 長さ取得 (cache)", path=str(abs_path), seconds=cached
-            )
-            return cached
-        self.logger.debug("FFprobe: 長さ取得", path=str(abs_path))
-
-        result = await self._run_text(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                str(abs_path),
-            ],
-            timeout=3,
+        probe = await self._probe(abs_path)
+        length = probe.duration if probe is not None else None
+        self.logger.debug(
+            "FFprobe: 長さ取得", path=str(abs_path), seconds=length
         )
-        if result.returncode != 0:
-            self._log_failure("FFprobe: 長さ取得失敗", result)
-            self._length_cache[abs_path] = None
-            return None
-
-        raw = result.stdout.strip()
-        if not raw:
-            self.logger.error(
-                "FFprobe: 長さ取得失敗 (stdout が空)",
-                path=str(abs_path),
-            )
-            self._length_cache[abs_path] = None
-            return None
-        try:
-            length = float(raw)
-        except ValueError:
-            self.logger.error("FFprobe: 長さ数値変換失敗", raw=raw)
-            self._length_cache[abs_path] = None
-            return None
-        else:
-            self._length_cache[abs_path] = length
-            return length
+        return length
 
     async def add_audio_track(
         self,
@@ -555,6 +559,55 @@ class FFmpegProcessor(VideoEditorPort):
         if result.returncode != 0:
             self._log_failure("FFmpeg: 音声トラック追加失敗", result)
 
+    async def render(self, plan: VideoEditPlan) -> Path:
+        clips = [clip.resolve() for clip in plan.clips]
+        if not clips:
+            raise ValueError("clips is empty")
+        output = plan.output.resolve()
+        self.logger.info(
+            "FFmpeg: 一括編集",
+            clips=[str(c) for c in clips],
+            output=str(output),
+            metadata=plan.metadata,
+            thumbnail=plan.thumbnail is not None,
+            narration=str(plan.narration) if plan.narration else None,
+            volume=plan.volume_multiplier,
+        )
+
+        source_audio_streams = (
+            await self._count_streams(clips[0], "audio")
+            if plan.narration is not None
+            else 0
+        )
+        # 並行して編集する他のグループと衝突しないよう出力ごとに分ける
+        filelist: Path | None = None
+        if len(clips) > 1:
+            filelist = output.with_name(f"{output.stem}_concat.txt")
+            filelist.write_text(
+                "\n".join(_concat_entry(clip) for clip in clips),
+                encoding="utf-8",
+            )
+        try:
+            result = await self._run_binary(
+                build_render_command(
+                    plan,
+                    filelist or clips[0],
+                    concat=filelist is not None,
+                    source_audio_streams=source_audio_streams,
+                ),
+                input_bytes=plan.thumbnail,
+            )
+        finally:
+            if filelist is not None:
+                filelist.unlink(missing_ok=True)
+        if result.returncode != 0:
+            self._log_failure("FFmpeg: 一括編集に失敗", result)
+            output.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"FFmpeg による動画の書き出しに失敗しました: {output}"
+            )
+        return plan.output
+
     async def list_video_devices(self) -> List[str]:
         """List available DirectShow video capture devices.
 
@@ -596,80 +649,106 @@ class FFmpegProcessor(VideoEditorPort):
         codec_type: Literal["video", "audio", "subtitle"],
         codec_name: str,
     ) -> List[int]:
-        result = await self._run_text(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_streams",
-                "-of",
-                "json",
-                str(path),
-            ]
-        )
-        if result.returncode != 0 or not result.stdout:
-            self.logger.error("FFprobe stream info failed")
+        probe = await self._probe(path.resolve())
+        if probe is None:
             return []
-
-        try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            self.logger.error("FFprobe stream JSON parse failed")
-            return []
-        if not isinstance(data, dict):
-            return []
-        streams = data.get("streams")
-        if not isinstance(streams, list):
-            return []
-
-        matching: list[int] = []
-        for stream in streams:
-            if not isinstance(stream, dict):
-                continue
-            if stream.get("codec_type") != codec_type:
-                continue
-            if stream.get("codec_name") != codec_name:
-                continue
-            index_value = stream.get("index")
-            if isinstance(index_value, int):
-                matching.append(index_value)
-        return matching
+        return probe.find_streams(codec_type, codec_name)
 
     async def _count_streams(
         self,
         path: Path,
         codec_type: Literal["video", "audio", "subtitle"],
     ) -> int:
-        result = await self._run_text(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_streams",
-                "-of",
-                "json",
-                str(path),
-            ]
-        )
-        if result.returncode != 0 or not result.stdout:
-            self.logger.error("FFprobe stream info failed")
+        probe = await self._probe(path.resolve())
+        if probe is None:
             return 0
+        return probe.count_streams(codec_type)
+
+    async def _probe(self, abs_path: Path) -> MediaProbe | None:
+        """動画の長さ・ストリーム・メタデータを 1 回の ffprobe で取得する。
 
+        結果はファイルのサイズと更新時刻が変わるまで再利用し、
+        同じ動画への同時の問い合わせは 1 回の ffprobe にまとめる。
+        """
         try:
-            data = json.loads(result.stdout)
-        except json.JSONDecodeError:
-            self.logger.error("FFprobe stream JSON parse failed")
-            return 0
-        if not isinstance(data, dict):
-            return 0
-        streams = data.get("streams")
-        if not isinstance(streams, list):
-            return 0
+            stat = abs_path.stat()
+        except OSError:
+            self.logger.error(
+                "FFprobe: 動画が見つかりません", path=str(abs_path)
+            )
+            return None
+        memo = self._probes.get(abs_path)
+        if memo is not None and memo[:2] == (stat.st_size, stat.st_mtime_ns):
+            return memo[2]
+        if self._probe_cache is not None:
+            cached = self._probe_cache.get(abs_path, stat)
+            if cached is not None:
+                self._probes[abs_path] = (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    cached,
+                )
+                return cached
+
+        task = self._inflight_probes.get(abs_path)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            # 呼び出し元が取り消されても他の待機者のために取得は続ける
+            task = asyncio.ensure_future(self._run_probe(abs_path, stat))
+            self._inflight_probes[abs_path] = task
+            task.add_done_callback(
+                lambda done: self._forget_probe(abs_path, done)
+            )
+        return await asyncio.shield(task)
 
-        count = 0
-        for stream in streams:
-            if not isinstance(stream, dict):
-                continue
-            if stream.get("codec_type") == codec_type:
-                count += 1
-        return count
+    def _forget_probe(
+        self, abs_path: Path, task: asyncio.Future[MediaProbe | None]
+    ) -> None:
+        if self._inflight_probes.get(abs_path) is task:
+            del self._inflight_probes[abs_path]
+        if not task.cancelled():
+            # 待機者がいなくても「未取得の例外」警告を出さない
+            task.exception()
+
+    async def _run_probe(
+        self, abs_path: Path, stat: os.stat_result
+    ) -> MediaProbe | None:
+        self.logger.debug("FFprobe: 動画情報取得", path=str(abs_path))
+        try:
+            result = await self._run_text(
+                [
+                    "ffprobe",
+                    "-v",
+                    "error",
+                    "-show_format",
+                    "-show_streams",
+                    "-of",
+                    "json",
+                    str(abs_path),
+                ],
+                timeout=PROBE_TIMEOUT_SECONDS,
+            )
+        except subprocess.TimeoutExpired:
+            # 一時的な負荷の可能性があるため失敗として記録しない
+            self.logger.warning(
+                "FFprobe: 動画情報取得がタイムアウトしました",
+                path=str(abs_path),
+            )
+            return None
+
+        probe: MediaProbe | None = None
+        if result.returncode != 0 or not result.stdout:
+            self._log_failure("FFprobe: 動画情報取得失敗", result)
+        else:
+            try:
+                probe = MediaProbe.from_ffprobe(json.loads(result.stdout))
+            except json.JSONDecodeError:
+                self.logger.error(
+                    "FFprobe: 動画情報の JSON 解析失敗", path=str(abs_path)
+                )
+        # 読めない動画も変更されるまでは問い合わせ直さない
+        self._probes[abs_path] = (stat.st_size, stat.st_mtime_ns, probe)
+        if probe is not None and self._probe_cache is not None:
+            await asyncio.to_thread(
+                self._probe_cache.put, abs_path, stat, probe
+            )
+        return probe
@@ -0,0 +1,264 @@
+"""ffprobe の結果を永続化するキャッシュ。
+
+動画の長さ・ストリーム構成・埋め込みメタデータを、ファイルの
+パス・サイズ・更新時刻をキーにして保存する。ファイルが書き換われば
+サイズか更新時刻が変わるため、古い結果は自然に使われなくなる。
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from structlog.stdlib import BoundLogger
+
+# 形式を変えたら更新する (古いキャッシュは捨てる)
+MEDIA_PROBE_CACHE_VERSION = 2
+
+# 存在しなくなった動画の結果を残しておく上限
+_MAX_ENTRIES = 10000
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS probes ("
+    "path TEXT PRIMARY KEY,"
+    " size INTEGER NOT NULL,"
+    " mtime_ns INTEGER NOT NULL,"
+    " probe TEXT NOT NULL)"
+)
+
+
+@dataclass(frozen=True)
+class StreamInfo:
+    """動画内の 1 ストリーム。"""
+
+    index: int
+    codec_type: str
+    codec_name: str
+
+
+@dataclass(frozen=True)
+class MediaProbe:
+    """ffprobe で得た動画の情報。
+
+    Attributes:
+        duration: 再生時間（秒）。取得できなかった場合は None
+        streams: ストリーム構成
+        tags: フォーマットに埋め込まれたメタデータ (キーは小文字)
+    """
+
+    duration: float | None
+    streams: tuple[StreamInfo, ...] = ()
+    tags: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_ffprobe(cls, data: object) -> MediaProbe:
+        """``ffprobe -show_format -show_streams -of json`` の出力から作る。"""
+        if not isinstance(data, dict):
+            return cls(duration=None)
+        format_section = data.get("format")
+        if not isinstance(format_section, dict):
+            format_section = {}
+
+        duration: float | None
+        try:
+            duration = float(format_section.get("duration", ""))
+        except (TypeError, ValueError):
+            duration = None
+
+        tags: dict[str, str] = {}
+        raw_tags = format_section.get("tags")
+        if isinstance(raw_tags, dict):
+            for key, value in raw_tags.items():
+                if isinstance(key, str) and isinstance(value, str):
+                    tags[key.lower()] = value
+
+        streams: list[StreamInfo] = []
+        raw_streams = data.get("streams")
+        if isinstance(raw_streams, list):
+            for stream in raw_streams:
+                if not isinstance(stream, dict):
+                    continue
+                index = stream.get("index")
+                if not isinstance(index, int):
+                    continue
+                streams.append(
+                    StreamInfo(
+                        index=index,
+                        codec_type=str(stream.get("codec_type", "")),
+                        codec_name=str(stream.get("codec_name", "")),
+                    )
+                )
+        return cls(duration=duration, streams=tuple(streams), tags=tags)
+
+    def find_streams(self, codec_type: str, codec_name: str) -> list[int]:
+        return [
+            stream.index
+            for stream in self.streams
+            if stream.codec_type == codec_type
+            and stream.codec_name == codec_name
+        ]
+
+    def count_streams(self, codec_type: str) -> int:
+        return sum(
+            1 for stream in self.streams if stream.codec_type == codec_type
+        )
+
+    def to_json(self) -> dict[str, object]:
+        return {
+            "duration": self.duration,
+            "streams": [
+                [stream.index, stream.codec_type, stream.codec_name]
+                for stream in self.streams
+            ],
+            "tags": self.tags,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, object]) -> MediaProbe:
+        duration = data.get("duration")
+        raw_streams = data.get("streams")
+        raw_tags = data.get("tags")
+        return cls(
+            duration=(
+                float(duration) if isinstance(duration, (int, float)) else None
+            ),
+            streams=tuple(
+                StreamInfo(int(index), str(codec_type), str(codec_name))
+                for index, codec_type, codec_name in (
+                    raw_streams if isinstance(raw_streams, list) else []
+                )
+            ),
+            tags=(
+                {str(k): str(v) for k, v in raw_tags.items()}
+                if isinstance(raw_tags, dict)
+                else {}
+            ),
+        )
+
+
+class MediaProbeCache:
+    """ffprobe の結果を SQLite に保存して再利用するキャッシュ。
+
+    Web API・編集・アップロードで同じインスタンスを共有する前提で、
+    動画 1 本ごとに行を読み書きする。操作ごとに接続を開くため、保存中も
+    他のスレッドの読み込みは止まらない。
+    """
+
+    def __init__(self, path: Path, logger: BoundLogger) -> None:
+        self._path = path
+        self._logger = logger
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def get(self, video: Path, stat: os.stat_result) -> MediaProbe | None:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT size, mtime_ns, probe FROM probes WHERE path = ?",
+                    (str(video),),
+                ).fetchone()
+        except (sqlite3.Error, OSError) as exc:
+            self._logger.warning(
+                "動画情報のキャッシュを読み込めません",
+                path=str(self._path),
+                error=str(exc),
+            )
+            return None
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        try:
+            probe = json.loads(row[2])
+            if not isinstance(probe, dict):
+                return None
+            return MediaProbe.from_json(probe)
+        except (TypeError, ValueError):
+            return None
+
+    def put(
+        self, video: Path, stat: os.stat_result, probe: MediaProbe
+    ) -> None:
+        try:
+            with self._connect() as conn:
+                # 置き換えた行は新しい rowid になるため、rowid 順が更新順になる
+                conn.execute(
+                    "INSERT OR REPLACE INTO probes (path, size, mtime_ns,"
+                    " probe) VALUES (?, ?, ?, ?)",
+                    (
+                        str(video),
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        json.dumps(probe.to_json(), ensure_ascii=False),
+                    ),
+                )
+                # 古いものから捨てる
+                conn.execute(
+                    "DELETE FROM probes WHERE rowid IN (SELECT rowid FROM"
+                    " probes ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (_MAX_ENTRIES,),
+                )
+        except (sqlite3.Error, OSError) as exc:
+            self._logger.warning(
+                "動画情報のキャッシュを保存できませんでした",
+                path=str(self._path),
+                error=str(exc),
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = self._open()
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _open(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=10)
+        try:
+            self._ensure_schema(conn)
+        except sqlite3.DatabaseError as exc:
+            conn.close()
+            if not _is_corrupt(exc):
+                raise
+            # キャッシュは ffprobe で作り直せるため、壊れていれば捨てる
+            self._logger.warning(
+                "動画情報のキャッシュを作り直します",
+                path=str(self._path),
+                error=str(exc),
+            )
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self._path}{suffix}").unlink(missing_ok=True)
+            conn = sqlite3.connect(self._path, timeout=10)
+            self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            # 読み込みと保存を並行できるようにする
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != MEDIA_PROBE_CACHE_VERSION:
+                conn.execute("DROP TABLE IF EXISTS probes")
+                conn.execute(_SCHEMA)
+                conn.execute(
+                    f"PRAGMA user_version = {MEDIA_PROBE_CACHE_VERSION}"
+                )
+                conn.commit()
+            self._schema_ready = True
+
+
+def _is_corrupt(exc: sqlite3.DatabaseError) -> bool:
+    # OperationalError (ロック中など) は一時的なものなので作り直さない
+    return not isinstance(exc, sqlite3.OperationalError)
+
+
+__all__ = ["MediaProbe", "MediaProbeCache", "StreamInfo"]
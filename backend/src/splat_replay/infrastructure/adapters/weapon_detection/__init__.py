@@ -1,5 +1,32 @@
-"""ブキ判別アダプタ。"""
+"""ブキ判別アダプタ。
 
-from .recognizer import WeaponRecognitionAdapter
+判別器はテンプレートや数値計算ライブラリの読み込みが重いため、
+必要になったものだけを import する。
+"""
 
-__all__ = ["WeaponRecognitionAdapter"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+__all__ = ["LazyWeaponRecognitionAdapter", "WeaponRecognitionAdapter"]
+
+_LAZY_EXPORTS = {
+    "LazyWeaponRecognitionAdapter": (".lazy", "LazyWeaponRecognitionAdapter"),
+    "WeaponRecognitionAdapter": (".recognizer", "WeaponRecognitionAdapter"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """必要になったアダプターだけを import する。"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute_name = _LAZY_EXPORTS[name]
+    module = import_module(module_name, __name__)
+    value = getattr(module, attribute_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,304 @@
+"""ブキテンプレートの一括照合。"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Mapping, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TemplateGroup:
+    """同じサイズのテンプレートを行列として束ねたもの。
+
+    配列はメモリマップされたバンクファイルを直接参照してもよい。
+    """
+
+    shape: tuple[int, int]
+    # 行ごとに (マスク内平均を引いてマスクを掛けたテンプレート, マスク)。
+    # shape=(件数, 2, 高さ*幅) の float32
+    kernels: np.ndarray
+    # マスク内の画素数と、中心化テンプレートの二乗和
+    counts: np.ndarray
+    norms: np.ndarray
+
+    @property
+    def count(self) -> int:
+        return int(self.kernels.shape[0])
+
+
+def build_template_groups(
+    templates: Sequence[np.ndarray],
+    masks: Sequence[np.ndarray | None],
+) -> tuple[list[TemplateGroup], list[tuple[int, int]]]:
+    """テンプレートをサイズごとに束ね、照合用の前計算を行う。
+
+    Returns:
+        (グループ一覧, 入力順の各テンプレートの (グループ番号, 行番号))
+    """
+    if len(templates) != len(masks):
+        raise ValueError("templates と masks の件数が一致しません")
+    members: dict[tuple[int, int], list[int]] = {}
+    for index, template in enumerate(templates):
+        if template.ndim != 2:
+            raise ValueError("テンプレートはグレースケールで指定します")
+        height, width = template.shape
+        members.setdefault((height, width), []).append(index)
+
+    groups: list[TemplateGroup] = []
+    locations: list[tuple[int, int]] = [(0, 0)] * len(templates)
+    for shape, indices in members.items():
+        size = shape[0] * shape[1]
+        pixels = np.empty((len(indices), size), dtype=np.float64)
+        weights = np.ones((len(indices), size), dtype=np.float64)
+        for row, index in enumerate(indices):
+            pixels[row] = templates[index].ravel()
+            mask = masks[index]
+            if mask is not None:
+                if mask.shape != shape:
+                    raise ValueError(
+                        "マスクとテンプレートのサイズが異なります"
+                    )
+                weights[row] = mask.ravel() > 0
+            locations[index] = (len(groups), row)
+        groups.append(_pack_group(shape, pixels, weights))
+    return groups, locations
+
+
+def downsample_template_groups(
+    groups: Sequence[TemplateGroup], factor: int
+) -> list[TemplateGroup]:
+    """前計算済みのグループを ``factor`` 分の 1 の解像度に縮小する。
+
+    マスク内の画素だけを ``factor`` 四方のブロックごとに平均し、
+    ブロックの半分以上がマスク内ならそのブロックをマスク内とする。
+    元画像を読み直さずに済むよう、中心化テンプレートとマスクから作る。
+    """
+    if factor < 1:
+        raise ValueError("factor は 1 以上である必要があります")
+    downsampled: list[TemplateGroup] = []
+    for group in groups:
+        height, width = group.shape
+        small = (height // factor, width // factor)
+        if min(small) < 1:
+            raise ValueError("縮小後のテンプレートが空になります")
+        kernels = group.kernels.astype(np.float64).reshape(
+            group.count, 2, height, width
+        )
+        centered = _block_sum(kernels[:, 0], factor)
+        weights = _block_sum(kernels[:, 1], factor)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pixels = np.where(weights > 0, centered / weights, 0.0)
+        downsampled.append(
+            _pack_group(
+                small,
+                pixels.reshape(group.count, -1),
+                (weights >= factor * factor / 2)
+                .reshape(group.count, -1)
+                .astype(np.float64),
+            )
+        )
+    return downsampled
+
+
+def _pack_group(
+    shape: tuple[int, int], pixels: np.ndarray, weights: np.ndarray
+) -> TemplateGroup:
+    """(件数, 画素数) のテンプレートと 0/1 の重みから照合用の配列を作る。"""
+    counts = weights.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(
+            counts > 0, (pixels * weights).sum(axis=1) / counts, 0.0
+        )
+    centered = (pixels - means[:, None]) * weights
+    return TemplateGroup(
+        shape=shape,
+        kernels=np.stack([centered, weights], axis=1).astype(np.float32),
+        counts=counts.astype(np.float32),
+        norms=(centered * centered).sum(axis=1).astype(np.float32),
+    )
+
+
+def _block_sum(images: np.ndarray, factor: int) -> np.ndarray:
+    """(..., 高さ, 幅) の画像を ``factor`` 四方のブロックごとに合計する。
+
+    割り切れない端の画素は捨てる。
+    """
+    height = images.shape[-2] // factor
+    width = images.shape[-1] // factor
+    trimmed = images[..., : height * factor, : width * factor]
+    return trimmed.reshape(
+        *images.shape[:-2], height, factor, width, factor
+    ).sum(axis=(-3, -1))
+
+
+class BatchTemplateScorer:
+    """多数のテンプレートを 1 回の行列積でクエリ画像と照合する。
+
+    マスク付き ``TM_CCOEFF_NORMED`` を ``cv2.matchTemplate`` と同じ式で求める。
+    クエリの各ずらし位置の窓を行に並べた行列と、テンプレート・マスクを
+    並べた行列の積から、相関とマスク内の画素和・二乗和をまとめて計算する。
+    マスクは ``cv2.matchTemplate`` の 8bit マスクと同様に非 0 を 1 とみなす。
+    スコアは応答の上位 ``response_top_k`` 件の平均で、有効な応答がなければ -1。
+    """
+
+    def __init__(
+        self,
+        groups: Sequence[TemplateGroup],
+        locations: Sequence[tuple[int, int]],
+        *,
+        response_top_k: int = 1,
+        scale: int = 1,
+        levels: Mapping[int, Sequence[TemplateGroup]] | None = None,
+    ) -> None:
+        """
+        Args:
+            groups: サイズごとに束ねたテンプレート
+            locations: 通し番号ごとの (グループ番号, グループ内の行番号)
+            response_top_k: 応答の集約点数
+            scale: テンプレートの縮小率。クエリも同じ率で縮小して照合する
+            levels: 縮小率ごとの前計算済みの縮小グループ (``groups`` と
+                同じ並び)。``downsampled`` で計算し直さずに使う
+        """
+        if response_top_k < 1:
+            raise ValueError("response_top_k は 1 以上である必要があります")
+        if scale < 1:
+            raise ValueError("scale は 1 以上である必要があります")
+        self._groups = list(groups)
+        self._locations = list(locations)
+        self._size = len(self._locations)
+        self._response_top_k = response_top_k
+        self._scale = scale
+        self._levels = dict(levels or {})
+
+    @classmethod
+    def from_templates(
+        cls,
+        templates: Sequence[np.ndarray],
+        masks: Sequence[np.ndarray | None],
+        *,
+        response_top_k: int = 1,
+    ) -> BatchTemplateScorer:
+        """グレースケールのテンプレートとマスクから作る。"""
+        groups, locations = build_template_groups(templates, masks)
+        return cls(groups, locations, response_top_k=response_top_k)
+
+    def downsampled(
+        self, factor: int, *, response_top_k: int = 1
+    ) -> BatchTemplateScorer:
+        """同じ通し番号で照合する、解像度を ``factor`` 分の 1 にした照合器を返す。
+
+        候補の絞り込み用の粗い照合に使う。前計算済みの縮小グループが
+        あればそれを (メモリマップされていれば共有したまま) 使う。
+        """
+        groups = self._levels.get(factor)
+        if groups is None:
+            groups = downsample_template_groups(self._groups, factor)
+        return BatchTemplateScorer(
+            groups,
+            self._locations,
+            response_top_k=response_top_k,
+            scale=self._scale * factor,
+        )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def score(
+        self,
+        query_gray: np.ndarray,
+        indices: Sequence[int] | None = None,
+        *,
+        cancel_check: Callable[[], bool] | None = None,
+    ) -> np.ndarray:
+        """クエリ画像に対する各テンプレートのスコアを返す。
+
+        Args:
+            query_gray: 照合対象のグレースケール画像 (テンプレート以上のサイズ)
+            indices: 照合するテンプレートの通し番号 (``None`` は全件)
+            cancel_check: 中断判定。True を返すと ``CancelledError`` を送出する
+
+        Returns:
+            ``indices`` の順に並んだスコア配列
+        """
+        targets = (
+            np.arange(self._size)
+            if indices is None
+            else np.asarray(indices, dtype=np.intp)
+        )
+        scores = np.full(len(targets), -1.0, dtype=np.float64)
+        if len(targets) == 0:
+            return scores
+
+        rows_by_group: dict[int, tuple[list[int], list[int]]] = {}
+        for position, index in enumerate(targets):
+            group_index, row = self._locations[int(index)]
+            positions, rows = rows_by_group.setdefault(group_index, ([], []))
+            positions.append(position)
+            rows.append(row)
+
+        query = query_gray.astype(np.float32)
+        if self._scale > 1:
+            query = _block_sum(query, self._scale) / (self._scale**2)
+        # 窓内の平均を引くため、全体の平均を引いても結果は変わらない。
+        # 値を 0 付近に寄せて二乗和の桁落ちを抑える。
+        query -= float(query.mean())
+        for group_index, (positions, rows) in rows_by_group.items():
+            if cancel_check is not None and cancel_check():
+                raise asyncio.CancelledError("template scoring cancelled")
+            scores[positions] = self._score_group(
+                self._groups[group_index], query, rows
+            )
+        if cancel_check is not None and cancel_check():
+            raise asyncio.CancelledError("template scoring cancelled")
+        return scores
+
+    def _score_group(
+        self, group: TemplateGroup, query: np.ndarray, rows: list[int]
+    ) -> np.ndarray:
+        height, width = group.shape
+        if query.shape[0] < height or query.shape[1] < width:
+            raise ValueError(
+                "クエリ画像がテンプレートより小さいため照合できません"
+            )
+        windows = np.lib.stride_tricks.sliding_window_view(
+            query, (height, width)
+        ).reshape(-1, height * width)
+        if rows == list(range(group.count)):
+            kernels, counts, norms = group.kernels, group.counts, group.norms
+        else:
+            kernels = group.kernels[rows]
+            counts = group.counts[rows]
+            norms = group.norms[rows]
+
+        count = len(rows)
+        flat_kernels = kernels.reshape(count * 2, height * width)
+        products = (windows @ flat_kernels.T).reshape(-1, count, 2)
+        numerators = products[:, :, 0]
+        sums = products[:, :, 1]
+        square_sums = (windows * windows) @ kernels[:, 1, :].T
+        variances = square_sums - sums * sums / counts
+        denominators = variances * norms
+        with np.errstate(divide="ignore", invalid="ignore"):
+            responses = numerators / np.sqrt(denominators)
+        responses[~(denominators > 0)] = np.nan
+        return self._aggregate(responses)
+
+    def _aggregate(self, responses: np.ndarray) -> np.ndarray:
+        """ずらし位置方向 (axis 0) に応答を集約する。"""
+        finite = np.isfinite(responses)
+        valid = finite.any(axis=0)
+        masked = np.where(finite, responses, -np.inf)
+        if self._response_top_k == 1:
+            aggregated = masked.max(axis=0)
+        else:
+            ordered = -np.sort(-masked, axis=0)
+            top_k = np.minimum(self._response_top_k, finite.sum(axis=0))
+            aggregated = np.empty(responses.shape[1], dtype=np.float64)
+            for column, k in enumerate(top_k):
+                aggregated[column] = (
+                    ordered[: int(k), column].mean() if k > 0 else -1.0
+                )
+        return np.where(valid, aggregated, -1.0)
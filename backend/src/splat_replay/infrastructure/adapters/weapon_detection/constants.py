@@ -109,6 +109,11 @@ LOW_SIGNAL_TEAM_EDGE_RATIO_MAX: Final[float] = 0.001
 # テンプレートマッチ応答の集約点数。1 は従来どおり最大値のみを使う。
 TEMPLATE_RESPONSE_TOP_K: Final[int] = 1
 
+# 粗い照合 (縮小テンプレート) で候補を絞り込んでから原寸で照合する。
+# 候補ブキ数がこの件数以下なら絞り込まない。
+WEAPON_COARSE_CANDIDATE_TOP_K: Final[int] = 24
+WEAPON_COARSE_SCALE: Final[int] = 2
+
 OUTLINE_MODEL_VOTE_RATIO: Final[float] = 0.35
 OUTLINE_MODEL_MAX_SHIFT: Final[int] = 20
 OUTLINE_ALIGN_FAST_MAX_SHIFT: Final[int] = 8
@@ -128,6 +133,9 @@ LABELING_VARIANT_MANIFEST_RELATIVE_PATH: Final[Path] = Path(
     "matching/weapon/generated_labeling_variants/manifest.json"
 )
 LABELING_VARIANT_RERANK_TOP_WEAPONS: Final[int] = 5
+WEAPON_TEMPLATE_BANK_RELATIVE_PATH: Final[Path] = Path(
+    "matching/weapon/template_bank.bin"
+)
 
 PREDICT_WEAPONS_OUTPUT_DIR: Final[Path] = (
     RUNTIME_ROOT / "outputs" / "predict_weapons"
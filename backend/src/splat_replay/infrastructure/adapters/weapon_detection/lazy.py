@@ -0,0 +1,62 @@
+"""初回利用まで構築を遅らせるブキ判別アダプタ。"""
+
+from __future__ import annotations
+
+from splat_replay.application.interfaces import (
+    WeaponDisplayDetectionResult,
+    WeaponRecognitionPort,
+    WeaponRecognitionResult,
+    WeaponSlotResult,
+)
+from splat_replay.domain.models import Frame
+from splat_replay.infrastructure.runtime.startup import LazyComponent
+
+
+class LazyWeaponRecognitionAdapter(
+    LazyComponent[WeaponRecognitionPort], WeaponRecognitionPort
+):
+    """初回利用時に factory でブキ判別アダプタを構築する。
+
+    数百枚のテンプレート読み込みを起動処理から外すためのラッパー。
+    起動後は warm_up() でバックグラウンドから構築しておく。
+    """
+
+    def request_cancel(self) -> None:
+        # 未構築なら進行中の判別処理も無い
+        instance = self._instance
+        if instance is not None:
+            instance.request_cancel()
+
+    async def detect_weapon_display(self, frame: Frame) -> bool:
+        return await (await self._aget()).detect_weapon_display(frame)
+
+    async def detect_weapon_display_details(
+        self, frame: Frame
+    ) -> WeaponDisplayDetectionResult:
+        return await (await self._aget()).detect_weapon_display_details(frame)
+
+    async def recognize_weapons(
+        self,
+        frame: Frame,
+        save_predict_weapons_output: bool = True,
+        target_slots: set[str] | None = None,
+        previous_results: dict[str, WeaponSlotResult] | None = None,
+        battle_dir_name: str | None = None,
+    ) -> WeaponRecognitionResult:
+        return await (await self._aget()).recognize_weapons(
+            frame,
+            save_predict_weapons_output=save_predict_weapons_output,
+            target_slots=target_slots,
+            previous_results=previous_results,
+            battle_dir_name=battle_dir_name,
+        )
+
+    async def save_predict_weapons_output(
+        self,
+        frame: Frame,
+        slot_results: tuple[WeaponSlotResult, ...],
+        battle_dir_name: str | None = None,
+    ) -> str | None:
+        return await (await self._aget()).save_predict_weapons_output(
+            frame, slot_results, battle_dir_name=battle_dir_name
+        )
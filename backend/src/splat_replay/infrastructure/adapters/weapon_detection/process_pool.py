@@ -0,0 +1,351 @@
+"""ブキ判別のプロセスプール実行。
+
+スロットごとの判別をワーカープロセスへ分散し、録画プロセスの GIL を
+判別処理で占有しないようにする。各ワーカーは起動時に判別器
+(テンプレートバンクのメモリマップを含む) を 1 度だけ構築して常駐させ、
+フレームは共有メモリ経由で受け渡してピクルしない。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+import traceback
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.sharedctypes import Synchronized
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+from splat_replay.application.interfaces import LoggerPort
+from splat_replay.domain.config import ImageMatchingSettings
+from splat_replay.domain.models import Frame
+from splat_replay.infrastructure.filesystem import ASSETS_DIR
+
+from . import constants
+from .recognizer import SlotPrediction, WeaponRecognitionAdapter
+
+# (レベル, イベント名, 付加情報)
+_LogRecord = tuple[str, str, dict[str, object]]
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """共有メモリ上のフレームの位置。ワーカーへはこれだけを渡す。"""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedFrame:
+    """フレームを共有メモリへ 1 回だけコピーし、使用後に解放する。"""
+
+    def __init__(self, frame: np.ndarray) -> None:
+        self._shm = SharedMemory(create=True, size=max(frame.nbytes, 1))
+        view = np.ndarray(frame.shape, dtype=frame.dtype, buffer=self._shm.buf)
+        view[...] = frame
+        # close() 前に共有メモリへの参照を手放す
+        del view
+        self.handle = SharedFrameHandle(
+            name=self._shm.name,
+            shape=tuple(frame.shape),
+            dtype=frame.dtype.str,
+        )
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def close_when_done(self, futures: Sequence[Future[Any]]) -> None:
+        """``futures`` がすべて終わってから解放する。
+
+        中断された場合も、実行中のワーカーが共有メモリを読み終える前に
+        解放しないようにする。
+        """
+        pending = [future for future in futures if not future.done()]
+        if not pending:
+            self.close()
+            return
+        lock = threading.Lock()
+        remaining = len(pending)
+
+        def _on_done(_: Future[Any]) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                last = remaining == 0
+            if last:
+                self.close()
+
+        for future in pending:
+            future.add_done_callback(_on_done)
+
+    def __enter__(self) -> SharedFrame:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def read_shared_region(
+    handle: SharedFrameHandle, box: tuple[int, int, int, int]
+) -> np.ndarray:
+    """共有メモリ上のフレームから ``box`` (x1, y1, x2, y2) を複製して返す。"""
+    x1, y1, x2, y2 = box
+    shm = SharedMemory(name=handle.name, track=False)
+    try:
+        frame = np.ndarray(
+            handle.shape, dtype=np.dtype(handle.dtype), buffer=shm.buf
+        )
+        region = frame[y1:y2, x1:x2].copy()
+        del frame
+        return region
+    finally:
+        shm.close()
+
+
+class _SharedCancelAdapter(WeaponRecognitionAdapter):
+    """プロセス間で共有するカウンタで中断を判定する判別器。"""
+
+    def __init__(
+        self,
+        settings: ImageMatchingSettings,
+        logger: LoggerPort,
+        assets_dir: Path,
+        cancel_counter: Synchronized[int],
+    ) -> None:
+        self._cancel_counter = cancel_counter
+        super().__init__(settings, logger, assets_dir)
+
+    def request_cancel(self) -> None:
+        with self._cancel_counter.get_lock():
+            self._cancel_counter.value += 1
+
+    def _capture_cancel_generation(self) -> int:
+        return int(self._cancel_counter.value)
+
+    def _is_cancelled(self, cancel_generation: int) -> bool:
+        return int(self._cancel_counter.value) != cancel_generation
+
+
+class _RecordingLogger:
+    """ワーカー内のログを記録し、呼び出し元プロセスで出力し直せるようにする。"""
+
+    def __init__(self) -> None:
+        self._records: list[_LogRecord] = []
+
+    def debug(self, event: str, **kw: object) -> None:
+        self._records.append(("debug", event, kw))
+
+    def info(self, event: str, **kw: object) -> None:
+        self._records.append(("info", event, kw))
+
+    def warning(self, event: str, **kw: object) -> None:
+        self._records.append(("warning", event, kw))
+
+    def error(self, event: str, **kw: object) -> None:
+        self._records.append(("error", event, kw))
+
+    def exception(self, event: str, **kw: object) -> None:
+        # 呼び出し元では例外を処理中ではないため、スタックトレースを
+        # 文字列にして error として出力し直す
+        self._records.append(
+            ("error", event, {**kw, "traceback": traceback.format_exc()})
+        )
+
+    def drain(self) -> list[_LogRecord]:
+        records, self._records = self._records, []
+        return records
+
+
+@dataclass
+class _WorkerState:
+    recognizer: _SharedCancelAdapter
+    logger: _RecordingLogger
+
+
+_worker_state: _WorkerState | None = None
+
+
+def _initialize_worker(
+    settings: ImageMatchingSettings,
+    assets_dir: Path,
+    cancel_counter: Synchronized[int],
+) -> None:
+    global _worker_state
+    logger = _RecordingLogger()
+    _worker_state = _WorkerState(
+        recognizer=_SharedCancelAdapter(
+            settings, logger, assets_dir, cancel_counter
+        ),
+        logger=logger,
+    )
+
+
+def _start_worker() -> None:
+    """ワーカーの起動 (初期化処理の実行) だけを目的とした空のタスク。"""
+
+
+def _recognize_slot_in_worker(
+    handle: SharedFrameHandle, slot: str, cancel_generation: int
+) -> tuple[SlotPrediction, list[_LogRecord]]:
+    state = _worker_state
+    if state is None:
+        raise RuntimeError("ブキ判別ワーカーが初期化されていません")
+    slot_image = read_shared_region(handle, constants.SLOT_BOXES[slot])
+    try:
+        prediction = asyncio.run(
+            state.recognizer._recognize_slot(
+                slot=slot,
+                slot_image=slot_image,
+                cancel_generation=cancel_generation,
+            )
+        )
+    finally:
+        records = state.logger.drain()
+    return prediction, records
+
+
+class ProcessPoolWeaponRecognitionAdapter(_SharedCancelAdapter):
+    """スロットの判別をワーカープロセスで並列に行うブキ判別アダプタ。
+
+    ブキ表示判定と predict_weapons 出力は呼び出し元プロセスで行う。
+    ワーカープロセスは生成時に起動を始め、異常終了した場合はその回だけ
+    呼び出し元プロセスで判別して、次回の判別でプールを作り直す。
+    """
+
+    def __init__(
+        self,
+        settings: ImageMatchingSettings,
+        logger: LoggerPort,
+        assets_dir: Path = ASSETS_DIR,
+        *,
+        workers: int,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers は 1 以上である必要があります")
+        self._context = multiprocessing.get_context("spawn")
+        super().__init__(
+            settings, logger, assets_dir, self._context.Value("q", 0)
+        )
+        self._workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+        self._ensure_pool()
+
+    def close(self) -> None:
+        """ワーカープロセスを停止する。"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=self._context,
+                initializer=_initialize_worker,
+                initargs=(
+                    self._settings,
+                    self._assets_dir,
+                    self._cancel_counter,
+                ),
+            )
+            # spawn ではワーカーは初回投入時に起動するため、
+            # 最初の判別を待たせないよう先に起動しておく
+            self._pool.submit(_start_worker)
+        return self._pool
+
+    async def _predict_slots(
+        self,
+        *,
+        frame: Frame,
+        slot_images: dict[str, np.ndarray],
+        slots: list[str],
+        cancel_generation: int,
+    ) -> dict[str, SlotPrediction]:
+        if not slots:
+            return {}
+        self._ensure_not_cancelled(cancel_generation)
+        try:
+            outcomes = await self._run_in_workers(
+                frame=frame, slots=slots, cancel_generation=cancel_generation
+            )
+            self._ensure_not_cancelled(cancel_generation)
+            broken = next(
+                (
+                    outcome
+                    for outcome in outcomes
+                    if isinstance(outcome, BrokenProcessPool)
+                ),
+                None,
+            )
+            if broken is not None:
+                raise broken
+        except BrokenProcessPool as exc:
+            self._logger.error(
+                "ブキ判別ワーカーが異常終了したため呼び出し元で判別します",
+                error=str(exc),
+            )
+            self._discard_pool()
+            return await super()._predict_slots(
+                frame=frame,
+                slot_images=slot_images,
+                slots=slots,
+                cancel_generation=cancel_generation,
+            )
+
+        predicted: dict[str, SlotPrediction] = {}
+        for slot, outcome in zip(slots, outcomes):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            prediction, records = outcome
+            for level, event, kw in records:
+                getattr(self._logger, level)(event, **kw)
+            predicted[slot] = prediction
+        return predicted
+
+    async def _run_in_workers(
+        self, *, frame: Frame, slots: list[str], cancel_generation: int
+    ) -> list[tuple[SlotPrediction, list[_LogRecord]] | BaseException]:
+        pool = self._ensure_pool()
+        shared = SharedFrame(frame)
+        futures: list[Future[tuple[SlotPrediction, list[_LogRecord]]]] = []
+        try:
+            for slot in slots:
+                futures.append(
+                    pool.submit(
+                        _recognize_slot_in_worker,
+                        shared.handle,
+                        slot,
+                        cancel_generation,
+                    )
+                )
+            return await asyncio.gather(
+                *(asyncio.wrap_future(future) for future in futures),
+                return_exceptions=True,
+            )
+        except asyncio.CancelledError:
+            # 未着手のスロットは取り消し、実行中のワーカーにも中断を伝える
+            for future in futures:
+                future.cancel()
+            self.request_cancel()
+            raise
+        finally:
+            shared.close_when_done(futures)
+
+    def _discard_pool(self) -> None:
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -7,7 +7,7 @@ import threading
 from dataclasses import dataclass
 from functools import cmp_to_key
 from pathlib import Path
-from typing import cast
+from typing import Callable, cast
 
 import cv2
 import numpy as np
@@ -29,10 +29,12 @@ from . import (
     labeling_variant_bank,
     outline_models,
     predict_weapons_output,
+    template_bank,
 )
+from .batch_scorer import BatchTemplateScorer
 from .query_builder import (
     QuerySlotData,
-    build_padded_gray_by_slot,
+    build_padded_gray,
     build_query_slot_data,
     crop_slot_images,
 )
@@ -46,9 +48,15 @@ def _to_four_tuple(items: list[str]) -> tuple[str, str, str, str]:
     return (items[0], items[1], items[2], items[3])
 
 
+# 1 スロット分の判別結果と predict_weapons 出力用の候補
+SlotPrediction = tuple[
+    WeaponSlotResult,
+    tuple[predict_weapons_output.SlotDebugCandidate, ...],
+]
+
+
 @dataclass(frozen=True)
 class _TemplateSource:
-    matcher: TemplateMatcher
     template_path: Path
     mask_path: Path
     threshold: float
@@ -93,6 +101,13 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
         self._labeling_variant_sources_by_weapon = (
             self._load_labeling_variant_sources()
         )
+        self._template_scorer, self._template_source_indices = (
+            self._build_template_scorer()
+        )
+        self._coarse_template_scorer = self._template_scorer.downsampled(
+            constants.WEAPON_COARSE_SCALE,
+            response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
+        )
         self._matching_assets_dir = self._resolve_matching_assets_dir()
         self._outline_model_masks: dict[str, np.ndarray] | None = None
         self._cancel_lock = threading.Lock()
@@ -606,9 +621,6 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
             )
 
         slot_images = crop_slot_images(frame)
-        query_padded_gray_by_slot = build_padded_gray_by_slot(
-            slot_images=slot_images,
-        )
         should_save_output = (
             save_predict_weapons_output
             and predict_weapons_output.should_save_predict_weapons_output()
@@ -630,6 +642,7 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
         slot_debug_candidates_by_slot: dict[
             str, tuple[predict_weapons_output.SlotDebugCandidate, ...]
         ] = {}
+        predict_slots: list[str] = []
         for slot in constants.SLOT_ORDER:
             self._ensure_not_cancelled(cancel_generation)
             # target_slotsに含まれないスロットは既存結果を使用（再判別しない）
@@ -659,18 +672,21 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
                         slot_debug_candidates_by_slot[slot] = ()
                 continue
             # target_slotsに含まれるスロットのみ再判別
-            slot_signal_metrics = self._compute_slot_signal_metrics(
-                slot_image=slot_images[slot]
-            )
-            slot_result, slot_debug_candidates = await self._predict_slot(
-                slot=slot,
-                query_padded_gray=query_padded_gray_by_slot[slot],
-                cancel_generation=cancel_generation,
-                slot_signal_metrics=slot_signal_metrics,
-            )
+            predict_slots.append(slot)
+
+        predicted = await self._predict_slots(
+            frame=frame,
+            slot_images=slot_images,
+            slots=predict_slots,
+            cancel_generation=cancel_generation,
+        )
+        for slot, (slot_result, slot_debug_candidates) in predicted.items():
             slot_results[slot] = slot_result
             if should_save_output:
                 slot_debug_candidates_by_slot[slot] = slot_debug_candidates
+        slot_results = {
+            slot: slot_results[slot] for slot in constants.SLOT_ORDER
+        }
 
         allies = _to_four_tuple(
             [
@@ -789,6 +805,43 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
             for candidate in slot_result.top_candidates
         )
 
+    async def _predict_slots(
+        self,
+        *,
+        frame: Frame,
+        slot_images: dict[str, np.ndarray],
+        slots: list[str],
+        cancel_generation: int,
+    ) -> dict[str, SlotPrediction]:
+        """指定スロットを順に判別する。別の実行方式はこのメソッドを置き換える。"""
+        _ = frame
+        predicted: dict[str, SlotPrediction] = {}
+        for slot in slots:
+            self._ensure_not_cancelled(cancel_generation)
+            predicted[slot] = await self._recognize_slot(
+                slot=slot,
+                slot_image=slot_images[slot],
+                cancel_generation=cancel_generation,
+            )
+        return predicted
+
+    async def _recognize_slot(
+        self,
+        *,
+        slot: str,
+        slot_image: np.ndarray,
+        cancel_generation: int,
+    ) -> SlotPrediction:
+        """1 スロットの切り出し画像からブキを判別する。"""
+        return await self._predict_slot(
+            slot=slot,
+            query_padded_gray=build_padded_gray(slot_image),
+            cancel_generation=cancel_generation,
+            slot_signal_metrics=self._compute_slot_signal_metrics(
+                slot_image=slot_image
+            ),
+        )
+
     async def _predict_slot(
         self,
         *,
@@ -1609,37 +1662,48 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
         cancel_generation: int,
         template_sources_by_weapon: dict[str, tuple[_TemplateSource, ...]],
     ) -> list[_RankedCandidate]:
-        query_padded_bgr = cv2.cvtColor(query_padded_gray, cv2.COLOR_GRAY2BGR)
-        candidates: list[_RankedCandidate] = []
+        self._ensure_not_cancelled(cancel_generation)
 
         def cancel_check() -> bool:
             return self._is_cancelled(cancel_generation)
 
+        if (
+            len(template_sources_by_weapon)
+            > constants.WEAPON_COARSE_CANDIDATE_TOP_K
+        ):
+            template_sources_by_weapon = await self._prune_weapon_candidates(
+                query_padded_gray=query_padded_gray,
+                template_sources_by_weapon=template_sources_by_weapon,
+                cancel_check=cancel_check,
+            )
+            self._ensure_not_cancelled(cancel_generation)
+
+        # 対象の全テンプレートを 1 回のワーカー呼び出しでまとめて照合する
+        indices = [
+            self._template_source_indices[source]
+            for template_sources in template_sources_by_weapon.values()
+            for source in template_sources
+        ]
+        score_vector = await asyncio.to_thread(
+            self._template_scorer.score,
+            query_padded_gray,
+            indices,
+            cancel_check=cancel_check,
+        )
+        self._ensure_not_cancelled(cancel_generation)
+
+        candidates: list[_RankedCandidate] = []
+        offset = 0
         for (
             weapon,
             template_sources,
         ) in template_sources_by_weapon.items():
-            self._ensure_not_cancelled(cancel_generation)
-            score_tasks = [
-                asyncio.create_task(
-                    source.matcher.score(
-                        query_padded_bgr,
-                        cancel_check=cancel_check,
-                    )
-                )
-                for source in template_sources
-            ]
-            try:
-                scores = await asyncio.gather(*score_tasks)
-            except BaseException:
-                for task in score_tasks:
-                    task.cancel()
-                await asyncio.gather(*score_tasks, return_exceptions=True)
-                raise
-            self._ensure_not_cancelled(cancel_generation)
+            scores = score_vector[offset : offset + len(template_sources)]
+            offset += len(template_sources)
             best_score = -1.0
             best_source: _TemplateSource | None = None
-            for source, score in zip(template_sources, scores):
+            for source, raw_score in zip(template_sources, scores):
+                score = float(raw_score)
                 if score > best_score + constants.SCORE_TIE_EPSILON:
                     best_score = score
                     best_source = source
@@ -1673,6 +1737,63 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
 
         return sorted(candidates, key=cmp_to_key(_compare))
 
+    async def _prune_weapon_candidates(
+        self,
+        *,
+        query_padded_gray: np.ndarray,
+        template_sources_by_weapon: dict[str, tuple[_TemplateSource, ...]],
+        cancel_check: Callable[[], bool],
+    ) -> dict[str, tuple[_TemplateSource, ...]]:
+        """縮小テンプレートでの粗い照合で上位のブキだけに絞り込む。
+
+        最終的な採否はしきい値で補正した信頼度で決まり、上位候補の表示は
+        スコア順のため、粗いスコアと粗い信頼度それぞれの上位を残す。
+        絞り込み後も元の辞書の順序を保つ。
+        """
+        indices = [
+            self._template_source_indices[source]
+            for template_sources in template_sources_by_weapon.values()
+            for source in template_sources
+        ]
+        coarse_scores = await asyncio.to_thread(
+            self._coarse_template_scorer.score,
+            query_padded_gray,
+            indices,
+            cancel_check=cancel_check,
+        )
+        thresholds = np.asarray(
+            [
+                source.threshold
+                for template_sources in template_sources_by_weapon.values()
+                for source in template_sources
+            ]
+        )
+        coarse_confidences = (
+            coarse_scores
+            - constants.CANDIDATE_CONFIDENCE_THRESHOLD_WEIGHT * thresholds
+        )
+        starts = np.cumsum(
+            [0]
+            + [
+                len(template_sources)
+                for template_sources in template_sources_by_weapon.values()
+            ][:-1]
+        )
+        best_scores = np.maximum.reduceat(coarse_scores, starts)
+        best_confidences = np.maximum.reduceat(coarse_confidences, starts)
+        top_k = constants.WEAPON_COARSE_CANDIDATE_TOP_K
+        kept = set(np.argsort(-best_scores, kind="stable")[:top_k].tolist())
+        kept.update(
+            np.argsort(-best_confidences, kind="stable")[:top_k].tolist()
+        )
+        return {
+            weapon: template_sources
+            for position, (weapon, template_sources) in enumerate(
+                template_sources_by_weapon.items()
+            )
+            if position in kept
+        }
+
     def _serialize_candidates_for_log(
         self, candidates: list[_RankedCandidate]
     ) -> list[dict[str, object]]:
@@ -1787,6 +1908,94 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
             if sources
         }
 
+    def write_template_bank(self, path: Path | None = None) -> int:
+        """全テンプレートを前計算したバンクファイルを書き出す。
+
+        Returns:
+            書き出したテンプレート数
+        """
+        bank_path = path or self._template_bank_path()
+        sources = list(self._template_source_indices)
+        matchers = [self._decode_template_source(source) for source in sources]
+        template_bank.write_template_bank(
+            bank_path,
+            [
+                template_bank.TemplateBankEntry(
+                    template_path=source.template_path,
+                    mask_path=source.mask_path,
+                )
+                for source in sources
+            ],
+            [matcher.template for matcher in matchers],
+            [matcher.mask for matcher in matchers],
+            assets_dir=self._assets_dir,
+            coarse_factors=(constants.WEAPON_COARSE_SCALE,),
+        )
+        return len(sources)
+
+    def _scored_template_sources(
+        self,
+    ) -> tuple[dict[str, tuple[_TemplateSource, ...]], ...]:
+        return (
+            self._template_sources_with_variant_by_weapon,
+            self._labeling_variant_sources_by_weapon,
+        )
+
+    def _template_bank_path(self) -> Path:
+        return self._assets_dir / constants.WEAPON_TEMPLATE_BANK_RELATIVE_PATH
+
+    def _build_template_scorer(
+        self,
+    ) -> tuple[BatchTemplateScorer, dict[_TemplateSource, int]]:
+        """全テンプレート (variant・ラベリング追加分を含む) の一括照合器を作る。
+
+        前計算済みのバンクファイルがあればメモリマップして使い、
+        無い・古い場合は PNG をデコードして作る。
+        """
+        indices: dict[_TemplateSource, int] = {}
+        for sources_by_weapon in self._scored_template_sources():
+            for sources in sources_by_weapon.values():
+                for source in sources:
+                    indices.setdefault(source, len(indices))
+
+        bank_path = self._template_bank_path()
+        if bank_path.is_file():
+            try:
+                scorer = template_bank.load_template_bank(
+                    bank_path,
+                    [
+                        (source.template_path, source.mask_path)
+                        for source in indices
+                    ],
+                    assets_dir=self._assets_dir,
+                    response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
+                )
+                return scorer, indices
+            except template_bank.TemplateBankError as exc:
+                self._logger.warning(
+                    "ブキテンプレートバンクを使用できないため画像から読み込みます",
+                    bank_path=str(bank_path),
+                    error=str(exc),
+                )
+
+        matchers = [self._decode_template_source(source) for source in indices]
+        scorer = BatchTemplateScorer.from_templates(
+            [matcher.template for matcher in matchers],
+            [matcher.mask for matcher in matchers],
+            response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
+        )
+        return scorer, indices
+
+    def _decode_template_source(
+        self, source: _TemplateSource
+    ) -> TemplateMatcher:
+        return TemplateMatcher(
+            template_path=source.template_path,
+            mask_path=source.mask_path,
+            threshold=source.threshold,
+            response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
+        )
+
     def _is_variant_template_source(self, cfg: MatcherConfig) -> bool:
         if not cfg.template_path:
             return False
@@ -1824,14 +2033,7 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
         mask_path = _resolve_asset_path(
             cfg.mask_path, assets_dir=self._assets_dir
         )
-        matcher = TemplateMatcher(
-            template_path=template_path,
-            mask_path=mask_path,
-            threshold=cfg.threshold,
-            response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
-        )
         return _TemplateSource(
-            matcher=matcher,
             template_path=template_path,
             mask_path=mask_path,
             threshold=cfg.threshold,
@@ -1857,14 +2059,7 @@ class WeaponRecognitionAdapter(WeaponRecognitionPort):
             or not resolved_mask_path.is_file()
         ):
             return None
-        matcher = TemplateMatcher(
-            template_path=resolved_template_path,
-            mask_path=resolved_mask_path,
-            threshold=threshold,
-            response_top_k=constants.TEMPLATE_RESPONSE_TOP_K,
-        )
         return _TemplateSource(
-            matcher=matcher,
             template_path=resolved_template_path,
             mask_path=resolved_mask_path,
             threshold=threshold,
@@ -0,0 +1,300 @@
+"""ブキテンプレートを前計算して 1 ファイルにまとめたバンクを扱う。
+
+バンクは次の構成のバイナリファイルで、照合用の配列はメモリマップで
+読み込むため、起動時に PNG をデコードせずに済み、複数プロセスからも
+同じページキャッシュを共有できる。
+
+- 先頭 16 バイト: マジック (8 バイト)、バージョン (uint32 LE)、ヘッダ長 (uint32 LE)
+- JSON ヘッダ: 各テンプレートの元画像のパス・サイズ・更新時刻・ハッシュ、
+  サイズごとのグループと配列のオフセット、縮小率ごとの縮小グループ
+- 64 バイト境界に揃えた配列データ (float32 LE)
+
+元画像の変更はサイズと更新時刻で判定し、更新時刻だけが異なる場合
+(チェックアウトし直した場合など) に限って内容のハッシュを比較する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from .batch_scorer import (
+    BatchTemplateScorer,
+    TemplateGroup,
+    build_template_groups,
+    downsample_template_groups,
+)
+
+BANK_MAGIC = b"SRWTBANK"
+BANK_VERSION = 2
+_PREAMBLE_SIZE = 16
+_ALIGNMENT = 64
+_FLOAT = np.dtype("<f4")
+
+
+class TemplateBankError(RuntimeError):
+    """バンクファイルが読めない、または現在のテンプレートと一致しない。"""
+
+
+@dataclass(frozen=True)
+class TemplateBankEntry:
+    """バンクに格納する 1 テンプレート分の定義。"""
+
+    template_path: Path
+    mask_path: Path
+
+
+def write_template_bank(
+    path: Path,
+    entries: Sequence[TemplateBankEntry],
+    templates: Sequence[np.ndarray],
+    masks: Sequence[np.ndarray | None],
+    *,
+    assets_dir: Path,
+    coarse_factors: Sequence[int] = (),
+) -> None:
+    """グレースケールのテンプレートとマスクからバンクファイルを書き出す。
+
+    ``coarse_factors`` の各縮小率の縮小グループも前計算して格納する。
+    """
+    if not (len(entries) == len(templates) == len(masks)):
+        raise ValueError("entries・templates・masks の件数が一致しません")
+    groups, locations = build_template_groups(templates, masks)
+    levels = {
+        factor: downsample_template_groups(groups, factor)
+        for factor in coarse_factors
+    }
+
+    digests: dict[Path, dict[str, object]] = {}
+    header_entries = [
+        {
+            "template": _file_record(entry.template_path, assets_dir, digests),
+            "mask": _file_record(entry.mask_path, assets_dir, digests),
+            "group": group_index,
+            "row": row,
+        }
+        for entry, (group_index, row) in zip(entries, locations)
+    ]
+
+    blocks: list[np.ndarray] = []
+    offset = 0
+
+    def _group_records(
+        source: Sequence[TemplateGroup],
+    ) -> list[dict[str, object]]:
+        nonlocal offset
+        records: list[dict[str, object]] = []
+        for group in source:
+            record: dict[str, object] = {
+                "shape": list(group.shape),
+                "count": group.count,
+            }
+            for name in ("kernels", "counts", "norms"):
+                array = np.ascontiguousarray(
+                    getattr(group, name), dtype=_FLOAT
+                )
+                record[name] = offset
+                blocks.append(array)
+                offset = _align(offset + array.nbytes)
+            records.append(record)
+        return records
+
+    header_groups = _group_records(groups)
+    header_levels = {
+        str(factor): _group_records(level) for factor, level in levels.items()
+    }
+
+    header = json.dumps(
+        {
+            "version": BANK_VERSION,
+            "entries": header_entries,
+            "groups": header_groups,
+            "levels": header_levels,
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    data_start = _align(_PREAMBLE_SIZE + len(header))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as fh:
+        fh.write(BANK_MAGIC)
+        fh.write(np.array([BANK_VERSION, len(header)], dtype="<u4").tobytes())
+        fh.write(header)
+        fh.write(b"\0" * (data_start - _PREAMBLE_SIZE - len(header)))
+        position = 0
+        for array in blocks:
+            fh.write(array.tobytes())
+            position += array.nbytes
+            padding = _align(position) - position
+            fh.write(b"\0" * padding)
+            position += padding
+    os.replace(tmp_path, path)
+
+
+def load_template_bank(
+    path: Path,
+    sources: Sequence[tuple[Path, Path]],
+    *,
+    assets_dir: Path,
+    response_top_k: int = 1,
+) -> BatchTemplateScorer:
+    """バンクファイルをメモリマップし、``sources`` の順に照合する照合器を返す。
+
+    Args:
+        path: バンクファイルのパス
+        sources: 照合対象の (テンプレート画像, マスク画像) のパス
+        assets_dir: バンク内の相対パスの基準ディレクトリ
+        response_top_k: 応答の集約点数
+
+    縮小グループもメモリマップのまま照合器に渡すため、``downsampled`` で
+    得る粗い照合器もプロセス間でページキャッシュを共有する。
+
+    Raises:
+        TemplateBankError: ファイルが壊れている、対象のテンプレートが含まれない、
+            または元画像がバンク作成時から変更されている場合
+    """
+    try:
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+    except (OSError, ValueError) as exc:
+        raise TemplateBankError(f"バンクを開けません: {path}") from exc
+    if raw.size < _PREAMBLE_SIZE or bytes(raw[:8]) != BANK_MAGIC:
+        raise TemplateBankError(f"バンクの形式が不正です: {path}")
+    version, header_size = np.frombuffer(
+        bytes(raw[8:_PREAMBLE_SIZE]), dtype="<u4"
+    )
+    if int(version) != BANK_VERSION:
+        raise TemplateBankError(
+            "未対応のバンク version です。"
+            f" expected={BANK_VERSION}, actual={int(version)}"
+        )
+    try:
+        header = json.loads(
+            bytes(raw[_PREAMBLE_SIZE : _PREAMBLE_SIZE + int(header_size)])
+        )
+        data_start = _align(_PREAMBLE_SIZE + int(header_size))
+        groups = [
+            _map_group(raw, data_start, record) for record in header["groups"]
+        ]
+        levels: Mapping[int, list[TemplateGroup]] = {
+            int(factor): [
+                _map_group(raw, data_start, record) for record in records
+            ]
+            for factor, records in header.get("levels", {}).items()
+        }
+        entries = {
+            (entry["template"]["path"], entry["mask"]["path"]): entry
+            for entry in header["entries"]
+        }
+    except (KeyError, TypeError, ValueError) as exc:
+        raise TemplateBankError(f"バンクのヘッダが不正です: {path}") from exc
+
+    verified: dict[Path, bool] = {}
+    locations: list[tuple[int, int]] = []
+    for template_path, mask_path in sources:
+        template_name = _bank_path_name(template_path, assets_dir)
+        entry = entries.get(
+            (template_name, _bank_path_name(mask_path, assets_dir))
+        )
+        if entry is None:
+            raise TemplateBankError(
+                f"バンクに含まれないテンプレートです: {template_name}"
+            )
+        if not (
+            _is_unchanged(template_path, entry["template"], verified)
+            and _is_unchanged(mask_path, entry["mask"], verified)
+        ):
+            raise TemplateBankError(
+                f"バンク作成後にテンプレートが変更されています: {template_name}"
+            )
+        locations.append((int(entry["group"]), int(entry["row"])))
+    return BatchTemplateScorer(
+        groups, locations, response_top_k=response_top_k, levels=levels
+    )
+
+
+def _map_group(
+    raw: np.ndarray, data_start: int, record: dict[str, object]
+) -> TemplateGroup:
+    height, width = (int(value) for value in record["shape"])  # type: ignore[union-attr]
+    count = int(record["count"])  # type: ignore[call-overload]
+
+    def _view(name: str, shape: tuple[int, ...]) -> np.ndarray:
+        start = data_start + int(record[name])  # type: ignore[call-overload]
+        nbytes = int(np.prod(shape)) * _FLOAT.itemsize
+        if start + nbytes > raw.size:
+            raise ValueError(f"{name} がファイル範囲外です")
+        return raw[start : start + nbytes].view(_FLOAT).reshape(shape)
+
+    return TemplateGroup(
+        shape=(height, width),
+        kernels=_view("kernels", (count, 2, height * width)),
+        counts=_view("counts", (count,)),
+        norms=_view("norms", (count,)),
+    )
+
+
+def _file_record(
+    path: Path, assets_dir: Path, cache: dict[Path, dict[str, object]]
+) -> dict[str, object]:
+    """バンク内でのパス表記と、変更検出用のサイズ・更新時刻・ハッシュを返す。"""
+    record = cache.get(path)
+    if record is None:
+        try:
+            stat = path.stat()
+            data = path.read_bytes()
+        except OSError as exc:
+            raise TemplateBankError(
+                f"テンプレート画像を読み込めません: {path}"
+            ) from exc
+        record = {
+            "path": _bank_path_name(path, assets_dir),
+            "size": len(data),
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        cache[path] = record
+    return record
+
+
+def _is_unchanged(
+    path: Path, record: Mapping[str, object], cache: dict[Path, bool]
+) -> bool:
+    """元画像がバンク作成時から変わっていないか判定する。
+
+    サイズと更新時刻が一致すれば読み込まずに一致とみなす。
+    """
+    unchanged = cache.get(path)
+    if unchanged is None:
+        try:
+            stat = path.stat()
+            if stat.st_size != record["size"]:
+                unchanged = False
+            elif stat.st_mtime_ns == record["mtime_ns"]:
+                unchanged = True
+            else:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                unchanged = digest == record["sha256"]
+        except OSError as exc:
+            raise TemplateBankError(
+                f"テンプレート画像を読み込めません: {path}"
+            ) from exc
+        cache[path] = unchanged
+    return unchanged
+
+
+def _bank_path_name(path: Path, assets_dir: Path) -> str:
+    try:
+        return path.relative_to(assets_dir).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -6,6 +6,7 @@ Phase 3 リファクタリング - DI コンテナのメイン設定。
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TypeVar
 
 import punq
@@ -17,6 +18,7 @@ from splat_replay.application.interfaces import (
     FileSystemPort,
     LoggerPort,
     PathsPort,
+    WeaponRecognitionPort,
 )
 from splat_replay.application.services import AutoRecorder
 from splat_replay.application.services.common.queries import AssetQueryService
@@ -29,8 +31,15 @@ from splat_replay.infrastructure.adapters.system.cross_cutting import (
     StructlogLoggerAdapter,
     TomlConfigAdapter,
 )
-from splat_replay.infrastructure.di.adapters import register_adapters
-from splat_replay.infrastructure.di.app_services import register_app_services
+from splat_replay.infrastructure.di.adapters import (
+    register_adapters,
+    register_frame_analysis_adapters,
+    reload_image_matching,
+)
+from splat_replay.infrastructure.di.app_services import (
+    register_app_services,
+    register_offline_analysis,
+)
 from splat_replay.infrastructure.di.config import (
     register_config,
     register_image_matching_settings,
@@ -41,13 +50,20 @@ from splat_replay.infrastructure.di.domain_services import (
 from splat_replay.infrastructure.di.use_cases import register_app_usecases
 from splat_replay.infrastructure.logging import get_logger
 from splat_replay.infrastructure.runtime import AppRuntime
+from splat_replay.infrastructure.runtime.startup import StartupProfile
 
 T = TypeVar("T")
 
 
 def configure_container() -> punq.Container:
-    """アプリで利用する依存関係を登録する。"""
+    """アプリで利用する依存関係を登録する。
+
+    重いアダプターは遅延ラッパーとして登録するだけで、ここでは構築しない。
+    段階ごとの所要時間は登録した StartupProfile に記録する。
+    """
     container = punq.Container()
+    profile = StartupProfile()
+    container.register(StartupProfile, instance=profile)
 
     # Cross-cutting concerns（横断的関心事）の登録
     logger_adapter = StructlogLoggerAdapter()
@@ -73,18 +89,29 @@ def configure_container() -> punq.Container:
     container.register(StateMachine, instance=state_machine)
 
     # Runtime (async loop & buses)
-    runtime = AppRuntime()
-    runtime.start()
+    with profile.stage("runtime"):
+        runtime = AppRuntime()
+        runtime.start()
     container.register(AppRuntime, instance=runtime)
 
-    app_settings = register_config(container)
-    container.register(AppSettings, instance=app_settings)
-    register_image_matching_settings(container)
-    register_adapters(container)
-    register_domain_services(container)
-    register_app_services(container)
-    register_app_usecases(container)
+    with profile.stage("settings"):
+        app_settings = register_config(container)
+        container.register(AppSettings, instance=app_settings)
+        register_image_matching_settings(container)
+    with profile.stage("register"):
+        register_adapters(container)
+        register_domain_services(container)
+        register_app_services(container)
+        register_app_usecases(container)
+
+    with profile.stage("resolve_services"):
+        _register_command_handlers(container)
+
+    return container
 
+
+def _register_command_handlers(container: punq.Container) -> None:
+    """サービスを解決し、コマンドバスにハンドラーを登録する。"""
     try:
         ar = resolve(container, AutoRecorder)
         container.register(AutoRecorder, instance=ar)
@@ -105,6 +132,32 @@ def configure_container() -> punq.Container:
     except Exception:
         pass
 
+
+def configure_analysis_container(
+    image_matching_file: Path | None = None,
+) -> punq.Container:
+    """録画済み動画の解析だけに必要な依存関係を登録する。
+
+    再解析のワーカープロセスで使う。録画・配信・GUI 向けのランタイムは
+    起動せず、ブキ判別もプロセスプールを使わずにワーカー内で行う。
+    """
+    from splat_replay.infrastructure.adapters.weapon_detection.recognizer import (
+        WeaponRecognitionAdapter,
+    )
+
+    container = punq.Container()
+    container.register(LoggerPort, instance=StructlogLoggerAdapter())
+    container.register(BoundLogger, instance=get_logger())
+    settings = register_image_matching_settings(container, image_matching_file)
+    register_frame_analysis_adapters(container)
+    container.register(
+        WeaponRecognitionPort,
+        instance=WeaponRecognitionAdapter(
+            settings, container.resolve(LoggerPort)
+        ),
+    )
+    register_domain_services(container)
+    register_offline_analysis(container)
     return container
 
 
@@ -113,4 +166,9 @@ def resolve(container: punq.Container, cls: type[T]) -> T:
     return container.resolve(cls)
 
 
-__all__ = ["configure_container", "resolve"]
+__all__ = [
+    "configure_analysis_container",
+    "configure_container",
+    "reload_image_matching",
+    "resolve",
+]
@@ -5,9 +5,11 @@ Phase 3 リファクタリング - インフラアダプタの登録を分離。
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
-from typing import Optional, cast
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, cast
 
 import punq
 from splat_replay.application.interfaces import (
@@ -23,6 +25,7 @@ from splat_replay.application.interfaces import (
     EventPublisher,
     FramePublisher,
     ImageSelector,
+    LoggerPort,
     MicrophoneEnumeratorPort,
     PowerPort,
     RecorderWithTranscriptionPort,
@@ -38,7 +41,11 @@ from splat_replay.application.interfaces import (
     VideoRecorderPort,
     WeaponRecognitionPort,
 )
-from splat_replay.domain.config import VideoEditSettings, VideoStorageSettings
+from splat_replay.domain.config import (
+    ImageMatchingSettings,
+    VideoEditSettings,
+    VideoStorageSettings,
+)
 from splat_replay.domain.models import Frame
 from splat_replay.domain.ports import (
     BattleMedalRecognizerPort,
@@ -64,6 +71,8 @@ from splat_replay.infrastructure import (
     FramePublisherAdapter,
     GuiRuntimePortAdapter,
     ImageDrawer,
+    LazyMatcherRegistry,
+    LazyWeaponRecognitionAdapter,
     MatcherRegistry,
     RecorderWithTranscription,
     SetupStateFileAdapter,
@@ -72,14 +81,15 @@ from splat_replay.infrastructure import (
     SystemPower,
     TesseractOCR,
     TomlSettingsRepository,
-    WeaponRecognitionAdapter,
-    YouTubeClient,
 )
 from splat_replay.infrastructure.adapters.system.capture_clock import (
     CaptureClock,
 )
 from splat_replay.infrastructure.adapters.upload import NoOpUploadPort
 from splat_replay.infrastructure.config import load_settings_from_toml
+from splat_replay.infrastructure.di.config import (
+    register_image_matching_settings,
+)
 from splat_replay.infrastructure.filesystem import paths
 from splat_replay.infrastructure.runtime import AppRuntime
 from splat_replay.infrastructure.test_input import (
@@ -87,11 +97,56 @@ from splat_replay.infrastructure.test_input import (
 )
 from structlog.stdlib import BoundLogger
 
+if TYPE_CHECKING:
+    from splat_replay.infrastructure.adapters.upload.youtube_client import (
+        YouTubeClient,
+    )
+
 
 def _is_e2e_noop_upload_enabled(environment: EnvironmentPort) -> bool:
     return environment.get("SPLAT_REPLAY_E2E_NOOP_UPLOAD", "0") == "1"
 
 
+def register_frame_analysis_adapters(container: punq.Container) -> None:
+    """FrameAnalyzer が利用するアダプターを DI コンテナに登録する。
+
+    録画済み動画を別プロセスで解析する際にも同じ構成を使うため、
+    録画・配信系のアダプターから分けて登録する。
+    """
+    # テンプレート画像を解析器ごとに読み込まないよう 1 つを共有する。
+    # デコードは起動処理から外し、初回利用か起動後の事前準備で行う
+    container.register(
+        ImageMatcherPort, LazyMatcherRegistry, scope=punq.Scope.singleton
+    )
+
+    # ImageEditorFactory: Frameごとに新しいImageEditorを生成するFactory関数
+    from splat_replay.infrastructure.adapters.image.image_editor import (
+        ImageEditor,
+    )
+
+    def _image_editor_factory(frame: Frame) -> ImageEditorPort:
+        return ImageEditor(frame)
+
+    container.register(ImageEditorFactory, instance=_image_editor_factory)
+    container.register(OCRPort, TesseractOCR)
+    container.register(
+        BattleMedalRecognizerPort,
+        BattleMedalRecognizerAdapter,
+        scope=punq.Scope.singleton,
+    )
+
+
+def reload_image_matching(
+    container: punq.Container, path: Path | None = None
+) -> ImageMatchingSettings:
+    """image_matching.yaml を読み直し、共有しているマッチャーに反映する。"""
+    settings = register_image_matching_settings(container, path)
+    matcher = container.resolve(ImageMatcherPort)
+    if isinstance(matcher, (LazyMatcherRegistry, MatcherRegistry)):
+        matcher.reload(settings)
+    return settings
+
+
 def register_adapters(container: punq.Container) -> None:
     """アダプターを DI コンテナに登録する。"""
     container.register(CaptureDevicePort, AdaptiveCaptureDeviceChecker)
@@ -127,27 +182,44 @@ def register_adapters(container: punq.Container) -> None:
         AdaptiveVideoRecorder,
         scope=punq.Scope.singleton,
     )
-    container.register(VideoEditorPort, FFmpegProcessor)
 
-    # ImageEditorFactory: Frameごとに新しいImageEditorを生成するFactory関数
-    from splat_replay.infrastructure.adapters.image.image_editor import (
-        ImageEditor,
-    )
+    def _video_editor_factory() -> VideoEditorPort:
+        from splat_replay.infrastructure.adapters.video.media_probe_cache import (
+            MediaProbeCache,
+        )
 
-    def _image_editor_factory(frame: Frame) -> ImageEditorPort:
-        return ImageEditor(frame)
+        logger = cast(BoundLogger, container.resolve(BoundLogger))
+        return FFmpegProcessor(
+            logger,
+            probe_cache=MediaProbeCache(paths.MEDIA_PROBE_CACHE_FILE, logger),
+        )
 
-    container.register(ImageEditorFactory, instance=_image_editor_factory)
+    # 動画情報のキャッシュを Web API・編集・アップロードで共有する
+    container.register(
+        VideoEditorPort,
+        factory=_video_editor_factory,
+        scope=punq.Scope.singleton,
+    )
+    register_frame_analysis_adapters(container)
 
     container.register(PowerPort, SystemPower)
-    container.register(OCRPort, TesseractOCR)
-    container.register(BattleMedalRecognizerPort, BattleMedalRecognizerAdapter)
     environment = container.resolve(EnvironmentPort)
+
+    # YouTube API クライアントは読み込みが重いため、使う時点で import する
+    def _youtube_client_factory() -> YouTubeClient:
+        from splat_replay.infrastructure.adapters.upload.youtube_client import (
+            YouTubeClient,
+        )
+
+        return YouTubeClient(cast(BoundLogger, container.resolve(BoundLogger)))
+
     if _is_e2e_noop_upload_enabled(environment):
         container.register(UploadPort, NoOpUploadPort)
     else:
-        container.register(UploadPort, YouTubeClient)
-    container.register(AuthenticatedClientPort, YouTubeClient)
+        container.register(UploadPort, factory=_youtube_client_factory)
+    container.register(
+        AuthenticatedClientPort, factory=_youtube_client_factory
+    )
     container.register(SystemCommandPort, SystemCommandAdapter)
 
     # SetupStateRepository の登録
@@ -195,26 +267,62 @@ def register_adapters(container: punq.Container) -> None:
     container.register(
         SpeechTranscriberPort, factory=lambda: _build_speech_transcriber()[0]
     )
-    container.register(ImageMatcherPort, MatcherRegistry)
     container.register(SubtitleEditorPort, SubtitleEditor)
     container.register(
         ImageSelector, instance=ImageDrawer.select_brightest_image
     )
+
+    def _build_weapon_recognition() -> WeaponRecognitionPort:
+        from splat_replay.infrastructure.adapters.weapon_detection.process_pool import (
+            ProcessPoolWeaponRecognitionAdapter,
+        )
+        from splat_replay.infrastructure.adapters.weapon_detection.recognizer import (
+            WeaponRecognitionAdapter,
+        )
+
+        settings = cast(
+            ImageMatchingSettings, container.resolve(ImageMatchingSettings)
+        )
+        logger = cast(LoggerPort, container.resolve(LoggerPort))
+        workers = settings.weapon_recognition.workers
+        if workers > 0:
+            recognizer = ProcessPoolWeaponRecognitionAdapter(
+                settings, logger, workers=workers
+            )
+            # ワーカープロセスはプロセス終了時に停止する
+            atexit.register(recognizer.close)
+            return recognizer
+        return WeaponRecognitionAdapter(settings, logger)
+
+    def _weapon_recognition_factory() -> WeaponRecognitionPort:
+        # テンプレート読み込みは初回利用か起動後の事前準備まで遅らせる
+        return LazyWeaponRecognitionAdapter(_build_weapon_recognition)
+
     container.register(
         WeaponRecognitionPort,
-        WeaponRecognitionAdapter,
+        factory=_weapon_recognition_factory,
         scope=punq.Scope.singleton,
     )
 
     def _text_to_speech_factory() -> TextToSpeechPort | None:
         try:
+            from splat_replay.infrastructure.adapters.audio.cached_text_to_speech import (
+                CachedTextToSpeech,
+            )
             from splat_replay.infrastructure.adapters.audio.google_text_to_speech import (
                 GoogleTextToSpeech,
             )
 
-            return GoogleTextToSpeech(
+            logger = cast(BoundLogger, container.resolve(BoundLogger))
+            google = GoogleTextToSpeech(
                 cast(VideoEditSettings, container.resolve(VideoEditSettings)),
-                cast(BoundLogger, container.resolve(BoundLogger)),
+                logger,
+            )
+            return CachedTextToSpeech(
+                google,
+                paths.SPEECH_CACHE_DIR,
+                logger,
+                identity=google.cache_identity,
             )
         except Exception:
             return None
@@ -48,6 +48,9 @@ from splat_replay.application.services.errors.error_logger import ErrorLogger
 from splat_replay.application.services.process.auto_process_service import (
     AutoProcessService,
 )
+from splat_replay.application.services.recording.offline_analyzer import (
+    OfflineRecordingAnalyzer,
+)
 from splat_replay.application.use_cases.auto_recording_use_case import (
     AutoRecordingUseCase,
 )
@@ -56,6 +59,22 @@ from splat_replay.domain.services import FrameAnalyzer
 from splat_replay.domain.services.state_machine import StateMachine
 
 
+def register_offline_analysis(container: Container) -> None:
+    """録画済み動画の再解析サービスを DI コンテナに登録する。"""
+
+    # Protocol型の依存を明示的に注入
+    def offline_recording_analyzer_factory() -> OfflineRecordingAnalyzer:
+        return OfflineRecordingAnalyzer(
+            analyzer=container.resolve(FrameAnalyzer),
+            weapon_recognizer=container.resolve(WeaponRecognitionPort),
+            logger=container.resolve(LoggerPort),
+        )
+
+    container.register(
+        OfflineRecordingAnalyzer, factory=offline_recording_analyzer_factory
+    )
+
+
 def register_app_services(container: Container) -> None:
     """アプリケーションサービスを DI コンテナに登録する。"""
     app_settings = container.resolve(AppSettings)
@@ -141,6 +160,8 @@ def register_app_services(container: Container) -> None:
         scope=punq.Scope.singleton,
     )
 
+    register_offline_analysis(container)
+
     container.register(
         ProgressEventStore, ProgressEventStore, scope=punq.Scope.singleton
     )
@@ -73,6 +73,12 @@ IMAGE_MATCHING_FILE = CONFIG_DIR / "image_matching.yaml"
 # アセットサブディレクトリ
 THUMBNAIL_ASSETS_DIR = ASSETS_DIR / "thumbnail"
 
+# 生成した読み上げ音声のキャッシュ
+SPEECH_CACHE_DIR = OUTPUTS_DIR / "speech_cache"
+
+# ffprobe で取得した動画情報のキャッシュ
+MEDIA_PROBE_CACHE_FILE = OUTPUTS_DIR / "media_probe_cache.sqlite3"
+
 
 def asset(path: str) -> Path:
     """assets ディレクトリ以下のパスを返す。"""
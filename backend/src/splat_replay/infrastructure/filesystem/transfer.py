@@ -0,0 +1,134 @@
+"""動画ファイルのコピー・移動。
+
+同じファイルシステム内ではデータを複製しない方法 (rename / hardlink /
+reflink) を優先し、使えない場合はカーネル内のコピー (copy_file_range)、
+最後に一定サイズずつ読み書きするコピーへ切り替える。どの方法でも
+ファイル全体をメモリに読み込むことはない。
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+TransferStrategy = Literal[
+    "rename", "hardlink", "reflink", "copy_file_range", "chunked"
+]
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# linux/fs.h の FICLONE (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# copy_file_range がこのファイルの組み合わせでは使えないことを表すエラー
+_UNSUPPORTED_RANGE_COPY = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.EPERM,
+}
+
+
+def move_file(
+    src: Path, dst: Path, *, replace: bool = False
+) -> TransferStrategy:
+    """ファイルを移動し、使った方法を返す。
+
+    別のファイルシステムへの移動はコピーしてから元を削除する。
+
+    Args:
+        src: 移動元
+        dst: 移動先
+        replace: True なら移動先の既存ファイルを置き換える。
+            False の場合、移動先が既にあれば FileExistsError を送出する。
+    """
+    if not replace and dst.exists():
+        raise FileExistsError(errno.EEXIST, "移動先が既に存在します", str(dst))
+    try:
+        os.replace(src, dst)
+        return "rename"
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+    strategy = copy_file(src, dst)
+    src.unlink()
+    return strategy
+
+
+def copy_file(
+    src: Path, dst: Path, *, allow_link: bool = False
+) -> TransferStrategy:
+    """ファイルをコピーし、使った方法を返す。
+
+    Args:
+        src: コピー元
+        dst: コピー先 (既にあれば置き換える)
+        allow_link: コピー元と中身を共有してよい場合に hardlink を試す
+    """
+    if allow_link:
+        try:
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            pass
+
+    size = src.stat().st_size
+    with src.open("rb") as reader, dst.open("wb") as writer:
+        if _reflink(reader, writer):
+            strategy: TransferStrategy = "reflink"
+        elif _copy_range(reader, writer, size) == size:
+            strategy = "copy_file_range"
+        else:
+            # 途中まで copy_file_range で書けていれば残りだけを読み書きする
+            shutil.copyfileobj(reader, writer, CHUNK_SIZE)
+            strategy = "chunked"
+    shutil.copystat(src, dst)
+    return strategy
+
+
+def _reflink(reader: BinaryIO, writer: BinaryIO) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(writer.fileno(), _FICLONE, reader.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def _copy_range(reader: BinaryIO, writer: BinaryIO, size: int) -> int:
+    """カーネル内でコピーし、コピーできたバイト数を返す。"""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None:
+        return 0
+    copied = 0
+    try:
+        while copied < size:
+            count = copy_file_range(
+                reader.fileno(), writer.fileno(), size - copied
+            )
+            if count == 0:
+                break
+            copied += count
+    except OSError as exc:
+        # 1 バイトも書いていなければ別の方法でやり直せる
+        if copied == 0 and exc.errno in _UNSUPPORTED_RANGE_COPY:
+            return 0
+        raise
+    return copied
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "TransferStrategy",
+    "copy_file",
+    "move_file",
+]
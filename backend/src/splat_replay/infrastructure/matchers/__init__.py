@@ -1,4 +1,5 @@
-__all__ = ["MatcherRegistry", "TemplateMatcher"]
+__all__ = ["LazyMatcherRegistry", "MatcherRegistry", "TemplateMatcher"]
 
+from .lazy import LazyMatcherRegistry
 from .registry import MatcherRegistry
 from .template import TemplateMatcher
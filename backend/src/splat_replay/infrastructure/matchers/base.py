@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Tuple
@@ -7,12 +8,19 @@ from typing import Optional, Tuple
 import cv2
 import numpy as np
 
-from .utils import imread_unicode
+from .frame_view import FrameView
+from .utils import load_shared_image
 
 
 class BaseMatcher(ABC):
     """画像マッチングの基底クラス。"""
 
+    # ROI が変化していないとき前回の判定を再利用してよいか
+    gateable: bool = True
+    # 判定に効く局所的な特徴 (テンプレートなど) の短辺 (画素)。
+    # None は ROI 全体の統計量で判定することを表す
+    feature_size: Optional[int] = None
+
     def __init__(
         self,
         mask_path: Optional[Path] = None,
@@ -22,7 +30,7 @@ class BaseMatcher(ABC):
         self.name = name
         self._mask: Optional[np.ndarray] = None
         if mask_path is not None:
-            mask = imread_unicode(mask_path, cv2.IMREAD_GRAYSCALE)
+            mask = load_shared_image(mask_path, cv2.IMREAD_GRAYSCALE)
             if mask is None:
                 raise FileNotFoundError(
                     f"マスク画像の読み込みに失敗しました: {mask_path}"
@@ -30,12 +38,24 @@ class BaseMatcher(ABC):
             self._mask = mask
         self._roi = roi
 
+    @property
+    def region(self) -> Optional[Tuple[int, int, int, int]]:
+        """判定に使う画像領域 (``None`` はフレーム全体)。"""
+        return self._roi
+
     def _apply_roi(self, image: np.ndarray) -> np.ndarray:
         if self._roi is None:
             return image
         x, y, w, h = self._roi
         return image[y : y + h, x : x + w]
 
-    @abstractmethod
     async def match(self, image: np.ndarray) -> bool:
         """画像が条件に一致するか判定する。"""
+        return await asyncio.to_thread(self._match, image)
+
+    def _match(self, image: np.ndarray) -> bool:
+        return self.evaluate(FrameView(image))
+
+    @abstractmethod
+    def evaluate(self, view: FrameView) -> bool:
+        """共有ビューを用いて同期的に判定する (ワーカースレッドで呼ぶ)。"""
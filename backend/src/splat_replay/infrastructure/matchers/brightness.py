@@ -1,16 +1,18 @@
-import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 
-import cv2
 import numpy as np
 
 from .base import BaseMatcher
+from .frame_view import FrameView
 
 
 class BrightnessMatcher(BaseMatcher):
     """最大明度が閾値内か判定するマッチャー。"""
 
+    # 1 画素の変化で判定が変わり得るうえ十分軽いため、ゲート対象外
+    gateable = False
+
     def __init__(
         self,
         max_value: Optional[float] = None,
@@ -25,9 +27,8 @@ class BrightnessMatcher(BaseMatcher):
         self._min_value = min_value
 
     def _calculate_brightness(
-        self, image: np.ndarray, mask: Optional[np.ndarray] = None
+        self, gray: np.ndarray, mask: Optional[np.ndarray] = None
     ) -> float:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         if mask is not None:
             pixels = gray[mask == 255]
         else:
@@ -36,12 +37,8 @@ class BrightnessMatcher(BaseMatcher):
             return 0.0
         return float(np.max(pixels))
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
-
-    def _match(self, image: np.ndarray) -> bool:
-        img = self._apply_roi(image)
-        level = self._calculate_brightness(img, self._mask)
+    def evaluate(self, view: FrameView) -> bool:
+        level = self._calculate_brightness(view.gray(self._roi), self._mask)
         if self._max_value is not None and level > self._max_value:
             return False
         if self._min_value is not None and level < self._min_value:
@@ -0,0 +1,81 @@
+"""ROI の変化を検出し、変化のないマッチャーの判定を再利用するゲート。"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .base import BaseMatcher
+from .frame_view import FrameView, cell_size
+
+
+class ChangeGate:
+    """マッチャーごとに前回評価時の ROI の指紋と判定を保持する。
+
+    指紋は ROI を正方形の区画に分けて区画ごとに平均した画素で
+    (:meth:`FrameView.fingerprint`)、どの区画でも画素値の差が
+    ``tolerance`` 以下なら「前回評価時から変化なし」とみなし、前回の判定を
+    返す。ROI 全体の平均ではなく区画ごとの最大差で比べるため、大きな ROI の
+    一部だけが変化した場合も見逃さない。比較対象は直前フレームではなく
+    判定を計算したときの指紋なので、ゆっくりした変化が積み重なっても
+    見逃さない。
+
+    テンプレートのように局所的な特徴で判定するマッチャーは、特徴が
+    区画 2 つ分以上の大きさのときだけ対象にする。そうであれば特徴の
+    範囲は必ず 1 つ以上の区画を覆い、その変化は区画の平均にそのまま現れる。
+    """
+
+    def __init__(self, tolerance: float = 0.0, samples: int = 64) -> None:
+        if tolerance < 0:
+            raise ValueError("tolerance は 0 以上で指定します")
+        if samples < 1:
+            raise ValueError("samples は 1 以上で指定します")
+        self._tolerance = tolerance
+        self._samples = samples
+        self._verdicts: Dict[str, Tuple[np.ndarray, bool]] = {}
+        self.reused = 0
+        self.evaluated = 0
+
+    def lookup(
+        self, name: str, matcher: BaseMatcher, view: FrameView
+    ) -> Optional[bool]:
+        """ROI が変化していなければ前回の判定を返す。"""
+        if not self._is_gateable(matcher, view):
+            return None
+        entry = self._verdicts.get(name)
+        if entry is None:
+            return None
+        previous, verdict = entry
+        current = view.fingerprint(matcher.region, self._samples)
+        if current.shape != previous.shape:
+            return None
+        if float(cv2.absdiff(current, previous).max()) > self._tolerance:
+            return None
+        self.reused += 1
+        return verdict
+
+    def remember(
+        self, name: str, matcher: BaseMatcher, view: FrameView, result: bool
+    ) -> None:
+        """評価した判定と、そのときの ROI の指紋を記録する。"""
+        if not self._is_gateable(matcher, view):
+            return
+        self.evaluated += 1
+        self._verdicts[name] = (
+            view.fingerprint(matcher.region, self._samples).copy(),
+            result,
+        )
+
+    def reset(self) -> None:
+        self._verdicts.clear()
+
+    def _is_gateable(self, matcher: BaseMatcher, view: FrameView) -> bool:
+        if not matcher.gateable:
+            return False
+        feature = matcher.feature_size
+        if feature is None:
+            return True
+        height, width = view.region(matcher.region).shape[:2]
+        return feature >= 2 * cell_size(height, width, self._samples)
@@ -1,14 +1,70 @@
-from typing import Dict
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 from splat_replay.domain.config import MatchExpression
 
 from .base import BaseMatcher
+from .change_gate import ChangeGate
+from .cost import MatcherCostModel
+from .frame_cache import LeafMemo
+from .frame_view import FrameView
+
+
+def evaluate_leaf(
+    lookup: Dict[str, BaseMatcher],
+    name: str,
+    view: FrameView,
+    memo: LeafMemo,
+    costs: Optional[MatcherCostModel] = None,
+    gate: Optional[ChangeGate] = None,
+) -> bool:
+    """単体マッチャーを評価し、同一フレーム内の結果を ``memo`` で共有する。
+
+    ``gate`` が与えられた場合、ROI が前回評価時から変化していなければ
+    前回の判定を再利用する (再利用した分はコストモデルに計上しない)。
+    """
+    cached = memo.get(name)
+    if cached is not None:
+        return cached
+    matcher = lookup.get(name)
+    if matcher is None:
+        result = False
+    else:
+        reused = gate.lookup(name, matcher, view) if gate else None
+        if reused is not None:
+            result = reused
+        else:
+            result = _evaluate_matcher(name, matcher, view, costs)
+            if gate is not None:
+                gate.remember(name, matcher, view, result)
+    memo.put(name, result)
+    return result
+
+
+def _evaluate_matcher(
+    name: str,
+    matcher: BaseMatcher,
+    view: FrameView,
+    costs: Optional[MatcherCostModel],
+) -> bool:
+    if costs is None:
+        return matcher.evaluate(view)
+    started = time.perf_counter()
+    result = matcher.evaluate(view)
+    costs.record(name, time.perf_counter() - started, result)
+    return result
 
 
 class CompositeMatcher:
-    """複数条件を評価するマッチャー。"""
+    """複数条件を評価するマッチャー。
+
+    コストモデルが与えられた場合、``and`` は「安くて不一致になりやすい」
+    子から、``or`` は「安くて一致しやすい」子から評価し、結果が確定した
+    時点で残りの子を評価しない。
+    """
 
     def __init__(
         self,
@@ -16,19 +72,96 @@ class CompositeMatcher:
         lookup: Dict[str, BaseMatcher],
         *,
         name: str | None = None,
+        costs: Optional[MatcherCostModel] = None,
+        gate: Optional[ChangeGate] = None,
     ) -> None:
         self.name = name
         self.expr = expr
         self.lookup = lookup
+        self.costs = costs
+        self.gate = gate
 
     async def match(self, image: np.ndarray) -> bool:
         """設定された式に基づき判定する。"""
+        return await asyncio.to_thread(self.evaluate, FrameView(image))
 
-        async def _eval(name: str) -> bool:
-            matcher = self.lookup.get(name)
-            if matcher is None:
-                return False
-            return await matcher.match(image)
+    def evaluate(
+        self, view: FrameView, memo: Optional[LeafMemo] = None
+    ) -> bool:
+        """式全体を 1 つのビュー上で同期的に評価する。"""
+        return self._evaluate_expr(
+            self.expr, view, LeafMemo() if memo is None else memo
+        )
 
-        result = await self.expr.evaluate(_eval)
-        return result
+    def _evaluate_expr(
+        self, expr: MatchExpression, view: FrameView, memo: LeafMemo
+    ) -> bool:
+        if expr.matcher is not None:
+            return evaluate_leaf(
+                self.lookup, expr.matcher, view, memo, self.costs, self.gate
+            )
+        if expr.not_ is not None:
+            return not self._evaluate_expr(expr.not_, view, memo)
+        if expr.and_ is not None:
+            return all(
+                self._evaluate_expr(child, view, memo)
+                for child in self._ordered(expr.and_, memo, conjunctive=True)
+            )
+        if expr.or_ is not None:
+            return any(
+                self._evaluate_expr(child, view, memo)
+                for child in self._ordered(expr.or_, memo, conjunctive=False)
+            )
+        return False
+
+    def _ordered(
+        self,
+        children: List[MatchExpression],
+        memo: LeafMemo,
+        *,
+        conjunctive: bool,
+    ) -> List[MatchExpression]:
+        """短絡評価で打ち切りやすい順に子式を並べ替える。
+
+        ``and`` は コスト / 不一致率、``or`` は コスト / 一致率 の昇順。
+        同じ値の子は宣言順を保つ。
+        """
+        costs = self.costs
+        if costs is None or len(children) < 2:
+            return children
+
+        def _rank(child: MatchExpression) -> float:
+            cost, pass_rate = self._estimate(child, memo, costs)
+            decisive = 1.0 - pass_rate if conjunctive else pass_rate
+            return cost / max(decisive, 1e-6)
+
+        return sorted(children, key=_rank)
+
+    def _estimate(
+        self,
+        expr: MatchExpression,
+        memo: LeafMemo,
+        costs: MatcherCostModel,
+    ) -> Tuple[float, float]:
+        """部分式の期待評価コストと一致確率を返す (子は独立と仮定)。"""
+        if expr.matcher is not None:
+            cached = memo.peek(expr.matcher)
+            if cached is not None:
+                return 0.0, 1.0 if cached else 0.0
+            return costs.cost(expr.matcher), costs.pass_rate(expr.matcher)
+        if expr.not_ is not None:
+            cost, pass_rate = self._estimate(expr.not_, memo, costs)
+            return cost, 1.0 - pass_rate
+        children = expr.and_ if expr.and_ is not None else expr.or_
+        if not children:
+            return 0.0, 0.0
+        conjunctive = expr.and_ is not None
+        total_cost = 0.0
+        # 次の子まで評価が進む確率
+        reach = 1.0
+        for child in self._ordered(children, memo, conjunctive=conjunctive):
+            cost, pass_rate = self._estimate(child, memo, costs)
+            total_cost += reach * cost
+            reach *= pass_rate if conjunctive else 1.0 - pass_rate
+        pass_rate = reach if conjunctive else 1.0 - reach
+        return total_cost, pass_rate
@@ -0,0 +1,106 @@
+"""マッチャーの評価コストと一致率を推定するモデル。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Mapping
+
+from .base import BaseMatcher
+from .brightness import BrightnessMatcher
+from .edge import EdgeMatcher
+from .hash import HashMatcher
+from .hsv import HSVMatcher
+from .hsv_ratio import HSVRatioMatcher
+from .rgb import RGBMatcher
+from .template import TemplateMatcher
+from .uniform import UniformColorMatcher
+
+# ROI 指定がないマッチャーはフルフレーム (1920x1080) を処理するとみなす
+DEFAULT_FRAME_AREA = 1920 * 1080
+
+# 1 画素あたりの相対コスト (秒)。計測値が得られるまでの初期推定に使う。
+_PIXEL_COST: Mapping[type[BaseMatcher], float] = {
+    BrightnessMatcher: 1e-9,
+    HashMatcher: 1e-9,
+    RGBMatcher: 3e-9,
+    HSVRatioMatcher: 1e-9,
+    HSVMatcher: 2e-9,
+    UniformColorMatcher: 8e-9,
+    EdgeMatcher: 4e-8,
+    TemplateMatcher: 6e-8,
+}
+_FALLBACK_PIXEL_COST = 1e-8
+
+
+@dataclass
+class MatcherStats:
+    """1 マッチャー分の計測値。"""
+
+    cost: float
+    evaluations: int = 0
+    hits: int = 0
+
+    @property
+    def pass_rate(self) -> float:
+        """一致率 (ラプラス平滑化済み)。"""
+        return (self.hits + 1) / (self.evaluations + 2)
+
+
+class MatcherCostModel:
+    """マッチャーごとの評価時間 (EWMA) と一致率を保持する。
+
+    初期値は型と ROI 面積から推定し、実フレームでの評価ごとに計測値で
+    更新する。複合マッチャーはこの推定値を使って ``and`` / ``or`` の
+    評価順を決める。更新はワーカースレッドから行われるが、値は順序付けの
+    目安にしか使わないためロックは取らない。
+    """
+
+    def __init__(self, smoothing: float = 0.2) -> None:
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing は 0 より大きく 1 以下で指定します")
+        self._smoothing = smoothing
+        self._stats: Dict[str, MatcherStats] = {}
+
+    def register(self, name: str, matcher: BaseMatcher) -> None:
+        """型と ROI から初期コストを登録する。"""
+        self._stats[name] = MatcherStats(cost=self._prior_cost(matcher))
+
+    def record(self, name: str, elapsed: float, result: bool) -> None:
+        """1 回分の評価時間と結果を反映する。"""
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = MatcherStats(cost=elapsed)
+            self._stats[name] = stats
+        elif stats.evaluations == 0:
+            stats.cost = elapsed
+        else:
+            stats.cost += self._smoothing * (elapsed - stats.cost)
+        stats.evaluations += 1
+        if result:
+            stats.hits += 1
+
+    def cost(self, name: str) -> float:
+        stats = self._stats.get(name)
+        return stats.cost if stats is not None else 0.0
+
+    def pass_rate(self, name: str) -> float:
+        stats = self._stats.get(name)
+        return stats.pass_rate if stats is not None else 0.5
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """プロファイリング用に現在の推定値を返す。"""
+        return {
+            name: {
+                "cost": stats.cost,
+                "pass_rate": stats.pass_rate,
+                "evaluations": float(stats.evaluations),
+            }
+            for name, stats in self._stats.items()
+        }
+
+    @staticmethod
+    def _prior_cost(matcher: BaseMatcher) -> float:
+        roi = matcher._roi
+        area = roi[2] * roi[3] if roi is not None else DEFAULT_FRAME_AREA
+        pixel_cost = _PIXEL_COST.get(type(matcher), _FALLBACK_PIXEL_COST)
+        return area * pixel_cost
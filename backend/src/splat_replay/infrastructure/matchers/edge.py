@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -6,7 +5,8 @@ import cv2
 import numpy as np
 
 from .base import BaseMatcher
-from .utils import imread_unicode
+from .frame_view import FrameView
+from .utils import load_shared_image
 
 
 class EdgeMatcher(BaseMatcher):
@@ -19,20 +19,22 @@ class EdgeMatcher(BaseMatcher):
         name: str | None = None,
     ) -> None:
         super().__init__(None, roi, name)
-        template = imread_unicode(template_path)
+        template = load_shared_image(template_path)
         if template is None:
             raise FileNotFoundError(
                 f"テンプレート画像の読み込みに失敗しました: {template_path}"
             )
-        self._template_edge = self._canny(template)
+        self._template_edge = self._canny(
+            cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+        )
         self._threshold = threshold
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
+    @property
+    def feature_size(self) -> int:  # type: ignore[override]
+        return min(self._template_edge.shape[:2])
 
-    def _match(self, image: np.ndarray) -> bool:
-        frame = self._apply_roi(image)
-        edge = self._canny(frame)
+    def evaluate(self, view: FrameView) -> bool:
+        edge = self._canny(view.gray(self._roi))
         dist = cv2.distanceTransform(255 - edge, cv2.DIST_L2, 3)
         res = cv2.filter2D(
             dist, -1, self._template_edge.astype(np.float32) / 255.0
@@ -40,7 +42,6 @@ class EdgeMatcher(BaseMatcher):
         min_val, _, _, _ = cv2.minMaxLoc(res)
         return min_val <= self._threshold
 
-    def _canny(self, bgr: np.ndarray) -> np.ndarray:
-        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+    def _canny(self, gray: np.ndarray) -> np.ndarray:
         blur = cv2.GaussianBlur(gray, (5, 5), 0)
         return cv2.Canny(blur, 50, 150)
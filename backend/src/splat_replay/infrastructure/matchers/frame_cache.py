@@ -0,0 +1,104 @@
+"""フレーム単位でマッチャーの評価結果を共有するキャッシュ。"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from .frame_view import FrameView
+
+
+@dataclass
+class CacheCounters:
+    """プロファイリング用のヒット/ミス数。
+
+    ワーカースレッドからも加算されるため厳密な値ではない。
+    """
+
+    frames: int = 0
+    hits: int = 0
+    misses: int = 0
+    result_hits: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "frames": self.frames,
+            "hits": self.hits,
+            "misses": self.misses,
+            "result_hits": self.result_hits,
+        }
+
+
+class LeafMemo:
+    """単体マッチャーの評価結果 (1 フレーム分)。"""
+
+    __slots__ = ("_results", "_counters")
+
+    def __init__(self, counters: Optional[CacheCounters] = None) -> None:
+        self._results: Dict[str, bool] = {}
+        self._counters = counters
+
+    def get(self, name: str) -> Optional[bool]:
+        """結果を取得し、ヒット/ミスを計上する。"""
+        result = self._results.get(name)
+        if self._counters is not None:
+            if result is None:
+                self._counters.misses += 1
+            else:
+                self._counters.hits += 1
+        return result
+
+    def peek(self, name: str) -> Optional[bool]:
+        """計上せずに結果を参照する (評価順の見積もり用)。"""
+        return self._results.get(name)
+
+    def put(self, name: str, result: bool) -> None:
+        self._results[name] = result
+
+
+class FrameMemo:
+    """1 フレーム分の派生画像・単体結果・キー単位の結果。"""
+
+    __slots__ = ("seq", "image", "view", "leaves", "results")
+
+    def __init__(
+        self,
+        seq: int,
+        image: np.ndarray,
+        counters: Optional[CacheCounters] = None,
+    ) -> None:
+        self.seq = seq
+        self.image = image
+        self.view = FrameView(image)
+        self.leaves = LeafMemo(counters)
+        self.results: Dict[str, bool] = {}
+
+
+class FrameResultCache:
+    """最新フレームの評価結果だけを保持するキャッシュ。
+
+    フレームは配列の同一性で識別し、新しいフレームが渡された時点で
+    前のフレームの結果を破棄する。参照を保持している間は ``id`` が
+    再利用されないため、同一性の比較で取り違えは起きない。
+    """
+
+    def __init__(self) -> None:
+        self.counters = CacheCounters()
+        self._current: Optional[FrameMemo] = None
+        self._seq = 0
+
+    def memo_for(self, image: np.ndarray) -> FrameMemo:
+        """フレームに対応するメモを返す (別フレームなら作り直す)。"""
+        current = self._current
+        if current is not None and current.image is image:
+            return current
+        self._seq += 1
+        self.counters.frames += 1
+        current = FrameMemo(self._seq, image, self.counters)
+        self._current = current
+        return current
+
+    def clear(self) -> None:
+        self._current = None
@@ -0,0 +1,87 @@
+"""1 フレーム分の ROI 派生画像を共有するためのビュー。"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Roi = Optional[Tuple[int, int, int, int]]
+
+
+def cell_size(height: int, width: int, cells: int) -> int:
+    """短辺方向に ``cells`` 区画以上とれる正方形区画の一辺 (画素)。"""
+    return max(1, min(height, width) // cells)
+
+
+class FrameView:
+    """フレームと ROI ごとの派生画像 (切り出し・グレー・HSV) を保持する。
+
+    同じ ROI を参照する複数のマッチャーが同一フレームを評価する際に、
+    ``cvtColor`` などの変換を 1 回に抑える。複数のワーカースレッドから
+    同時に参照された場合も、競合時に同じ変換を重複して行うだけで
+    結果は変わらない。
+    """
+
+    __slots__ = ("image", "_regions", "_gray", "_hsv", "_fingerprints")
+
+    def __init__(self, image: np.ndarray) -> None:
+        self.image = image
+        self._regions: Dict[Tuple[Roi, int], np.ndarray] = {}
+        self._gray: Dict[Roi, np.ndarray] = {}
+        self._hsv: Dict[Tuple[Roi, int], np.ndarray] = {}
+        self._fingerprints: Dict[Tuple[Roi, int], np.ndarray] = {}
+
+    def region(self, roi: Roi, step: int = 1) -> np.ndarray:
+        """ROI で切り出し、``step`` 間隔で間引いた画像を返す (コピーなし)。"""
+        key = (roi, step)
+        cached = self._regions.get(key)
+        if cached is not None:
+            return cached
+        if roi is None:
+            img = self.image
+        else:
+            x, y, w, h = roi
+            img = self.image[y : y + h, x : x + w]
+        if step > 1:
+            img = img[::step, ::step]
+        self._regions[key] = img
+        return img
+
+    def gray(self, roi: Roi) -> np.ndarray:
+        """ROI のグレースケール画像を返す。"""
+        cached = self._gray.get(roi)
+        if cached is None:
+            cached = cv2.cvtColor(self.region(roi), cv2.COLOR_BGR2GRAY)
+            self._gray[roi] = cached
+        return cached
+
+    def fingerprint(self, roi: Roi, cells: int) -> np.ndarray:
+        """ROI を区画ごとの平均画素に縮小した指紋を返す。
+
+        短辺方向が ``cells`` 区画以上になる正方形の区画に分け、区画内の
+        全画素を平均する (間引きと違い、区画内のどこが変化しても現れる)。
+        """
+        key = (roi, cells)
+        cached = self._fingerprints.get(key)
+        if cached is None:
+            region = self.region(roi)
+            height, width = region.shape[:2]
+            cell = cell_size(height, width, cells)
+            cached = cv2.resize(
+                region,
+                (max(1, width // cell), max(1, height // cell)),
+                interpolation=cv2.INTER_AREA,
+            )
+            self._fingerprints[key] = cached
+        return cached
+
+    def hsv(self, roi: Roi, step: int = 1) -> np.ndarray:
+        """ROI を ``step`` 間隔で間引いた HSV 画像を返す。"""
+        key = (roi, step)
+        cached = self._hsv.get(key)
+        if cached is None:
+            cached = cv2.cvtColor(self.region(roi, step), cv2.COLOR_BGR2HSV)
+            self._hsv[key] = cached
+        return cached
@@ -1,4 +1,3 @@
-import asyncio
 import hashlib
 from pathlib import Path
 from typing import Optional, Tuple
@@ -6,12 +5,16 @@ from typing import Optional, Tuple
 import numpy as np
 
 from .base import BaseMatcher
+from .frame_view import FrameView
 from .utils import imread_unicode
 
 
 class HashMatcher(BaseMatcher):
     """ハッシュ値による完全一致判定用マッチャー。"""
 
+    # 完全一致判定のため、わずかな差分も無視できない
+    gateable = False
+
     def __init__(
         self,
         image_path: Path,
@@ -30,11 +33,8 @@ class HashMatcher(BaseMatcher):
     def _compute_hash(self, image: np.ndarray) -> str:
         return hashlib.sha1(image.tobytes()).hexdigest()
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
-
-    def _match(self, image: np.ndarray) -> bool:
-        img = self._apply_roi(image)
+    def evaluate(self, view: FrameView) -> bool:
+        img = view.region(self._roi)
         image_hash = self._compute_hash(img)
         result = image_hash == self._hash_value
         return result
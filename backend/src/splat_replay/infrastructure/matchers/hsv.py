@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -6,6 +5,7 @@ import cv2
 import numpy as np
 
 from .base import BaseMatcher
+from .frame_view import FrameView
 
 
 class HSVMatcher(BaseMatcher):
@@ -34,10 +34,13 @@ class HSVMatcher(BaseMatcher):
                 x, y, w, h = cv2.boundingRect(nz)
                 self._mask_bbox = (int(x), int(y), int(w), int(h))
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
+    @property
+    def region(self) -> Optional[Tuple[int, int, int, int]]:
+        if self._roi is None and self._mask_bbox is not None:
+            return self._mask_bbox
+        return self._roi
 
-    def _match(self, image: np.ndarray) -> bool:
+    def evaluate(self, view: FrameView) -> bool:
         # Decide processing region and corresponding mask to minimize work.
         roi_to_use: Optional[Tuple[int, int, int, int]]
         mask_to_use: Optional[np.ndarray]
@@ -60,25 +63,21 @@ class HSVMatcher(BaseMatcher):
             roi_to_use = None
             mask_to_use = self._mask
 
-        if roi_to_use is not None:
-            x, y, w, h = roi_to_use
-            img = image[y : y + h, x : x + w]
-        else:
-            img = image
+        img = view.region(roi_to_use)
 
         # Compute HSV only on the necessary area, with light downsampling to
         # reduce work while keeping ratios stable.
         # Downsample by a factor of 2 if region is reasonably large.
         if img.shape[0] >= 60 and img.shape[1] >= 60:
-            img_small = img[::2, ::2]
+            step = 2
             mask_small = (
                 mask_to_use[::2, ::2] if mask_to_use is not None else None
             )
         else:
-            img_small = img
+            step = 1
             mask_small = mask_to_use
 
-        hsv = cv2.cvtColor(img_small, cv2.COLOR_BGR2HSV)
+        hsv = view.hsv(roi_to_use, step)
         color_mask = cv2.inRange(hsv, self._lower_bound, self._upper_bound)
 
         if mask_small is not None:
@@ -87,7 +86,7 @@ class HSVMatcher(BaseMatcher):
             total = cv2.countNonZero(mask_small)
             count = cv2.countNonZero(combined)
         else:
-            total = img_small.shape[0] * img_small.shape[1]
+            total = hsv.shape[0] * hsv.shape[1]
             count = cv2.countNonZero(color_mask)
 
         ratio = count / total if total > 0 else 0.0
@@ -0,0 +1,46 @@
+"""初回利用まで構築を遅らせるマッチャーレジストリ。"""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+from splat_replay.domain.config import ImageMatchingSettings
+from splat_replay.domain.models import Frame
+from splat_replay.domain.ports import ImageMatcherPort
+from splat_replay.infrastructure.runtime.startup import LazyComponent
+
+from .registry import MatcherRegistry
+
+
+class LazyMatcherRegistry(LazyComponent[MatcherRegistry], ImageMatcherPort):
+    """初回利用時に MatcherRegistry を構築する ImageMatcherPort。
+
+    テンプレート画像のデコードを起動処理から外すためのラッパー。
+    起動後は warm_up() でバックグラウンドから構築しておく。
+    """
+
+    def __init__(self, settings: ImageMatchingSettings) -> None:
+        super().__init__(self._build)
+        self._settings = settings
+
+    def _build(self) -> MatcherRegistry:
+        return MatcherRegistry(self._settings)
+
+    def reload(self, settings: ImageMatchingSettings) -> None:
+        """設定を差し替える。構築済みならマッチャーも作り直す。"""
+        with self._lock:
+            self._settings = settings
+            if self._instance is None:
+                return
+        self._instance.reload(settings)
+
+    async def match(self, key: str, image: Frame) -> bool:
+        return await (await self._aget()).match(key, image)
+
+    async def match_many(
+        self, keys: Sequence[str], image: Frame
+    ) -> Mapping[str, bool]:
+        return await (await self._aget()).match_many(keys, image)
+
+    async def matched_name(self, group: str, image: Frame) -> str | None:
+        return await (await self._aget()).matched_name(group, image)
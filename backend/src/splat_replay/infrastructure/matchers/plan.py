@@ -0,0 +1,72 @@
+"""複数のマッチャーを 1 回のワーカー呼び出しで評価する実行計画。"""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional, Sequence, Union
+
+from .base import BaseMatcher
+from .change_gate import ChangeGate
+from .composite import CompositeMatcher, evaluate_leaf
+from .cost import MatcherCostModel
+from .frame_cache import FrameMemo
+
+PlanTarget = Union[BaseMatcher, CompositeMatcher]
+
+
+class EvaluationPlan:
+    """キー集合を解決済みのマッチャーへ束ねた評価計画。
+
+    ``run`` / ``first`` はワーカースレッド上で呼び出す同期処理で、
+    フレームごとの :class:`FrameMemo` を共有して ROI ごとの切り出しや
+    色変換を使い回し、同じ単体マッチャーの結果も 1 回だけ計算する。
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        targets: Mapping[str, Optional[PlanTarget]],
+        lookup: Dict[str, BaseMatcher],
+        costs: Optional[MatcherCostModel] = None,
+        gate: Optional[ChangeGate] = None,
+    ) -> None:
+        self.keys = tuple(keys)
+        self._targets = [(key, targets.get(key)) for key in self.keys]
+        self._lookup = lookup
+        self._costs = costs
+        self._gate = gate
+
+    def run(self, memo: FrameMemo) -> Dict[str, bool]:
+        """全キーを評価して結果を返す (結果は ``memo`` にも記録する)。"""
+        return {
+            key: self._evaluate(key, target, memo)
+            for key, target in self._targets
+        }
+
+    def first(self, memo: FrameMemo) -> Optional[str]:
+        """宣言順に評価し、最初に一致したキーを返す。"""
+        for key, target in self._targets:
+            if self._evaluate(key, target, memo):
+                return key
+        return None
+
+    def _evaluate(
+        self, key: str, target: Optional[PlanTarget], memo: FrameMemo
+    ) -> bool:
+        cached = memo.results.get(key)
+        if cached is not None:
+            return cached
+        if target is None:
+            result = False
+        elif isinstance(target, CompositeMatcher):
+            result = target.evaluate(memo.view, memo.leaves)
+        else:
+            result = evaluate_leaf(
+                self._lookup,
+                key,
+                memo.view,
+                memo.leaves,
+                self._costs,
+                self._gate,
+            )
+        memo.results[key] = result
+        return result
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Protocol
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence
 
 import numpy as np
 
@@ -17,47 +19,140 @@ from splat_replay.infrastructure.filesystem import ASSETS_DIR
 
 from .base import BaseMatcher
 from .brightness import BrightnessMatcher
+from .change_gate import ChangeGate
 from .composite import CompositeMatcher
+from .cost import MatcherCostModel
 from .edge import EdgeMatcher
+from .frame_cache import FrameResultCache
 from .hash import HashMatcher
 from .hsv import HSVMatcher
 from .hsv_ratio import HSVRatioMatcher
+from .plan import EvaluationPlan, PlanTarget
 from .rgb import RGBMatcher
 from .template import TemplateMatcher
 from .uniform import UniformColorMatcher
 
 
-class MatcherLike(Protocol):
-    name: str | None
+@dataclass(frozen=True)
+class CompiledMatchers:
+    """1 つの設定から構築したマッチャー一式。
 
-    async def match(self, image: np.ndarray) -> bool: ...
+    reload では新しい一式を丸ごと構築してから参照を 1 回で差し替えるため、
+    評価中のスレッドが新旧のマッチャー・評価計画・キャッシュを
+    混ぜて参照することはない。評価計画とフレーム単位のキャッシュも
+    一式ごとに持つ。
+    """
+
+    matchers: Dict[str, BaseMatcher]
+    composites: Dict[str, CompositeMatcher]
+    groups: Mapping[str, Sequence[str]]
+    costs: MatcherCostModel
+    gate: Optional[ChangeGate]
+    # 最新フレームの評価結果。単体マッチャーはフレームごとに 1 回だけ評価する
+    frame_cache: FrameResultCache = field(default_factory=FrameResultCache)
+    plans: Dict[tuple[str, ...], EvaluationPlan] = field(default_factory=dict)
+
+    def get(self, key: str) -> PlanTarget | None:
+        composite = self.composites.get(key)
+        if composite is not None:
+            return composite
+        return self.matchers.get(key)
+
+    def plan_for(self, keys: Sequence[str]) -> EvaluationPlan:
+        """キー集合に対応する評価計画を返す (キー列ごとにキャッシュ)。"""
+        plan_key = tuple(keys)
+        plan = self.plans.get(plan_key)
+        if plan is None:
+            plan = EvaluationPlan(
+                plan_key,
+                {key: self.get(key) for key in plan_key},
+                self.matchers,
+                self.costs,
+                self.gate,
+            )
+            self.plans[plan_key] = plan
+        return plan
 
 
 class MatcherRegistry(ImageMatcherPort):
-    """設定に基づいてマッチャーを管理するクラス。"""
+    """設定に基づいてマッチャーを管理するクラス。
+
+    テンプレートの読み込みを 1 回で済ませるため、プロセス内の解析器で
+    1 つのインスタンスを共有する (DI ではシングルトンとして登録する)。
+    """
 
     def __init__(self, settings: ImageMatchingSettings) -> None:
-        self.matchers: Dict[str, BaseMatcher] = {}
+        self._compiled = self._compile(settings)
+
+    def reload(self, settings: ImageMatchingSettings) -> None:
+        """設定からマッチャーを作り直す (image_matching.yaml の変更時に呼ぶ)。
+
+        画像は更新されたものだけ読み直す。構築に失敗した場合は例外を送出し、
+        それまでのマッチャーを使い続ける。
+        """
+        self._compiled = self._compile(settings)
+
+    @property
+    def matchers(self) -> Dict[str, BaseMatcher]:
+        return self._compiled.matchers
+
+    @property
+    def composites(self) -> Dict[str, CompositeMatcher]:
+        return self._compiled.composites
+
+    @property
+    def groups(self) -> Mapping[str, Sequence[str]]:
+        return self._compiled.groups
+
+    @property
+    def costs(self) -> MatcherCostModel:
+        return self._compiled.costs
+
+    @property
+    def gate(self) -> Optional[ChangeGate]:
+        return self._compiled.gate
+
+    def _compile(self, settings: ImageMatchingSettings) -> CompiledMatchers:
+        # 複合マッチャーの評価順を決めるコスト推定 (プロファイリングにも使う)
+        costs = MatcherCostModel()
+        # ROI に変化がないフレームでは前回の判定を再利用する
+        gate_cfg = settings.change_gate
+        gate: Optional[ChangeGate] = (
+            ChangeGate(gate_cfg.tolerance, gate_cfg.samples)
+            if gate_cfg.enabled
+            else None
+        )
+        matchers: Dict[str, BaseMatcher] = {}
         for name, cfg in settings.matchers.items():
             matcher = self._build_matcher(cfg)
             if matcher:
-                self.matchers[name] = matcher
+                matchers[name] = matcher
+                costs.register(name, matcher)
 
-        self.composites: Dict[str, CompositeMatcher] = {}
+        composites: Dict[str, CompositeMatcher] = {}
         for name, comp in settings.composites.items():
             composite = self._build_composite_matcher(
-                name, comp, self.matchers
+                name, comp, matchers, costs, gate
             )
             if composite:
-                self.composites[name] = composite
+                composites[name] = composite
 
-        self.groups: Dict[str, list[str]] = settings.matcher_groups
+        return CompiledMatchers(
+            matchers=matchers,
+            composites=composites,
+            groups=MappingProxyType(
+                {
+                    group: tuple(keys)
+                    for group, keys in settings.matcher_groups.items()
+                }
+            ),
+            costs=costs,
+            gate=gate,
+        )
 
-    def _get_matcher(self, key: str) -> MatcherLike | None:
-        composite = self.composites.get(key)
-        if composite is not None:
-            return composite
-        return self.matchers.get(key)
+    def plan_for(self, keys: Sequence[str]) -> EvaluationPlan:
+        """キー集合に対応する評価計画を返す (キー列ごとにキャッシュ)。"""
+        return self._compiled.plan_for(keys)
 
     def _build_matcher(self, config: MatcherConfig) -> Optional[BaseMatcher]:
         if not config:
@@ -238,48 +333,78 @@ class MatcherRegistry(ImageMatcherPort):
         name: str,
         config: CompositeMatcherConfig,
         lookup: dict[str, BaseMatcher],
+        costs: MatcherCostModel,
+        gate: Optional[ChangeGate],
     ) -> Optional[CompositeMatcher]:
         if not config or not config.rule:
             return None
-        return CompositeMatcher(config.rule, lookup, name=name)
+        return CompositeMatcher(
+            config.rule, lookup, name=name, costs=costs, gate=gate
+        )
+
+    def cache_stats(self) -> Dict[str, int]:
+        """フレーム単位キャッシュと変化ゲートの計上値を返す (プロファイリング用)。
+
+        ``gate_reused`` は ROI 無変化により評価を省いた回数、
+        ``gate_evaluated`` はゲート対象のマッチャーを実際に評価した回数。
+        """
+        compiled = self._compiled
+        stats = compiled.frame_cache.counters.as_dict()
+        if compiled.gate is not None:
+            stats["gate_reused"] = compiled.gate.reused
+            stats["gate_evaluated"] = compiled.gate.evaluated
+        return stats
 
     async def match(self, key: str, image: np.ndarray) -> bool:
-        matcher = self._get_matcher(key)
-        result = await matcher.match(image) if matcher else False
-        return result
+        compiled = self._compiled
+        memo = compiled.frame_cache.memo_for(image)
+        cached = memo.results.get(key)
+        if cached is not None:
+            compiled.frame_cache.counters.result_hits += 1
+            return cached
+        if compiled.get(key) is None:
+            return False
+        results = await asyncio.to_thread(compiled.plan_for((key,)).run, memo)
+        return results[key]
+
+    async def match_many(
+        self, keys: Sequence[str], image: np.ndarray
+    ) -> Dict[str, bool]:
+        """複数キーを 1 回のワーカー呼び出しでまとめて評価する。
+
+        ROI ごとの派生画像と単体マッチャーの結果はフレーム単位で保持され、
+        同じフレームに対する後続の ``match`` でも再利用される。
+        """
+        if not keys:
+            return {}
+        compiled = self._compiled
+        memo = compiled.frame_cache.memo_for(image)
+        if all(key in memo.results for key in keys):
+            compiled.frame_cache.counters.result_hits += len(keys)
+            return {key: memo.results[key] for key in keys}
+        return await asyncio.to_thread(compiled.plan_for(keys).run, memo)
 
     async def match_first(
-        self, keys: list[str], image: np.ndarray
+        self, keys: Sequence[str], image: np.ndarray
     ) -> str | None:
-        # For small groups, evaluate in parallel to reduce wall time.
-        if len(keys) <= 4:
-            tasks: list[asyncio.Task[bool]] = []
-            matchers: list[MatcherLike | None] = []
-            for key in keys:
-                matcher = self._get_matcher(key)
-                matchers.append(matcher)
-                if matcher is not None:
-                    tasks.append(asyncio.create_task(matcher.match(image)))
-                else:
-                    tasks.append(
-                        asyncio.create_task(asyncio.sleep(0, result=False))
-                    )
-            results = await asyncio.gather(*tasks)
-            for key, matcher, ok in zip(keys, matchers, results):
-                if matcher is not None and ok:
-                    return matcher.name or key
-            return None
-
-        # Fallback: sequential evaluation to avoid spawning many tasks.
-        for key in keys:
-            matcher = self._get_matcher(key)
-            if matcher and await matcher.match(image):
-                return matcher.name or key
-        return None
+        return await self._match_first(self._compiled, keys, image)
 
     async def matched_name(self, group: str, image: np.ndarray) -> str | None:
-        keys = self.groups.get(group)
+        compiled = self._compiled
+        keys = compiled.groups.get(group)
         if not keys:
             return None
-        result = await self.match_first(keys, image)
-        return result
+        return await self._match_first(compiled, keys, image)
+
+    @staticmethod
+    async def _match_first(
+        compiled: CompiledMatchers, keys: Sequence[str], image: np.ndarray
+    ) -> str | None:
+        if not keys:
+            return None
+        memo = compiled.frame_cache.memo_for(image)
+        key = await asyncio.to_thread(compiled.plan_for(keys).first, memo)
+        if key is None:
+            return None
+        matcher = compiled.get(key)
+        return (matcher.name if matcher else None) or key
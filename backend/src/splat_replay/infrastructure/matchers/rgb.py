@@ -1,10 +1,10 @@
-import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 
 import numpy as np
 
 from .base import BaseMatcher
+from .frame_view import FrameView
 
 
 class RGBMatcher(BaseMatcher):
@@ -23,11 +23,8 @@ class RGBMatcher(BaseMatcher):
         self._rgb = rgb
         self._threshold = threshold
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
-
-    def _match(self, image: np.ndarray) -> bool:
-        img = self._apply_roi(image)
+    def evaluate(self, view: FrameView) -> bool:
+        img = view.region(self._roi)
         if self._mask is not None:
             mask = self._mask == 255
             masked = img[mask]
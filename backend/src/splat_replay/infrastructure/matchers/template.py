@@ -6,7 +6,8 @@ import cv2
 import numpy as np
 
 from .base import BaseMatcher
-from .utils import imread_unicode
+from .frame_view import FrameView
+from .utils import load_shared_image
 
 
 class TemplateMatcher(BaseMatcher):
@@ -27,7 +28,7 @@ class TemplateMatcher(BaseMatcher):
             raise ValueError("response_top_k は 1 以上である必要があります")
         self.template_path = template_path
         self.mask_path = mask_path
-        template = imread_unicode(template_path)
+        template = load_shared_image(template_path)
         if template is None:
             raise FileNotFoundError(
                 f"テンプレート画像の読み込みに失敗しました: {template_path}"
@@ -36,11 +37,21 @@ class TemplateMatcher(BaseMatcher):
         self._threshold = threshold
         self._response_top_k = response_top_k
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
+    @property
+    def feature_size(self) -> int:  # type: ignore[override]
+        return min(self._template.shape[:2])
 
-    def _match(self, image: np.ndarray) -> bool:
-        return self._score(image) >= self._threshold
+    @property
+    def template(self) -> np.ndarray:
+        """グレースケールのテンプレート画像。"""
+        return self._template
+
+    @property
+    def mask(self) -> Optional[np.ndarray]:
+        return self._mask
+
+    def evaluate(self, view: FrameView) -> bool:
+        return self._score_gray(view.gray(self._roi)) >= self._threshold
 
     async def score(
         self,
@@ -60,6 +71,13 @@ class TemplateMatcher(BaseMatcher):
             raise asyncio.CancelledError("template scoring cancelled")
         img = self._apply_roi(image)
         gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        return self._score_gray(gray, cancel_check)
+
+    def _score_gray(
+        self,
+        gray: np.ndarray,
+        cancel_check: Callable[[], bool] | None = None,
+    ) -> float:
         if cancel_check is not None and cancel_check():
             raise asyncio.CancelledError("template scoring cancelled")
         if self._mask is not None:
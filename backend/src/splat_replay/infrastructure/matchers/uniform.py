@@ -1,11 +1,10 @@
-import asyncio
 from pathlib import Path
 from typing import Optional, Tuple
 
-import cv2
 import numpy as np
 
 from .base import BaseMatcher
+from .frame_view import FrameView
 
 
 class UniformColorMatcher(BaseMatcher):
@@ -22,12 +21,8 @@ class UniformColorMatcher(BaseMatcher):
         super().__init__(mask_path, roi, name)
         self._hue_threshold = hue_threshold
 
-    async def match(self, image: np.ndarray) -> bool:
-        return await asyncio.to_thread(self._match, image)
-
-    def _match(self, image: np.ndarray) -> bool:
-        img = self._apply_roi(image)
-        hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+    def evaluate(self, view: FrameView) -> bool:
+        hsv = view.hsv(self._roi)
         hue = hsv[:, :, 0]
         if self._mask is not None:
             values = hue[self._mask == 255]
@@ -1,11 +1,16 @@
 """画像読み込みのためのユーティリティ関数。"""
 
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import cv2
 import numpy as np
 
+# (パス, imread フラグ) -> (更新時刻, サイズ, デコード済み画像)
+_image_cache: Dict[Tuple[str, int], Tuple[int, int, np.ndarray]] = {}
+_image_cache_lock = threading.Lock()
+
 
 def imread_unicode(
     file_path: Path, flags: int = cv2.IMREAD_COLOR
@@ -33,3 +38,48 @@ def imread_unicode(
         return img
     except Exception:
         return None
+
+
+def load_shared_image(
+    file_path: Path, flags: int = cv2.IMREAD_COLOR
+) -> Optional[np.ndarray]:
+    """画像を読み込み、プロセス内で共有する。
+
+    パスとフラグごとにデコード結果を保持し、ファイルの更新時刻か
+    サイズが変わった場合だけ読み直す。複数のマッチャーや解析器で
+    同じ配列を共有するため、返す画像は書き込み不可にしてある。
+
+    Args:
+        file_path: 読み込む画像ファイルのパス
+        flags: OpenCV の imread フラグ (IMREAD_COLOR, IMREAD_GRAYSCALE など)
+
+    Returns:
+        読み込んだ画像の ndarray (読み取り専用)。失敗時は None。
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    key = (str(file_path), flags)
+    with _image_cache_lock:
+        cached = _image_cache.get(key)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return cached[2]
+
+    image = imread_unicode(file_path, flags)
+    if image is None:
+        return None
+    image.setflags(write=False)
+    with _image_cache_lock:
+        _image_cache[key] = (stat.st_mtime_ns, stat.st_size, image)
+    return image
+
+
+def clear_shared_images() -> None:
+    """共有している画像をすべて破棄する。"""
+    with _image_cache_lock:
+        _image_cache.clear()
@@ -2,16 +2,23 @@
 
 Thread-safe in-memory publish/subscribe bus. Domain & application should depend
 only on abstract EventPublisher; this module is an infra detail.
+
+Subscribers on an asyncio loop can ``await sub.wait()`` instead of polling: the
+publishing thread wakes them through ``call_soon_threadsafe`` once per burst.
+``wait`` returns ``None`` once the subscription is closed, so consumer loops
+must stop there.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import threading
 import time
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Iterable, Protocol
+from typing import Callable, Deque, Iterable, Protocol
 
 
 @dataclass(slots=True)
@@ -26,15 +33,42 @@ class Event:
 
 class Subscription(Protocol):
     def poll(self, max_items: int | None = None) -> list[Event]: ...
+    async def wait(
+        self, max_items: int | None = None
+    ) -> list[Event] | None: ...
     def close(self) -> None: ...
 
 
+def _wake(
+    waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]],
+) -> None:
+    for loop, waiter in waiters:
+        # RuntimeError: loop already closed, so nobody is waiting any more
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class _Subscription:
-    def __init__(self, types: set[str] | None, maxlen: int, drop_oldest: bool):
+    def __init__(
+        self,
+        types: set[str] | None,
+        maxlen: int,
+        drop_oldest: bool,
+        on_close: Callable[[_Subscription], None] | None = None,
+    ):
         self.types = types
         self._queue: Deque[Event] = deque()
         self._lock = threading.Lock()
         self._closed = False
+        self._waiters: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = []
+        self._on_close = on_close
         self.maxlen = maxlen
         self.drop_oldest = drop_oldest
 
@@ -51,25 +85,58 @@ class _Subscription:
                 else:
                     return
             self._queue.append(ev)
+            # only the first event of a burst schedules a wakeup
+            waiters, self._waiters = self._waiters, []
+        _wake(waiters)
 
     def poll(self, max_items: int | None = None) -> list[Event]:
-        out: list[Event] = []
         with self._lock:
-            if self._closed:
-                return out
-            n = (
-                len(self._queue)
-                if max_items is None
-                else min(len(self._queue), max_items)
-            )
-            for _ in range(n):
-                out.append(self._queue.popleft())
+            return self._take(max_items)
+
+    async def wait(self, max_items: int | None = None) -> list[Event] | None:
+        """Return queued events, sleeping until at least one arrives.
+
+        Returns ``None`` once the subscription is closed.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._closed:
+                    return None
+                if self._queue:
+                    return self._take(max_items)
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+
+    def _take(self, max_items: int | None) -> list[Event]:
+        out: list[Event] = []
+        if self._closed:
+            return out
+        n = (
+            len(self._queue)
+            if max_items is None
+            else min(len(self._queue), max_items)
+        )
+        for _ in range(n):
+            out.append(self._queue.popleft())
         return out
 
     def close(self) -> None:
         with self._lock:
+            if self._closed:
+                return
             self._closed = True
             self._queue.clear()
+            waiters, self._waiters = self._waiters, []
+        _wake(waiters)
+        if self._on_close is not None:
+            self._on_close(self)
 
 
 class EventBus:
@@ -92,16 +159,19 @@ class EventBus:
         drop_oldest: bool = True,
     ) -> Subscription:
         types = set(event_types) if event_types is not None else None
-        sub = _Subscription(types, max_queue, drop_oldest)
+        sub = _Subscription(types, max_queue, drop_oldest, self._detach)
         with self._lock:
             self._subs.append(sub)
         return sub
 
     def unsubscribe(self, sub: _Subscription) -> None:
+        sub.close()
+
+    def _detach(self, sub: _Subscription) -> None:
+        # closed subscriptions no longer receive events
         with self._lock:
             if sub in self._subs:
                 self._subs.remove(sub)
-        sub.close()
 
 
 __all__ = ["Event", "EventBus", "Subscription"]
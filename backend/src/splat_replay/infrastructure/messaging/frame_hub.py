@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import threading
-from typing import Callable, List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from splat_replay.domain.models import Frame
 
@@ -11,12 +11,15 @@ from splat_replay.domain.models import Frame
 class FrameHub:
     def __init__(self) -> None:
         self._latest: Optional[Frame] = None
+        # 発行のたびに増える通し番号 (同じフレームかどうかの判定に使う)
+        self._sequence = 0
         self._lock = threading.Lock()
         self._listeners: List[Callable[[Frame], None]] = []
 
     def publish(self, frame: Frame) -> None:
         with self._lock:
             self._latest = frame
+            self._sequence += 1
             listeners = list(self._listeners)
         for cb in listeners:
             try:
@@ -28,6 +31,10 @@ class FrameHub:
         with self._lock:
             return self._latest
 
+    def get_latest_with_sequence(self) -> Tuple[int, Optional[Frame]]:
+        with self._lock:
+            return self._sequence, self._latest
+
     def add_listener(self, cb: Callable[[Frame], None]) -> None:
         with self._lock:
             self._listeners.append(cb)
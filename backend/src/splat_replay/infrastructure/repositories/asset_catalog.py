@@ -0,0 +1,494 @@
+"""動画アセットの索引 (SQLite)。
+
+録画・編集済みフォルダの動画ごとに、ファイルの状態とサイドカー JSON の
+内容を保存しておき、一覧・絞り込み・件数をフォルダの走査や JSON の
+読み込みなしに返す。
+
+索引は保存・削除・メタデータ更新のたびに該当行だけ更新する。アプリの外で
+ファイルが増減・変更された場合に備え、一覧の前にはフォルダを 1 度だけ
+走査し、サイズ・更新時刻・サイドカーの有無が変わった動画だけを読み直す。
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import contextlib
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+from structlog.stdlib import BoundLogger
+
+from splat_replay.application.interfaces import (
+    AssetListQuery,
+    AssetPage,
+    AssetSortKey,
+)
+
+AssetKind = Literal["recorded", "edited"]
+
+# サイドカーの内容を読み込む関数 (動画パスを受け取り、辞書か None を返す)
+MetadataLoader = Callable[[Path], Mapping[str, object] | None]
+
+CATALOG_FILENAME = ".asset_catalog.sqlite3"
+
+# スキーマを変えたら更新する (古い索引は作り直す)
+CATALOG_SCHEMA_VERSION = 2
+
+VIDEO_SUFFIXES = (".mkv", ".mp4")
+
+# 絞り込みに使うメタデータ項目 (索引の列として保持する)
+INDEXED_FIELDS = (
+    "started_at",
+    "game_mode",
+    "match",
+    "rule",
+    "stage",
+    "judgement",
+)
+
+_COLUMNS = (
+    "kind TEXT NOT NULL",
+    "name TEXT NOT NULL",
+    "size_bytes INTEGER NOT NULL",
+    "mtime_ns INTEGER NOT NULL",
+    "sidecar_mtime_ns INTEGER",
+    "has_subtitle INTEGER NOT NULL",
+    "has_thumbnail INTEGER NOT NULL",
+    "metadata TEXT",
+    *(f'"{field}" TEXT' for field in INDEXED_FIELDS),
+)
+
+# 並び替えの基準ごとの SQL 式 (同じ値の動画は名前で順序を決める)
+_SORT_EXPRESSIONS: dict[AssetSortKey, str] = {
+    "started_at": "COALESCE(started_at, '')",
+    "filename": "name",
+    "size": "size_bytes",
+    "updated_at": "mtime_ns",
+}
+
+_SCHEMA = "".join(
+    [
+        (
+            "CREATE TABLE IF NOT EXISTS assets"
+            f" ({', '.join(_COLUMNS)}, PRIMARY KEY (kind, name));"
+        ),
+        *(
+            f"CREATE INDEX IF NOT EXISTS assets_{field}"
+            f' ON assets (kind, "{field}");'
+            for field in INDEXED_FIELDS
+        ),
+        # ページ送りで並び順の途中から読み始められるようにする
+        # (名前順は主キーで足りる)
+        *(
+            f"CREATE INDEX IF NOT EXISTS assets_order_{key}"
+            f" ON assets (kind, {expression}, name);"
+            for key, expression in _SORT_EXPRESSIONS.items()
+            if key != "filename"
+        ),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """索引に登録された動画 1 本。
+
+    Attributes:
+        name: フォルダ内のファイル名
+        size_bytes: 動画のサイズ
+        mtime_ns: 動画の更新時刻 (ナノ秒)
+        sidecar_mtime_ns: サイドカー JSON の更新時刻。無ければ None
+        has_subtitle: 字幕ファイルの有無
+        has_thumbnail: サムネイルファイルの有無
+        metadata: サイドカーの内容。無いか読めなければ None
+    """
+
+    name: str
+    size_bytes: int
+    mtime_ns: int
+    sidecar_mtime_ns: int | None
+    has_subtitle: bool
+    has_thumbnail: bool
+    metadata: dict[str, object] | None
+
+    @property
+    def updated_at(self) -> float:
+        return self.mtime_ns / 1_000_000_000
+
+
+@dataclass(frozen=True)
+class _FileState:
+    size_bytes: int
+    mtime_ns: int
+    sidecar_mtime_ns: int | None
+    has_subtitle: bool
+    has_thumbnail: bool
+
+    def matches(self, row: sqlite3.Row) -> bool:
+        return (
+            row["size_bytes"] == self.size_bytes
+            and row["mtime_ns"] == self.mtime_ns
+            and row["sidecar_mtime_ns"] == self.sidecar_mtime_ns
+            and bool(row["has_subtitle"]) == self.has_subtitle
+            and bool(row["has_thumbnail"]) == self.has_thumbnail
+        )
+
+
+class AssetCatalog:
+    """録画・編集済み動画の索引。
+
+    操作ごとに接続を開くため、複数のリポジトリやスレッドから
+    同じ索引ファイルを共有できる。
+    """
+
+    def __init__(self, path: Path, logger: BoundLogger) -> None:
+        self._path = path
+        self._logger = logger
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def sync(
+        self, kind: AssetKind, directory: Path, load: MetadataLoader
+    ) -> None:
+        """フォルダの現状に合わせて索引を更新する。
+
+        変更のあった動画だけサイドカーを読み直し、消えた動画は削除する。
+        """
+        states = _scan(directory)
+        with self._connect() as conn:
+            rows = {
+                row["name"]: row
+                for row in conn.execute(
+                    "SELECT name, size_bytes, mtime_ns, sidecar_mtime_ns,"
+                    " has_subtitle, has_thumbnail FROM assets WHERE kind = ?",
+                    (kind,),
+                )
+            }
+            removed = [name for name in rows if name not in states]
+            for name in removed:
+                _delete(conn, kind, name)
+            changed = [
+                name
+                for name, state in states.items()
+                if name not in rows or not state.matches(rows[name])
+            ]
+            for name in changed:
+                _upsert(
+                    conn,
+                    kind,
+                    name,
+                    states[name],
+                    load(directory / name),
+                )
+        if removed or changed:
+            self._logger.debug(
+                "アセット索引を更新しました",
+                kind=kind,
+                changed=len(changed),
+                removed=len(removed),
+            )
+
+    def refresh(
+        self, kind: AssetKind, video: Path, load: MetadataLoader
+    ) -> None:
+        """動画 1 本の行を現在のファイルの状態で書き直す。
+
+        索引の更新に失敗しても保存処理は止めない (次の一覧で追いつく)。
+        """
+        state = _stat(video)
+        try:
+            with self._connect() as conn:
+                if state is None:
+                    _delete(conn, kind, video.name)
+                else:
+                    _upsert(conn, kind, video.name, state, load(video))
+        except (sqlite3.Error, OSError) as exc:
+            self._warn_update_failed(kind, video, exc)
+
+    def remove(self, kind: AssetKind, video: Path) -> None:
+        try:
+            with self._connect() as conn:
+                _delete(conn, kind, video.name)
+        except (sqlite3.Error, OSError) as exc:
+            self._warn_update_failed(kind, video, exc)
+
+    def _warn_update_failed(
+        self, kind: AssetKind, video: Path, exc: Exception
+    ) -> None:
+        self._logger.warning(
+            "アセット索引を更新できませんでした",
+            kind=kind,
+            video=str(video),
+            error=str(exc),
+        )
+
+    def entries(self, kind: AssetKind) -> list[CatalogEntry]:
+        """索引の動画をすべて録画開始時刻の新しい順に返す。"""
+        return self.query(kind, AssetListQuery()).items
+
+    def query(
+        self, kind: AssetKind, query: AssetListQuery
+    ) -> AssetPage[CatalogEntry]:
+        """絞り込み・並び替えた動画を 1 ページ分返す。
+
+        ページの位置は並び替えの値と名前の組 (カーソル) で表すため、
+        読み込む行数は動画の総数ではなくページの大きさで決まる。
+
+        Raises:
+            ValueError: カーソルが別の並び順のものか壊れている場合
+        """
+        clauses, params = _conditions(kind, query)
+        expression = _SORT_EXPRESSIONS[query.sort]
+        direction = "DESC" if query.descending else "ASC"
+        page_clauses = list(clauses)
+        page_params = list(params)
+        if query.cursor is not None:
+            value, name = _decode_cursor(query.cursor, query)
+            page_clauses.append(
+                f"({expression}, name)"
+                f" {'<' if query.descending else '>'} (?, ?)"
+            )
+            page_params.extend([value, name])
+        sql = (
+            f"SELECT *, {expression} AS sort_value FROM assets"
+            f" WHERE {' AND '.join(page_clauses)}"
+            f" ORDER BY {expression} {direction}, name {direction}"
+        )
+        if query.limit is not None:
+            # 次のページがあるか判定するため 1 件多く読む
+            sql += " LIMIT ?"
+            page_params.append(query.limit + 1)
+
+        with self._connect() as conn:
+            (total,) = conn.execute(
+                f"SELECT COUNT(*) FROM assets WHERE {' AND '.join(clauses)}",
+                params,
+            ).fetchone()
+            rows = conn.execute(sql, page_params).fetchall()
+
+        next_cursor: str | None = None
+        if query.limit is not None and len(rows) > query.limit:
+            rows = rows[: query.limit]
+            next_cursor = _encode_cursor(
+                query, rows[-1]["sort_value"], rows[-1]["name"]
+            )
+        return AssetPage(
+            items=[_entry(row) for row in rows],
+            total=int(total),
+            next_cursor=next_cursor,
+        )
+
+    def count(
+        self, kind: AssetKind, query: AssetListQuery | None = None
+    ) -> int:
+        """絞り込み条件に一致する動画の数を返す。"""
+        clauses, params = _conditions(kind, query or AssetListQuery())
+        with self._connect() as conn:
+            (total,) = conn.execute(
+                f"SELECT COUNT(*) FROM assets WHERE {' AND '.join(clauses)}",
+                params,
+            ).fetchone()
+        return int(total)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=10)
+        try:
+            conn.row_factory = sqlite3.Row
+            self._ensure_schema(conn)
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            # 読み込み中の一覧と保存処理を並行できるようにする
+            conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version != CATALOG_SCHEMA_VERSION:
+                # 索引はファイルから作り直せるため、形式が違えば捨てる
+                conn.execute("DROP TABLE IF EXISTS assets")
+                conn.executescript(_SCHEMA)
+                conn.execute(f"PRAGMA user_version = {CATALOG_SCHEMA_VERSION}")
+            self._schema_ready = True
+
+
+def _scan(directory: Path) -> dict[str, _FileState]:
+    """フォルダを 1 度だけ走査し、動画ごとのファイルの状態を求める。"""
+    try:
+        with os.scandir(directory) as it:
+            files = {
+                entry.name: entry.stat() for entry in it if entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
+    states: dict[str, _FileState] = {}
+    for name, stat in files.items():
+        stem, suffix = os.path.splitext(name)
+        if suffix.lower() not in VIDEO_SUFFIXES:
+            continue
+        sidecar = files.get(f"{stem}.json")
+        states[name] = _FileState(
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            sidecar_mtime_ns=sidecar.st_mtime_ns if sidecar else None,
+            has_subtitle=f"{stem}.srt" in files,
+            has_thumbnail=f"{stem}.png" in files,
+        )
+    return states
+
+
+def _stat(video: Path) -> _FileState | None:
+    try:
+        stat = video.stat()
+    except FileNotFoundError:
+        return None
+    try:
+        sidecar_mtime_ns: int | None = (
+            video.with_suffix(".json").stat().st_mtime_ns
+        )
+    except FileNotFoundError:
+        sidecar_mtime_ns = None
+    return _FileState(
+        size_bytes=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sidecar_mtime_ns=sidecar_mtime_ns,
+        has_subtitle=video.with_suffix(".srt").exists(),
+        has_thumbnail=video.with_suffix(".png").exists(),
+    )
+
+
+def _delete(conn: sqlite3.Connection, kind: AssetKind, name: str) -> None:
+    conn.execute(
+        "DELETE FROM assets WHERE kind = ? AND name = ?", (kind, name)
+    )
+
+
+def _upsert(
+    conn: sqlite3.Connection,
+    kind: AssetKind,
+    name: str,
+    state: _FileState,
+    metadata: Mapping[str, object] | None,
+) -> None:
+    columns = [
+        value if isinstance(value, str) else None
+        for value in ((metadata or {}).get(field) for field in INDEXED_FIELDS)
+    ]
+    placeholders = ", ".join("?" for _ in _COLUMNS)
+    conn.execute(
+        f"INSERT OR REPLACE INTO assets VALUES ({placeholders})",
+        (
+            kind,
+            name,
+            state.size_bytes,
+            state.mtime_ns,
+            state.sidecar_mtime_ns,
+            int(state.has_subtitle),
+            int(state.has_thumbnail),
+            json.dumps(dict(metadata), ensure_ascii=False)
+            if metadata is not None
+            else None,
+            *columns,
+        ),
+    )
+
+
+def _conditions(
+    kind: AssetKind, query: AssetListQuery
+) -> tuple[list[str], list[object]]:
+    clauses = ["kind = ?"]
+    params: list[object] = [kind]
+    for field, value in query.filters().items():
+        clauses.append(f'"{field}" = ?')
+        params.append(value)
+
+    # 期間は録画なら録画開始日、編集済みなら更新日で絞り込む
+    until = (
+        query.until + datetime.timedelta(days=1)
+        if query.until is not None
+        else None
+    )
+    for bound, operator in ((query.since, ">="), (until, "<")):
+        if bound is None:
+            continue
+        if kind == "recorded":
+            clauses.append(f"started_at {operator} ?")
+            params.append(bound.isoformat())
+        else:
+            clauses.append(f"mtime_ns {operator} ?")
+            params.append(_local_midnight_ns(bound))
+    return clauses, params
+
+
+def _local_midnight_ns(day: datetime.date) -> int:
+    midnight = datetime.datetime.combine(day, datetime.time())
+    return int(midnight.timestamp()) * 1_000_000_000
+
+
+def _encode_cursor(query: AssetListQuery, value: object, name: str) -> str:
+    payload = json.dumps(
+        [query.sort, query.descending, value, name], ensure_ascii=False
+    )
+    return (
+        base64.urlsafe_b64encode(payload.encode("utf-8"))
+        .decode("ascii")
+        .rstrip("=")
+    )
+
+
+def _decode_cursor(cursor: str, query: AssetListQuery) -> tuple[object, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort, descending, value, name = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii"))
+        )
+    except (ValueError, TypeError, UnicodeError, binascii.Error) as exc:
+        raise ValueError("カーソルが不正です") from exc
+    if (
+        sort != query.sort
+        or descending != query.descending
+        or not isinstance(name, str)
+        or not isinstance(value, (str, int))
+    ):
+        raise ValueError("カーソルが並び順と一致しません")
+    return value, name
+
+
+def _entry(row: sqlite3.Row) -> CatalogEntry:
+    metadata = json.loads(row["metadata"]) if row["metadata"] else None
+    return CatalogEntry(
+        name=row["name"],
+        size_bytes=row["size_bytes"],
+        mtime_ns=row["mtime_ns"],
+        sidecar_mtime_ns=row["sidecar_mtime_ns"],
+        has_subtitle=bool(row["has_subtitle"]),
+        has_thumbnail=bool(row["has_thumbnail"]),
+        metadata=metadata if isinstance(metadata, dict) else None,
+    )
+
+
+__all__ = [
+    "CATALOG_FILENAME",
+    "INDEXED_FIELDS",
+    "AssetCatalog",
+    "AssetKind",
+    "CatalogEntry",
+    "MetadataLoader",
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
 
 import cv2
@@ -200,17 +201,39 @@ class AssetFileOperations:
         metadata_path = base_path.with_suffix(".json")
         if not metadata_path.exists():
             return None
+        try:
+            data = json.loads(metadata_path.read_text(encoding="utf-8"))
+        except Exception as exc:  # noqa: BLE001
+            self.logger.error(
+                "メタデータの読み込みに失敗しました",
+                path=str(metadata_path),
+                error=str(exc),
+            )
+            return None
+        return self.parse_metadata(data, metadata_path)
+
+    def parse_metadata(
+        self, data: Mapping[str, object], source: Path
+    ) -> RecordingMetadata | None:
+        """サイドカーの内容 (辞書) からメタデータを復元する。
+
+        Args:
+            data: サイドカー JSON を読み込んだ値
+            source: ログ用の読み込み元パス
+
+        Returns:
+            メタデータ。解釈できない場合はNone
+        """
         try:
             from splat_replay.application.services.editing.metadata_parser import (
                 MetadataParser,
             )
 
-            data = json.loads(metadata_path.read_text(encoding="utf-8"))
             return MetadataParser.from_dict(data)
         except Exception as exc:  # noqa: BLE001
             self.logger.error(
                 "メタデータの読み込みに失敗しました",
-                path=str(metadata_path),
+                path=str(source),
                 error=str(exc),
             )
             return None
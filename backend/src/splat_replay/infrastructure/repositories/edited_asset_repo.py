@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import shutil
+import sqlite3
 from pathlib import Path
 
 from structlog.stdlib import BoundLogger
 
+from splat_replay.application.interfaces import AssetListQuery, AssetPage
 from splat_replay.domain.config import VideoStorageSettings
+from splat_replay.infrastructure.filesystem import transfer
+from splat_replay.infrastructure.repositories.asset_catalog import (
+    AssetCatalog,
+)
 from splat_replay.infrastructure.repositories.asset_file_operations import (
     AssetEventPublisher,
     AssetFileOperations,
@@ -21,6 +26,9 @@ class EditedAssetRepository:
     - 編集済みファイルの保存・削除・一覧取得
     - 字幕/サムネイル/メタデータの操作
     - 編集済み関連のイベント発行
+
+    索引 (AssetCatalog) が渡された場合、一覧は索引から返し、
+    保存・削除・メタデータ更新のたびに索引を更新する。
     """
 
     def __init__(
@@ -29,11 +37,13 @@ class EditedAssetRepository:
         logger: BoundLogger,
         file_ops: AssetFileOperations,
         event_publisher: AssetEventPublisher,
+        catalog: AssetCatalog | None = None,
     ) -> None:
         self.settings = settings
         self.logger = logger
         self._file_ops = file_ops
         self._event_publisher = event_publisher
+        self._catalog = catalog
 
     def save_edited(self, video: Path) -> Path:
         """編集済みファイルを保存する。
@@ -43,24 +53,40 @@ class EditedAssetRepository:
 
         Returns:
             保存先パス
+
+        Raises:
+            OSError: 動画を編集済みフォルダへ移動できなかった場合
         """
         dest = self.settings.edited_dir
         dest.mkdir(parents=True, exist_ok=True)
         target = dest / video.name
 
-        # 動画ファイルを移動
+        # 動画ファイルを移動 (別ドライブの場合もメモリに載せずにコピーする)
+        # 同じ時間帯を編集し直した場合は既存の編集済み動画を置き換える
         try:
-            shutil.move(str(video), target)
-        except Exception:
-            target = video
+            strategy = transfer.move_file(video, target, replace=True)
+        except OSError as exc:
+            # 録画済みフォルダに残したまま元の録画を消させないよう呼び出し元へ伝える
+            self.logger.error(
+                "編集済み動画の移動に失敗しました",
+                error=str(exc),
+                src=str(video),
+                dst=str(target),
+            )
+            raise
+        self.logger.debug(
+            "編集済み動画を移動しました",
+            path=str(target),
+            strategy=strategy,
+        )
 
         # 関連ファイル（字幕、サムネイル、メタデータ）も移動
         for suffix in (".srt", ".png", ".json"):
             src_file = video.with_suffix(suffix)
-            if src_file.exists():
-                dst_file = target.with_suffix(suffix)
+            dst_file = target.with_suffix(suffix)
+            if src_file.exists() and dst_file != src_file:
                 try:
-                    shutil.move(str(src_file), dst_file)
+                    transfer.move_file(src_file, dst_file, replace=True)
                     self.logger.info(
                         f"関連ファイル{suffix}を移動しました",
                         src=str(src_file),
@@ -74,6 +100,7 @@ class EditedAssetRepository:
                     )
 
         self.logger.info("編集後ファイル保存", path=str(target))
+        self._refresh_catalog(target)
 
         self._event_publisher.publish_edited_saved(target)
         return target
@@ -84,11 +111,52 @@ class EditedAssetRepository:
         Returns:
             ファイルパスのリスト
         """
+        edited_dir = self.settings.edited_dir
+        if self._catalog is not None:
+            try:
+                self._catalog.sync(
+                    "edited", edited_dir, self._file_ops.load_metadata_dict
+                )
+                return [
+                    edited_dir / entry.name
+                    for entry in self._catalog.entries("edited")
+                ]
+            except (sqlite3.Error, OSError) as exc:
+                self.logger.warning(
+                    "アセット索引を利用できないためフォルダを直接読み込みます",
+                    error=str(exc),
+                )
         videos: list[Path] = []
         for pattern in ("*.mkv", "*.mp4"):
-            videos.extend(self.settings.edited_dir.glob(pattern))
+            videos.extend(edited_dir.glob(pattern))
         return videos
 
+    def query_edited(self, query: AssetListQuery) -> AssetPage[Path]:
+        """絞り込み・並び替えた編集済みファイルを 1 ページ分取得する。
+
+        フォルダとの突き合わせは最初のページ (カーソル無し) だけで行い、
+        続きのページは索引だけから返す。
+
+        Args:
+            query: 絞り込み・並び順・ページの指定
+
+        Returns:
+            このページのファイルパスと全件数、次のページのカーソル
+        """
+        if self._catalog is None:
+            raise RuntimeError("アセット索引が設定されていません")
+        edited_dir = self.settings.edited_dir
+        if query.cursor is None:
+            self._catalog.sync(
+                "edited", edited_dir, self._file_ops.load_metadata_dict
+            )
+        page = self._catalog.query("edited", query)
+        return AssetPage(
+            items=[edited_dir / entry.name for entry in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
     def delete_edited(self, video: Path) -> bool:
         """編集済みファイルを削除する。
 
@@ -103,6 +171,8 @@ class EditedAssetRepository:
             video.unlink(missing_ok=True)
 
         self._file_ops.delete_related_files(video)
+        if self._catalog is not None:
+            self._catalog.remove("edited", video)
 
         self._event_publisher.publish_edited_deleted(video)
 
@@ -134,7 +204,10 @@ class EditedAssetRepository:
         Returns:
             成功した場合True
         """
-        return self._file_ops.save_subtitle(video, content)
+        success = self._file_ops.save_subtitle(video, content)
+        if success:
+            self._refresh_catalog(video)
+        return success
 
     def get_thumbnail(self, video: Path) -> bytes | None:
         """サムネイルを取得する。
@@ -157,7 +230,10 @@ class EditedAssetRepository:
         Returns:
             成功した場合True
         """
-        return self._file_ops.save_thumbnail(video, data)
+        success = self._file_ops.save_thumbnail(video, data)
+        if success:
+            self._refresh_catalog(video)
+        return success
 
     def get_metadata(self, video: Path) -> dict[str, str] | None:
         """メタデータを取得する。
@@ -180,4 +256,13 @@ class EditedAssetRepository:
         Returns:
             成功した場合True
         """
-        return self._file_ops.save_metadata(video, metadata)
+        success = self._file_ops.save_metadata(video, metadata)
+        if success:
+            self._refresh_catalog(video)
+        return success
+
+    def _refresh_catalog(self, video: Path) -> None:
+        if self._catalog is not None:
+            self._catalog.refresh(
+                "edited", video, self._file_ops.load_metadata_dict
+            )
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import shutil
+import sqlite3
+from collections.abc import Mapping
 from pathlib import Path
 
 from structlog.stdlib import BoundLogger
 
+from splat_replay.application.interfaces import AssetListQuery, AssetPage
+from splat_replay.application.metadata import recording_metadata_to_dict
 from splat_replay.domain.config import VideoStorageSettings
 from splat_replay.domain.models import Frame, RecordingMetadata, VideoAsset
+from splat_replay.infrastructure.repositories.asset_catalog import (
+    AssetCatalog,
+    CatalogEntry,
+)
 from splat_replay.infrastructure.repositories.asset_file_operations import (
     AssetEventPublisher,
     AssetFileOperations,
@@ -22,6 +30,9 @@ class RecordedAssetRepository:
     - 録画ファイルの保存・削除・一覧取得
     - 字幕/サムネイル/メタデータの操作
     - 録画関連のイベント発行
+
+    索引 (AssetCatalog) が渡された場合、一覧は索引から返し、
+    保存・削除・メタデータ更新のたびに索引を更新する。
     """
 
     def __init__(
@@ -30,11 +41,13 @@ class RecordedAssetRepository:
         logger: BoundLogger,
         file_ops: AssetFileOperations,
         event_publisher: AssetEventPublisher,
+        catalog: AssetCatalog | None = None,
     ) -> None:
         self.settings = settings
         self.logger = logger
         self._file_ops = file_ops
         self._event_publisher = event_publisher
+        self._catalog = catalog
 
     def save_recording(
         self,
@@ -92,6 +105,7 @@ class RecordedAssetRepository:
             raise
 
         self.logger.info("録画ファイル保存", path=str(target))
+        self._refresh_catalog(target)
 
         # イベント発行
         self._event_publisher.publish_recorded_saved(
@@ -150,12 +164,87 @@ class RecordedAssetRepository:
         Returns:
             VideoAssetのリスト
         """
+        if self._catalog is not None:
+            try:
+                return [
+                    self._asset_from_entry(entry)
+                    for entry in self._catalog_entries(self._catalog)
+                ]
+            except (sqlite3.Error, OSError) as exc:
+                self.logger.warning(
+                    "アセット索引を利用できないためフォルダを直接読み込みます",
+                    error=str(exc),
+                )
         assets: list[VideoAsset] = []
         for pattern in ("*.mkv", "*.mp4"):
             for video in self.settings.recorded_dir.glob(pattern):
                 assets.append(self._load_asset(video))
         return assets
 
+    def query_recordings(self, query: AssetListQuery) -> AssetPage[VideoAsset]:
+        """絞り込み・並び替えた録画アセットを 1 ページ分取得する。
+
+        フォルダとの突き合わせは最初のページ (カーソル無し) だけで行い、
+        続きのページは索引だけから返す。
+
+        Args:
+            query: 絞り込み・並び順・ページの指定
+
+        Returns:
+            このページの VideoAsset と全件数、次のページのカーソル
+        """
+        if self._catalog is None:
+            raise RuntimeError("アセット索引が設定されていません")
+        if query.cursor is None:
+            self._catalog.sync(
+                "recorded",
+                self.settings.recorded_dir,
+                self._metadata_for_catalog,
+            )
+        page = self._catalog.query("recorded", query)
+        return AssetPage(
+            items=[self._asset_from_entry(entry) for entry in page.items],
+            total=page.total,
+            next_cursor=page.next_cursor,
+        )
+
+    def _catalog_entries(self, catalog: AssetCatalog) -> list[CatalogEntry]:
+        catalog.sync(
+            "recorded", self.settings.recorded_dir, self._metadata_for_catalog
+        )
+        return catalog.entries("recorded")
+
+    def _asset_from_entry(self, entry: CatalogEntry) -> VideoAsset:
+        video = self.settings.recorded_dir / entry.name
+        return VideoAsset(
+            video=video,
+            subtitle=video.with_suffix(".srt") if entry.has_subtitle else None,
+            thumbnail=(
+                video.with_suffix(".png") if entry.has_thumbnail else None
+            ),
+            metadata=(
+                self._file_ops.parse_metadata(
+                    entry.metadata, video.with_suffix(".json")
+                )
+                if entry.metadata is not None
+                else None
+            ),
+        )
+
+    def _metadata_for_catalog(
+        self, video: Path
+    ) -> Mapping[str, object] | None:
+        metadata = self._file_ops.load_metadata(video)
+        if metadata is None:
+            return None
+        return recording_metadata_to_dict(metadata)
+
+    def _refresh_catalog(self, video: Path) -> None:
+        if self._catalog is not None:
+            self._catalog.refresh(
+                "recorded", video, self._metadata_for_catalog
+            )
+
     def _load_asset(self, video: Path) -> VideoAsset:
         """内部用：アセットを読み込む。
 
@@ -195,6 +284,8 @@ class RecordedAssetRepository:
             video.unlink(missing_ok=True)
 
         self._file_ops.delete_related_files(video)
+        if self._catalog is not None:
+            self._catalog.remove("recorded", video)
 
         self._event_publisher.publish_recorded_deleted(video)
 
@@ -228,6 +319,7 @@ class RecordedAssetRepository:
         """
         success = self._file_ops.save_subtitle(video, content)
         if success:
+            self._refresh_catalog(video)
             self._event_publisher.publish_recorded_subtitle_updated(video)
         return success
 
@@ -241,4 +333,5 @@ class RecordedAssetRepository:
             metadata: 更新するメタデータ
         """
         self._file_ops.save_metadata(video, metadata)
+        self._refresh_catalog(video)
         self._event_publisher.publish_recorded_metadata_updated(video)
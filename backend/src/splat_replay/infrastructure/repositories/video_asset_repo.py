@@ -12,12 +12,18 @@ from pathlib import Path
 from structlog.stdlib import BoundLogger
 
 from splat_replay.application.interfaces import (
+    AssetListQuery,
+    AssetPage,
     DomainEventPublisher,
     VideoAssetRepositoryPort,
 )
 from splat_replay.application.interfaces.data import FileStats
 from splat_replay.domain.config import VideoStorageSettings
 from splat_replay.domain.models import Frame, RecordingMetadata, VideoAsset
+from splat_replay.infrastructure.repositories.asset_catalog import (
+    CATALOG_FILENAME,
+    AssetCatalog,
+)
 from splat_replay.infrastructure.repositories.asset_file_operations import (
     AssetEventPublisher,
     AssetFileOperations,
@@ -49,13 +55,15 @@ class FileVideoAssetRepository(VideoAssetRepositoryPort):
         # 共通機能の初期化
         file_ops = AssetFileOperations(logger)
         event_publisher = AssetEventPublisher(publisher)
+        # 一覧を毎回フォルダから読み直さないための索引
+        catalog = AssetCatalog(settings.base_dir / CATALOG_FILENAME, logger)
 
         # 録画・編集済みリポジトリの初期化
         self._recorded_repo = RecordedAssetRepository(
-            settings, logger, file_ops, event_publisher
+            settings, logger, file_ops, event_publisher, catalog
         )
         self._edited_repo = EditedAssetRepository(
-            settings, logger, file_ops, event_publisher
+            settings, logger, file_ops, event_publisher, catalog
         )
 
     def get_recorded_dir(self) -> Path:
@@ -108,6 +116,10 @@ class FileVideoAssetRepository(VideoAssetRepositoryPort):
         """録画アセットの一覧を取得する（RecordedAssetRepositoryに委譲）。"""
         return self._recorded_repo.list_recordings()
 
+    def query_recordings(self, query: AssetListQuery) -> AssetPage[VideoAsset]:
+        """録画アセットを 1 ページ分取得する（RecordedAssetRepositoryに委譲）。"""
+        return self._recorded_repo.query_recordings(query)
+
     def delete_recording(self, video: Path) -> bool:
         """録画ファイルを削除する（RecordedAssetRepositoryに委譲）。"""
         return self._recorded_repo.delete_recording(video)
@@ -128,6 +140,10 @@ class FileVideoAssetRepository(VideoAssetRepositoryPort):
         """編集済みファイルの一覧を取得する（EditedAssetRepositoryに委譲）。"""
         return self._edited_repo.list_edited()
 
+    def query_edited(self, query: AssetListQuery) -> AssetPage[Path]:
+        """編集済みファイルを 1 ページ分取得する（EditedAssetRepositoryに委譲）。"""
+        return self._edited_repo.query_edited(query)
+
     def delete_edited(self, video: Path) -> bool:
         """編集済みファイルを削除する（EditedAssetRepositoryに委譲）。"""
         return self._edited_repo.delete_edited(video)
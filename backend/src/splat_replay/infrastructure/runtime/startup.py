@@ -0,0 +1,206 @@
+"""段階的な起動処理。
+
+責務：
+- 起動処理の段階ごとの所要時間を計測し、内訳をログへ出す
+- 構築に時間のかかるアダプターを初回利用まで遅延させる
+- 遅延させたアダプターを Web UI の起動後にバックグラウンドで準備する
+
+Web サーバーと UI を先に立ち上げ、テンプレート画像の読み込みのような
+重い初期化はその後ろで進める。準備の進み具合は進捗イベントで通知する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Generic,
+    Iterator,
+    Protocol,
+    Sequence,
+    TypeVar,
+)
+
+from splat_replay.application.interfaces import LoggerPort
+
+if TYPE_CHECKING:
+    from splat_replay.application.services.common.progress import (
+        ProgressReporter,
+    )
+
+T = TypeVar("T")
+
+WARM_UP_TASK_ID = "startup_warm_up"
+WARM_UP_TASK_NAME = "起動準備"
+
+
+@dataclass(frozen=True)
+class StartupStage:
+    """計測した起動段階。
+
+    Attributes:
+        name: 段階名
+        seconds: 所要時間 (秒)
+    """
+
+    name: str
+    seconds: float
+
+
+class StartupProfile:
+    """起動処理の段階ごとの所要時間を記録する。"""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._stages: list[StartupStage] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """with ブロックの所要時間を name の段階として記録する。"""
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, self._clock() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        """計測済みの所要時間を記録する。"""
+        with self._lock:
+            self._stages.append(StartupStage(name=name, seconds=seconds))
+
+    @property
+    def stages(self) -> tuple[StartupStage, ...]:
+        with self._lock:
+            return tuple(self._stages)
+
+    def elapsed(self) -> float:
+        """計測開始からの経過時間 (秒)。"""
+        return self._clock() - self._origin
+
+    def report(self, logger: LoggerPort, message: str) -> None:
+        """記録済みの内訳をミリ秒単位で 1 行のログに出す。"""
+        breakdown = {
+            stage.name: round(stage.seconds * 1000, 1) for stage in self.stages
+        }
+        logger.info(
+            message,
+            elapsed_ms=round(self.elapsed() * 1000, 1),
+            breakdown_ms=breakdown,
+        )
+
+
+class WarmUpTarget(Protocol):
+    """バックグラウンドで事前に準備できるコンポーネント。"""
+
+    @property
+    def is_ready(self) -> bool: ...
+
+    def warm_up(self) -> None: ...
+
+
+class LazyComponent(Generic[T]):
+    """初回利用時に factory で実体を構築するラッパーの基底。
+
+    構築はスレッドセーフで 1 回だけ行う。warm_up() で先に構築しておけば、
+    初回利用で待たされることはない。
+    """
+
+    def __init__(self, factory: Callable[[], T]) -> None:
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._instance: T | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self._instance is not None
+
+    def warm_up(self) -> None:
+        """実体を構築しておく。構築済みなら何もしない。"""
+        self._get()
+
+    def _get(self) -> T:
+        instance = self._instance
+        if instance is not None:
+            return instance
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._factory()
+            return self._instance
+
+    async def _aget(self) -> T:
+        """イベントループを止めないよう、未構築なら別スレッドで構築する。"""
+        instance = self._instance
+        if instance is not None:
+            return instance
+        return await asyncio.to_thread(self._get)
+
+
+async def warm_up_components(
+    targets: Sequence[tuple[str, WarmUpTarget]],
+    progress: ProgressReporter,
+    profile: StartupProfile,
+    logger: LoggerPort,
+) -> bool:
+    """遅延コンポーネントを順に準備し、進捗イベントで通知する。
+
+    準備に失敗したコンポーネントは初回利用時に改めて構築されるため、
+    ここでは警告を出して次へ進む。
+
+    Args:
+        targets: (表示名, コンポーネント) の並び
+        progress: 進捗の通知先
+        profile: 所要時間の記録先
+        logger: ロガー
+
+    Returns:
+        すべて準備できたら True
+    """
+    pending = [
+        (label, target) for label, target in targets if not target.is_ready
+    ]
+    if not pending:
+        return True
+    progress.start_task(
+        WARM_UP_TASK_ID,
+        WARM_UP_TASK_NAME,
+        len(pending),
+        items=[label for label, _ in pending],
+    )
+    succeeded = True
+    for index, (label, target) in enumerate(pending):
+        progress.item_stage(WARM_UP_TASK_ID, index, "warm_up", label)
+        try:
+            with profile.stage(f"warm_up:{label}"):
+                await asyncio.to_thread(target.warm_up)
+        except Exception as exc:
+            succeeded = False
+            logger.warning(
+                "起動準備に失敗しました", component=label, error=str(exc)
+            )
+            progress.item_finish(
+                WARM_UP_TASK_ID, index, success=False, message=str(exc)
+            )
+        else:
+            progress.item_finish(WARM_UP_TASK_ID, index)
+        progress.advance(WARM_UP_TASK_ID)
+    progress.finish(WARM_UP_TASK_ID, success=succeeded)
+    profile.report(logger, "起動準備が完了しました")
+    return succeeded
+
+
+__all__ = [
+    "WARM_UP_TASK_ID",
+    "WARM_UP_TASK_NAME",
+    "LazyComponent",
+    "StartupProfile",
+    "StartupStage",
+    "WarmUpTarget",
+    "warm_up_components",
+]
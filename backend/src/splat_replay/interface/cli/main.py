@@ -8,15 +8,28 @@ import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
 
 import typer
-from fastapi import FastAPI
-from structlog.stdlib import BoundLogger
 
-from splat_replay.application.use_cases import AutoUseCase, UploadUseCase
 from splat_replay.interface.cli.logging_utils import buffer_console_logs
 
+# --help や単機能のサブコマンドを速く起動できるよう、重い依存は型注釈でだけ
+# 参照し、実体は各サブコマンドが必要になった時点で読み込む
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from structlog.stdlib import BoundLogger
+
+    from splat_replay.application.dto import (
+        ReanalysisReportDTO,
+        RecordingReanalysisDTO,
+    )
+    from splat_replay.application.use_cases import (
+        AutoUseCase,
+        UploadUseCase,
+    )
+
 
 class WebViewApp(Protocol):
     """Minimal interface for a webview application."""
@@ -24,6 +37,18 @@ class WebViewApp(Protocol):
     def run(self) -> None: ...
 
 
+class RecordingReanalyzer(Protocol):
+    """Minimal interface for the recorded video batch re-analysis."""
+
+    def run(
+        self,
+        *,
+        workers: int,
+        force: bool = False,
+        on_result: Callable[[RecordingReanalysisDTO], None] | None = None,
+    ) -> ReanalysisReportDTO: ...
+
+
 @dataclass(frozen=True)
 class CliDependencies:
     auto_use_case: Callable[[], AutoUseCase]
@@ -33,6 +58,7 @@ class CliDependencies:
     webview_app: Callable[[], WebViewApp]
     start_dev_server: Callable[[], None]
     remote_access_enabled: Callable[[], bool]
+    recording_reanalyzer: Callable[[], RecordingReanalyzer]
 
 
 def resolve_web_bind_host(
@@ -109,6 +135,45 @@ def build_app(deps: CliDependencies) -> typer.Typer:
         uc = deps.upload_use_case()
         await uc.execute()
 
+    @app.command()
+    def reanalyze(
+        workers: int = typer.Option(
+            os.cpu_count() or 1,
+            help="並列に解析するプロセス数（0 でこのプロセスのみ）",
+        ),
+        force: bool = typer.Option(False, help="解析済みの録画も解析し直す"),
+    ) -> None:
+        """録画済み動画をまとめて再解析し、メタデータを更新する。"""
+        if workers < 0:
+            typer.echo("--workers には 0 以上を指定してください。")
+            raise typer.Exit(1)
+
+        def show(item: RecordingReanalysisDTO) -> None:
+            name = Path(item.path).name
+            if item.status == "skipped":
+                typer.echo(f"[skip] {name}")
+            elif item.status == "failed":
+                typer.echo(f"[fail] {name}: {item.error}")
+            else:
+                typer.echo(
+                    f"[done] {name}: {item.outcome} "
+                    f"({item.frames_analyzed} フレーム, "
+                    f"{item.elapsed_seconds:.1f} 秒)"
+                )
+
+        report = deps.recording_reanalyzer().run(
+            workers=workers, force=force, on_result=show
+        )
+        typer.echo(
+            f"再解析 {report.count('analyzed')} 件 / "
+            f"スキップ {report.count('skipped')} 件 / "
+            f"失敗 {report.count('failed')} 件 "
+            f"(動画 {report.video_seconds:.0f} 秒分を "
+            f"{report.elapsed_seconds:.1f} 秒, {report.workers} プロセス)"
+        )
+        if report.count("failed"):
+            raise typer.Exit(1)
+
     @app.command()
     def web(
         host: str | None = typer.Option(
@@ -183,4 +248,9 @@ def build_app(deps: CliDependencies) -> typer.Typer:
     return app
 
 
-__all__ = ["CliDependencies", "build_app", "resolve_web_bind_host"]
+__all__ = [
+    "CliDependencies",
+    "RecordingReanalyzer",
+    "build_app",
+    "resolve_web_bind_host",
+]
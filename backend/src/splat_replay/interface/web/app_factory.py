@@ -11,6 +11,8 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from splat_replay.interface.web.routers import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
     create_assets_router,
     create_events_router,
     create_file_serving_router,
@@ -68,11 +70,30 @@ def create_app(server: WebAPIServer, enable_lifespan: bool = True) -> FastAPI:
         auto_process_task = asyncio.create_task(
             server.auto_process_service.start()
         )
+        # 重いアダプターの準備は応答を始めてからバックグラウンドで行う
+        warm_up_task = (
+            asyncio.create_task(server.warm_up_fn())
+            if server.warm_up_fn is not None
+            else None
+        )
+        # image_matching.yaml を編集したら再起動せずにマッチャーへ反映する
+        image_matching_watch_task = (
+            asyncio.create_task(server.image_matching_watch_fn())
+            if server.image_matching_watch_fn is not None
+            else None
+        )
         yield
         # Shutdown
-        auto_process_task.cancel()
-        with contextlib.suppress(Exception):
-            await auto_process_task
+        for task in (
+            auto_process_task,
+            warm_up_task,
+            image_matching_watch_task,
+        ):
+            if task is None:
+                continue
+            task.cancel()
+            with contextlib.suppress(Exception, asyncio.CancelledError):
+                await task
 
     # テスト時は lifespan を無効化
     if enable_lifespan:
@@ -94,6 +115,8 @@ def create_app(server: WebAPIServer, enable_lifespan: bool = True) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # 一覧 API のページ情報を開発サーバーからも読めるようにする
+        expose_headers=[TOTAL_COUNT_HEADER, NEXT_CURSOR_HEADER, "ETag"],
     )
 
     # 静的ファイル配信 (フロントエンド)
@@ -0,0 +1,119 @@
+"""録画プレビュー用の JPEG フレーム。
+
+責務：
+- 最新フレームをプレビュー用の大きさに縮小して JPEG 化する
+- 同じフレームの JPEG 化を 1 回にまとめ、全クライアントで共有する
+- 条件付き GET に使う ETag の発行
+
+JPEG 化の負荷はクライアント数やポーリング間隔ではなく、
+新しいフレームの発行頻度で決まる。
+"""
+
+from __future__ import annotations
+
+import secrets
+import threading
+from dataclasses import dataclass
+
+from splat_replay.application.interfaces import FrameSource
+from splat_replay.domain.models import Frame
+
+# プレビューの最大幅 (これより大きいフレームは縦横比を保って縮小する)
+PREVIEW_MAX_WIDTH = 960
+PREVIEW_JPEG_QUALITY = 80
+
+
+@dataclass(frozen=True)
+class EncodedPreviewFrame:
+    """JPEG 化済みのプレビューフレーム。
+
+    Attributes:
+        sequence: 元フレームの発行番号
+        jpeg: JPEG データ
+        etag: 条件付き GET 用の ETag
+    """
+
+    sequence: int
+    jpeg: bytes
+    etag: str
+
+
+class PreviewFrameEncoder:
+    """最新フレームの JPEG を発行番号ごとに 1 回だけ作って共有する。"""
+
+    def __init__(
+        self,
+        source: FrameSource,
+        *,
+        max_width: int = PREVIEW_MAX_WIDTH,
+        quality: int = PREVIEW_JPEG_QUALITY,
+    ) -> None:
+        self._source = source
+        self._max_width = max_width
+        self._quality = quality
+        self._lock = threading.Lock()
+        self._cached: EncodedPreviewFrame | None = None
+        # 再起動で発行番号が戻っても、以前の ETag と一致させない
+        self._epoch = secrets.token_hex(4)
+
+    def current_etag(self) -> str | None:
+        """最新フレームの ETag。フレームが無ければ None。
+
+        JPEG 化せずに求められるため、変化の無い条件付き GET を
+        エンコードなしで 304 にできる。
+        """
+        sequence, frame = self._source.get_latest_with_sequence()
+        if frame is None:
+            return None
+        return self._etag(sequence)
+
+    def latest(self) -> EncodedPreviewFrame | None:
+        """最新フレームの JPEG を返す。フレームが無ければ None。
+
+        Raises:
+            RuntimeError: JPEG 化に失敗した場合
+        """
+        sequence, frame = self._source.get_latest_with_sequence()
+        if frame is None:
+            return None
+        # 同時に来た要求は先に JPEG 化したものを待って使い回す
+        with self._lock:
+            cached = self._cached
+            if cached is not None and cached.sequence == sequence:
+                return cached
+            encoded = EncodedPreviewFrame(
+                sequence=sequence,
+                jpeg=self._encode(frame),
+                etag=self._etag(sequence),
+            )
+            self._cached = encoded
+            return encoded
+
+    def _etag(self, sequence: int) -> str:
+        return f'"{self._epoch}-{sequence}"'
+
+    def _encode(self, frame: Frame) -> bytes:
+        # OpenCV はルーター読み込み時ではなく最初のプレビュー要求で読み込む
+        import cv2
+
+        height, width = frame.shape[:2]
+        if width > self._max_width:
+            frame = cv2.resize(
+                frame,
+                (self._max_width, max(1, height * self._max_width // width)),
+                interpolation=cv2.INTER_AREA,
+            )
+        success, encoded = cv2.imencode(
+            ".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), self._quality]
+        )
+        if not success:
+            raise RuntimeError("プレビューフレームの JPEG 化に失敗しました")
+        return encoded.tobytes()
+
+
+__all__ = [
+    "PREVIEW_JPEG_QUALITY",
+    "PREVIEW_MAX_WIDTH",
+    "EncodedPreviewFrame",
+    "PreviewFrameEncoder",
+]
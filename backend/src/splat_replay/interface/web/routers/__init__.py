@@ -1,6 +1,11 @@
 """Web APIルーター群。"""
 
-from .assets import create_assets_router, create_file_serving_router
+from .assets import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
+    create_assets_router,
+    create_file_serving_router,
+)
 from .events import create_events_router
 from .history import create_history_router
 from .metadata import create_metadata_router
@@ -12,6 +17,8 @@ from .settings import create_settings_router
 from .setup import create_setup_router
 
 __all__ = [
+    "NEXT_CURSOR_HEADER",
+    "TOTAL_COUNT_HEADER",
     "create_assets_router",
     "create_file_serving_router",
     "create_events_router",
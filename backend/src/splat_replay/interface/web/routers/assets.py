@@ -9,12 +9,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+import datetime
+from collections.abc import Callable
+from typing import TYPE_CHECKING, List, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from fastapi.responses import FileResponse, JSONResponse
 
 from splat_replay.application.dto.assets import EditUploadStatusDTO
+from splat_replay.application.interfaces import AssetListQuery, AssetSortKey
 from splat_replay.interface.web.converters import to_recorded_video_item
 from splat_replay.interface.web.schemas import (
     EditedVideoItem,
@@ -27,6 +30,66 @@ from splat_replay.interface.web.schemas import (
 if TYPE_CHECKING:
     from splat_replay.interface.web.server import WebAPIServer
 
+# 一覧のページ情報を返すレスポンスヘッダー (本文は従来どおり配列)
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+MAX_PAGE_SIZE = 500
+
+
+def _asset_list_query(
+    default_sort: AssetSortKey,
+) -> Callable[..., AssetListQuery]:
+    """一覧 API のクエリパラメータを AssetListQuery にまとめる依存関数。"""
+
+    def dependency(
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="1 ページの件数 (省略時は全件)",
+        ),
+        cursor: Optional[str] = Query(
+            None, description=f"前のページの {NEXT_CURSOR_HEADER} の値"
+        ),
+        game_mode: Optional[str] = Query(None, description="ゲームモード"),
+        match: Optional[str] = Query(None, description="マッチ種別"),
+        rule: Optional[str] = Query(None, description="ルール"),
+        stage: Optional[str] = Query(None, description="ステージ"),
+        judgement: Optional[str] = Query(None, description="勝敗"),
+        since: Optional[datetime.date] = Query(
+            None, description="この日以降 (YYYY-MM-DD)"
+        ),
+        until: Optional[datetime.date] = Query(
+            None, description="この日以前 (YYYY-MM-DD)"
+        ),
+        sort: AssetSortKey = Query(default_sort, description="並び替えの基準"),
+        order: Literal["asc", "desc"] = Query("desc", description="並び順"),
+    ) -> AssetListQuery:
+        return AssetListQuery(
+            game_mode=game_mode,
+            match=match,
+            rule=rule,
+            stage=stage,
+            judgement=judgement,
+            since=since,
+            until=until,
+            sort=sort,
+            descending=order == "desc",
+            limit=limit,
+            cursor=cursor,
+        )
+
+    return dependency
+
+
+def _set_page_headers(
+    response: Response, total: int, next_cursor: str | None
+) -> None:
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
 
 def create_assets_router(server: WebAPIServer) -> APIRouter:
     """アセット管理ルーターを作成。
@@ -56,16 +119,28 @@ def create_assets_router(server: WebAPIServer) -> APIRouter:
         "/assets/recorded",
         response_model=List[RecordedVideoItem],
     )
-    async def get_recorded_assets() -> List[RecordedVideoItem]:
-        """録画済みビデオ一覧を取得。"""
+    async def get_recorded_assets(
+        response: Response,
+        query: AssetListQuery = Depends(_asset_list_query("started_at")),
+    ) -> List[RecordedVideoItem]:
+        """録画済みビデオ一覧を取得。
+
+        絞り込み・並び替え・ページ指定はクエリパラメータで行い、
+        全件数と次のページのカーソルはレスポンスヘッダーで返す。
+        """
         try:
-            dtos = await server.list_recorded_videos_uc.execute()
-            return [to_recorded_video_item(dto) for dto in dtos]
+            page = await server.list_recorded_videos_uc.execute_page(query)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
         except Exception as e:
             server.logger.error(
                 "録画一覧取得エラー", error=str(e), exc_info=True
             )
             raise
+        _set_page_headers(response, page.total, page.next_cursor)
+        return [to_recorded_video_item(dto) for dto in page.items]
 
     @router.delete("/assets/recorded/{video_id:path}")
     async def delete_recorded_asset(video_id: str) -> JSONResponse:
@@ -87,9 +162,22 @@ def create_assets_router(server: WebAPIServer) -> APIRouter:
         "/assets/edited",
         response_model=List[EditedVideoItem],
     )
-    async def get_edited_assets() -> List[EditedVideoItem]:
-        """編集済みビデオ一覧を取得。"""
-        dtos = await server.list_edited_videos_uc.execute()
+    async def get_edited_assets(
+        response: Response,
+        query: AssetListQuery = Depends(_asset_list_query("updated_at")),
+    ) -> List[EditedVideoItem]:
+        """編集済みビデオ一覧を取得。
+
+        絞り込み・並び替え・ページ指定はクエリパラメータで行い、
+        全件数と次のページのカーソルはレスポンスヘッダーで返す。
+        """
+        try:
+            page = await server.list_edited_videos_uc.execute_page(query)
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        _set_page_headers(response, page.total, page.next_cursor)
         # Application DTO → Interface DTO に変換
         return [
             EditedVideoItem(
@@ -105,7 +193,7 @@ def create_assets_router(server: WebAPIServer) -> APIRouter:
                 title=dto.title,
                 description=dto.description,
             )
-            for dto in dtos
+            for dto in page.items
         ]
 
     @router.delete("/assets/edited/{video_id:path}")
@@ -389,4 +477,9 @@ def create_file_serving_router(server: WebAPIServer) -> APIRouter:
     return router
 
 
-__all__ = ["create_assets_router", "create_file_serving_router"]
+__all__ = [
+    "NEXT_CURSOR_HEADER",
+    "TOTAL_COUNT_HEADER",
+    "create_assets_router",
+    "create_file_serving_router",
+]
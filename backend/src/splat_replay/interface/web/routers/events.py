@@ -3,11 +3,12 @@
 責務：
 - ドメインイベントの配信
 - 進捗イベントの配信
+
+イベントは届いた時点で送る (待機中はポーリングせず眠っている)。
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Protocol, cast
 
@@ -43,15 +44,12 @@ def create_events_router(server: WebAPIServer) -> APIRouter:
         async def event_generator() -> AsyncGenerator[Dict[str, str], None]:
             cursor = 0
             while True:
-                events, cursor = server.progress_store.read_since(cursor)
-                if events:
-                    for payload in events:
-                        yield {
-                            "event": "progress_event",
-                            "data": json.dumps(payload),
-                        }
-                else:
-                    await asyncio.sleep(0.1)
+                events, cursor = await server.progress_store.wait_since(cursor)
+                for payload in events:
+                    yield {
+                        "event": "progress_event",
+                        "data": json.dumps(payload),
+                    }
 
         return EventSourceResponse(event_generator())
 
@@ -63,7 +61,10 @@ def create_events_router(server: WebAPIServer) -> APIRouter:
             sub = server.event_bus.subscribe(event_types=None)
             try:
                 while True:
-                    events = sub.poll(max_items=10)
+                    events = await sub.wait(max_items=10)
+                    if events is None:
+                        # 購読が閉じられたら配信を終える
+                        break
                     for ev in events:
                         event = cast(EventLike, ev)
                         if not event.type.startswith("domain."):
@@ -74,8 +75,6 @@ def create_events_router(server: WebAPIServer) -> APIRouter:
                                 {"type": event.type, "payload": event.payload}
                             ),
                         }
-                    if not events:
-                        await asyncio.sleep(0.1)
             finally:
                 sub.close()
 
@@ -5,20 +5,22 @@
 - 録画開始・一時停止・再開・停止
 - 録画状態の取得
 - リアルタイムメタデータの取得・保存
+- 録画プレビュー (JPEG 1 枚・MJPEG ストリーム) の配信
 """
 
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Literal
 
-import cv2
-from fastapi import APIRouter
-from fastapi.responses import Response
+from fastapi import APIRouter, Request
+from fastapi.responses import Response, StreamingResponse
 from starlette import status
 from pydantic import BaseModel
 from splat_replay.application.metadata import recording_metadata_to_dict
-from splat_replay.domain.models import RecordingMetadata
+from splat_replay.domain.models import Frame, RecordingMetadata
+from splat_replay.interface.web.preview_frame import PreviewFrameEncoder
 from splat_replay.interface.web.schemas import (
     RecordingMetadataResponse,
     RecordingMetadataUpdateRequest,
@@ -27,6 +29,20 @@ from splat_replay.interface.web.schemas import (
 if TYPE_CHECKING:
     from splat_replay.interface.web.server import WebAPIServer
 
+# MJPEG ストリームの区切り文字列
+MJPEG_BOUNDARY = "preview-frame"
+
+# MJPEG ストリームで送るフレームの上限 (毎秒)
+PREVIEW_STREAM_MAX_FPS = 15
+
+# 新しいフレームが来ない間に切断を確認する間隔 (秒)
+_PREVIEW_STREAM_IDLE_SECONDS = 1.0
+
+_PREVIEW_NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, max-age=0",
+    "Pragma": "no-cache",
+}
+
 
 # ========================================
 # Response Schemas
@@ -84,6 +100,8 @@ def create_recording_router(server: WebAPIServer) -> APIRouter:
     """
     router = APIRouter(prefix="/api/recorder", tags=["recording"])
     error_handler = server.web_error_handler
+    # 全クライアントで JPEG を共有する
+    preview = PreviewFrameEncoder(server.frame_source)
 
     @router.post("/prepare", response_model=StandardResponse)
     async def prepare_recording() -> StandardResponse:
@@ -197,31 +215,90 @@ def create_recording_router(server: WebAPIServer) -> APIRouter:
         return RecorderStateResponse(state=state)
 
     @router.get("/preview-frame")
-    async def get_preview_frame() -> Response:
-        """最新フレームの JPEG プレビューを取得。"""
-        frame = server.frame_source.get_latest()
-        if frame is None:
+    async def get_preview_frame(request: Request) -> Response:
+        """最新フレームの JPEG プレビューを取得。
+
+        ``If-None-Match`` が最新フレームの ETag と一致すれば 304 を返す。
+        """
+        etag = preview.current_etag()
+        if etag is None:
             return Response(status_code=status.HTTP_204_NO_CONTENT)
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, **_PREVIEW_NO_CACHE_HEADERS},
+            )
 
-        success, encoded = cv2.imencode(
-            ".jpg",
-            frame,
-            [int(cv2.IMWRITE_JPEG_QUALITY), 80],
-        )
-        if not success:
+        try:
+            encoded = await asyncio.to_thread(preview.latest)
+        except RuntimeError:
             server.logger.warning("プレビューフレームの JPEG 化に失敗しました")
             return Response(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if encoded is None:
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
 
         return Response(
-            content=encoded.tobytes(),
+            content=encoded.jpeg,
             media_type="image/jpeg",
-            headers={
-                "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-                "Pragma": "no-cache",
-                "Expires": "0",
-            },
+            headers={"ETag": encoded.etag, **_PREVIEW_NO_CACHE_HEADERS},
+        )
+
+    @router.get("/preview-stream")
+    async def stream_preview_frames(request: Request) -> StreamingResponse:
+        """最新フレームを MJPEG (multipart/x-mixed-replace) で配信する。
+
+        新しいフレームが発行されたときだけ送るため、ポーリングと違い
+        変化の無いフレームを取得し直すことがない。
+        """
+        return StreamingResponse(
+            _preview_stream(request),
+            media_type=(
+                f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}"
+            ),
+            headers=_PREVIEW_NO_CACHE_HEADERS,
         )
 
+    async def _preview_stream(request: Request) -> AsyncIterator[bytes]:
+        loop = asyncio.get_running_loop()
+        arrived = asyncio.Event()
+
+        def on_frame(_frame: Frame) -> None:
+            # フレームは録画側のスレッドから届く
+            loop.call_soon_threadsafe(arrived.set)
+
+        server.frame_source.add_listener(on_frame)
+        try:
+            last_sequence: int | None = None
+            while not await request.is_disconnected():
+                arrived.clear()
+                try:
+                    encoded = await asyncio.to_thread(preview.latest)
+                except RuntimeError:
+                    server.logger.warning(
+                        "プレビューフレームの JPEG 化に失敗しました"
+                    )
+                    encoded = None
+                if encoded is not None and encoded.sequence != last_sequence:
+                    last_sequence = encoded.sequence
+                    yield (
+                        (
+                            f"--{MJPEG_BOUNDARY}\r\n"
+                            "Content-Type: image/jpeg\r\n"
+                            f"Content-Length: {len(encoded.jpeg)}\r\n\r\n"
+                        ).encode("ascii")
+                        + encoded.jpeg
+                        + b"\r\n"
+                    )
+                    await asyncio.sleep(1 / PREVIEW_STREAM_MAX_FPS)
+                try:
+                    await asyncio.wait_for(
+                        arrived.wait(), _PREVIEW_STREAM_IDLE_SECONDS
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            server.frame_source.remove_listener(on_frame)
+
     @router.get("/preview-mode", response_model=RecorderPreviewModeResponse)
     async def get_preview_mode() -> RecorderPreviewModeResponse:
         """プレビュー入力種別を取得。"""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional
 
@@ -101,6 +101,12 @@ class WebAPIServer:
         Callable[..., AsyncGenerator[Dict[str, Any], None]]
     ]
 
+    # Startup warm-up
+    warm_up_fn: Optional[Callable[[], Awaitable[None]]]
+
+    # Config watch
+    image_matching_watch_fn: Optional[Callable[[], Awaitable[None]]]
+
     def __init__(
         self,
         settings_service: SettingsService,
@@ -142,6 +148,12 @@ class WebAPIServer:
         speech_test_fn: Optional[
             Callable[..., AsyncGenerator[Dict[str, Any], None]]
         ] = None,
+        # Startup warm-up
+        warm_up_fn: Optional[Callable[[], Awaitable[None]]] = None,
+        # Config watch
+        image_matching_watch_fn: Optional[
+            Callable[[], Awaitable[None]]
+        ] = None,
     ) -> None:
         """初期化。
 
@@ -176,6 +188,9 @@ class WebAPIServer:
             get_recorded_subtitle_structured_uc: 構造化字幕取得ユースケース
             update_recorded_subtitle_structured_uc: 構造化字幕更新ユースケース
             list_battle_history_uc: 対戦履歴一覧取得ユースケース
+            speech_test_fn: 文字起こしテストのストリーム関数
+            warm_up_fn: 起動後にバックグラウンドで実行する事前準備
+            image_matching_watch_fn: 画像マッチング設定の変更を監視し続ける処理
         """
         self.settings_service = settings_service
         self.setup_service = setup_service
@@ -222,5 +237,11 @@ class WebAPIServer:
         # Speech test
         self.speech_test_fn = speech_test_fn
 
+        # Startup warm-up
+        self.warm_up_fn = warm_up_fn
+
+        # Config watch
+        self.image_matching_watch_fn = image_matching_watch_fn
+
 
 __all__ = ["WebAPIServer"]
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping
+from datetime import date, datetime
+from pathlib import Path
+from typing import cast
+
+import pytest
+from structlog.stdlib import BoundLogger
+
+from splat_replay.application.interfaces import AssetListQuery
+from splat_replay.domain.config import VideoStorageSettings
+from splat_replay.domain.models import (
+    BattleResult,
+    GameMode,
+    Judgement,
+    Match,
+    RecordingMetadata,
+    Rule,
+    Stage,
+)
+from splat_replay.infrastructure.repositories.asset_catalog import (
+    AssetCatalog,
+)
+from splat_replay.infrastructure.repositories.asset_file_operations import (
+    AssetEventPublisher,
+    AssetFileOperations,
+)
+from splat_replay.infrastructure.repositories.recorded_asset_repo import (
+    RecordedAssetRepository,
+)
+
+
+class _DummyLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def info(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def warning(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def error(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+
+class _NullPublisher:
+    def publish_domain_event(self, event: object) -> None:
+        _ = event
+
+
+class _CountingLoader:
+    """サイドカーの読み込み回数を数える。"""
+
+    def __init__(self) -> None:
+        self.loaded: list[str] = []
+
+    def __call__(self, video: Path) -> Mapping[str, object] | None:
+        self.loaded.append(video.name)
+        sidecar = video.with_suffix(".json")
+        if not sidecar.exists():
+            return None
+        return json.loads(sidecar.read_text(encoding="utf-8"))
+
+
+def _logger() -> BoundLogger:
+    return cast(BoundLogger, _DummyLogger())
+
+
+def _write(
+    directory: Path, stem: str, metadata: dict[str, str] | None
+) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    video = directory / f"{stem}.mkv"
+    video.write_bytes(b"video")
+    if metadata is not None:
+        video.with_suffix(".json").write_text(
+            json.dumps(metadata), encoding="utf-8"
+        )
+    return video
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_sync_only_reloads_changed_sidecars(tmp_path: Path) -> None:
+    catalog = AssetCatalog(tmp_path / "catalog.sqlite3", _logger())
+    directory = tmp_path / "recorded"
+    first = _write(directory, "first", {"started_at": "2026-01-01T10:00"})
+    _write(directory, "second", {"started_at": "2026-01-02T10:00"})
+    loader = _CountingLoader()
+
+    catalog.sync("recorded", directory, loader)
+    catalog.sync("recorded", directory, loader)
+    assert sorted(loader.loaded) == ["first.mkv", "second.mkv"]
+
+    first.with_suffix(".json").write_text(
+        json.dumps({"started_at": "2026-01-03T10:00"}), encoding="utf-8"
+    )
+    _touch_later(first.with_suffix(".json"))
+    first.with_suffix(".srt").write_text("subtitle", encoding="utf-8")
+    (directory / "second.mkv").unlink()
+    catalog.sync("recorded", directory, loader)
+
+    assert loader.loaded[2:] == ["first.mkv"]
+    entries = catalog.entries("recorded")
+    assert [entry.name for entry in entries] == ["first.mkv"]
+    assert entries[0].has_subtitle
+    assert entries[0].metadata == {"started_at": "2026-01-03T10:00"}
+
+
+def test_entries_are_filtered_counted_and_newest_first(
+    tmp_path: Path,
+) -> None:
+    catalog = AssetCatalog(tmp_path / "catalog.sqlite3", _logger())
+    directory = tmp_path / "recorded"
+    for stem, started_at, rule in (
+        ("a", "2026-01-01T10:00", "ナワバリバトル"),
+        ("b", "2026-01-03T10:00", "ガチエリア"),
+        ("c", "2026-01-02T10:00", "ガチエリア"),
+    ):
+        _write(directory, stem, {"started_at": started_at, "rule": rule})
+    _write(tmp_path / "edited", "edited", {"title": "title"})
+    loader = _CountingLoader()
+    catalog.sync("recorded", directory, loader)
+    catalog.sync("edited", tmp_path / "edited", loader)
+
+    assert [entry.name for entry in catalog.entries("recorded")] == [
+        "b.mkv",
+        "c.mkv",
+        "a.mkv",
+    ]
+    area = AssetListQuery(rule="ガチエリア")
+    assert [entry.name for entry in catalog.query("recorded", area).items] == [
+        "b.mkv",
+        "c.mkv",
+    ]
+    assert catalog.count("recorded", area) == 2
+    assert catalog.count("edited") == 1
+
+
+def test_repository_keeps_catalog_in_step_with_saves(tmp_path: Path) -> None:
+    logger = _logger()
+    settings = VideoStorageSettings(base_dir=tmp_path / "videos")
+    catalog = AssetCatalog(tmp_path / "catalog.sqlite3", logger)
+    repository = RecordedAssetRepository(
+        settings,
+        logger,
+        AssetFileOperations(logger),
+        AssetEventPublisher(_NullPublisher()),
+        catalog,
+    )
+    capture = tmp_path / "capture.mkv"
+    capture.write_bytes(b"video")
+    metadata = RecordingMetadata(
+        game_mode=GameMode.BATTLE,
+        started_at=datetime(2026, 3, 8, 14, 19, 56),
+        result=BattleResult(
+            match=Match.REGULAR,
+            rule=Rule.TURF_WAR,
+            stage=Stage.SCORCH_GORGE,
+            kill=5,
+            death=3,
+            special=2,
+        ),
+        judgement=Judgement.WIN,
+    )
+
+    saved = repository.save_recording(capture, None, None, metadata)
+
+    assert catalog.count("recorded", AssetListQuery(judgement="WIN")) == 1
+    listed = repository.list_recordings()
+    assert [asset.video for asset in listed] == [saved.video]
+    assert listed[0].metadata == metadata
+    assert listed[0].subtitle is None
+
+    repository.save_subtitle(saved.video, "subtitle")
+    assert catalog.entries("recorded")[0].has_subtitle
+
+    repository.delete_recording(saved.video)
+    assert catalog.count("recorded") == 0
+
+
+def test_repository_falls_back_to_directory_when_catalog_is_broken(
+    tmp_path: Path,
+) -> None:
+    logger = _logger()
+    settings = VideoStorageSettings(base_dir=tmp_path / "videos")
+    broken = tmp_path / "catalog.sqlite3"
+    broken.write_bytes(b"not a database" * 100)
+    repository = RecordedAssetRepository(
+        settings,
+        logger,
+        AssetFileOperations(logger),
+        AssetEventPublisher(_NullPublisher()),
+        AssetCatalog(broken, logger),
+    )
+    _write(settings.recorded_dir, "video", None)
+
+    assert [asset.video.name for asset in repository.list_recordings()] == [
+        "video.mkv"
+    ]
+
+
+def _sync_days(tmp_path: Path) -> AssetCatalog:
+    catalog = AssetCatalog(tmp_path / "catalog.sqlite3", _logger())
+    directory = tmp_path / "recorded"
+    for day in range(1, 8):
+        _write(
+            directory,
+            f"day{day}",
+            {"started_at": f"2026-01-0{day}T10:00", "rule": "ガチエリア"},
+        )
+    catalog.sync("recorded", directory, _CountingLoader())
+    return catalog
+
+
+def test_query_pages_through_all_entries_with_cursor(tmp_path: Path) -> None:
+    catalog = _sync_days(tmp_path)
+    query = AssetListQuery(limit=3)
+    names: list[str] = []
+    pages = 0
+    while True:
+        page = catalog.query("recorded", query)
+        pages += 1
+        assert page.total == 7
+        names.extend(entry.name for entry in page.items)
+        if page.next_cursor is None:
+            break
+        query = AssetListQuery(limit=3, cursor=page.next_cursor)
+
+    assert pages == 3
+    assert names == [f"day{day}.mkv" for day in range(7, 0, -1)]
+
+
+def test_query_sorts_ascending_and_filters_by_date(tmp_path: Path) -> None:
+    catalog = _sync_days(tmp_path)
+    query = AssetListQuery(
+        since=date(2026, 1, 2),
+        until=date(2026, 1, 4),
+        sort="filename",
+        descending=False,
+    )
+
+    page = catalog.query("recorded", query)
+
+    assert [entry.name for entry in page.items] == [
+        "day2.mkv",
+        "day3.mkv",
+        "day4.mkv",
+    ]
+    assert page.total == 3
+    assert page.next_cursor is None
+
+
+def test_query_rejects_cursor_from_another_order(tmp_path: Path) -> None:
+    catalog = _sync_days(tmp_path)
+    page = catalog.query("recorded", AssetListQuery(limit=2))
+    assert page.next_cursor is not None
+
+    with pytest.raises(ValueError):
+        catalog.query(
+            "recorded",
+            AssetListQuery(limit=2, cursor=page.next_cursor, sort="size"),
+        )
+    with pytest.raises(ValueError):
+        catalog.query("recorded", AssetListQuery(cursor="not-a-cursor"))
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from splat_replay.application.interfaces import (
+    ConfigPort,
+    EventPublisher,
+    FileSystemPort,
+    ImageSelector,
+    LoggerPort,
+    PathsPort,
+    SubtitleEditorPort,
+    TextToSpeechPort,
+    VideoAssetRepositoryPort,
+    VideoEditorPort,
+    VideoEditPlan,
+)
+from splat_replay.application.services.common.progress import ProgressReporter
+from splat_replay.application.services.editing.auto_editor import AutoEditor
+from splat_replay.domain.config.video_edit import VideoEditSettings
+from splat_replay.domain.models import VideoAsset
+
+
+class _DummyLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def info(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def warning(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def error(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def exception(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+
+class _DummyPublisher:
+    def publish(self, event_type: str, payload: object = None) -> None:
+        _ = event_type, payload
+
+
+class _DummyConfig:
+    def __init__(self, settings: VideoEditSettings) -> None:
+        self._settings = settings
+
+    def get_video_edit_settings(self) -> VideoEditSettings:
+        return self._settings
+
+
+class _Timeline:
+    """呼び出しの順序と同時実行数を記録する。"""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.inflight_merges = 0
+        self.max_inflight_merges = 0
+
+
+class _FakeVideoEditor:
+    def __init__(self, timeline: _Timeline, delays: dict[str, float]) -> None:
+        self._timeline = timeline
+        self._delays = delays
+        self.plans: list[VideoEditPlan] = []
+
+    async def get_video_length(self, path: Path) -> float | None:
+        return 60.0
+
+    async def render(self, plan: VideoEditPlan) -> Path:
+        self._timeline.inflight_merges += 1
+        self._timeline.max_inflight_merges = max(
+            self._timeline.max_inflight_merges, self._timeline.inflight_merges
+        )
+        try:
+            await asyncio.sleep(self._delays.get(plan.output.stem, 0.0))
+            if plan.output.stem == "broken":
+                raise RuntimeError("render failed")
+            self._timeline.calls.append(f"render:{plan.output.stem}")
+            self.plans.append(plan)
+            return plan.output
+        finally:
+            self._timeline.inflight_merges -= 1
+
+
+class _FakeRepo:
+    def __init__(self) -> None:
+        self.deleted: list[Path] = []
+
+    def list_recordings(self) -> list[VideoAsset]:
+        return []
+
+    def save_edited(self, path: Path) -> Path:
+        return path
+
+    def delete_recording(self, path: Path) -> None:
+        self.deleted.append(path)
+
+    def save_edited_metadata_dict(self, path: Path, metadata: object) -> None:
+        return None
+
+    def save_edited_thumbnail(self, path: Path, data: bytes) -> None:
+        return None
+
+
+class _FakeSubtitleProcessor:
+    def __init__(self, timeline: _Timeline) -> None:
+        self._timeline = timeline
+        self.discarded: list[Path] = []
+
+    async def prepare(self, target: Path, group: list[VideoAsset]) -> Path:
+        self._timeline.calls.append(f"prepare:{target.stem}")
+        return target.with_name(f"{target.stem}_narration.wav")
+
+    async def discard_narration(self, narration: Path) -> None:
+        self._timeline.calls.append(f"discard:{narration.stem}")
+        self.discarded.append(narration)
+
+
+class _FakeTitleGenerator:
+    async def generate(
+        self, group: list[VideoAsset], day: dt.date, time_slot: dt.time
+    ) -> tuple[str, str]:
+        return "title", "description"
+
+
+class _FakeThumbnailGenerator:
+    def create(self, group: list[VideoAsset]) -> Path | None:
+        return None
+
+
+def _group(tmp_path: Path, name: str) -> list[VideoAsset]:
+    return [
+        VideoAsset(video=tmp_path / f"{name}_{index}.mkv")
+        for index in range(2)
+    ]
+
+
+def _build(
+    tmp_path: Path,
+    names: list[str],
+    *,
+    max_parallel_groups: int = 2,
+    volume_multiplier: float = 1.0,
+    delays: dict[str, float] | None = None,
+) -> tuple[AutoEditor, _Timeline, _FakeSubtitleProcessor, _FakeRepo]:
+    timeline = _Timeline()
+    groups = {
+        (dt.date(2026, 1, 1), dt.time(hour), name, "rule"): _group(
+            tmp_path, name
+        )
+        for hour, name in enumerate(names)
+    }
+    repo = _FakeRepo()
+    logger = cast(LoggerPort, _DummyLogger())
+    editor = AutoEditor(
+        logger=logger,
+        config=cast(
+            ConfigPort,
+            _DummyConfig(
+                VideoEditSettings(
+                    max_parallel_groups=max_parallel_groups,
+                    volume_multiplier=volume_multiplier,
+                )
+            ),
+        ),
+        paths=cast(PathsPort, object()),
+        video_editor=cast(
+            VideoEditorPort, _FakeVideoEditor(timeline, delays or {})
+        ),
+        subtitle_editor=cast(SubtitleEditorPort, object()),
+        image_selector=cast(ImageSelector, object()),
+        text_to_speech=cast(TextToSpeechPort, object()),
+        repo=cast(VideoAssetRepositoryPort, repo),
+        file_system=cast(FileSystemPort, object()),
+        progress=ProgressReporter(
+            cast(EventPublisher, _DummyPublisher()), logger
+        ),
+    )
+    subtitles = _FakeSubtitleProcessor(timeline)
+    editor.grouping.group_by_timeslot = lambda assets: groups  # type: ignore[method-assign]
+    editor.subtitle_processor = subtitles  # type: ignore[assignment]
+    editor.title_generator = _FakeTitleGenerator()  # type: ignore[assignment]
+    editor.thumbnail_generator = _FakeThumbnailGenerator()  # type: ignore[assignment]
+    editor._make_filename = (  # type: ignore[method-assign]
+        lambda group, day, time_slot, match_name, rule_name: (
+            tmp_path / f"{match_name}.mkv"
+        )
+    )
+    return editor, timeline, subtitles, repo
+
+
+@pytest.mark.asyncio
+async def test_execute_edits_groups_concurrently_in_group_order(
+    tmp_path: Path,
+) -> None:
+    editor, timeline, _, _ = _build(
+        tmp_path, ["first", "second"], delays={"first": 0.05}
+    )
+
+    edited = await editor.execute()
+
+    assert [path.stem for path in edited] == ["first", "second"]
+    assert timeline.max_inflight_merges == 2
+    # 後から始めたグループが先に結合を終えている
+    renders = [call for call in timeline.calls if call.startswith("render")]
+    assert renders == ["render:second", "render:first"]
+
+
+@pytest.mark.asyncio
+async def test_execute_respects_parallel_group_budget(tmp_path: Path) -> None:
+    editor, timeline, _, _ = _build(
+        tmp_path, ["a", "b", "c"], max_parallel_groups=1
+    )
+
+    edited = await editor.execute()
+
+    assert len(edited) == 3
+    assert timeline.max_inflight_merges == 1
+
+
+@pytest.mark.asyncio
+async def test_edit_renders_prepared_assets_in_one_pass(
+    tmp_path: Path,
+) -> None:
+    editor, timeline, _, _ = _build(tmp_path, ["solo"], volume_multiplier=1.5)
+
+    await editor.execute()
+
+    video_editor = cast(_FakeVideoEditor, editor.video_editor)
+    assert len(video_editor.plans) == 1
+    plan = video_editor.plans[0]
+    assert plan.clips == (tmp_path / "solo_0.mkv", tmp_path / "solo_1.mkv")
+    assert plan.metadata == {"title": "title", "description": "description"}
+    assert plan.narration == tmp_path / "solo_narration.wav"
+    assert plan.volume_multiplier == 1.5
+    calls = timeline.calls
+    assert calls.index("render:solo") < calls.index("discard:solo_narration")
+
+
+@pytest.mark.asyncio
+async def test_failed_group_discards_narration_and_others_continue(
+    tmp_path: Path,
+) -> None:
+    editor, _, subtitles, repo = _build(tmp_path, ["broken", "ok"])
+
+    edited = await editor.execute()
+
+    assert [path.stem for path in edited] == ["ok"]
+    assert tmp_path / "broken_narration.wav" in subtitles.discarded
+    assert all("broken" not in path.name for path in repo.deleted)
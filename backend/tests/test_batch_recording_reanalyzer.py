@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import cast
+
+import pytest
+from structlog.stdlib import BoundLogger
+from typer.testing import CliRunner
+
+from splat_replay.application.dto import (
+    ReanalysisReportDTO,
+    RecordingReanalysisDTO,
+)
+from splat_replay.domain.config import VideoStorageSettings
+from splat_replay.infrastructure.adapters.reanalysis import (
+    batch_reanalyzer,
+)
+from splat_replay.infrastructure.adapters.reanalysis.batch_reanalyzer import (
+    REANALYSIS_STATE_FILENAME,
+    BatchRecordingReanalyzer,
+)
+from splat_replay.interface.cli.main import CliDependencies, build_app
+
+
+class _DummyLogger:
+    def info(self, event: str, **kw: object) -> None:
+        return None
+
+    def warning(self, event: str, **kw: object) -> None:
+        return None
+
+
+class _FakeWorker:
+    """サイドカーを書き込むだけの解析ワーカー。"""
+
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.analyzed: list[str] = []
+        self.initialized = 0
+        self._failing = failing or set()
+
+    def initialize(self, image_matching_file: Path) -> None:
+        self.initialized += 1
+
+    def analyze(self, video: Path) -> RecordingReanalysisDTO:
+        self.analyzed.append(video.name)
+        if video.name in self._failing:
+            return RecordingReanalysisDTO(
+                path=str(video), status="failed", error="boom"
+            )
+        video.with_suffix(".json").write_text("{}", encoding="utf-8")
+        return RecordingReanalysisDTO(
+            path=str(video),
+            status="analyzed",
+            outcome="completed",
+            frames_analyzed=10,
+            video_seconds=180.0,
+            metadata_saved=True,
+        )
+
+
+@pytest.fixture
+def worker(monkeypatch: pytest.MonkeyPatch) -> _FakeWorker:
+    fake = _FakeWorker()
+    monkeypatch.setattr(
+        batch_reanalyzer, "_initialize_worker", fake.initialize
+    )
+    monkeypatch.setattr(batch_reanalyzer, "_analyze_in_worker", fake.analyze)
+    return fake
+
+
+def _build(tmp_path: Path) -> BatchRecordingReanalyzer:
+    recorded_dir = tmp_path / "videos" / "recorded"
+    recorded_dir.mkdir(parents=True)
+    for name in ("b.mkv", "a.mp4", "notes.txt"):
+        (recorded_dir / name).write_bytes(b"")
+    config = tmp_path / "image_matching.yaml"
+    config.write_text("matchers: {}\n", encoding="utf-8")
+    return BatchRecordingReanalyzer(
+        settings=VideoStorageSettings(base_dir=tmp_path / "videos"),
+        logger=cast(BoundLogger, _DummyLogger()),
+        image_matching_file=config,
+    )
+
+
+def _statuses(report: ReanalysisReportDTO) -> dict[str, str]:
+    return {Path(item.path).name: item.status for item in report.items}
+
+
+def test_run_analyzes_recordings_and_records_progress(
+    tmp_path: Path, worker: _FakeWorker
+) -> None:
+    reanalyzer = _build(tmp_path)
+    seen: list[str] = []
+
+    report = reanalyzer.run(
+        workers=0, on_result=lambda item: seen.append(item.status)
+    )
+
+    assert worker.analyzed == ["a.mp4", "b.mkv"]
+    assert _statuses(report) == {"a.mp4": "analyzed", "b.mkv": "analyzed"}
+    assert seen == ["analyzed", "analyzed"]
+    assert report.video_seconds == 360.0
+    assert (reanalyzer.state_path.name) == REANALYSIS_STATE_FILENAME
+    assert reanalyzer.state_path.exists()
+
+
+def test_run_skips_recordings_analyzed_with_same_config(
+    tmp_path: Path, worker: _FakeWorker
+) -> None:
+    reanalyzer = _build(tmp_path)
+    reanalyzer.run(workers=0)
+    worker.analyzed.clear()
+    worker.initialized = 0
+
+    report = reanalyzer.run(workers=0)
+
+    assert worker.analyzed == []
+    assert worker.initialized == 0
+    assert report.count("skipped") == 2
+
+
+def test_run_reanalyzes_when_sidecar_is_older_than_recorded(
+    tmp_path: Path, worker: _FakeWorker
+) -> None:
+    reanalyzer = _build(tmp_path)
+    reanalyzer.run(workers=0)
+    worker.analyzed.clear()
+    # 解析後にサイドカーが古い内容へ差し戻された
+    sidecar = tmp_path / "videos" / "recorded" / "a.json"
+    stat = sidecar.stat()
+    os.utime(sidecar, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+
+    report = reanalyzer.run(workers=0)
+
+    assert worker.analyzed == ["a.mp4"]
+    assert _statuses(report) == {"a.mp4": "analyzed", "b.mkv": "skipped"}
+
+
+def test_run_reanalyzes_everything_when_matcher_config_changes(
+    tmp_path: Path, worker: _FakeWorker
+) -> None:
+    reanalyzer = _build(tmp_path)
+    reanalyzer.run(workers=0)
+    worker.analyzed.clear()
+    (tmp_path / "image_matching.yaml").write_text(
+        "matchers: {changed: true}\n", encoding="utf-8"
+    )
+
+    reanalyzer.run(workers=0)
+
+    assert worker.analyzed == ["a.mp4", "b.mkv"]
+
+
+def test_failed_recordings_are_retried_on_next_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = _FakeWorker(failing={"a.mp4"})
+    monkeypatch.setattr(
+        batch_reanalyzer, "_initialize_worker", fake.initialize
+    )
+    monkeypatch.setattr(batch_reanalyzer, "_analyze_in_worker", fake.analyze)
+    reanalyzer = _build(tmp_path)
+
+    first = reanalyzer.run(workers=0)
+    fake.analyzed.clear()
+    second = reanalyzer.run(workers=0)
+
+    assert first.count("failed") == 1
+    assert fake.analyzed == ["a.mp4"]
+    assert _statuses(second)["b.mkv"] == "skipped"
+
+
+def test_force_reanalyzes_up_to_date_recordings(
+    tmp_path: Path, worker: _FakeWorker
+) -> None:
+    reanalyzer = _build(tmp_path)
+    reanalyzer.run(workers=0)
+    worker.analyzed.clear()
+
+    reanalyzer.run(workers=0, force=True)
+
+    assert worker.analyzed == ["a.mp4", "b.mkv"]
+
+
+class _ScriptedReanalyzer:
+    def __init__(self, items: tuple[RecordingReanalysisDTO, ...]) -> None:
+        self._items = items
+        self.calls: list[tuple[int, bool]] = []
+
+    def run(self, *, workers, force=False, on_result=None):
+        self.calls.append((workers, force))
+        for item in self._items:
+            if on_result is not None:
+                on_result(item)
+        return ReanalysisReportDTO(
+            items=self._items, workers=workers, elapsed_seconds=1.0
+        )
+
+
+def _unused() -> object:
+    raise AssertionError("This dependency should not be used in this test")
+
+
+def _invoke_reanalyze(
+    reanalyzer: _ScriptedReanalyzer, *args: str
+) -> tuple[int, str]:
+    deps = CliDependencies(
+        auto_use_case=_unused,  # type: ignore[arg-type]
+        upload_use_case=_unused,  # type: ignore[arg-type]
+        logger=_unused,  # type: ignore[arg-type]
+        web_app=_unused,  # type: ignore[arg-type]
+        webview_app=_unused,  # type: ignore[arg-type]
+        start_dev_server=_unused,  # type: ignore[arg-type]
+        remote_access_enabled=lambda: False,
+        recording_reanalyzer=lambda: reanalyzer,
+    )
+    result = CliRunner().invoke(build_app(deps), ["reanalyze", *args])
+    return result.exit_code, result.output
+
+
+def test_reanalyze_command_prints_summary() -> None:
+    reanalyzer = _ScriptedReanalyzer(
+        (
+            RecordingReanalysisDTO(
+                path="/videos/recorded/a.mkv",
+                status="analyzed",
+                outcome="completed",
+                frames_analyzed=42,
+                video_seconds=200.0,
+            ),
+            RecordingReanalysisDTO(
+                path="/videos/recorded/b.mkv", status="skipped"
+            ),
+        )
+    )
+
+    exit_code, output = _invoke_reanalyze(
+        reanalyzer, "--workers", "3", "--force"
+    )
+
+    assert exit_code == 0
+    assert reanalyzer.calls == [(3, True)]
+    assert "[done] a.mkv: completed" in output
+    assert "[skip] b.mkv" in output
+    assert "再解析 1 件 / スキップ 1 件 / 失敗 0 件" in output
+
+
+def test_reanalyze_command_fails_when_any_recording_fails() -> None:
+    reanalyzer = _ScriptedReanalyzer(
+        (
+            RecordingReanalysisDTO(
+                path="/videos/recorded/a.mkv", status="failed", error="boom"
+            ),
+        )
+    )
+
+    exit_code, output = _invoke_reanalyze(reanalyzer, "--workers", "0")
+
+    assert exit_code == 1
+    assert "[fail] a.mkv: boom" in output
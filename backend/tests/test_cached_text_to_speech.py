@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Self, cast
+
+import pytest
+from structlog.stdlib import BoundLogger
+
+from splat_replay.application.interfaces import (
+    SpeechSynthesisRequest,
+    SpeechSynthesisResult,
+)
+from splat_replay.infrastructure.adapters.audio.cached_text_to_speech import (
+    CachedTextToSpeech,
+    speech_cache_key,
+)
+
+
+class _DummyLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        return None
+
+    def warning(self, event: str, **kw: object) -> None:
+        return None
+
+
+class _CountingTextToSpeech:
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    def synthesize(
+        self, request: SpeechSynthesisRequest
+    ) -> SpeechSynthesisResult:
+        self.requests.append(request.text)
+        return SpeechSynthesisResult(
+            audio=request.text.encode("utf-8"), sample_rate_hz=22050
+        )
+
+
+def _request(text: str, voice_name: str = "voice-a") -> SpeechSynthesisRequest:
+    return SpeechSynthesisRequest(
+        text=text,
+        language_code="ja-JP",
+        voice_name=voice_name,
+        speaking_rate=1.0,
+        pitch=0.0,
+        audio_encoding="LINEAR16",
+        sample_rate_hz=24000,
+    )
+
+
+def _build(
+    tmp_path: Path, identity: str | None = None, max_bytes: int = 1 << 20
+) -> tuple[CachedTextToSpeech, _CountingTextToSpeech]:
+    inner = _CountingTextToSpeech()
+    return (
+        CachedTextToSpeech(
+            inner,
+            tmp_path / "cache",
+            cast(BoundLogger, _DummyLogger()),
+            identity=identity,
+            max_bytes=max_bytes,
+        ),
+        inner,
+    )
+
+
+def test_repeated_request_is_served_from_cache(tmp_path: Path) -> None:
+    tts, inner = _build(tmp_path)
+
+    first = tts.synthesize(_request("ナイス"))
+    second = tts.synthesize(_request("ナイス"))
+
+    assert inner.requests == ["ナイス"]
+    assert second == first
+    assert second.sample_rate_hz == 22050
+
+
+def test_cache_survives_new_adapter_instances(tmp_path: Path) -> None:
+    tts, _ = _build(tmp_path)
+    tts.synthesize(_request("カモン"))
+
+    reopened, inner = _build(tmp_path)
+    result = reopened.synthesize(_request("カモン"))
+
+    assert inner.requests == []
+    assert result.audio == "カモン".encode()
+
+
+def test_cache_key_covers_voice_settings(tmp_path: Path) -> None:
+    tts, inner = _build(tmp_path)
+
+    tts.synthesize(_request("ナイス", voice_name="voice-a"))
+    tts.synthesize(_request("ナイス", voice_name="voice-b"))
+
+    assert inner.requests == ["ナイス", "ナイス"]
+    assert speech_cache_key(_request("a"), "google") != speech_cache_key(
+        _request("a", voice_name="voice-b"), "google"
+    )
+
+
+def test_cache_key_covers_speech_backend(tmp_path: Path) -> None:
+    tts, _ = _build(tmp_path, identity="google:model-a:key-a")
+    tts.synthesize(_request("ナイス"))
+
+    switched, inner = _build(tmp_path, identity="google:model-a:key-b")
+    switched.synthesize(_request("ナイス"))
+
+    assert inner.requests == ["ナイス"]
+
+
+def test_truncated_cache_entry_is_resynthesized(tmp_path: Path) -> None:
+    tts, inner = _build(tmp_path, identity="google")
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    key = speech_cache_key(_request("ナイス"), "google")
+    (cache_dir / f"{key}.bin").write_bytes(b"\x00")
+
+    result = tts.synthesize(_request("ナイス"))
+
+    assert inner.requests == ["ナイス"]
+    assert result.audio == "ナイス".encode()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    # 1 件あたり 4 + 3 * 3 = 13 バイト。3 件目で上限を超える
+    tts, inner = _build(tmp_path, max_bytes=30)
+    tts.synthesize(_request("あああ"))
+    time.sleep(0.01)
+    tts.synthesize(_request("いいい"))
+    time.sleep(0.01)
+    tts.synthesize(_request("あああ"))
+    time.sleep(0.01)
+    tts.synthesize(_request("ううう"))
+
+    assert len(list((tmp_path / "cache").glob("*.bin"))) == 1
+    tts.synthesize(_request("ううう"))
+    assert inner.requests == ["あああ", "いいい", "ううう"]
+
+
+def test_failed_write_leaves_no_temporary_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tts, _ = _build(tmp_path)
+    named_temporary_file = tempfile.NamedTemporaryFile
+
+    class _FullDisk:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self._file = named_temporary_file(*args, **kwargs)
+            self.name = self._file.name
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            self._file.close()
+
+        def write(self, data: bytes) -> int:
+            raise OSError("disk full")
+
+        def close(self) -> None:
+            self._file.close()
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", _FullDisk)
+    result = tts.synthesize(_request("ナイス"))
+
+    assert result.audio == "ナイス".encode()
+    assert list((tmp_path / "cache").iterdir()) == []
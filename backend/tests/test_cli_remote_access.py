@@ -11,6 +11,7 @@ from typer.testing import CliRunner
 from splat_replay.application.use_cases import AutoUseCase, UploadUseCase
 from splat_replay.interface.cli.main import (
     CliDependencies,
+    RecordingReanalyzer,
     WebViewApp,
     build_app,
     resolve_web_bind_host,
@@ -37,6 +38,10 @@ def _unused_webview_app() -> WebViewApp:
     raise AssertionError("This dependency should not be used in this test")
 
 
+def _unused_recording_reanalyzer() -> RecordingReanalyzer:
+    raise AssertionError("This dependency should not be used in this test")
+
+
 def _unused_dependency() -> None:
     raise AssertionError("This dependency should not be used in this test")
 
@@ -54,6 +59,7 @@ def _build_test_app(
         webview_app=_unused_webview_app,
         start_dev_server=_unused_dependency,
         remote_access_enabled=lambda: remote_access_enabled,
+        recording_reanalyzer=_unused_recording_reanalyzer,
     )
     return build_app(deps)
 
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pytest
+
+from splat_replay.application.interfaces import EventBusPort, LoggerPort
+from splat_replay.application.services.recording.commands import (
+    RecordingAction,
+)
+from splat_replay.application.services.recording.detection_schedule import (
+    DetectionSchedule,
+)
+from splat_replay.application.services.recording.ingame_handler import (
+    InGamePhaseHandler,
+)
+from splat_replay.application.services.recording.postfinish_handler import (
+    PostFinishPhaseHandler,
+)
+from splat_replay.application.services.recording.recording_context import (
+    RecordingContext,
+)
+from splat_replay.application.services.recording.result_handler import (
+    ResultPhaseHandler,
+)
+from splat_replay.domain.models import (
+    GameMode,
+    Judgement,
+    RecordingMetadata,
+)
+from splat_replay.domain.services import FrameAnalyzer, RecordState
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def now(self) -> float:
+        return self.value
+
+
+class _AnalyzerStub:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def detect_session_result(
+        self, frame: np.ndarray, mode: GameMode | None
+    ) -> bool:
+        self.calls += 1
+        return False
+
+
+class _LoggerStub:
+    def info(self, event: str, **kw: object) -> None:
+        return None
+
+
+def _run_frames(
+    schedule: DetectionSchedule,
+    clock: _FakeClock,
+    rates: dict[str, float],
+    *,
+    fps: float,
+    seconds: float,
+) -> dict[str, int]:
+    counts = dict.fromkeys(rates, 0)
+    for index in range(int(fps * seconds)):
+        clock.value = index / fps
+        schedule.begin_frame(rates)
+        for name in rates:
+            if schedule.is_due(name):
+                counts[name] += 1
+    return counts
+
+
+def test_detectors_run_at_declared_rates() -> None:
+    clock = _FakeClock()
+    schedule = DetectionSchedule(clock)
+
+    counts = _run_frames(
+        schedule,
+        clock,
+        {"battle_finish": 30.0, "loading": 5.0, "power_off": 0.2},
+        fps=60.0,
+        seconds=10.0,
+    )
+
+    assert counts == {"battle_finish": 300, "loading": 50, "power_off": 2}
+
+
+def test_rate_is_kept_when_frames_jitter() -> None:
+    clock = _FakeClock()
+    schedule = DetectionSchedule(clock)
+    rng = np.random.default_rng(0)
+    runs = 0
+    for index in range(600):
+        clock.value = index / 60.0 + float(rng.uniform(0.0, 0.005))
+        schedule.begin_frame({"battle_finish": 30.0})
+        runs += schedule.is_due("battle_finish")
+
+    assert 295 <= runs <= 305
+
+
+def test_undeclared_detectors_are_always_due() -> None:
+    schedule = DetectionSchedule(_FakeClock())
+
+    schedule.begin_frame({"loading": 1.0})
+
+    assert schedule.is_due("battle_result")
+
+
+def test_non_positive_rate_disables_detector() -> None:
+    schedule = DetectionSchedule(_FakeClock())
+
+    schedule.begin_frame({"loading": 0.0})
+
+    assert not schedule.is_due("loading")
+
+
+def test_detector_runs_immediately_after_long_gap() -> None:
+    clock = _FakeClock()
+    schedule = DetectionSchedule(clock)
+    schedule.begin_frame({"loading": 10.0})
+
+    clock.value = 100.0
+    schedule.begin_frame({"loading": 10.0})
+    assert schedule.is_due("loading")
+
+    clock.value = 100.05
+    schedule.begin_frame({"loading": 10.0})
+    assert not schedule.is_due("loading")
+
+
+@pytest.mark.asyncio
+async def test_handler_skips_detection_when_not_due() -> None:
+    clock = _FakeClock()
+    schedule = DetectionSchedule(clock)
+    analyzer = _AnalyzerStub()
+    handler = ResultPhaseHandler(
+        cast(FrameAnalyzer, analyzer),
+        cast(LoggerPort, _LoggerStub()),
+        cast(EventBusPort, object()),
+        schedule=schedule,
+    )
+    ctx = RecordingContext(metadata=RecordingMetadata())
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    schedule.begin_frame(handler.detector_rates)
+    first = await handler.handle(frame, ctx, RecordState.RECORDING)
+    clock.value = 0.01
+    schedule.begin_frame(handler.detector_rates)
+    second = await handler.handle(frame, ctx, RecordState.RECORDING)
+
+    assert first.action is RecordingAction.STOP_RECORDING
+    assert second.action is RecordingAction.NONE
+    assert analyzer.calls == 1
+
+
+def test_prefetch_keys_follow_context() -> None:
+    analyzer = cast(FrameAnalyzer, _AnalyzerStub())
+    logger = cast(LoggerPort, _LoggerStub())
+    bus = cast(EventBusPort, object())
+    post_finish = PostFinishPhaseHandler(analyzer, logger, bus)
+    in_game = InGamePhaseHandler(analyzer, logger, bus)
+    battle = RecordingMetadata(game_mode=GameMode.BATTLE)
+
+    assert post_finish.prefetch_keys_for(
+        RecordingContext(metadata=battle)
+    ) == ("battle_judgement_latter_half",)
+    assert post_finish.prefetch_keys_for(
+        RecordingContext(
+            metadata=RecordingMetadata(
+                game_mode=GameMode.BATTLE, judgement=Judgement.WIN
+            )
+        )
+    ) == ("loading", "battle_result")
+    salmon = RecordingContext(
+        metadata=RecordingMetadata(game_mode=GameMode.SALMON)
+    )
+    assert post_finish.prefetch_keys_for(salmon) == ()
+    assert in_game.prefetch_keys_for(salmon) == ()
+    assert "battle_finish" in in_game.prefetch_keys_for(
+        RecordingContext(metadata=battle)
+    )
+
+
+def test_finish_detection_is_not_throttled_at_high_fps() -> None:
+    clock = _FakeClock()
+    schedule = DetectionSchedule(clock)
+    handler = InGamePhaseHandler(
+        cast(FrameAnalyzer, _AnalyzerStub()),
+        cast(LoggerPort, _LoggerStub()),
+        cast(EventBusPort, object()),
+        schedule=schedule,
+    )
+
+    runs = 0
+    for index in range(60):
+        clock.value = index / 60.0
+        schedule.begin_frame(handler.detector_rates)
+        runs += schedule.is_due("battle_finish")
+
+    assert runs == 60
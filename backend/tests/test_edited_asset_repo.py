@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from splat_replay.domain.config import VideoStorageSettings
+from splat_replay.infrastructure.repositories.asset_file_operations import (
+    AssetFileOperations,
+)
+from splat_replay.infrastructure.repositories.edited_asset_repo import (
+    EditedAssetRepository,
+)
+
+
+def _repository(tmp_path: Path) -> EditedAssetRepository:
+    logger = MagicMock()
+    return EditedAssetRepository(
+        VideoStorageSettings(base_dir=tmp_path),
+        logger,
+        AssetFileOperations(logger),
+        MagicMock(),
+    )
+
+
+def _render(settings: VideoStorageSettings, name: str, body: bytes) -> Path:
+    settings.recorded_dir.mkdir(parents=True, exist_ok=True)
+    video = settings.recorded_dir / name
+    video.write_bytes(body)
+    video.with_suffix(".json").write_text(
+        f'{{"body": "{body.decode()}"}}', encoding="utf-8"
+    )
+    return video
+
+
+def test_save_edited_replaces_previous_edit_of_same_slot(
+    tmp_path: Path,
+) -> None:
+    repo = _repository(tmp_path)
+    settings = repo.settings
+
+    first = repo.save_edited(_render(settings, "slot.mp4", b"first"))
+    second = repo.save_edited(_render(settings, "slot.mp4", b"second"))
+
+    assert first == second == settings.edited_dir / "slot.mp4"
+    assert second.read_bytes() == b"second"
+    assert second.with_suffix(".json").read_text(encoding="utf-8") == (
+        '{"body": "second"}'
+    )
+    # 録画済みフォルダに編集済み動画が残らない
+    assert list(settings.recorded_dir.iterdir()) == []
+
+
+def test_save_edited_raises_when_video_cannot_be_moved(
+    tmp_path: Path,
+) -> None:
+    repo = _repository(tmp_path)
+
+    with pytest.raises(OSError):
+        repo.save_edited(repo.settings.recorded_dir / "missing.mp4")
+
+    repo.logger.error.assert_called_once()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import cast
+
+import pytest
+
+from splat_replay.application.interfaces import EventBusPort
+from splat_replay.application.services.common.progress import (
+    ProgressEventStore,
+)
+from splat_replay.infrastructure.messaging import Event, EventBus
+
+
+@pytest.mark.asyncio
+async def test_wait_wakes_on_event_published_from_another_thread() -> None:
+    bus = EventBus()
+    sub = bus.subscribe(event_types={"domain.test"})
+
+    waiting = asyncio.create_task(sub.wait())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    publisher = threading.Thread(
+        target=lambda: bus.publish(Event(type="domain.test"))
+    )
+    publisher.start()
+    publisher.join()
+    events = await asyncio.wait_for(waiting, timeout=1.0)
+
+    assert [event.type for event in events] == ["domain.test"]
+    sub.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_a_burst_in_one_batch() -> None:
+    bus = EventBus()
+    sub = bus.subscribe()
+
+    waiting = asyncio.create_task(sub.wait(max_items=10))
+    await asyncio.sleep(0)
+    for index in range(3):
+        bus.publish(Event(type="domain.test", payload={"index": index}))
+    events = await asyncio.wait_for(waiting, timeout=1.0)
+
+    assert [event.payload["index"] for event in events] == [0, 1, 2]
+    sub.close()
+
+
+@pytest.mark.asyncio
+async def test_close_releases_waiter_and_detaches_from_bus() -> None:
+    bus = EventBus()
+    sub = bus.subscribe()
+
+    waiting = asyncio.create_task(sub.wait())
+    await asyncio.sleep(0)
+    sub.close()
+
+    assert await asyncio.wait_for(waiting, timeout=1.0) is None
+    assert bus._subs == []
+    # 閉じた後の呼び出しもすぐに閉じたことを返す
+    assert await asyncio.wait_for(sub.wait(), timeout=1.0) is None
+
+
+@pytest.mark.asyncio
+async def test_progress_listener_stops_when_subscription_closes() -> None:
+    bus = EventBus()
+    store = ProgressEventStore()
+    listening = asyncio.create_task(
+        store.start_listening(cast(EventBusPort, bus))
+    )
+    await asyncio.sleep(0)
+    bus.publish(
+        Event(
+            type="progress.start",
+            payload={"kind": "start", "task_id": "a"},
+        )
+    )
+    events, _ = await asyncio.wait_for(store.wait_since(0), timeout=1.0)
+    assert [event["kind"] for event in events] == ["start"]
+
+    [sub] = bus._subs
+    sub.close()
+    await asyncio.wait_for(listening, timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_progress_store_wait_since_blocks_until_recorded() -> None:
+    store = ProgressEventStore()
+    store.record_payload({"kind": "start", "task_id": "a"})
+    events, cursor = await store.wait_since(0)
+    assert [event["kind"] for event in events] == ["start"]
+
+    waiting = asyncio.create_task(store.wait_since(cursor))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    store.record_payload({"kind": "advance", "task_id": "a"})
+    store.record_payload({"kind": "finish", "task_id": "a"})
+    events, cursor = await asyncio.wait_for(waiting, timeout=1.0)
+
+    assert [event["kind"] for event in events] == ["advance", "finish"]
+    assert cursor == 3
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from splat_replay.application.interfaces import VideoEditPlan
+from splat_replay.infrastructure.adapters.video.ffmpeg_processor import (
+    build_render_command,
+)
+
+
+def _option(command: list[str], name: str) -> list[str]:
+    return [
+        command[index + 1]
+        for index, value in enumerate(command[:-1])
+        if value == name
+    ]
+
+
+def test_render_command_copies_streams_without_extra_edits(
+    tmp_path: Path,
+) -> None:
+    plan = VideoEditPlan(
+        clips=(tmp_path / "a.mkv",), output=tmp_path / "out.mkv"
+    )
+
+    command = build_render_command(
+        plan, tmp_path / "a.mkv", concat=False, source_audio_streams=1
+    )
+
+    assert _option(command, "-i") == [str(tmp_path / "a.mkv")]
+    assert _option(command, "-c") == ["copy"]
+    assert "-filter:a" not in command
+    assert command[-1] == str((tmp_path / "out.mkv").resolve())
+
+
+def test_render_command_applies_every_edit_in_one_invocation(
+    tmp_path: Path,
+) -> None:
+    plan = VideoEditPlan(
+        clips=(tmp_path / "a.mkv", tmp_path / "b.mkv"),
+        output=tmp_path / "out.mkv",
+        metadata={"title": "タイトル", "description": ""},
+        thumbnail=b"png",
+        narration=tmp_path / "narration.wav",
+        narration_title="読み上げ",
+        volume_multiplier=1.5,
+    )
+
+    command = build_render_command(
+        plan, tmp_path / "list.txt", concat=True, source_audio_streams=2
+    )
+
+    assert command[command.index("-f") + 1] == "concat"
+    assert _option(command, "-i") == [
+        str(tmp_path / "list.txt"),
+        str((tmp_path / "narration.wav").resolve()),
+        "-",
+    ]
+    assert _option(command, "-map") == ["0:v", "0:a?", "0:s?", "1:a", "2"]
+    assert _option(command, "-filter:a") == ["volume=1.5"]
+    assert _option(command, "-c:a") == ["aac"]
+    assert _option(command, "-metadata:s:a:2") == ["title=読み上げ"]
+    assert _option(command, "-metadata") == ["title=タイトル"]
+
+
+def test_render_command_encodes_only_the_narration_track(
+    tmp_path: Path,
+) -> None:
+    plan = VideoEditPlan(
+        clips=(tmp_path / "a.mkv",),
+        output=tmp_path / "out.mkv",
+        narration=tmp_path / "narration.wav",
+    )
+
+    command = build_render_command(
+        plan, tmp_path / "a.mkv", concat=False, source_audio_streams=1
+    )
+
+    assert _option(command, "-c") == ["copy"]
+    assert _option(command, "-c:a:1") == ["aac"]
+    assert "-c:a" not in command
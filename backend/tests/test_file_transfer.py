@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import errno
+import os
+from pathlib import Path
+
+import pytest
+
+from splat_replay.infrastructure.filesystem import transfer
+
+
+def _write(path: Path, size: int = 3 * 1024 * 1024 + 17) -> bytes:
+    data = os.urandom(size)
+    path.write_bytes(data)
+    return data
+
+
+def test_move_file_renames_within_filesystem(tmp_path: Path) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+
+    strategy = transfer.move_file(src, tmp_path / "b.mkv")
+
+    assert strategy == "rename"
+    assert not src.exists()
+    assert (tmp_path / "b.mkv").read_bytes() == data
+
+
+def test_move_file_does_not_overwrite_existing_file(tmp_path: Path) -> None:
+    src = tmp_path / "a.mkv"
+    _write(src)
+    (tmp_path / "b.mkv").write_bytes(b"keep")
+
+    with pytest.raises(FileExistsError):
+        transfer.move_file(src, tmp_path / "b.mkv")
+
+    assert src.exists()
+    assert (tmp_path / "b.mkv").read_bytes() == b"keep"
+
+
+def test_move_file_replaces_existing_file_when_requested(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+    (tmp_path / "b.mkv").write_bytes(b"old")
+
+    transfer.move_file(src, tmp_path / "b.mkv", replace=True)
+
+    assert not src.exists()
+    assert (tmp_path / "b.mkv").read_bytes() == data
+
+
+def test_move_file_replaces_existing_file_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+    (tmp_path / "b.mkv").write_bytes(b"old" * 1024 * 1024)
+
+    def cross_device(src: object, dst: object) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(transfer.os, "replace", cross_device)
+
+    transfer.move_file(src, tmp_path / "b.mkv", replace=True)
+
+    assert not src.exists()
+    assert (tmp_path / "b.mkv").read_bytes() == data
+
+
+def test_move_file_copies_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+
+    def cross_device(src: object, dst: object) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(transfer.os, "replace", cross_device)
+
+    strategy = transfer.move_file(src, tmp_path / "b.mkv")
+
+    assert strategy in ("reflink", "copy_file_range", "chunked")
+    assert not src.exists()
+    assert (tmp_path / "b.mkv").read_bytes() == data
+
+
+def test_copy_file_shares_data_with_hardlink_when_allowed(
+    tmp_path: Path,
+) -> None:
+    src = tmp_path / "a.mkv"
+    _write(src, 1024)
+
+    strategy = transfer.copy_file(src, tmp_path / "b.mkv", allow_link=True)
+
+    assert strategy == "hardlink"
+    assert os.path.samefile(src, tmp_path / "b.mkv")
+
+
+def test_copy_file_falls_back_to_chunked_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+    monkeypatch.setattr(transfer, "_reflink", lambda reader, writer: False)
+    monkeypatch.setattr(
+        transfer, "_copy_range", lambda reader, writer, size: 0
+    )
+
+    strategy = transfer.copy_file(src, tmp_path / "b.mkv")
+
+    assert strategy == "chunked"
+    assert (tmp_path / "b.mkv").read_bytes() == data
+    assert src.read_bytes() == data
+
+
+def test_copy_file_finishes_partial_range_copy_with_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "a.mkv"
+    data = _write(src)
+    half = len(data) // 2
+
+    def partial(reader, writer, size: int) -> int:  # type: ignore[no-untyped-def]
+        writer.write(reader.read(half))
+        writer.flush()
+        return half
+
+    monkeypatch.setattr(transfer, "_reflink", lambda reader, writer: False)
+    monkeypatch.setattr(transfer, "_copy_range", partial)
+
+    strategy = transfer.copy_file(src, tmp_path / "b.mkv")
+
+    assert strategy == "chunked"
+    assert (tmp_path / "b.mkv").read_bytes() == data
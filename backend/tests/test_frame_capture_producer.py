@@ -10,6 +10,9 @@ import numpy as np
 from splat_replay.application.services.recording.frame_capture_producer import (
     FrameCaptureProducer,
 )
+from splat_replay.application.services.recording.frame_ring_buffer import (
+    FrameRingBuffer,
+)
 from splat_replay.domain.models import Frame, as_frame
 
 
@@ -130,3 +133,70 @@ def test_late_frame_from_stopped_thread_is_discarded_after_restart() -> None:
 
     assert frame is not None
     assert np.array_equal(frame, new_frame)
+
+
+def test_frames_are_written_into_frame_ring() -> None:
+    capture = _QueuedCapture()
+    ring = FrameRingBuffer(4, writer_reserve=1)
+    published: list[Frame] = []
+
+    class _Publisher:
+        def publish_frame(self, frame: Frame) -> None:
+            published.append(frame)
+
+    producer = FrameCaptureProducer(
+        capture,
+        frame_publisher=_Publisher(),
+        queue_maxsize=1,
+        device_retry_sleep=0.01,
+        frame_ring=ring,
+    )
+    source = _frame(3)
+
+    capture.frames.put(source)
+    producer.start()
+    try:
+        frame = producer.get_frame(timeout=1.0)
+    finally:
+        producer.stop()
+
+    assert frame is not None
+    assert np.array_equal(frame, source)
+    assert ring.latest_sequence == 1
+    # GUI とキューは同じスロットを共有する
+    assert published and np.shares_memory(published[0], frame)
+
+
+def test_capture_into_decodes_into_frame_ring_slot() -> None:
+    ring = FrameRingBuffer(4, writer_reserve=1)
+    targets: list[Frame | None] = []
+
+    class _BufferedCapture(_QueuedCapture):
+        def capture_into(self, out: Frame | None) -> Frame | None:
+            frame = self.capture()
+            targets.append(out)
+            if frame is None or out is None:
+                return frame
+            np.copyto(out, frame)
+            return out
+
+    capture = _BufferedCapture()
+    producer = FrameCaptureProducer(
+        capture,
+        frame_publisher=None,
+        queue_maxsize=1,
+        device_retry_sleep=0.01,
+        frame_ring=ring,
+    )
+
+    capture.frames.put(_frame(3))
+    producer.start()
+    try:
+        frame = producer.get_frame(timeout=1.0)
+    finally:
+        producer.stop()
+
+    assert frame is not None
+    assert np.all(frame == 3)
+    assert not frame.flags.writeable
+    assert targets
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from splat_replay.application.services.recording.frame_ring_buffer import (
+    FrameRingBuffer,
+)
+from splat_replay.domain.models import Frame, as_frame
+
+
+def _frame(value: int, shape: tuple[int, ...] = (4, 6, 3)) -> Frame:
+    return as_frame(np.full(shape, value, dtype=np.uint8))
+
+
+def test_write_returns_read_only_view_with_sequence() -> None:
+    ring = FrameRingBuffer(3, writer_reserve=1)
+    source = _frame(7)
+
+    frame = ring.write(source)
+
+    assert np.array_equal(frame, source)
+    assert not np.shares_memory(frame, source)
+    assert not frame.flags.writeable
+    assert not frame[1:3].flags.writeable
+    assert ring.latest_sequence == 1
+    with pytest.raises(ValueError):
+        frame[0, 0, 0] = 1
+
+
+def test_held_frames_are_not_overwritten_and_slots_are_reused() -> None:
+    ring = FrameRingBuffer(2, writer_reserve=1)
+
+    first = ring.write(_frame(1))
+    crop = first[:2, :2]
+    del first
+    second = ring.write(_frame(2))
+
+    # スライスが残っている間は元のスロットを使い続ける
+    assert ring.in_use == 2
+    assert np.all(crop == 1)
+    assert np.all(second == 2)
+
+    del crop, second
+    assert ring.in_use == 0
+    third = ring.write(_frame(3))
+    assert ring.latest_sequence == 3
+    assert ring.overflow_count == 0
+    assert np.all(third == 3)
+
+
+def test_full_ring_returns_frame_outside_slots() -> None:
+    ring = FrameRingBuffer(1, writer_reserve=0)
+    held = ring.write(_frame(1))
+    source = _frame(2)
+
+    overflow = ring.write(source)
+
+    assert overflow is source
+    assert ring.overflow_count == 1
+    assert np.all(held == 1)
+
+
+def test_resolution_change_reallocates_slot() -> None:
+    ring = FrameRingBuffer(1, writer_reserve=0)
+    small = ring.write(_frame(1))
+    del small
+
+    large = ring.write(_frame(2, shape=(8, 10, 3)))
+
+    assert large.shape == (8, 10, 3)
+    assert np.all(large == 2)
+
+
+def test_pin_keeps_slot_only_while_writer_reserve_remains() -> None:
+    ring = FrameRingBuffer(3, writer_reserve=1)
+    first = ring.write(_frame(1))
+
+    pinned = ring.pin(first)
+    assert pinned is first
+
+    second = ring.write(_frame(2))
+    # 空きが writer_reserve だけになったのでコピーして明け渡す
+    copied = ring.pin(second)
+    assert copied is not second
+    assert copied.flags.writeable
+    assert not np.shares_memory(copied, second)
+    assert np.array_equal(copied, second)
+
+    external = _frame(3)
+    assert ring.pin(external) is not external
+
+
+def test_fill_decodes_into_slot_without_copy() -> None:
+    ring = FrameRingBuffer(2, writer_reserve=1)
+    targets: list[np.ndarray | None] = []
+
+    def decode(out: np.ndarray | None) -> Frame:
+        targets.append(out)
+        if out is None or out.shape != (4, 6, 3):
+            return _frame(len(targets))
+        out[...] = len(targets)
+        return as_frame(out)
+
+    first = ring.fill(decode)
+    assert first is not None
+    del first
+    second = ring.fill(decode)
+
+    # 初回に確保した配列をスロットとして採用し、以後はそこへ直接書き込む
+    assert targets[0] is None
+    assert targets[1] is not None
+    assert second is not None
+    assert np.shares_memory(second, targets[1])
+    assert np.all(second == 2)
+    assert not second.flags.writeable
+
+
+def test_fill_releases_slot_when_decode_returns_none() -> None:
+    ring = FrameRingBuffer(1, writer_reserve=0)
+
+    assert ring.fill(lambda out: None) is None
+    assert ring.in_use == 0
+    assert ring.fill(lambda out: _frame(1)) is not None
+
+
+def test_release_from_gc_does_not_take_lock() -> None:
+    ring = FrameRingBuffer(2, writer_reserve=1)
+    frame = ring.write(_frame(1))
+
+    # 書き込み中 (ロック保持中) に GC でビューが破棄されても詰まらない
+    with ring._lock:
+        del frame
+    assert ring.in_use == 0
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import punq
+import pytest
+
+from splat_replay.application.interfaces import LoggerPort
+from splat_replay.bootstrap.web_app import build_image_matching_watch
+from splat_replay.domain.config import ImageMatchingSettings, MatcherConfig
+from splat_replay.domain.ports import ImageMatcherPort
+from splat_replay.infrastructure.filesystem import paths
+from splat_replay.infrastructure.matchers import MatcherRegistry
+from splat_replay.infrastructure.matchers.base import BaseMatcher
+from splat_replay.infrastructure.matchers.frame_view import FrameView
+
+
+def _write_yaml(path: Path, matcher: str, body: str) -> None:
+    path.write_text(
+        f"simple_matchers:\n  {matcher}:\n{body}", encoding="utf-8"
+    )
+    # 同じ秒内の書き換えでも更新を検出できるよう更新時刻を進める
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.mark.asyncio
+async def test_watch_reloads_matchers_when_yaml_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    yaml_path = tmp_path / "image_matching.yaml"
+    _write_yaml(
+        yaml_path, "dark", '    type: "brightness"\n    max_value: 20\n'
+    )
+    monkeypatch.setattr(paths, "IMAGE_MATCHING_FILE", yaml_path)
+    registry = MatcherRegistry(ImageMatchingSettings.load_from_yaml(yaml_path))
+    container = punq.Container()
+    container.register(ImageMatcherPort, instance=registry)
+    container.register(LoggerPort, instance=_NullLogger())
+
+    watch = asyncio.create_task(
+        build_image_matching_watch(container, interval=0.01)()
+    )
+    try:
+        await asyncio.sleep(0.05)
+        _write_yaml(
+            yaml_path, "bright", '    type: "brightness"\n    min_value: 200\n'
+        )
+        for _ in range(200):
+            if set(registry.matchers) == {"bright"}:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        watch.cancel()
+
+    assert set(registry.matchers) == {"bright"}
+    assert container.resolve(ImageMatchingSettings).matchers.keys() == {
+        "bright"
+    }
+
+
+def test_reload_during_evaluation_keeps_the_running_matcher_set() -> None:
+    entered, release = threading.Event(), threading.Event()
+
+    class _BlockingMatcher(BaseMatcher):
+        def evaluate(self, view: FrameView) -> bool:
+            entered.set()
+            release.wait(5)
+            return True
+
+    old_settings = ImageMatchingSettings(
+        matchers={
+            "a": MatcherConfig(type="brightness", max_value=20),
+            "b": MatcherConfig(type="brightness", max_value=20),
+        }
+    )
+    registry = MatcherRegistry(old_settings)
+    registry.matchers["a"] = _BlockingMatcher()
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    async def _run() -> dict[str, bool]:
+        pending = asyncio.create_task(registry.match_many(["a", "b"], frame))
+        await asyncio.to_thread(entered.wait, 5)
+        # 評価中に差し替えても、評価中の処理は開始時のマッチャー一式を使う
+        registry.reload(
+            ImageMatchingSettings(
+                matchers={"b": MatcherConfig(type="brightness", min_value=200)}
+            )
+        )
+        release.set()
+        return await pending
+
+    assert asyncio.run(_run()) == {"a": True, "b": True}
+    assert asyncio.run(registry.match_many(["a", "b"], frame)) == {
+        "a": False,
+        "b": False,
+    }
+
+
+class _NullLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def info(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def warning(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def error(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def exception(self, event: str, **kw: object) -> None:
+        _ = event, kw
@@ -0,0 +1,110 @@
+"""CLI エントリポイントの import コストのテスト。
+
+``python -X importtime`` の出力から読み込まれたモジュールを調べ、
+``--help`` や ``upload`` のような軽いサブコマンドの起動で
+重い依存 (OpenCV, Web サーバー, Google API など) を読み込まないことを確認する。
+
+所要時間の上限は環境によって揺れるため perf マーカーで分けている。
+実行するには: pytest -m perf
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+# サブコマンドを実行するまで読み込んではいけないトップレベルパッケージ
+HEAVY_MODULES = frozenset(
+    {
+        "cv2",
+        "numpy",
+        "structlog",
+        "fastapi",
+        "uvicorn",
+        "googleapiclient",
+        "google_auth_oauthlib",
+        "speech_recognition",
+        "groq",
+        "webview",
+        "punq",
+    }
+)
+
+HELP_STATEMENT = (
+    "import sys; sys.argv = ['splat-replay', '--help']\n"
+    "from splat_replay.bootstrap.cli import app\n"
+    "try:\n"
+    "    app()\n"
+    "except SystemExit as exc:\n"
+    "    assert not exc.code, exc.code\n"
+)
+
+DEFAULT_CLI_IMPORT_BUDGET_SEC = 0.5
+CLI_IMPORT_BUDGET_SEC = float(
+    os.getenv("CLI_IMPORT_BUDGET_SEC", DEFAULT_CLI_IMPORT_BUDGET_SEC)
+)
+
+
+def _import_times(statement: str) -> dict[str, float]:
+    """statement を別プロセスで実行し、モジュールごとの累積 import 時間 (秒) を返す。"""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(BACKEND_ROOT / "src")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=BACKEND_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # ヘッダー行
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def _heavy_imports(times: dict[str, float]) -> set[str]:
+    return {name for name in times if name.split(".")[0] in HEAVY_MODULES}
+
+
+def test_cli_import_defers_heavy_dependencies() -> None:
+    times = _import_times("import splat_replay.bootstrap.cli")
+
+    assert "splat_replay.bootstrap.cli" in times
+    assert _heavy_imports(times) == set()
+
+
+def test_cli_help_defers_heavy_dependencies() -> None:
+    times = _import_times(HELP_STATEMENT)
+
+    assert _heavy_imports(times) == set()
+
+
+def test_preview_frame_defers_opencv() -> None:
+    times = _import_times("import splat_replay.interface.web.preview_frame")
+
+    assert "cv2" not in times
+
+
+@pytest.mark.perf
+def test_cli_import_within_budget() -> None:
+    times = _import_times("import splat_replay.bootstrap.cli")
+
+    elapsed = times["splat_replay.bootstrap.cli"]
+    assert elapsed <= CLI_IMPORT_BUDGET_SEC, (
+        f"splat_replay.bootstrap.cli の import に {elapsed:.3f}s かかりました"
+        f" (上限 {CLI_IMPORT_BUDGET_SEC:.3f}s)"
+    )
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import cv2
+import numpy as np
+from splat_replay.domain.config import (
+    ChangeGateConfig,
+    ImageMatchingSettings,
+    MatcherConfig,
+)
+from splat_replay.infrastructure.matchers import MatcherRegistry
+from splat_replay.infrastructure.matchers.change_gate import ChangeGate
+from splat_replay.infrastructure.matchers.frame_view import FrameView
+from splat_replay.infrastructure.matchers.hsv import HSVMatcher
+from splat_replay.infrastructure.matchers.template import TemplateMatcher
+
+ROI = {"x": 0, "y": 0, "width": 8, "height": 8}
+
+
+def _settings(enabled: bool = True) -> ImageMatchingSettings:
+    return ImageMatchingSettings(
+        matchers={
+            "red": MatcherConfig(
+                type="hsv",
+                roi=ROI,
+                lower_bound=(0, 200, 200),
+                upper_bound=(5, 255, 255),
+                threshold=0.9,
+            ),
+            "dark": MatcherConfig(type="brightness", max_value=20),
+        },
+        change_gate=ChangeGateConfig(enabled=enabled),
+    )
+
+
+def _frame(bgr: tuple[int, int, int]) -> np.ndarray:
+    frame = np.zeros((16, 16, 3), dtype=np.uint8)
+    frame[:, :] = bgr
+    return frame
+
+
+def test_unchanged_roi_reuses_previous_verdict() -> None:
+    registry = MatcherRegistry(_settings())
+
+    async def _run() -> list[bool]:
+        return [
+            await registry.match("red", _frame((0, 0, 255))),
+            await registry.match("red", _frame((0, 0, 255))),
+            await registry.match("red", _frame((0, 0, 255))),
+        ]
+
+    assert asyncio.run(_run()) == [True, True, True]
+    stats = registry.cache_stats()
+    assert stats["gate_evaluated"] == 1
+    assert stats["gate_reused"] == 2
+    assert registry.costs.snapshot()["red"]["evaluations"] == 1.0
+
+
+def test_changed_roi_is_reevaluated() -> None:
+    registry = MatcherRegistry(_settings())
+
+    async def _run() -> list[bool]:
+        return [
+            await registry.match("red", _frame((0, 0, 255))),
+            await registry.match("red", _frame((255, 0, 0))),
+        ]
+
+    assert asyncio.run(_run()) == [True, False]
+    assert registry.cache_stats()["gate_evaluated"] == 2
+
+
+def test_change_outside_roi_does_not_trigger_evaluation() -> None:
+    registry = MatcherRegistry(_settings())
+    changed = _frame((0, 0, 255))
+    changed[8:, 8:] = (255, 255, 255)
+
+    async def _run() -> None:
+        await registry.match("red", _frame((0, 0, 255)))
+        await registry.match("red", changed)
+
+    asyncio.run(_run())
+    assert registry.cache_stats()["gate_reused"] == 1
+
+
+def test_non_gateable_matchers_are_always_evaluated() -> None:
+    registry = MatcherRegistry(_settings())
+
+    async def _run() -> None:
+        await registry.match("dark", _frame((0, 0, 0)))
+        await registry.match("dark", _frame((0, 0, 0)))
+
+    asyncio.run(_run())
+    stats = registry.cache_stats()
+    assert stats["gate_reused"] == 0
+    assert registry.costs.snapshot()["dark"]["evaluations"] == 2.0
+
+
+def test_gate_can_be_disabled() -> None:
+    registry = MatcherRegistry(_settings(enabled=False))
+
+    assert registry.gate is None
+    assert "gate_reused" not in registry.cache_stats()
+
+
+def test_gate_compares_against_last_evaluated_samples() -> None:
+    gate = ChangeGate(tolerance=1.0, samples=4)
+    matcher = HSVMatcher((0, 0, 0), (180, 255, 255), roi=(0, 0, 8, 8))
+    base = np.full((8, 8, 3), 100, dtype=np.uint8)
+    gate.remember("m", matcher, FrameView(base), True)
+
+    # 少しずつ変化しても、評価時のサンプルとの差分が閾値を超えれば再評価する
+    assert gate.lookup("m", matcher, FrameView(base + 1)) is True
+    assert gate.lookup("m", matcher, FrameView(base + 2)) is None
+
+
+def test_small_template_regions_are_not_gated(tmp_path: Path) -> None:
+    template_path = tmp_path / "template.png"
+    cv2.imwrite(str(template_path), np.full((4, 4, 3), 255, dtype=np.uint8))
+    gate = ChangeGate(tolerance=1.0, samples=4)
+    full_frame = TemplateMatcher(template_path)
+    large_roi = TemplateMatcher(template_path, roi=(0, 0, 64, 64))
+    tight_roi = TemplateMatcher(template_path, roi=(0, 0, 6, 6))
+    base = np.zeros((64, 64, 3), dtype=np.uint8)
+
+    # 区画 2 つ分より小さいテンプレートは、その部分だけの変化が区画の平均に
+    # 薄まって現れるため毎回評価する
+    for name, matcher in (("full", full_frame), ("large", large_roi)):
+        gate.remember(name, matcher, FrameView(base), False)
+        assert gate.lookup(name, matcher, FrameView(base)) is None
+
+    gate.remember("tight", tight_roi, FrameView(base), False)
+    assert gate.lookup("tight", tight_roi, FrameView(base)) is False
+
+
+def test_full_frame_template_is_gated_when_larger_than_cells(
+    tmp_path: Path,
+) -> None:
+    template_path = tmp_path / "template.png"
+    cv2.imwrite(str(template_path), np.full((8, 8, 3), 255, dtype=np.uint8))
+    gate = ChangeGate(samples=16)
+    matcher = TemplateMatcher(template_path)
+    base = np.zeros((64, 64, 3), dtype=np.uint8)
+    gate.remember("full", matcher, FrameView(base), False)
+
+    assert gate.lookup("full", matcher, FrameView(base.copy())) is False
+
+    # テンプレート大の変化はフレームのどこで起きても再評価される
+    changed = base.copy()
+    changed[37:45, 13:21] = 255
+    assert gate.lookup("full", matcher, FrameView(changed)) is None
+
+
+def test_small_change_inside_large_roi_is_reevaluated() -> None:
+    gate = ChangeGate(tolerance=1.0, samples=64)
+    matcher = HSVMatcher((0, 0, 0), (180, 255, 255), roi=(0, 0, 256, 256))
+    base = np.zeros((256, 256, 3), dtype=np.uint8)
+    gate.remember("m", matcher, FrameView(base), True)
+
+    # ROI 全体の平均ではほとんど変わらない 8x8 画素の変化も区画ごとに比べて検出する
+    changed = base.copy()
+    changed[101:109, 201:209] = 255
+    assert gate.lookup("m", matcher, FrameView(changed)) is None
+
+
+def test_gate_is_enabled_by_default_and_reuses_only_unchanged_roi() -> None:
+    config = ChangeGateConfig()
+
+    assert config.enabled is True
+    assert config.tolerance == 0.0
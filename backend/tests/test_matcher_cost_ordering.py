@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+from splat_replay.domain.config import MatchExpression
+from splat_replay.infrastructure.matchers.base import BaseMatcher
+from splat_replay.infrastructure.matchers.composite import CompositeMatcher
+from splat_replay.infrastructure.matchers.cost import MatcherCostModel
+from splat_replay.infrastructure.matchers.frame_view import FrameView
+
+
+class _StubMatcher(BaseMatcher):
+    def __init__(self, result: bool, calls: list[str], name: str) -> None:
+        super().__init__(name=name)
+        self._result = result
+        self._calls = calls
+
+    def evaluate(self, view: FrameView) -> bool:
+        self._calls.append(self.name or "")
+        return self._result
+
+
+def _composite(
+    rule: dict[str, object],
+    results: dict[str, bool],
+    costs: MatcherCostModel,
+    calls: list[str],
+) -> CompositeMatcher:
+    lookup: dict[str, BaseMatcher] = {
+        name: _StubMatcher(result, calls, name)
+        for name, result in results.items()
+    }
+    return CompositeMatcher(
+        MatchExpression.parse_obj(rule), lookup, name="c", costs=costs
+    )
+
+
+def _view() -> FrameView:
+    return FrameView(np.zeros((4, 4, 3), dtype=np.uint8))
+
+
+def test_and_evaluates_cheap_check_first_and_short_circuits() -> None:
+    costs = MatcherCostModel()
+    costs.record("template", 0.020, True)
+    costs.record("bright", 0.0001, False)
+    calls: list[str] = []
+    composite = _composite(
+        {"and": [{"matcher": "template"}, {"matcher": "bright"}]},
+        {"template": True, "bright": False},
+        costs,
+        calls,
+    )
+
+    assert composite.evaluate(_view()) is False
+    assert calls == ["bright"]
+
+
+def test_or_prefers_cheap_likely_match() -> None:
+    costs = MatcherCostModel()
+    costs.record("slow", 0.010, False)
+    costs.record("fast", 0.001, True)
+    calls: list[str] = []
+    composite = _composite(
+        {"or": [{"matcher": "slow"}, {"matcher": "fast"}]},
+        {"slow": False, "fast": True},
+        costs,
+        calls,
+    )
+
+    assert composite.evaluate(_view()) is True
+    assert calls == ["fast"]
+
+
+def test_nested_not_uses_inverted_pass_rate() -> None:
+    costs = MatcherCostModel()
+    # black は安いがほぼ常に不一致 -> not black はほぼ常に一致するので後回し
+    for _ in range(10):
+        costs.record("black", 0.001, False)
+    costs.record("result", 0.002, False)
+    calls: list[str] = []
+    composite = _composite(
+        {"and": [{"not": {"matcher": "black"}}, {"matcher": "result"}]},
+        {"black": False, "result": False},
+        costs,
+        calls,
+    )
+
+    assert composite.evaluate(_view()) is False
+    assert calls == ["result"]
+
+
+def test_declaration_order_is_kept_without_cost_model() -> None:
+    calls: list[str] = []
+    lookup: dict[str, BaseMatcher] = {
+        "a": _StubMatcher(False, calls, "a"),
+        "b": _StubMatcher(False, calls, "b"),
+    }
+    composite = CompositeMatcher(
+        MatchExpression.parse_obj(
+            {"and": [{"matcher": "a"}, {"matcher": "b"}]}
+        ),
+        lookup,
+    )
+
+    assert composite.evaluate(_view()) is False
+    assert calls == ["a"]
+
+
+def test_cost_model_tracks_smoothed_cost_and_pass_rate() -> None:
+    costs = MatcherCostModel(smoothing=0.5)
+    costs.record("m", 0.010, True)
+    costs.record("m", 0.020, False)
+
+    snapshot = costs.snapshot()["m"]
+
+    assert snapshot["cost"] == 0.015
+    assert snapshot["evaluations"] == 2.0
+    assert costs.pass_rate("m") == 0.5
+
+
+def test_match_expression_evaluate_short_circuits() -> None:
+    calls: list[str] = []
+
+    async def _fn(name: str) -> bool:
+        calls.append(name)
+        return name == "yes"
+
+    expr = MatchExpression.parse_obj(
+        {
+            "or": [
+                {"and": [{"matcher": "no"}, {"matcher": "never"}]},
+                {"matcher": "yes"},
+                {"matcher": "skipped"},
+            ]
+        }
+    )
+
+    assert asyncio.run(expr.evaluate(_fn)) is True
+    assert calls == ["no", "yes"]
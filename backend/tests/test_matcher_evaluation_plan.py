@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+
+import cv2
+import numpy as np
+import pytest
+from splat_replay.domain.config import (
+    CompositeMatcherConfig,
+    ImageMatchingSettings,
+    MatchExpression,
+    MatcherConfig,
+)
+from splat_replay.infrastructure.matchers import MatcherRegistry
+from splat_replay.infrastructure.matchers.frame_view import FrameView
+
+ROI = {"x": 0, "y": 0, "width": 8, "height": 8}
+
+
+def _settings() -> ImageMatchingSettings:
+    return ImageMatchingSettings(
+        matchers={
+            "dark": MatcherConfig(type="brightness", max_value=20),
+            "red": MatcherConfig(
+                name="赤",
+                type="hsv",
+                roi=ROI,
+                lower_bound=(0, 200, 200),
+                upper_bound=(5, 255, 255),
+                threshold=0.9,
+            ),
+            "uniform": MatcherConfig(type="uniform", roi=ROI),
+        },
+        composites={
+            "red_screen": CompositeMatcherConfig(
+                rule=MatchExpression.parse_obj(
+                    {
+                        "and": [
+                            {"not": {"matcher": "dark"}},
+                            {"matcher": "red"},
+                            {"matcher": "uniform"},
+                        ]
+                    }
+                )
+            ),
+        },
+        matcher_groups={"colors": ["dark", "red"]},
+    )
+
+
+def _red_frame() -> np.ndarray:
+    frame = np.zeros((16, 16, 3), dtype=np.uint8)
+    frame[:, :] = (0, 0, 255)
+    return frame
+
+
+def test_frame_view_converts_each_roi_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[int] = []
+    original = cv2.cvtColor
+
+    def _counting_cvt(image: np.ndarray, code: int) -> np.ndarray:
+        calls.append(code)
+        return original(image, code)
+
+    monkeypatch.setattr(cv2, "cvtColor", _counting_cvt)
+    view = FrameView(_red_frame())
+    roi = (0, 0, 8, 8)
+
+    first = view.hsv(roi)
+    second = view.hsv(roi)
+    view.gray(None)
+    view.gray(None)
+
+    assert first is second
+    assert calls == [cv2.COLOR_BGR2HSV, cv2.COLOR_BGR2GRAY]
+
+
+def test_match_many_evaluates_composites_and_leaves_together() -> None:
+    registry = MatcherRegistry(_settings())
+    frame = _red_frame()
+
+    results = asyncio.run(
+        registry.match_many(["red_screen", "dark", "missing"], frame)
+    )
+
+    assert results == {"red_screen": True, "dark": False, "missing": False}
+
+
+def test_match_reuses_prefetched_results_for_same_frame(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = MatcherRegistry(_settings())
+    frame = _red_frame()
+
+    async def _run() -> tuple[bool, bool]:
+        await registry.match_many(["red_screen"], frame)
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("prefetched result should be reused")
+
+        monkeypatch.setattr(asyncio, "to_thread", _fail)
+        cached = await registry.match("red_screen", frame)
+        monkeypatch.undo()
+        other = await registry.match("red_screen", frame.copy())
+        return cached, other
+
+    cached, other = asyncio.run(_run())
+
+    assert cached is True
+    assert other is True
+
+
+def test_matched_name_returns_first_matching_name_in_group() -> None:
+    registry = MatcherRegistry(_settings())
+
+    name = asyncio.run(registry.matched_name("colors", _red_frame()))
+
+    assert name == "赤"
+
+
+def test_shared_leaf_is_computed_once_per_frame() -> None:
+    settings = _settings()
+    settings.composites["not_dark"] = CompositeMatcherConfig(
+        rule=MatchExpression.parse_obj({"not": {"matcher": "dark"}})
+    )
+    settings.composites["dark_or_red"] = CompositeMatcherConfig(
+        rule=MatchExpression.parse_obj(
+            {"or": [{"matcher": "dark"}, {"matcher": "red"}]}
+        )
+    )
+    registry = MatcherRegistry(settings)
+    frame = _red_frame()
+
+    async def _run() -> None:
+        await registry.match("not_dark", frame)
+        await registry.match("dark_or_red", frame)
+        await registry.match("not_dark", frame)
+        await registry.match("not_dark", frame.copy())
+
+    asyncio.run(_run())
+    stats = registry.cache_stats()
+
+    assert stats["frames"] == 2
+    assert stats["result_hits"] == 1
+    # dark: 1 フレーム目で 1 回ミスして 1 回ヒット、2 フレーム目で再計算
+    assert registry.costs.snapshot()["dark"]["evaluations"] == 2.0
+    assert stats["hits"] == 1
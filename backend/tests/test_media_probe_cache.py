@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import subprocess
+from collections.abc import Sequence
+from pathlib import Path
+from subprocess import CompletedProcess
+from typing import cast
+
+import pytest
+from structlog.stdlib import BoundLogger
+
+from splat_replay.infrastructure.adapters.video import media_probe_cache
+from splat_replay.infrastructure.adapters.video.ffmpeg_processor import (
+    FFmpegProcessor,
+)
+from splat_replay.infrastructure.adapters.video.media_probe_cache import (
+    MediaProbe,
+    MediaProbeCache,
+)
+
+_PROBE_OUTPUT = json.dumps(
+    {
+        "streams": [
+            {"index": 0, "codec_type": "video", "codec_name": "h264"},
+            {"index": 1, "codec_type": "audio", "codec_name": "aac"},
+            {"index": 2, "codec_type": "audio", "codec_name": "aac"},
+            {"index": 3, "codec_type": "subtitle", "codec_name": "subrip"},
+        ],
+        "format": {
+            "duration": "182.5",
+            "tags": {"TITLE": "title", "Comment": "description"},
+        },
+    }
+)
+
+
+class _DummyLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def info(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def warning(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def error(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+
+class _StubProcessor(FFmpegProcessor):
+    """ffprobe を起動せず、呼び出し回数だけを数える。"""
+
+    def __init__(
+        self,
+        cache: MediaProbeCache | None,
+        *,
+        stdout: str = _PROBE_OUTPUT,
+        returncode: int = 0,
+        delay: float = 0.0,
+        timeout: bool = False,
+    ) -> None:
+        super().__init__(cast(BoundLogger, _DummyLogger()), probe_cache=cache)
+        self.commands: list[list[str]] = []
+        self._stdout = stdout
+        self._returncode = returncode
+        self._delay = delay
+        self._timeout = timeout
+
+    async def _run_text(
+        self,
+        command: Sequence[str],
+        *,
+        cwd: Path | None = None,
+        input_text: str | None = None,
+        timeout: float | None = None,
+    ) -> CompletedProcess[str]:
+        self.commands.append(list(command))
+        await asyncio.sleep(self._delay)
+        if self._timeout:
+            raise subprocess.TimeoutExpired(list(command), timeout or 0)
+        return CompletedProcess(
+            args=list(command),
+            returncode=self._returncode,
+            stdout=self._stdout,
+            stderr="",
+        )
+
+
+def _video(tmp_path: Path, name: str = "battle.mkv") -> Path:
+    video = tmp_path / name
+    video.write_bytes(b"video")
+    return video
+
+
+def _cache(tmp_path: Path) -> MediaProbeCache:
+    return MediaProbeCache(
+        tmp_path / "cache" / "media_probe_cache.sqlite3",
+        cast(BoundLogger, _DummyLogger()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_one_probe_answers_length_metadata_and_streams(
+    tmp_path: Path,
+) -> None:
+    video = _video(tmp_path)
+    processor = _StubProcessor(_cache(tmp_path))
+
+    assert await processor.get_video_length(video) == 182.5
+    assert await processor.get_metadata(video) == {
+        "title": "title",
+        "comment": "description",
+    }
+    assert await processor._find_streams(video, "subtitle", "subrip") == [3]
+    assert await processor._count_streams(video, "audio") == 2
+    assert len(processor.commands) == 1
+    assert "-show_format" in processor.commands[0]
+    assert "-show_streams" in processor.commands[0]
+
+
+@pytest.mark.asyncio
+async def test_cache_survives_restart_until_file_changes(
+    tmp_path: Path,
+) -> None:
+    video = _video(tmp_path)
+    await _StubProcessor(_cache(tmp_path)).get_video_length(video)
+
+    restarted = _StubProcessor(_cache(tmp_path))
+    assert await restarted.get_video_length(video) == 182.5
+    assert restarted.commands == []
+
+    video.write_bytes(b"re-encoded video")
+    assert await restarted.get_video_length(video) == 182.5
+    assert len(restarted.commands) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_probe(tmp_path: Path) -> None:
+    video = _video(tmp_path)
+    processor = _StubProcessor(_cache(tmp_path), delay=0.02)
+
+    lengths = await asyncio.gather(
+        *(processor.get_video_length(video) for _ in range(5))
+    )
+
+    assert lengths == [182.5] * 5
+    assert len(processor.commands) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_is_not_repeated_or_persisted(
+    tmp_path: Path,
+) -> None:
+    video = _video(tmp_path)
+    cache = _cache(tmp_path)
+    processor = _StubProcessor(cache, stdout="", returncode=1)
+
+    assert await processor.get_video_length(video) is None
+    assert await processor.get_metadata(video) == {}
+    assert len(processor.commands) == 1
+    assert cache.get(video.resolve(), video.stat()) is None
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_retried_on_next_request(tmp_path: Path) -> None:
+    video = _video(tmp_path)
+    processor = _StubProcessor(None, timeout=True)
+
+    assert await processor.get_video_length(video) is None
+    assert await processor.get_video_length(video) is None
+    assert len(processor.commands) == 2
+
+
+def test_cache_rebuilds_corrupt_file(tmp_path: Path) -> None:
+    video = _video(tmp_path)
+    cache_file = tmp_path / "media_probe_cache.sqlite3"
+    cache_file.write_text("{broken", encoding="utf-8")
+    cache = MediaProbeCache(cache_file, cast(BoundLogger, _DummyLogger()))
+
+    assert cache.get(video, video.stat()) is None
+
+    probe = MediaProbe.from_ffprobe(json.loads(_PROBE_OUTPUT))
+    cache.put(video, video.stat(), probe)
+    assert cache.get(video, video.stat()) == probe
+
+
+def test_cache_drops_oldest_entries_beyond_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(media_probe_cache, "_MAX_ENTRIES", 2)
+    cache = _cache(tmp_path)
+    probe = MediaProbe.from_ffprobe(json.loads(_PROBE_OUTPUT))
+    videos = [_video(tmp_path, f"battle{i}.mkv") for i in range(3)]
+    cache.put(videos[0], videos[0].stat(), probe)
+    cache.put(videos[1], videos[1].stat(), probe)
+    # 書き直した動画は新しい扱いになる
+    cache.put(videos[0], videos[0].stat(), probe)
+    cache.put(videos[2], videos[2].stat(), probe)
+
+    assert cache.get(videos[0], videos[0].stat()) == probe
+    assert cache.get(videos[1], videos[1].stat()) is None
+    assert cache.get(videos[2], videos[2].stat()) == probe
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pytest
+
+from splat_replay.application.interfaces import (
+    LoggerPort,
+    WeaponCandidateScore,
+    WeaponRecognitionPort,
+    WeaponRecognitionResult,
+    WeaponSlotResult,
+)
+from splat_replay.application.services.recording.offline_analyzer import (
+    OfflineRecordingAnalyzer,
+    _DiscardingEventBus,
+)
+from splat_replay.domain.models import Frame, Judgement
+from splat_replay.domain.services import FrameAnalyzer
+
+_FPS = 10.0
+
+_BATTLE = 1
+_FINISH = 2
+_JUDGEMENT = 3
+_RESULT = 4
+
+_SLOTS = (
+    "ally_1",
+    "ally_2",
+    "ally_3",
+    "ally_4",
+    "enemy_1",
+    "enemy_2",
+    "enemy_3",
+    "enemy_4",
+)
+
+
+def _timeline(*sections: tuple[int, float]) -> list[int]:
+    scenes: list[int] = []
+    for scene, seconds in sections:
+        scenes.extend([scene] * round(seconds * _FPS))
+    return scenes
+
+
+def _scene(frame: Frame) -> int:
+    return int(frame[0, 0, 0])
+
+
+class _DummyLogger:
+    def debug(self, event: str, **kw: object) -> None:
+        return None
+
+    def info(self, event: str, **kw: object) -> None:
+        return None
+
+    def warning(self, event: str, **kw: object) -> None:
+        return None
+
+    def error(self, event: str, **kw: object) -> None:
+        return None
+
+    def exception(self, event: str, **kw: object) -> None:
+        return None
+
+
+class _ScriptedVideo:
+    """シーン番号を画素値に持つフレーム列を返す動画。"""
+
+    def __init__(self, scenes: list[int]) -> None:
+        self._scenes = scenes
+        self._next_index = 0
+        self._current_index: int | None = None
+        self.read_indices: list[int] = []
+        self.setup_calls = 0
+        self.teardown_calls = 0
+
+    def setup(self) -> None:
+        self.setup_calls += 1
+        self._next_index = 0
+
+    def teardown(self) -> None:
+        self.teardown_calls += 1
+
+    def seek(self, seconds: float) -> None:
+        self._next_index = round(seconds * _FPS)
+
+    def capture(self) -> Frame | None:
+        if self._next_index >= len(self._scenes):
+            return None
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+        frame[0, 0, 0] = self._scenes[self._next_index]
+        self._current_index = self._next_index
+        self.read_indices.append(self._next_index)
+        self._next_index += 1
+        return frame
+
+    def current_time_seconds(self) -> float | None:
+        if self._current_index is None:
+            return None
+        return self._current_index / _FPS
+
+
+class _SceneAnalyzer:
+    async def prefetch(self, frame: Frame, keys: object) -> None:
+        return None
+
+    async def detect_session_abort(self, frame: Frame, gm: object) -> bool:
+        return False
+
+    async def detect_communication_error(
+        self, frame: Frame, gm: object
+    ) -> bool:
+        return False
+
+    async def detect_session_finish(self, frame: Frame, gm: object) -> bool:
+        return _scene(frame) == _FINISH
+
+    async def detect_session_judgement(self, frame: Frame, gm: object) -> bool:
+        return _scene(frame) == _JUDGEMENT
+
+    async def extract_session_judgement(
+        self, frame: Frame, gm: object
+    ) -> Judgement | None:
+        return Judgement.WIN
+
+    async def detect_loading(self, frame: Frame) -> bool:
+        return False
+
+    async def detect_session_result(self, frame: Frame, gm: object) -> bool:
+        return _scene(frame) == _RESULT
+
+    async def extract_session_result(self, frame: Frame, gm: object) -> None:
+        return None
+
+
+class _Recognizer:
+    def request_cancel(self) -> None:
+        return None
+
+    async def detect_weapon_display(self, frame: Frame) -> bool:
+        return True
+
+    async def recognize_weapons(
+        self,
+        frame: Frame,
+        save_predict_weapons_output: bool = True,
+        target_slots: set[str] | None = None,
+        previous_results: dict[str, WeaponSlotResult] | None = None,
+        battle_dir_name: str | None = None,
+    ) -> WeaponRecognitionResult:
+        labels = [f"weapon_{index}" for index in range(len(_SLOTS))]
+        return WeaponRecognitionResult(
+            allies=(labels[0], labels[1], labels[2], labels[3]),
+            enemies=(labels[4], labels[5], labels[6], labels[7]),
+            slot_results=tuple(
+                WeaponSlotResult(
+                    slot=slot,
+                    predicted_weapon=labels[index],
+                    is_unmatched=False,
+                    top_candidates=(
+                        WeaponCandidateScore(
+                            weapon=labels[index], score=0.9, threshold=0.85
+                        ),
+                    ),
+                )
+                for index, slot in enumerate(_SLOTS)
+            ),
+        )
+
+    async def save_predict_weapons_output(
+        self,
+        frame: Frame,
+        slot_results: tuple[WeaponSlotResult, ...],
+        battle_dir_name: str | None = None,
+    ) -> str | None:
+        return None
+
+
+def _build_analyzer() -> OfflineRecordingAnalyzer:
+    return OfflineRecordingAnalyzer(
+        analyzer=cast(FrameAnalyzer, _SceneAnalyzer()),
+        weapon_recognizer=cast(WeaponRecognitionPort, _Recognizer()),
+        logger=cast(LoggerPort, _DummyLogger()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_analyze_derives_metadata_without_reading_every_frame() -> None:
+    video = _ScriptedVideo(
+        _timeline(
+            (_BATTLE, 120.0),
+            (_FINISH, 0.2),
+            (_JUDGEMENT, 5.0),
+            (_RESULT, 10.0),
+        )
+    )
+
+    result = await _build_analyzer().analyze(video)
+
+    assert result.outcome == "completed"
+    assert result.metadata.judgement is Judgement.WIN
+    assert result.metadata.allies == (
+        "weapon_0",
+        "weapon_1",
+        "weapon_2",
+        "weapon_3",
+    )
+    assert result.result_frame is not None
+    assert _scene(result.result_frame) == _RESULT
+    # 2 フレームしかない終了表示も区間の読み直しで拾える
+    assert 1200 in video.read_indices
+    assert result.frames_analyzed < len(video._scenes) // 4
+    assert video.setup_calls == 1
+    assert video.teardown_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_analyze_reports_incomplete_when_video_ends_in_battle() -> None:
+    video = _ScriptedVideo(_timeline((_BATTLE, 60.0)))
+
+    result = await _build_analyzer().analyze(video)
+
+    assert result.outcome == "incomplete"
+    assert result.metadata.judgement is None
+    assert result.result_frame is None
+    assert video.teardown_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_analyze_continues_from_judgement_when_finish_is_missing() -> (
+    None
+):
+    video = _ScriptedVideo(
+        _timeline((_BATTLE, 30.0), (_JUDGEMENT, 5.0), (_RESULT, 5.0))
+    )
+
+    result = await _build_analyzer().analyze(video)
+
+    assert result.outcome == "completed"
+    assert result.metadata.judgement is Judgement.WIN
+
+
+def test_discarding_event_bus_subscription_is_empty() -> None:
+    subscription = _DiscardingEventBus().subscribe({"recording.started"})
+
+    assert subscription.poll() == []
+    subscription.close()
@@ -14,6 +14,12 @@ from splat_replay.infrastructure.adapters import (
 from splat_replay.infrastructure.adapters.audio import (
     _LAZY_EXPORTS as AUDIO_LAZY_EXPORTS,
 )
+from splat_replay.infrastructure.adapters.upload import (
+    _LAZY_EXPORTS as UPLOAD_LAZY_EXPORTS,
+)
+from splat_replay.infrastructure.adapters.weapon_detection import (
+    _LAZY_EXPORTS as WEAPON_DETECTION_LAZY_EXPORTS,
+)
 
 
 def _resolve_module_name(package_name: str, module_name: str) -> str:
@@ -38,6 +44,11 @@ def test_collect_pyinstaller_hiddenimports_covers_all_lazy_exports() -> None:
         ("splat_replay.infrastructure", INFRASTRUCTURE_LAZY_EXPORTS),
         ("splat_replay.infrastructure.adapters", ADAPTERS_LAZY_EXPORTS),
         ("splat_replay.infrastructure.adapters.audio", AUDIO_LAZY_EXPORTS),
+        ("splat_replay.infrastructure.adapters.upload", UPLOAD_LAZY_EXPORTS),
+        (
+            "splat_replay.infrastructure.adapters.weapon_detection",
+            WEAPON_DETECTION_LAZY_EXPORTS,
+        ),
     )
 
     for package_name, lazy_exports in lazy_export_packages:
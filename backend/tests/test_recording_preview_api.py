@@ -3,11 +3,13 @@ from __future__ import annotations
 from types import SimpleNamespace
 from typing import Any
 
+import cv2
 import numpy as np
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from splat_replay.interface.web.preview_frame import PreviewFrameEncoder
 from splat_replay.interface.web.routers.recording import (
     create_recording_router,
 )
@@ -18,10 +20,24 @@ pytestmark = pytest.mark.contract
 class _StaticFrameSource:
     def __init__(self, frame: np.ndarray | None) -> None:
         self._frame = frame
+        self.sequence = 0 if frame is None else 1
+
+    def publish(self, frame: np.ndarray) -> None:
+        self._frame = frame
+        self.sequence += 1
 
     def get_latest(self) -> np.ndarray | None:
         return self._frame
 
+    def get_latest_with_sequence(self) -> tuple[int, np.ndarray | None]:
+        return self.sequence, self._frame
+
+    def add_listener(self, cb: Any) -> None:
+        _ = cb
+
+    def remove_listener(self, cb: Any) -> None:
+        _ = cb
+
 
 def _build_server(
     frame: np.ndarray | None,
@@ -59,12 +75,57 @@ def test_get_preview_frame_returns_jpeg_when_frame_exists() -> None:
 
     assert response.status_code == 200
     assert response.headers["content-type"].startswith("image/jpeg")
-    assert response.headers["cache-control"] == (
-        "no-store, no-cache, must-revalidate, max-age=0"
-    )
+    assert response.headers["cache-control"] == "no-cache, max-age=0"
+    assert response.headers["etag"]
     assert response.content
 
 
+def test_get_preview_frame_returns_304_until_a_new_frame_arrives() -> None:
+    server = _build_server(np.full((24, 32, 3), 96, dtype=np.uint8))
+    app = FastAPI()
+    app.include_router(create_recording_router(server))
+
+    with TestClient(app) as client:
+        first = client.get("/api/recorder/preview-frame")
+        etag = first.headers["etag"]
+        unchanged = client.get(
+            "/api/recorder/preview-frame", headers={"If-None-Match": etag}
+        )
+        server.frame_source.publish(np.zeros((24, 32, 3), dtype=np.uint8))
+        changed = client.get(
+            "/api/recorder/preview-frame", headers={"If-None-Match": etag}
+        )
+
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_preview_encoder_encodes_each_frame_once_at_preview_size(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = _StaticFrameSource(np.zeros((1080, 1920, 3), dtype=np.uint8))
+    encoder = PreviewFrameEncoder(source, max_width=640)
+    encoded_shapes: list[tuple[int, ...]] = []
+    original = cv2.imencode
+
+    def counting_imencode(ext: str, img: np.ndarray, params: Any) -> Any:
+        encoded_shapes.append(img.shape)
+        return original(ext, img, params)
+
+    monkeypatch.setattr(cv2, "imencode", counting_imencode)
+
+    first = encoder.latest()
+    assert encoder.latest() is first
+    source.publish(np.zeros((1080, 1920, 3), dtype=np.uint8))
+    second = encoder.latest()
+
+    assert first is not None and second is not None
+    assert second.etag != first.etag
+    assert encoded_shapes == [(360, 640, 3), (360, 640, 3)]
+
+
 def test_get_preview_mode_returns_live_capture_when_test_video_is_not_set() -> (
     None
 ):
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from splat_replay.domain.config import ImageMatchingSettings, MatcherConfig
+from splat_replay.infrastructure.matchers import MatcherRegistry, utils
+from splat_replay.infrastructure.matchers.template import TemplateMatcher
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_images() -> None:
+    utils.clear_shared_images()
+
+
+def _write_image(path: Path, value: int) -> None:
+    assert cv2.imwrite(str(path), np.full((4, 4, 3), value, dtype=np.uint8))
+
+
+def _touch_later(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_template_is_decoded_once_and_shared_read_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    template_path = tmp_path / "template.png"
+    _write_image(template_path, 0)
+    decoded: list[Path] = []
+    original = utils.imread_unicode
+
+    def counting_imread(file_path: Path, flags: int = cv2.IMREAD_COLOR):
+        decoded.append(file_path)
+        return original(file_path, flags)
+
+    monkeypatch.setattr(utils, "imread_unicode", counting_imread)
+
+    first = utils.load_shared_image(template_path)
+    TemplateMatcher(template_path, threshold=0.5)
+    TemplateMatcher(template_path, threshold=0.9)
+
+    assert decoded == [template_path]
+    assert first is not None
+    assert utils.load_shared_image(template_path) is first
+    with pytest.raises(ValueError):
+        first[0, 0] = 255
+
+
+def test_changed_image_is_decoded_again(tmp_path: Path) -> None:
+    template_path = tmp_path / "template.png"
+    _write_image(template_path, 0)
+    before = utils.load_shared_image(template_path)
+
+    _write_image(template_path, 255)
+    _touch_later(template_path)
+    after = utils.load_shared_image(template_path)
+
+    assert before is not None and after is not None
+    assert after is not before
+    assert int(after[0, 0, 0]) == 255
+
+
+def test_registry_reload_replaces_matchers() -> None:
+    registry = MatcherRegistry(
+        ImageMatchingSettings(
+            matchers={"dark": MatcherConfig(type="brightness", max_value=20)}
+        )
+    )
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+    assert asyncio.run(registry.match("dark", frame)) is True
+
+    registry.reload(
+        ImageMatchingSettings(
+            matchers={
+                "bright": MatcherConfig(type="brightness", min_value=200)
+            }
+        )
+    )
+
+    assert asyncio.run(registry.match("dark", frame)) is False
+    assert set(registry.matchers) == {"bright"}
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import cast
+
+import numpy as np
+import pytest
+
+from splat_replay.application.interfaces import EventPublisher, LoggerPort
+from splat_replay.application.services.common.progress import (
+    ProgressEvent,
+    ProgressReporter,
+)
+from splat_replay.domain.config import ImageMatchingSettings, MatcherConfig
+from splat_replay.infrastructure.matchers import LazyMatcherRegistry
+from splat_replay.infrastructure.runtime.startup import (
+    WARM_UP_TASK_ID,
+    LazyComponent,
+    StartupProfile,
+    warm_up_components,
+)
+
+
+class _RecordingLogger:
+    def __init__(self) -> None:
+        self.records: list[tuple[str, dict[str, object]]] = []
+
+    def debug(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def info(self, event: str, **kw: object) -> None:
+        self.records.append((event, kw))
+
+    def warning(self, event: str, **kw: object) -> None:
+        self.records.append((event, kw))
+
+    def error(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+    def exception(self, event: str, **kw: object) -> None:
+        _ = event, kw
+
+
+class _DummyPublisher:
+    def publish(self, event_type: str, payload: object = None) -> None:
+        _ = event_type, payload
+
+
+class _Component(LazyComponent[object]):
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__(self._build)
+        self.builds = 0
+        self._fail = fail
+
+    def _build(self) -> object:
+        self.builds += 1
+        if self._fail:
+            raise RuntimeError("broken")
+        return object()
+
+
+def _dark_settings(name: str) -> ImageMatchingSettings:
+    return ImageMatchingSettings(
+        matchers={name: MatcherConfig(type="brightness", max_value=20)}
+    )
+
+
+def test_lazy_component_builds_once_across_threads() -> None:
+    component = _Component()
+    assert not component.is_ready
+
+    workers = [threading.Thread(target=component.warm_up) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert component.is_ready
+    assert component.builds == 1
+
+
+def test_lazy_matcher_registry_builds_on_first_match() -> None:
+    matcher = LazyMatcherRegistry(_dark_settings("dark"))
+    assert not matcher.is_ready
+
+    # 構築前の設定変更は構築時に反映される
+    matcher.reload(_dark_settings("black"))
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    assert asyncio.run(matcher.match("black", frame)) is True
+    assert asyncio.run(matcher.match("dark", frame)) is False
+    assert matcher.is_ready
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_progress_and_breakdown() -> None:
+    logger = _RecordingLogger()
+    progress = ProgressReporter(
+        cast(EventPublisher, _DummyPublisher()), cast(LoggerPort, logger)
+    )
+    events: list[ProgressEvent] = []
+    progress.add_listener(events.append)
+    profile = StartupProfile()
+    ready, broken, fine = _Component(), _Component(fail=True), _Component()
+    ready.warm_up()
+
+    succeeded = await warm_up_components(
+        [("ready", ready), ("broken", broken), ("fine", fine)],
+        progress,
+        profile,
+        cast(LoggerPort, logger),
+    )
+
+    assert succeeded is False
+    assert fine.is_ready and not broken.is_ready
+    assert {event.task_id for event in events} == {WARM_UP_TASK_ID}
+    assert events[0].kind == "start"
+    assert events[0].items == ["broken", "fine"]
+    assert [
+        event.success for event in events if event.kind == "item_finish"
+    ] == [False, True]
+    assert events[-1].kind == "finish" and events[-1].success is False
+    assert [stage.name for stage in profile.stages] == [
+        "warm_up:broken",
+        "warm_up:fine",
+    ]
+    message, fields = logger.records[-1]
+    assert message == "起動準備が完了しました"
+    assert set(cast(dict[str, float], fields["breakdown_ms"])) == {
+        "warm_up:broken",
+        "warm_up:fine",
+    }
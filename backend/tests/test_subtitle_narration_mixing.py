@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+
+from splat_replay.application.services.editing.subtitle_processor import (
+    SubtitleProcessor,
+)
+
+_RATE = 10
+
+
+def _pcm(*samples: int) -> bytes:
+    return np.array(samples, dtype="<i2").tobytes()
+
+
+def _render(
+    segments: list[tuple[float, bytes]], chunk_frames: int | None = None
+) -> tuple[tuple[int, int, int], np.ndarray]:
+    placed = SubtitleProcessor._place_segments(segments, _RATE)
+    frame_count = max(start + len(samples) for start, samples in placed)
+    data = b"".join(
+        SubtitleProcessor._wave_chunks(
+            placed, frame_count, _RATE, chunk_frames=chunk_frames
+        )
+    )
+    with wave.open(io.BytesIO(data), "rb") as reader:
+        params = (
+            reader.getnchannels(),
+            reader.getsampwidth(),
+            reader.getframerate(),
+        )
+        frames = reader.readframes(reader.getnframes())
+    return params, np.frombuffer(frames, dtype="<i2")
+
+
+def test_wave_chunks_place_segments_on_timeline() -> None:
+    params, samples = _render([(0.2, _pcm(1, 2, 3)), (0.6, _pcm(4, 5))])
+
+    assert params == (1, 2, _RATE)
+    assert samples.tolist() == [0, 0, 1, 2, 3, 0, 4, 5]
+
+
+def test_wave_chunks_mix_overlaps_and_clip_once() -> None:
+    _, samples = _render(
+        [
+            (0.0, _pcm(30000, 30000, -30000)),
+            (0.1, _pcm(30000, -30000)),
+            (0.1, _pcm(-30000, 100)),
+        ]
+    )
+
+    assert samples.tolist() == [30000, 30000, -32768]
+
+
+def test_wave_chunks_match_across_chunk_boundaries() -> None:
+    segments = [
+        (0.0, _pcm(*range(1, 8))),
+        (0.3, _pcm(*range(100, 110))),
+        (1.5, _pcm(7, 7)),
+    ]
+
+    _, whole = _render(segments)
+    _, chunked = _render(segments, chunk_frames=4)
+
+    assert chunked.tolist() == whole.tolist()
+    assert len(whole) == 17
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import cast
+
+import numpy as np
+import pytest
+
+from splat_replay.application.interfaces import (
+    ConfigPort,
+    FileSystemPort,
+    LoggerPort,
+    SpeechSynthesisRequest,
+    SpeechSynthesisResult,
+    SubtitleEditorPort,
+    TextToSpeechPort,
+    VideoAssetRepositoryPort,
+    VideoEditorPort,
+)
+from splat_replay.application.services.editing.subtitle_processor import (
+    SubtitleProcessor,
+)
+from splat_replay.domain.config.video_edit import (
+    SubtitleSpeechSettings,
+    VideoEditSettings,
+)
+
+_SRT = """1
+00:00:00,000 --> 00:00:01,000
+いち
+
+2
+00:00:01,000 --> 00:00:02,000
+に
+
+3
+00:00:02,000 --> 00:00:03,000
+さん
+
+4
+00:00:03,000 --> 00:00:04,000
+よん
+"""
+
+
+class _DummyLogger:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def info(self, event: str, **kw: object) -> None:
+        return None
+
+    def warning(self, event: str, **kw: object) -> None:
+        return None
+
+    def error(self, event: str, **kw: object) -> None:
+        self.errors.append(event)
+
+
+class _DummyConfig:
+    def __init__(self, settings: VideoEditSettings) -> None:
+        self._settings = settings
+
+    def get_video_edit_settings(self) -> VideoEditSettings:
+        return self._settings
+
+
+class _SlowTextToSpeech:
+    def __init__(self, failing: str | None = None) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self.max_active = 0
+        self._failing = failing
+
+    def synthesize(
+        self, request: SpeechSynthesisRequest
+    ) -> SpeechSynthesisResult:
+        with self._lock:
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            time.sleep(0.05)
+            if request.text == self._failing:
+                raise RuntimeError("quota exceeded")
+            sample = len(request.text) * 100
+            return SpeechSynthesisResult(
+                audio=np.full(2, sample, dtype="<i2").tobytes(),
+                sample_rate_hz=request.sample_rate_hz,
+            )
+        finally:
+            with self._lock:
+                self._active -= 1
+
+
+class _MemoryFileSystem:
+    def __init__(self) -> None:
+        self.files: dict[Path, bytes] = {}
+
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> None:
+        self.files[path] = b"".join(chunks)
+
+
+def _build(
+    tts: _SlowTextToSpeech, max_concurrent_requests: int
+) -> tuple[SubtitleProcessor, _MemoryFileSystem, _DummyLogger]:
+    settings = VideoEditSettings(
+        speech=SubtitleSpeechSettings(
+            enabled=True,
+            sample_rate_hz=1,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+    )
+    file_system = _MemoryFileSystem()
+    logger = _DummyLogger()
+    processor = SubtitleProcessor(
+        cast(LoggerPort, logger),
+        cast(ConfigPort, _DummyConfig(settings)),
+        cast(SubtitleEditorPort, object()),
+        cast(TextToSpeechPort, tts),
+        cast(VideoEditorPort, object()),
+        cast(VideoAssetRepositoryPort, object()),
+        cast(FileSystemPort, file_system),
+    )
+    return processor, file_system, logger
+
+
+@pytest.mark.asyncio
+async def test_synthesis_runs_concurrently_up_to_limit(tmp_path: Path) -> None:
+    tts = _SlowTextToSpeech()
+    processor, file_system, _ = _build(tts, max_concurrent_requests=2)
+
+    narration = await processor._synthesize_narration(
+        tmp_path / "edited.mkv", _SRT
+    )
+
+    assert narration == tmp_path / "edited_narration.wav"
+    assert tts.max_active == 2
+    samples = np.frombuffer(file_system.files[narration][44:], dtype="<i2")
+    # 完了順によらず字幕の開始位置に配置される
+    assert samples.tolist() == [200, 200 + 100, 100 + 200, 200 + 200, 200]
+
+
+@pytest.mark.asyncio
+async def test_synthesis_failure_skips_narration(tmp_path: Path) -> None:
+    tts = _SlowTextToSpeech(failing="さん")
+    processor, file_system, logger = _build(tts, max_concurrent_requests=4)
+
+    narration = await processor._synthesize_narration(
+        tmp_path / "edited.mkv", _SRT
+    )
+
+    assert narration is None
+    assert file_system.files == {}
+    assert logger.errors == ["字幕読み上げ生成に失敗しました"]
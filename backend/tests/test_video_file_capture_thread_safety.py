@@ -71,3 +71,51 @@ def test_setup_does_not_release_capture_during_read(monkeypatch) -> None:
     setup_thread.join(timeout=2)
 
     assert not first_capture.released_during_read
+
+
+class _SeekRecordingVideoCapture(_FakeVideoCapture):
+    def __init__(self) -> None:
+        super().__init__()
+        self.allow_read_finish.set()
+        self.position_frames = 0
+        self.grab_calls = 0
+        self.set_calls: list[tuple[int, float]] = []
+
+    def get(self, prop: int) -> float:
+        if prop == video_file_capture.cv2.CAP_PROP_POS_FRAMES:
+            return float(self.position_frames)
+        return super().get(prop)
+
+    def set(self, prop: int, value: float) -> bool:
+        self.set_calls.append((prop, value))
+        return True
+
+    def grab(self) -> bool:
+        self.grab_calls += 1
+        self.position_frames += 1
+        return True
+
+
+def test_seek_grabs_short_forward_moves_and_sets_position_otherwise(
+    monkeypatch,
+) -> None:
+    fake = _SeekRecordingVideoCapture()
+    monkeypatch.setattr(
+        video_file_capture, "resolve_video_input_path", lambda path: path
+    )
+    monkeypatch.setattr(
+        video_file_capture.cv2, "VideoCapture", lambda _path: fake
+    )
+
+    capture = VideoFileCapture(Path("dummy.mkv"), MagicMock())
+    capture.setup()
+
+    capture.seek(0.1)
+    assert fake.grab_calls == 3
+    assert fake.set_calls == []
+
+    capture.seek(10.0)
+    assert fake.grab_calls == 3
+    assert fake.set_calls == [
+        (video_file_capture.cv2.CAP_PROP_POS_MSEC, 10000.0)
+    ]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+
+import cv2
+import numpy as np
+import pytest
+from splat_replay.infrastructure.adapters.weapon_detection.batch_scorer import (
+    BatchTemplateScorer,
+)
+
+
+def _random_templates(
+    rng: np.random.Generator, count: int, shape: tuple[int, int]
+) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    templates = [
+        rng.integers(0, 256, size=shape, dtype=np.uint8) for _ in range(count)
+    ]
+    masks = []
+    for _ in range(count):
+        mask = np.zeros(shape, dtype=np.uint8)
+        mask[rng.random(shape) < 0.4] = 255
+        masks.append(mask)
+    return templates, masks
+
+
+def _reference_score(
+    query: np.ndarray, template: np.ndarray, mask: np.ndarray, top_k: int
+) -> float:
+    result = cv2.matchTemplate(
+        query, template, cv2.TM_CCOEFF_NORMED, mask=mask
+    )
+    values = result[np.isfinite(result)].ravel()
+    if values.size == 0:
+        return -1.0
+    return float(np.sort(values)[::-1][:top_k].mean())
+
+
+@pytest.mark.parametrize("top_k", [1, 3])
+def test_scores_match_opencv_masked_ccoeff_normed(top_k: int) -> None:
+    rng = np.random.default_rng(0)
+    templates, masks = _random_templates(rng, 6, (20, 18))
+    query = rng.integers(0, 256, size=(28, 26), dtype=np.uint8)
+    scorer = BatchTemplateScorer.from_templates(
+        templates, masks, response_top_k=top_k
+    )
+
+    scores = scorer.score(query)
+
+    expected = [
+        _reference_score(query, template, mask, top_k)
+        for template, mask in zip(templates, masks)
+    ]
+    assert scores == pytest.approx(expected, abs=1e-4)
+
+
+def test_scores_subset_in_requested_order_across_sizes() -> None:
+    rng = np.random.default_rng(1)
+    small, small_masks = _random_templates(rng, 2, (10, 10))
+    large, large_masks = _random_templates(rng, 2, (16, 12))
+    scorer = BatchTemplateScorer.from_templates(
+        [small[0], large[0], small[1], large[1]],
+        [small_masks[0], large_masks[0], small_masks[1], large_masks[1]],
+    )
+    query = rng.integers(0, 256, size=(24, 20), dtype=np.uint8)
+
+    full = scorer.score(query)
+    subset = scorer.score(query, [3, 0])
+
+    assert len(scorer) == 4
+    assert subset == pytest.approx([full[3], full[0]])
+
+
+def test_flat_query_scores_minus_one() -> None:
+    rng = np.random.default_rng(2)
+    templates, masks = _random_templates(rng, 2, (8, 8))
+    scorer = BatchTemplateScorer.from_templates(templates, masks)
+
+    scores = scorer.score(np.full((12, 12), 128, dtype=np.uint8))
+
+    assert scores.tolist() == [-1.0, -1.0]
+
+
+def test_cancel_check_aborts_scoring() -> None:
+    rng = np.random.default_rng(3)
+    templates, masks = _random_templates(rng, 2, (8, 8))
+    scorer = BatchTemplateScorer.from_templates(templates, masks)
+
+    with pytest.raises(asyncio.CancelledError):
+        scorer.score(
+            np.zeros((12, 12), dtype=np.uint8), cancel_check=lambda: True
+        )
+
+
+def test_downsampled_scorer_matches_block_averaged_templates() -> None:
+    rng = np.random.default_rng(4)
+    templates = [
+        rng.integers(0, 256, size=(12, 10), dtype=np.uint8) for _ in range(3)
+    ]
+    query = rng.integers(0, 256, size=(20, 18), dtype=np.uint8)
+    scorer = BatchTemplateScorer.from_templates(templates, [None] * 3)
+
+    coarse = scorer.downsampled(2)
+
+    def _block_mean(image: np.ndarray) -> np.ndarray:
+        height, width = image.shape[0] // 2, image.shape[1] // 2
+        return (
+            image[: height * 2, : width * 2]
+            .astype(np.float32)
+            .reshape(height, 2, width, 2)
+            .mean(axis=(1, 3))
+        )
+
+    expected = [
+        _reference_score(
+            _block_mean(query),
+            _block_mean(template),
+            np.ones((6, 5), dtype=np.uint8),
+            1,
+        )
+        for template in templates
+    ]
+    assert len(coarse) == 3
+    assert coarse.score(query, [2, 0, 1]) == pytest.approx(
+        [expected[2], expected[0], expected[1]], abs=1e-4
+    )
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
+import time
 from pathlib import Path
 
 import cv2
@@ -18,6 +20,10 @@ from splat_replay.infrastructure.adapters.weapon_detection import constants
 from splat_replay.infrastructure.adapters.weapon_detection.constants import (
     UNKNOWN_WEAPON_LABEL,
 )
+from splat_replay.infrastructure.adapters.weapon_detection.query_builder import (
+    build_padded_gray_by_slot,
+    crop_slot_images,
+)
 from splat_replay.infrastructure.adapters.weapon_detection.recognizer import (
     WeaponRecognitionAdapter,
     _RankedCandidate,
@@ -1921,23 +1927,23 @@ async def test_recognize_weapons_stops_calculation_after_cancel_request(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     frame = _load_image(VISIBLE_FIXTURE_DIR / "weapon_icons_visible_01.png")
-    score_started = asyncio.Event()
+    score_started = threading.Event()
 
-    async def _slow_score(
-        query_padded_bgr: np.ndarray,
+    def _slow_score(
+        query_gray: np.ndarray,
+        indices: object = None,
         *,
         cancel_check: object = None,
-    ) -> float:
-        _ = query_padded_bgr
+    ) -> np.ndarray:
+        _ = query_gray
+        _ = indices
         score_started.set()
         while True:
             if callable(cancel_check) and cancel_check():
                 raise asyncio.CancelledError("cancelled by test")
-            await asyncio.sleep(0.001)
+            time.sleep(0.001)
 
-    for template_sources in recognizer._template_sources_by_weapon.values():
-        for source in template_sources:
-            monkeypatch.setattr(source.matcher, "score", _slow_score)
+    monkeypatch.setattr(recognizer._template_scorer, "score", _slow_score)
 
     task = asyncio.create_task(
         recognizer.recognize_weapons(
@@ -1945,7 +1951,7 @@ async def test_recognize_weapons_stops_calculation_after_cancel_request(
             save_predict_weapons_output=False,
         )
     )
-    await asyncio.wait_for(score_started.wait(), timeout=1.0)
+    assert await asyncio.to_thread(score_started.wait, 1.0)
 
     recognizer.request_cancel()
 
@@ -1953,6 +1959,37 @@ async def test_recognize_weapons_stops_calculation_after_cancel_request(
         await asyncio.wait_for(task, timeout=1.0)
 
 
+@pytest.mark.asyncio
+async def test_rank_weapon_candidates_keeps_top_candidates_after_pruning(
+    recognizer: WeaponRecognitionAdapter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    frame = _load_image(VISIBLE_FIXTURE_DIR / "weapon_icons_visible_04.png")
+    query_by_slot = build_padded_gray_by_slot(
+        slot_images=crop_slot_images(frame)
+    )
+    cancel_generation = recognizer._capture_cancel_generation()
+
+    for query in query_by_slot.values():
+        pruned = await recognizer._rank_weapon_candidates(
+            query, cancel_generation=cancel_generation
+        )
+        monkeypatch.setattr(
+            constants, "WEAPON_COARSE_CANDIDATE_TOP_K", 10**6
+        )
+        full = await recognizer._rank_weapon_candidates(
+            query, cancel_generation=cancel_generation
+        )
+        monkeypatch.undo()
+
+        assert len(pruned) < len(full)
+        assert pruned[:3] == full[:3]
+        assert (
+            recognizer._select_best_candidates_by_confidence(pruned)
+            == recognizer._select_best_candidates_by_confidence(full)
+        )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "sample_id",
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Iterator
+
+import cv2
+import numpy as np
+import pytest
+from splat_replay.domain.config import ImageMatchingSettings
+from splat_replay.infrastructure.adapters.weapon_detection.process_pool import (
+    ProcessPoolWeaponRecognitionAdapter,
+    SharedFrame,
+    _RecordingLogger,
+    read_shared_region,
+)
+from splat_replay.infrastructure.adapters.weapon_detection.recognizer import (
+    WeaponRecognitionAdapter,
+)
+
+FIXTURE_PATH = (
+    Path(__file__).resolve().parent
+    / "fixtures"
+    / "weapon_detection"
+    / "weapon_icons_visible"
+    / "weapon_icons_visible_01.png"
+)
+MATCHING_CONFIG_PATH = (
+    Path(__file__).resolve().parents[1] / "config" / "image_matching.yaml"
+)
+
+
+class _TestLogger:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def debug(self, event: str, **kw: object) -> None:
+        self.events.append(("debug", event))
+
+    def info(self, event: str, **kw: object) -> None:
+        self.events.append(("info", event))
+
+    def warning(self, event: str, **kw: object) -> None:
+        self.events.append(("warning", event))
+
+    def error(self, event: str, **kw: object) -> None:
+        self.events.append(("error", event))
+
+    def exception(self, event: str, **kw: object) -> None:
+        self.events.append(("exception", event))
+
+
+@pytest.fixture(scope="module")
+def settings() -> ImageMatchingSettings:
+    return ImageMatchingSettings.load_from_yaml(MATCHING_CONFIG_PATH)
+
+
+@pytest.fixture
+def pool_logger() -> _TestLogger:
+    return _TestLogger()
+
+
+@pytest.fixture
+def pool_recognizer(
+    settings: ImageMatchingSettings, pool_logger: _TestLogger
+) -> Iterator[ProcessPoolWeaponRecognitionAdapter]:
+    recognizer = ProcessPoolWeaponRecognitionAdapter(
+        settings, pool_logger, workers=2
+    )
+    yield recognizer
+    recognizer.close()
+
+
+def test_shared_frame_region_round_trip() -> None:
+    frame = np.arange(6 * 8 * 3, dtype=np.uint8).reshape(6, 8, 3)
+
+    with SharedFrame(frame) as shared:
+        region = read_shared_region(shared.handle, (2, 1, 5, 4))
+
+    assert np.array_equal(region, frame[1:4, 2:5])
+
+
+def test_shared_frame_outlives_pending_workers() -> None:
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    finished: Future[object] = Future()
+    finished.set_result(None)
+    pending: Future[object] = Future()
+
+    shared = SharedFrame(frame)
+    shared.close_when_done([finished, pending])
+
+    # 実行中のワーカーがまだ読めること
+    region = read_shared_region(shared.handle, (0, 0, 2, 2))
+    assert region.shape == (2, 2, 3)
+
+    pending.set_result(None)
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared.handle.name, track=False)
+
+
+def test_recording_logger_keeps_worker_traceback() -> None:
+    logger = _RecordingLogger()
+    try:
+        raise ValueError("broken template")
+    except ValueError:
+        logger.exception("判別に失敗しました", slot="ally_1")
+
+    [(level, event, kw)] = logger.drain()
+    assert (level, event, kw["slot"]) == (
+        "error",
+        "判別に失敗しました",
+        "ally_1",
+    )
+    assert "ValueError: broken template" in str(kw["traceback"])
+
+
+@pytest.mark.asyncio
+async def test_process_pool_matches_in_process_recognition(
+    settings: ImageMatchingSettings,
+    pool_recognizer: ProcessPoolWeaponRecognitionAdapter,
+    pool_logger: _TestLogger,
+) -> None:
+    frame = cv2.imread(str(FIXTURE_PATH))
+    assert frame is not None
+    in_process = WeaponRecognitionAdapter(settings, _TestLogger())
+
+    expected = await in_process.recognize_weapons(
+        frame, save_predict_weapons_output=False
+    )
+    actual = await pool_recognizer.recognize_weapons(
+        frame, save_predict_weapons_output=False
+    )
+
+    assert actual == expected
+    # ワーカー内のスロットごとのログは呼び出し元のロガーへ転送される
+    assert pool_logger.events.count(("info", "ブキ判別候補")) == 8
+
+
+@pytest.mark.asyncio
+async def test_process_pool_falls_back_when_workers_are_broken(
+    pool_recognizer: ProcessPoolWeaponRecognitionAdapter,
+    pool_logger: _TestLogger,
+) -> None:
+    frame = cv2.imread(str(FIXTURE_PATH))
+    assert frame is not None
+    pool = pool_recognizer._ensure_pool()
+    for process in list(pool._processes.values()):
+        process.kill()
+        process.join()
+
+    result = await pool_recognizer.recognize_weapons(
+        frame, save_predict_weapons_output=False
+    )
+
+    assert len(result.slot_results) == 8
+    assert any(level == "error" for level, _ in pool_logger.events)
+    assert pool_recognizer._pool is None
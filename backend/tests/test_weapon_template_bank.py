@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import os
+
+import cv2
+import numpy as np
+import pytest
+from splat_replay.infrastructure.adapters.weapon_detection.batch_scorer import (
+    BatchTemplateScorer,
+)
+from splat_replay.infrastructure.adapters.weapon_detection.template_bank import (
+    TemplateBankEntry,
+    TemplateBankError,
+    load_template_bank,
+    write_template_bank,
+)
+
+
+def _write_templates(
+    assets_dir: Path, shapes: list[tuple[int, int]]
+) -> tuple[list[TemplateBankEntry], list[np.ndarray], list[np.ndarray]]:
+    rng = np.random.default_rng(0)
+    entries: list[TemplateBankEntry] = []
+    templates: list[np.ndarray] = []
+    masks: list[np.ndarray] = []
+    for index, shape in enumerate(shapes):
+        template = rng.integers(0, 256, size=shape, dtype=np.uint8)
+        mask = np.where(rng.random(shape) < 0.5, 255, 0).astype(np.uint8)
+        template_path = assets_dir / f"weapon_{index}.png"
+        mask_path = assets_dir / f"weapon_{index}_mask.png"
+        cv2.imwrite(str(template_path), template)
+        cv2.imwrite(str(mask_path), mask)
+        entries.append(
+            TemplateBankEntry(
+                template_path=template_path,
+                mask_path=mask_path,
+            )
+        )
+        templates.append(template)
+        masks.append(mask)
+    return entries, templates, masks
+
+
+def test_loaded_bank_scores_match_decoded_templates(tmp_path: Path) -> None:
+    entries, templates, masks = _write_templates(
+        tmp_path, [(10, 12), (14, 9), (10, 12)]
+    )
+    bank_path = tmp_path / "bank.bin"
+    write_template_bank(
+        bank_path, entries, templates, masks, assets_dir=tmp_path
+    )
+    query = np.random.default_rng(1).integers(
+        0, 256, size=(20, 20), dtype=np.uint8
+    )
+
+    # 書き込み時と異なる順序でも sources の順に照合する
+    order = [2, 0, 1]
+    scorer = load_template_bank(
+        bank_path,
+        [(entries[i].template_path, entries[i].mask_path) for i in order],
+        assets_dir=tmp_path,
+        response_top_k=3,
+    )
+    expected = BatchTemplateScorer.from_templates(
+        [templates[i] for i in order],
+        [masks[i] for i in order],
+        response_top_k=3,
+    ).score(query)
+
+    assert len(scorer) == 3
+    assert np.array_equal(scorer.score(query), expected)
+
+
+def test_modified_template_invalidates_bank(tmp_path: Path) -> None:
+    entries, templates, masks = _write_templates(tmp_path, [(8, 8)])
+    bank_path = tmp_path / "bank.bin"
+    write_template_bank(
+        bank_path, entries, templates, masks, assets_dir=tmp_path
+    )
+    cv2.imwrite(str(entries[0].template_path), 255 - templates[0])
+
+    with pytest.raises(TemplateBankError):
+        load_template_bank(
+            bank_path,
+            [(entries[0].template_path, entries[0].mask_path)],
+            assets_dir=tmp_path,
+        )
+
+
+def test_missing_entry_and_corrupt_file_raise(tmp_path: Path) -> None:
+    entries, templates, masks = _write_templates(tmp_path, [(8, 8), (8, 8)])
+    bank_path = tmp_path / "bank.bin"
+    write_template_bank(
+        bank_path, entries[:1], templates[:1], masks[:1], assets_dir=tmp_path
+    )
+
+    with pytest.raises(TemplateBankError):
+        load_template_bank(
+            bank_path,
+            [(entries[1].template_path, entries[1].mask_path)],
+            assets_dir=tmp_path,
+        )
+
+    bank_path.write_bytes(b"broken")
+    with pytest.raises(TemplateBankError):
+        load_template_bank(
+            bank_path,
+            [(entries[0].template_path, entries[0].mask_path)],
+            assets_dir=tmp_path,
+        )
+
+
+def test_bank_stores_memmapped_coarse_level(tmp_path: Path) -> None:
+    entries, templates, masks = _write_templates(tmp_path, [(10, 12), (14, 9)])
+    bank_path = tmp_path / "bank.bin"
+    write_template_bank(
+        bank_path,
+        entries,
+        templates,
+        masks,
+        assets_dir=tmp_path,
+        coarse_factors=(2,),
+    )
+    query = np.random.default_rng(2).integers(
+        0, 256, size=(24, 24), dtype=np.uint8
+    )
+    sources = [(entry.template_path, entry.mask_path) for entry in entries]
+
+    coarse = load_template_bank(
+        bank_path, sources, assets_dir=tmp_path
+    ).downsampled(2)
+    expected = (
+        BatchTemplateScorer.from_templates(templates, masks)
+        .downsampled(2)
+        .score(query)
+    )
+
+    assert all(
+        isinstance(group.kernels.base, np.memmap)
+        and group.kernels.dtype == np.float32
+        for group in coarse._groups
+    )
+    assert np.allclose(coarse.score(query), expected, atol=1e-5)
+
+
+def test_touched_but_identical_template_keeps_bank_valid(
+    tmp_path: Path,
+) -> None:
+    entries, templates, masks = _write_templates(tmp_path, [(8, 8)])
+    bank_path = tmp_path / "bank.bin"
+    write_template_bank(
+        bank_path, entries, templates, masks, assets_dir=tmp_path
+    )
+    stat = entries[0].template_path.stat()
+    os.utime(
+        entries[0].template_path,
+        ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+    )
+
+    scorer = load_template_bank(
+        bank_path,
+        [(entries[0].template_path, entries[0].mask_path)],
+        assets_dir=tmp_path,
+    )
+
+    assert len(scorer) == 1
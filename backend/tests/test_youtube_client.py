@@ -80,9 +80,7 @@ class TestYouTubeClientAuthentication:
                 mock_dump.assert_called_once()
                 assert mock_dump.call_args[0][0] == mock_credentials
 
-    @patch(
-        "splat_replay.infrastructure.adapters.upload.youtube_client.InstalledAppFlow"
-    )
+    @patch("google_auth_oauthlib.flow.InstalledAppFlow")
     def test_authenticate_with_new_credentials(
         self, mock_flow, youtube_client, mock_credentials
     ):
@@ -97,9 +95,7 @@ class TestYouTubeClientAuthentication:
             )
 
             # discovery.build のモック
-            with patch(
-                "splat_replay.infrastructure.adapters.upload.youtube_client.discovery.build"
-            ) as mock_build:
+            with patch("googleapiclient.discovery.build") as mock_build:
                 mock_youtube = MagicMock()
                 mock_build.return_value = mock_youtube
 
@@ -119,9 +115,7 @@ class TestYouTubeClientAuthentication:
 class TestYouTubeClientUpload:
     """アップロードテスト。"""
 
-    @patch(
-        "splat_replay.infrastructure.adapters.upload.youtube_client.MediaFileUpload"
-    )
+    @patch("googleapiclient.http.MediaFileUpload")
     def test_upload_video_success(
         self, mock_media_upload, youtube_client, mock_credentials
     ):
@@ -150,9 +144,7 @@ class TestYouTubeClientUpload:
         assert video_id == "video123"
         mock_youtube.videos().insert.assert_called_once()
 
-    @patch(
-        "splat_replay.infrastructure.adapters.upload.youtube_client.MediaFileUpload"
-    )
+    @patch("googleapiclient.http.MediaFileUpload")
     def test_upload_video_authentication_failure(
         self, mock_media_upload, youtube_client, mock_credentials, mock_logger
     ):
@@ -182,9 +174,7 @@ class TestYouTubeClientUpload:
         # エラーログが記録される
         mock_logger.error.assert_called()
 
-    @patch(
-        "splat_replay.infrastructure.adapters.upload.youtube_client.MediaFileUpload"
-    )
+    @patch("googleapiclient.http.MediaFileUpload")
     def test_upload_thumbnail_success(
         self, mock_media_upload, youtube_client, mock_credentials
     ):
@@ -205,9 +195,7 @@ class TestYouTubeClientUpload:
         # 検証
         mock_youtube.thumbnails().set.assert_called_once()
 
-    @patch(
-        "splat_replay.infrastructure.adapters.upload.youtube_client.MediaFileUpload"
-    )
+    @patch("googleapiclient.http.MediaFileUpload")
     def test_upload_subtitle_success(
         self, mock_media_upload, youtube_client, mock_credentials
     ):